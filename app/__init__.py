@@ -4,6 +4,7 @@ from flask_login import LoginManager
 from flask_migrate import Migrate
 from flask_wtf.csrf import CSRFProtect
 from config.config import Config
+from modules.rate_limiter import configure_rate_limits
 
 db = SQLAlchemy()
 login_manager = LoginManager()
@@ -23,6 +24,9 @@ def create_app():
     login_manager.login_message = 'Please login to access this page.'
     login_manager.login_message_category = 'info'
     
+    # One rate limit budget per API and platform for every user session of this process
+    configure_rate_limits(app.config['RATE_LIMITS'], app.config['RATE_LIMIT_STATE_PATH'])
+    
     # Register blueprints
     from app.auth import bp as auth_bp
     from app.dashboard import bp as dashboard_bp
@@ -36,4 +40,8 @@ def create_app():
     from app.routes import init_routes
     init_routes(app)
     
+    # Command line commands (flask export-history)
+    from app.commands import init_commands
+    init_commands(app)
+    
     return app
@@ -19,6 +19,12 @@ from app.models.job_application import JobApplication
 from app.models.job_preferences import JobPreferences
 from app.automation.scrapers.linkedin_automation import LinkedInAutomation
 from app.automation.scrapers.indeed_automation import IndeedAutomation
+from app.automation.seen_jobs import SeenJobIndex
+from app.automation.search_planner import SearchPlanner
+from app.automation.job_cursor import JobListCursor
+from app.automation.element_handles import JobCardHandle
+from modules.ai.llm_provider import provider_metrics
+from modules.rate_limiter import rate_limiter_metrics, set_rate_limit_key
 # from app.automation.scrapers.naukri_automation import NaukriAutomation
 # from app.automation.scrapers.internshala_automation import InternshalaAutomation
 import json
@@ -33,16 +39,34 @@ class AutomationManager:
         self.job_preferences = JobPreferences.query.filter_by(user_id=user_id).first()
         self.logger = logging.getLogger(__name__)
         
+        # Rate limited calls of this session queue fairly against other users' sessions
+        self.rate_limit_key = f"user:{user_id}"
+        
         # Automation instances
         self.linkedin_bot = None
         self.indeed_bot = None
         
+        # Jobs already handled this session (seeded lazily from existing applications)
+        self.seen_jobs = None
+        
         # Session tracking
         self.session_stats = {
             'total_searched': 0,
             'total_applied': 0,
             'successful_applications': 0,
             'failed_applications': 0,
+            'duplicates_skipped': 0,
+            'searches_run': 0,
+            'stale_recoveries': 0,
+            'stale_cards_lost': 0,
+            'questions_seen': 0,
+            'questions_answered_locally': 0,
+            'questions_sent_to_ai': 0,
+            'answers_reused': 0,
+            'ai_calls_avoided': 0,
+            'ai_breaker': {},
+            'rate_limit_waits': {},
+            'search_plans': {},
             'errors': []
         }
     
@@ -118,6 +142,74 @@ class AutomationManager:
             'experience_level': self.job_preferences.experience_level
         }
     
+    def get_search_plan(self, search_criteria, platform_name):
+        """Plan the searches for a platform, merging compatible titles and ordering by past yield"""
+        job_titles = search_criteria.get('job_titles', []) or []
+        locations = search_criteria.get('locations', []) or []
+        
+        history = []
+        try:
+            rows = JobApplication.query.with_entities(
+                JobApplication.job_title, JobApplication.location, JobApplication.status
+            ).filter_by(user_id=self.user_id, platform=platform_name).all()
+            history = SearchPlanner.match_history(rows, job_titles, locations)
+        except Exception as e:
+            self.logger.warning(f"Could not load application history for search planning: {str(e)}")
+        
+        return SearchPlanner().plan(platform_name, job_titles, locations, history)
+    
+    def get_seen_job_index(self):
+        """Get the session's seen job index, seeding it from existing applications on first use"""
+        if self.seen_jobs is None:
+            self.seen_jobs = SeenJobIndex.from_applications(self.user_id)
+        return self.seen_jobs
+    
+    def _update_seen_job_stats(self):
+        """Copy seen job index counters into the session stats"""
+        if self.seen_jobs is not None:
+            seen_stats = self.seen_jobs.get_stats()
+            self.session_stats['duplicates_skipped'] = seen_stats['total_skipped']
+            self.session_stats['seen_jobs'] = seen_stats
+    
+    def _update_stale_recovery_stats(self):
+        """Total the stale job card recoveries of all bots into the session stats"""
+        recovered = 0
+        lost = 0
+        for bot in (self.linkedin_bot, self.indeed_bot):
+            if bot is not None:
+                recovered += bot.stale_recoveries.get('recovered', 0)
+                lost += bot.stale_recoveries.get('lost', 0)
+        self.session_stats['stale_recoveries'] = recovered
+        self.session_stats['stale_cards_lost'] = lost
+    
+    def _update_answer_stats(self):
+        """Total how many form questions the bots answered from the profile rules or earlier answers and how many went to AI"""
+        seen = local = sent = reused = 0
+        for bot in (self.linkedin_bot, self.indeed_bot):
+            engine = getattr(bot, 'answer_engine', None) if bot is not None else None
+            if engine is not None:
+                stats = engine.get_stats()
+                seen += stats['questions']
+                local += stats['answered_locally']
+                sent += stats['sent_to_llm']
+            ai_answerer = getattr(bot, 'ai_answerer', None) if bot is not None else None
+            if ai_answerer is not None:
+                reused += ai_answerer.answer_memory.llm_calls_avoided
+        self.session_stats['questions_seen'] = seen
+        self.session_stats['questions_answered_locally'] = local
+        self.session_stats['questions_sent_to_ai'] = sent
+        self.session_stats['answers_reused'] = reused
+        self.session_stats['ai_calls_avoided'] = local + reused
+        # Circuit breaker state of every AI provider used this session (closed, open or half_open)
+        self.session_stats['ai_breaker'] = {name: metrics['breaker'] for name, metrics in provider_metrics().items()}
+        # Time this session waited for the shared AI and platform rate limits, per resource
+        key = self.rate_limit_key
+        self.session_stats['rate_limit_waits'] = {
+            resource: {'calls': metrics['keys'][key]['acquired'], 'wait_seconds': metrics['keys'][key]['wait'],
+                       'p95_wait_all_users': metrics['p95_wait']}
+            for resource, metrics in rate_limiter_metrics().items() if key in metrics['keys']
+        }
+    
     def get_platform_priorities(self):
         """Get platform priorities from user preferences"""
         if not self.job_preferences:
@@ -396,146 +488,168 @@ class AutomationManager:
             
             self.logger.info(f"Successfully logged into {platform_name}")
             
-            # Search and apply for each job title and location combination
-            for job_title in search_criteria.get('job_titles', []):
-                for location in search_criteria.get('locations', []):
-                    # Check if stopped
-                    if stop_event and stop_event.is_set():
-                        return applications_made
+            seen_jobs = self.get_seen_job_index()
+            
+            # Run the planned searches in order of expected yield; each search may
+            # combine several compatible titles into one OR query
+            search_plan = self.get_search_plan(search_criteria, platform_name)
+            self.session_stats['search_plans'][platform_name] = search_plan.preview(applications_limit)
+            
+            for planned_search in search_plan:
+                job_title = planned_search.keywords
+                location = planned_search.location
+                
+                # Check if stopped
+                if stop_event and stop_event.is_set():
+                    return applications_made
+                
+                if applications_made >= applications_limit:
+                    break
+                
+                try:
+                    # Update current action
+                    self.session_stats['current_action'] = f'Searching {platform_name.title()} for "{job_title}" in "{location}" with Easy Apply filter'
                     
-                    if applications_made >= applications_limit:
-                        break
+                    # Easy Apply is mandatory; preference filters are encoded in the search URL
+                    search_filters = {
+                        'easy_apply': True,
+                        'work_type': search_criteria.get('work_type'),
+                        'work_mode': search_criteria.get('work_mode'),
+                        'experience_level': search_criteria.get('experience_level')
+                    }
                     
-                    try:
-                        # Update current action
-                        self.session_stats['current_action'] = f'Searching {platform_name.title()} for "{job_title}" in "{location}" with Easy Apply filter'
+                    # Search for jobs with mandatory Easy Apply filter
+                    self.logger.info(f"Searching {platform_name} for '{job_title}' in '{location}' with Easy Apply filter")
+                    jobs = platform_bot.search_jobs(job_title, location, filters=search_filters)
+                    self.session_stats['searches_run'] += 1
+                    
+                    if not jobs:
+                        self.logger.info(f"No jobs found for '{job_title}' in '{location}'")
+                        continue
                         
-                        # Create filter for Easy Apply jobs only
-                        search_filters = {'easy_apply': True}
+                    self.session_stats['total_searched'] += len(jobs)
+                    self.logger.info(f" Found {len(jobs)} jobs, starting sequential processing...")
+                    
+                    # Use LinkedIn's built-in sequential processing instead of manual iteration
+                    if hasattr(platform_bot, 'process_jobs_sequentially'):
+                        # Get user data for sequential processing
+                        user_data = self._get_user_application_data()
                         
-                        # Search for jobs with mandatory Easy Apply filter
-                        self.logger.info(f"Searching {platform_name} for '{job_title}' in '{location}' with Easy Apply filter")
-                        jobs = platform_bot.search_jobs(job_title, location, filters=search_filters)
+                        # Update current action
+                        self.session_stats['current_action'] = f'Processing {len(jobs)} jobs sequentially with AI assistance...'
                         
-                        if not jobs:
-                            self.logger.info(f"No jobs found for '{job_title}' in '{location}'")
-                            continue
-                            
-                        self.session_stats['total_searched'] += len(jobs)
-                        self.logger.info(f" Found {len(jobs)} jobs, starting sequential processing...")
+                        # Use LinkedIn's optimized sequential processing
+                        processing_result = platform_bot.process_jobs_sequentially(
+                            user_preferences=self.job_preferences,
+                            user_skills=self._get_user_skills(),
+                            user_data=user_data,
+                            max_applications=applications_limit - applications_made,
+                            seen_jobs=seen_jobs
+                        )
+                        self._update_seen_job_stats()
                         
-                        # Use LinkedIn's built-in sequential processing instead of manual iteration
-                        if hasattr(platform_bot, 'process_jobs_sequentially'):
-                            # Get user data for sequential processing
-                            user_data = self._get_user_application_data()
+                        if processing_result['success']:
+                            apps_made_this_search = processing_result['applications_made']
+                            applications_made += apps_made_this_search
                             
-                            # Update current action
-                            self.session_stats['current_action'] = f'Processing {len(jobs)} jobs sequentially with AI assistance...'
+                            # Update session stats
+                            self.session_stats['successful_applications'] += apps_made_this_search
+                            self.session_stats['total_applied'] += apps_made_this_search
                             
-                            # Use LinkedIn's optimized sequential processing
-                            processing_result = platform_bot.process_jobs_sequentially(
-                                user_preferences=self.job_preferences,
-                                user_skills=self._get_user_skills(),
-                                user_data=user_data,
-                                max_applications=applications_limit - applications_made
-                            )
+                            self.logger.info(f" Sequential processing completed: {apps_made_this_search} applications made")
+                        else:
+                            self.logger.warning(f"⚠️ Sequential processing had issues: {processing_result.get('error', 'Unknown error')}")
+                            self.session_stats['errors'].append(processing_result.get('error', 'Sequential processing failed'))
+                    
+                    else:
+                        # Fallback to manual iteration for platforms without sequential processing
+                        self.logger.info("Using fallback manual job iteration...")
+                        
+                        # Walk the result list by job id, loading further result pages as needed
+                        for card_job_id, card_element in JobListCursor(platform_bot):
+                            # Check if stopped
+                            if stop_event and stop_event.is_set():
+                                return applications_made
                             
-                            if processing_result['success']:
-                                apps_made_this_search = processing_result['applications_made']
-                                applications_made += apps_made_this_search
+                            if applications_made >= applications_limit:
+                                break
+                            
+                            try:
+                                # Skip postings already handled by an earlier search before extracting anything
+                                if seen_jobs.should_skip(platform_name, card_job_id):
+                                    self.logger.info(f"Skipping already seen job: {card_job_id}")
+                                    self._update_seen_job_stats()
+                                    continue
                                 
-                                # Update session stats
-                                self.session_stats['successful_applications'] += apps_made_this_search
-                                self.session_stats['total_applied'] += apps_made_this_search
+                                # Keep the card's job id with it so a re-render can be recovered by id
+                                job_element = JobCardHandle(platform_bot, card_element, card_job_id)
                                 
-                                self.logger.info(f" Sequential processing completed: {apps_made_this_search} applications made")
-                            else:
-                                self.logger.warning(f"⚠️ Sequential processing had issues: {processing_result.get('error', 'Unknown error')}")
-                                self.session_stats['errors'].append(processing_result.get('error', 'Sequential processing failed'))
-                        
-                        else:
-                            # Fallback to manual iteration for platforms without sequential processing
-                            self.logger.info("Using fallback manual job iteration...")
-                            
-                            for job_element in jobs:
-                                # Check if stopped
-                                if stop_event and stop_event.is_set():
-                                    return applications_made
+                                # Extract job details
+                                job_details = platform_bot.extract_job_details(job_element)
+                                if not job_details:
+                                    continue
+                                
+                                job_id = job_details.get('platform_job_id') or card_job_id
+                                if job_id != card_job_id and seen_jobs.should_skip(platform_name, job_id):
+                                    self.logger.info(f"Skipping already seen job: {job_details.get('job_title')}")
+                                    self._update_seen_job_stats()
+                                    continue
+                                seen_jobs.mark_seen(platform_name, job_id)
                                 
-                                if applications_made >= applications_limit:
-                                    break
+                                # Update current action
+                                self.session_stats['current_action'] = f'Evaluating job: {job_details.get("job_title", "Unknown")} at {job_details.get("company_name", "Unknown")}'
                                 
-                                try:
-                                    # Extract job details
-                                    job_details = platform_bot.extract_job_details(job_element)
-                                    if not job_details:
-                                        continue
-                                    
-                                    # Update current action
-                                    self.session_stats['current_action'] = f'Evaluating job: {job_details.get("job_title", "Unknown")} at {job_details.get("company_name", "Unknown")}'
-                                    
-                                    # Check if job matches user preferences
-                                    if not self.job_matches_preferences(job_details):
-                                        self.logger.info(f"Job doesn't match preferences: {job_details.get('job_title')}")
-                                        continue
-                                    
-                                    # Check if already applied to this job
-                                    existing_app = JobApplication.query.filter_by(
-                                        user_id=self.user_id,
-                                        platform_job_id=job_details.get('platform_job_id'),
-                                        platform=platform_name
-                                    ).first()
-                                    
-                                    if existing_app:
-                                        self.logger.info(f"Already applied to: {job_details.get('job_title')}")
-                                        continue
-                                    
-                                    # Update current action for application
-                                    self.session_stats['current_action'] = f'Applying to: {job_details.get("job_title", "Unknown")} at {job_details.get("company_name", "Unknown")}'
-                                    
-                                    # Get user data for application
-                                    user_data = self._get_user_application_data()
-                                    
-                                    # Apply to job with proper parameters
-                                    self.logger.info(f"Applying to: {job_details.get('job_title')} at {job_details.get('company_name')}")
-                                    application_result = platform_bot.apply_to_job(
-                                        job_element, 
-                                        user_preferences=self.job_preferences,
-                                        user_skills=self._get_user_skills(),
-                                        user_data=user_data
-                                    )
-                                    
-                                    # Save to database
-                                    saved_app = self.save_job_application(job_details, application_result)
-                                    
-                                    # Update session stats
-                                    self.session_stats['total_applied'] += 1
-                                    if application_result['success']:
-                                        self.session_stats['successful_applications'] += 1
-                                        applications_made += 1
-                                        self.logger.info(f" Successfully applied and saved: {job_details.get('job_title')}")
-                                    else:
-                                        self.session_stats['failed_applications'] += 1
-                                        self.logger.warning(f" Application failed: {application_result.get('error')}")
-                                    
-                                    # Add delay between applications
-                                    platform_bot.random_delay(3, 6)
-                                    
-                                except Exception as e:
-                                    self.logger.error(f"Error processing job: {str(e)}")
-                                    self.session_stats['errors'].append(str(e))
+                                # Check if job matches user preferences
+                                if not self.job_matches_preferences(job_details):
+                                    self.logger.info(f"Job doesn't match preferences: {job_details.get('job_title')}")
                                     continue
-                        
-                        # Add delay between searches
-                        platform_bot.random_delay(2, 4)
-                        
-                    except Exception as e:
-                        self.logger.error(f"Error searching {platform_name}: {str(e)}")
-                        self.session_stats['errors'].append(str(e))
-                        continue
-                
-                if applications_made >= applications_limit:
-                    break
+                                
+                                # Update current action for application
+                                self.session_stats['current_action'] = f'Applying to: {job_details.get("job_title", "Unknown")} at {job_details.get("company_name", "Unknown")}'
+                                
+                                # Get user data for application
+                                user_data = self._get_user_application_data()
+                                
+                                # Apply to job with proper parameters
+                                self.logger.info(f"Applying to: {job_details.get('job_title')} at {job_details.get('company_name')}")
+                                application_result = platform_bot.apply_to_job(
+                                    job_element, 
+                                    user_preferences=self.job_preferences,
+                                    user_skills=self._get_user_skills(),
+                                    user_data=user_data
+                                )
+                                
+                                # Save to database
+                                saved_app = self.save_job_application(job_details, application_result)
+                                
+                                # Update session stats
+                                self.session_stats['total_applied'] += 1
+                                if application_result['success']:
+                                    self.session_stats['successful_applications'] += 1
+                                    applications_made += 1
+                                    self.logger.info(f" Successfully applied and saved: {job_details.get('job_title')}")
+                                else:
+                                    self.session_stats['failed_applications'] += 1
+                                    self.logger.warning(f" Application failed: {application_result.get('error')}")
+                                
+                                # Add delay between applications
+                                platform_bot.random_delay(3, 6)
+                                
+                            except Exception as e:
+                                self.logger.error(f"Error processing job: {str(e)}")
+                                self.session_stats['errors'].append(str(e))
+                                continue
+                    
+                    self._update_stale_recovery_stats()
+                    self._update_answer_stats()
+                    
+                    # Add delay between searches
+                    platform_bot.random_delay(2, 4)
+                    
+                except Exception as e:
+                    self.logger.error(f"Error searching {platform_name}: {str(e)}")
+                    self.session_stats['errors'].append(str(e))
+                    continue
         
         except Exception as e:
             self.logger.error(f"Error running automation for {platform_name}: {str(e)}")
@@ -545,6 +659,7 @@ class AutomationManager:
     
     def run_full_automation(self, stop_event=None):
         """Run full automation process with stop event support"""
+        set_rate_limit_key(self.rate_limit_key)
         try:
             self.session_stats['status'] = 'initializing'
             self.session_stats['current_action'] = 'Checking daily limits and preferences...'
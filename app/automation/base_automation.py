@@ -16,10 +16,17 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 import time
 import logging
+from modules.rate_limiter import rate_limit
 
 class BaseJobAutomation(ABC):
     """Base class for job platform automation"""
     
+    # XPath that finds one job card by its id, with a {job_id} placeholder (set per platform)
+    job_card_locator = None
+    
+    # Rate limiter resource of the platform ('linkedin', 'indeed'), shared by all user sessions
+    platform = None
+    
     def __init__(self, username, password, headless=True):
         self.username = username
         self.password = password
@@ -28,6 +35,9 @@ class BaseJobAutomation(ABC):
         self.wait = None
         self.logger = logging.getLogger(self.__class__.__name__)
         
+        # Stale job cards re-resolved by job id ('recovered') or no longer on the page ('lost')
+        self.stale_recoveries = {'recovered': 0, 'lost': 0}
+        
     def setup_driver(self):
         """Setup Chrome WebDriver with options"""
         chrome_options = Options()
@@ -178,6 +188,18 @@ class BaseJobAutomation(ABC):
         self.driver.execute_script("arguments[0].scrollIntoView();", element)
         time.sleep(1)
     
+    def throttle(self, tokens=1):
+        """Wait for the platform's shared rate limit before a page load or an application"""
+        if self.platform:
+            waited = rate_limit(self.platform, tokens)
+            if waited >= 1:
+                self.logger.info(f"Waited {waited:.1f}s for the {self.platform} rate limit")
+    
+    def open_page(self, url):
+        """Load a page of the platform within its rate limit"""
+        self.throttle()
+        self.driver.get(url)
+    
     def random_delay(self, min_seconds=1, max_seconds=3):
         """Add random delay to mimic human behavior"""
         import random
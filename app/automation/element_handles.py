@@ -0,0 +1,84 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Element Handles - Job card references that survive list re-renders by
+re-resolving the card from its job id
+"""
+
+import logging
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+
+class JobCardHandle:
+    """A job card element together with the stable job id it was found under
+
+    When the results list re-renders, the held WebElement goes stale. Instead of
+    re-querying the whole list and guessing, the handle looks the card up again
+    with the bot's job_card_locator for this job id only.
+    """
+
+    def __init__(self, bot, element, job_id):
+        self.bot = bot
+        self.element = element
+        self.job_id = job_id
+        self.logger = logging.getLogger(__name__)
+
+    def __repr__(self):
+        return f"<JobCardHandle job_id={self.job_id!r}>"
+
+    def is_stale(self):
+        try:
+            self.element.is_displayed()
+            return False
+        except StaleElementReferenceException:
+            return True
+
+    def get(self):
+        """Return a live element for this card, re-resolving it if the held one went stale
+
+        Returns None if the card is no longer on the page.
+        """
+        if self.element is not None and not self.is_stale():
+            return self.element
+        return self.resolve()
+
+    def resolve(self):
+        """Find this job's card again with a single targeted query"""
+        locator = getattr(self.bot, 'job_card_locator', None)
+        if not self.job_id or not locator:
+            self._count('lost')
+            return None
+
+        try:
+            matches = self.bot.driver.find_elements(By.XPATH, locator.format(job_id=self.job_id))
+        except WebDriverException as e:
+            self.logger.debug(f"Could not re-resolve job card {self.job_id}: {str(e)}")
+            matches = []
+
+        if not matches:
+            self.logger.warning(f"Job card {self.job_id} is no longer in the results list")
+            self._count('lost')
+            return None
+
+        self.element = matches[0]
+        self.logger.info(f"Recovered stale job card {self.job_id}")
+        self._count('recovered')
+        return self.element
+
+    def _count(self, outcome):
+        counters = getattr(self.bot, 'stale_recoveries', None)
+        if counters is not None:
+            counters[outcome] = counters.get(outcome, 0) + 1
+
+
+def unwrap_job_card(job_card):
+    """Accept either a JobCardHandle or a plain WebElement and return (element, handle)"""
+    if isinstance(job_card, JobCardHandle):
+        return job_card.get(), job_card
+    return job_card, None
@@ -0,0 +1,228 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Job List Cursor - Walks the job cards of a loaded search by job id, yielding each
+card once as the list grows and moving through result pages until they run out
+"""
+
+import logging
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+
+# Reads the job id of every card in one round trip. Mirrors get_card_job_id on the
+# scrapers: LinkedIn cards carry data-occludable-job-id / data-job-id, Indeed cards data-jk.
+# Cards without an id get a "card:" key from their title, company and link instead (see card_key),
+# and cards with none of these (placeholders not rendered yet) get null.
+READ_JOB_IDS_SCRIPT = """
+const attributes = ['data-occludable-job-id', 'data-job-id', 'data-jk'];
+const patterns = [/currentJobId=(\\d+)/, /\\/jobs\\/view\\/(\\d+)/, /[?&]jk=([^&]+)/];
+const titles = 'h2, h3, [class*="title"]';
+const companies = '[class*="company"], [data-testid="company-name"], .artdeco-entity-lockup__subtitle';
+const text = function (card, selector) {
+    const element = card.querySelector(selector);
+    return element ? element.textContent : '';
+};
+const clean = function (value) { return (value || '').replace(/\\s+/g, ' ').trim().toLowerCase(); };
+return arguments[0].map(function (card) {
+    try {
+        for (const name of attributes) {
+            const own = card.getAttribute(name);
+            if (own) { return own.trim(); }
+        }
+        for (const name of attributes) {
+            const child = card.querySelector('[' + name + ']');
+            if (child && child.getAttribute(name)) { return child.getAttribute(name).trim(); }
+        }
+        for (const link of card.querySelectorAll('a[href]')) {
+            for (const pattern of patterns) {
+                const match = link.href.match(pattern);
+                if (match) { return match[1]; }
+            }
+        }
+        const first = card.querySelector('a[href]');
+        const parts = [clean(text(card, titles)), clean(text(card, companies)),
+                       first ? first.href.split(/[?#]/)[0] : ''];
+        if (parts.some(Boolean)) { return 'card:' + parts.join('|'); }
+    } catch (e) {}
+    return null;
+});
+"""
+
+
+def card_key(title, company, link):
+    """Key of a job card without a job id, stable across re-renders of the list
+
+    Args:
+        title: Job title shown on the card
+        company: Company name shown on the card
+        link: First link of the card
+
+    Returns:
+        "card:title|company|link" (lowercased, query string dropped), or None if all are empty
+    """
+    parts = [' '.join((title or '').split()).lower(), ' '.join((company or '').split()).lower(),
+             (link or '').split('?')[0].split('#')[0]]
+    return 'card:' + '|'.join(parts) if any(parts) else None
+
+# Resolves true as soon as children are added under the list container, false on timeout
+WAIT_FOR_GROWTH_SCRIPT = """
+const anchor = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+const container = anchor && anchor.parentElement;
+if (!container) { done(false); return; }
+let finished = false;
+const finish = function (grew) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    done(grew);
+};
+const observer = new MutationObserver(function (mutations) {
+    for (const mutation of mutations) {
+        if (mutation.addedNodes && mutation.addedNodes.length) { finish(true); return; }
+    }
+});
+observer.observe(container, {childList: true, subtree: true});
+anchor.scrollIntoView({block: 'end'});
+const scroller = container.closest('.jobs-search-results-list, .scaffold-layout__list') || document.scrollingElement;
+scroller.scrollTop = scroller.scrollHeight;
+setTimeout(function () { finish(false); }, timeoutMs);
+"""
+
+
+def wait_for_list_growth(driver, anchor, timeout=6):
+    """Scroll to the last card and wait for the list to grow
+
+    Args:
+        driver: Selenium WebDriver
+        anchor: Last job card element in the list
+        timeout: Seconds to wait for new cards
+
+    Returns:
+        True if new nodes were added to the list before the timeout
+    """
+    try:
+        driver.set_script_timeout(timeout + 2)
+        return bool(driver.execute_async_script(WAIT_FOR_GROWTH_SCRIPT, anchor, int(timeout * 1000)))
+    except (TimeoutException, WebDriverException):
+        return False
+
+
+class JobListCursor:
+    """Yields (job_id, card) for every job card of the current search exactly once
+
+    The bot must provide _get_job_cards(); if it also provides go_to_search_page(page)
+    and current_search_page, the cursor moves on to the next results page once the
+    current list stops growing.
+    """
+
+    def __init__(self, bot, max_pages=10, growth_timeout=6):
+        self.bot = bot
+        self.driver = bot.driver
+        self.max_pages = max_pages
+        self.growth_timeout = growth_timeout
+        self.logger = logging.getLogger(__name__)
+
+        self.seen_ids = set()
+        self.position = 0  # Index of the last yielded card in the current list
+        self.exhausted = False
+        self.stats = {
+            'cards_yielded': 0,
+            'cards_without_id': 0,
+            'growth_events': 0,
+            'pages_loaded': 0
+        }
+
+    def __iter__(self):
+        return self.iter_cards()
+
+    def _read_job_ids(self, cards):
+        try:
+            return self.driver.execute_script(READ_JOB_IDS_SCRIPT, cards)
+        except WebDriverException as e:
+            self.logger.debug(f"Batch job id read failed, reading cards one by one: {str(e)}")
+            read_id = getattr(self.bot, 'get_card_job_id', lambda card: None)
+            return [read_id(card) or self._read_card_key(card) for card in cards]
+
+    def _read_card_key(self, card):
+        """card_key of one card, reading its first two lines of text as title and company"""
+        try:
+            lines = [line.strip() for line in card.text.splitlines() if line.strip()] + ['', '']
+            links = card.find_elements(By.CSS_SELECTOR, 'a[href]')
+            return card_key(lines[0], lines[1], links[0].get_attribute('href') if links else '')
+        except WebDriverException:
+            return None
+
+    def _new_cards(self):
+        """Return (position, job_id, card) for cards whose id or card key has not been yielded yet"""
+        cards = self.bot._get_job_cards()
+        if not cards:
+            return [], cards
+
+        new_cards = []
+        for position, (card, job_id) in enumerate(zip(cards, self._read_job_ids(cards))):
+            if not job_id:
+                # Nothing to key it by yet (a placeholder card); it is read again once rendered
+                continue
+            if job_id in self.seen_ids:
+                continue
+            new_cards.append((position, job_id, card))
+        return new_cards, cards
+
+    def _next_page(self):
+        if not hasattr(self.bot, 'go_to_search_page'):
+            return False
+        if self.stats['pages_loaded'] + 1 >= self.max_pages:
+            self.logger.info(f"Reached the page limit of {self.max_pages} result pages")
+            return False
+
+        next_page = getattr(self.bot, 'current_search_page', 0) + 1
+        self.logger.info(f"Loading results page {next_page + 1}")
+        if not self.bot.go_to_search_page(next_page):
+            return False
+
+        self.stats['pages_loaded'] += 1
+        return True
+
+    def iter_cards(self):
+        """Generator over new cards; ends when the list stops growing and there are no more pages"""
+        idle_growths = 0  # Growth events that did not produce new cards (e.g. cards hydrating)
+        while True:
+            new_cards, cards = self._new_cards()
+
+            if new_cards:
+                idle_growths = 0
+                for position, job_id, card in new_cards:
+                    self.seen_ids.add(job_id)
+                    self.position = position
+                    self.stats['cards_yielded'] += 1
+                    if job_id.startswith('card:'):
+                        self.stats['cards_without_id'] += 1
+                        job_id = None
+                    yield job_id, card
+                continue
+
+            # Nothing new in the current list: let it grow, then try the next page
+            if cards and idle_growths < 2 and wait_for_list_growth(self.driver, cards[-1], self.growth_timeout):
+                self.stats['growth_events'] += 1
+                idle_growths += 1
+                continue
+
+            idle_growths = 0
+
+            if self._next_page():
+                new_on_page, _ = self._new_cards()
+                if new_on_page:
+                    continue
+                self.logger.info("Next results page had no new jobs")
+
+            self.logger.info(f"Job list exhausted after {self.stats['cards_yielded']} jobs")
+            self.exhausted = True
+            return
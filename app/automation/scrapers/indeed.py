@@ -11,6 +11,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from app.automation.base_automation import BaseJobAutomation
+from app.automation.search_urls import build_indeed_search_url
+from app.automation.element_handles import unwrap_job_card
 import time
 import re
 
@@ -18,17 +20,23 @@ import re
 class IndeedAutomation(BaseJobAutomation):
     """Indeed Job Automation"""
     
+    # Job cards hold the job key (data-jk) on the title link inside the card
+    job_card_locator = "//div[contains(@class, 'job_seen_beacon')][.//*[@data-jk='{job_id}']]"
+    platform = 'indeed'
+    
     def __init__(self, username, password, headless=True):
         super().__init__(username, password, headless)
         self.base_url = "https://www.indeed.com"
         self.login_url = "https://secure.indeed.com/account/login"
         self.applied_jobs = set()
+        self.current_search = None  # (keywords, location, filters) of the loaded search
+        self.current_search_page = 0
     
     def login(self):
         """Login to Indeed"""
         try:
             self.logger.info("Navigating to Indeed login page")
-            self.driver.get(self.login_url)
+            self.open_page(self.login_url)
             
             # Wait for login form
             email_field = self.wait_for_element((By.ID, "ifl-InputFormField-3"))
@@ -67,12 +75,75 @@ class IndeedAutomation(BaseJobAutomation):
             return False
     
     def search_jobs(self, keywords, location=None, filters=None):
-        """Search for jobs on Indeed"""
+        """Search for jobs on Indeed by opening the search URL with all filters encoded,
+        falling back to the search form if that fails"""
         try:
             self.logger.info(f"Searching Indeed jobs: {keywords} in {location or 'Any location'}")
             
+            search_url = build_indeed_search_url(keywords, location, filters, base_url=self.base_url)
+            job_cards = self._load_search_results_page(search_url)
+            
+            if job_cards is None:
+                self.logger.warning("Search URL did not load any results, falling back to the search form")
+                job_cards = self._search_jobs_via_ui(keywords, location, filters)
+            else:
+                self.logger.info(f"Found {len(job_cards)} job listings")
+            
+            self.current_search = (keywords, location, filters)
+            self.current_search_page = 0
+            return job_cards
+            
+        except Exception as e:
+            self.logger.error(f"Error searching Indeed jobs: {str(e)}")
+            return []
+    
+    def _load_search_results_page(self, search_url, timeout=15):
+        """Open a search URL and wait for the results list
+        
+        Returns the job cards, an empty list if Indeed reports no results,
+        or None if the results page did not load.
+        """
+        try:
+            self.open_page(search_url)
+            
+            results_xpath = ("//div[contains(@class, 'job_seen_beacon')] | "
+                             "//div[contains(@class, 'jobsearch-SerpJobCard')] | "
+                             "//*[contains(@class, 'jobsearch-NoResult')]")
+            WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.find_elements(By.XPATH, results_xpath))
+            
+            if self.driver.find_elements(By.XPATH, "//*[contains(@class, 'jobsearch-NoResult')]"):
+                self.logger.info("Indeed reports no results for this search")
+                return []
+            
+            return self._get_job_cards()
+            
+        except TimeoutException:
+            self.logger.warning(f"Search results did not load within {timeout}s")
+            return None
+        except Exception as e:
+            self.logger.warning(f"Error loading search results page: {str(e)}")
+            return None
+    
+    def go_to_search_page(self, page):
+        """Load another results page of the current search (page is zero-based)"""
+        if not self.current_search:
+            return []
+        
+        keywords, location, filters = self.current_search
+        job_cards = self._load_search_results_page(
+            build_indeed_search_url(keywords, location, filters, page=page, base_url=self.base_url))
+        if not job_cards:
+            return []
+        
+        self.current_search_page = page
+        return job_cards
+    
+    def _search_jobs_via_ui(self, keywords, location=None, filters=None):
+        """Search for jobs by filling in the Indeed search form"""
+        try:
             # Navigate to Indeed search page
-            self.driver.get(self.base_url)
+            self.open_page(self.base_url)
             self.random_delay(2, 3)
             
             # Find search boxes
@@ -175,9 +246,43 @@ class IndeedAutomation(BaseJobAutomation):
         except Exception as e:
             self.logger.error(f"Error getting job cards: {str(e)}")
             return []
-    
+
+    def get_card_job_id(self, job_element):
+        """Read the Indeed job key (jk) from a job card without clicking it"""
+        try:
+            job_id = job_element.get_attribute('data-jk')
+            if job_id:
+                return job_id.strip()
+
+            try:
+                job_key_element = job_element.find_element(By.XPATH, ".//*[@data-jk]")
+                job_id = job_key_element.get_attribute('data-jk')
+                if job_id:
+                    return job_id.strip()
+            except NoSuchElementException:
+                pass
+
+            try:
+                title_element = job_element.find_element(
+                    By.XPATH, ".//h2[contains(@class, 'jobTitle')]//a")
+                job_id_match = re.search(r'jk=([^&]+)', title_element.get_attribute('href') or '')
+                if job_id_match:
+                    return job_id_match.group(1)
+            except NoSuchElementException:
+                pass
+
+        except Exception as e:
+            self.logger.debug(f"Could not read job key from card: {str(e)}")
+
+        return None
+
     def extract_job_details(self, job_element):
-        """Extract job details from job card"""
+        """Extract job details from job card (a card element or a JobCardHandle)"""
+        job_element, _ = unwrap_job_card(job_element)
+        if job_element is None:
+            self.logger.error("Job card is no longer in the results list")
+            return None
+        
         try:
             job_details = {
                 'platform': 'indeed',
@@ -256,9 +361,13 @@ class IndeedAutomation(BaseJobAutomation):
             self.logger.error(f"Error extracting job details: {str(e)}")
             return None
     
-    def apply_to_job(self, job_element):
-        """Apply to a job on Indeed"""
+    def apply_to_job(self, job_element, user_preferences=None, user_skills=None, user_data=None):
+        """Apply to a job on Indeed (job_element may be a card element or a JobCardHandle)"""
         try:
+            job_element, _ = unwrap_job_card(job_element)
+            if job_element is None:
+                return {'success': False, 'error': 'Job card is no longer in the results list'}
+            
             job_details = self.extract_job_details(job_element)
             if not job_details or not job_details.get('platform_job_id'):
                 return {'success': False, 'error': 'Could not extract job details'}
@@ -268,6 +377,9 @@ class IndeedAutomation(BaseJobAutomation):
             if job_id in self.applied_jobs:
                 return {'success': False, 'error': 'Already applied to this job'}
             
+            # Opening a job and applying counts against the shared Indeed rate limit
+            self.throttle()
+            
             # Click on job title to open job details
             try:
                 title_link = job_element.find_element(
@@ -11,8 +11,12 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from app.automation.base_automation import BaseJobAutomation
+from app.automation.search_urls import build_linkedin_search_url
+from app.automation.job_cursor import JobListCursor, wait_for_list_growth
+from app.automation.element_handles import JobCardHandle, unwrap_job_card
 from app.utils.ai_question_answerer import AIQuestionAnswerer
 from app.utils.form_question_parser import FormQuestionParser
+from modules.answer_rules import ProfileAnswerEngine, profile_from_user_data, matches_experience_range
 import time
 import logging
 import re
@@ -23,6 +27,11 @@ class LinkedInAutomation(BaseJobAutomation):
     # Enhanced LinkedIn Automation including AI scoring and PDF generation
     """LinkedIn Job Automation"""
     
+    # Result list items carry data-occludable-job-id; the inner card div carries data-job-id
+    job_card_locator = ("//li[@data-occludable-job-id='{job_id}'] | "
+                        "//*[@data-job-id='{job_id}']/ancestor::li[1]")
+    platform = 'linkedin'
+    
     def __init__(self, username, password, headless=True, gemini_api_key=None):
         super().__init__(username, password, headless)
         self.base_url = "https://www.linkedin.com"
@@ -31,16 +40,20 @@ class LinkedInAutomation(BaseJobAutomation):
         self.search_completed = False
         self.current_job_index = 0
         self.easy_apply_filter_applied = False
+        self.current_search = None  # (keywords, location, filters) of the loaded search
+        self.current_search_url = None
+        self.current_search_page = 0
         self.successful_applications = 0
         self.daily_application_limit = 10
         
         # Initialize AI question answerer
         self.ai_answerer = None
         self.form_parser = None
+        self.answer_engine = ProfileAnswerEngine()  # Profile rules, shared with the AI answerer
         
         if gemini_api_key:
             try:
-                self.ai_answerer = AIQuestionAnswerer(api_key=gemini_api_key)
+                self.ai_answerer = AIQuestionAnswerer(api_key=gemini_api_key, answer_engine=self.answer_engine)
                 self.logger.info(" AI Question Answerer initialized successfully")
             except Exception as e:
                 self.logger.warning(f"Failed to initialize AI Question Answerer: {str(e)}")
@@ -61,7 +74,7 @@ class LinkedInAutomation(BaseJobAutomation):
         """Login to LinkedIn"""
         try:
             self.logger.info("Navigating to LinkedIn login page")
-            self.driver.get(f"{self.base_url}/login")
+            self.open_page(f"{self.base_url}/login")
             
             # Wait for login form
             username_field = self.wait_for_element((By.ID, "username"))
@@ -95,20 +108,94 @@ class LinkedInAutomation(BaseJobAutomation):
             return False
     
     def search_jobs(self, keywords, location=None, filters=None):
-        """Search for jobs on LinkedIn - only perform search if not already completed"""
+        """Search for jobs on LinkedIn by opening the search URL with all filters encoded,
+        falling back to typing the search and clicking the filters if that fails"""
         try:
-            # Check if we already have a search loaded and should not reload
-            if self.search_completed and "jobs/search" in self.driver.current_url:
+            filters = dict(filters or {})
+            filters['easy_apply'] = True  # Easy Apply is mandatory in our workflow
+            search_url = build_linkedin_search_url(keywords, location, filters)
+            
+            # Check if this exact search is already loaded and should not reload
+            if self.search_completed and self.current_search_url == search_url and "jobs/search" in self.driver.current_url:
                 self.logger.info("Search already completed and loaded, skipping new search")
-                # Get existing job cards from current search
                 job_cards = self._get_job_cards()
                 self.logger.info(f"Found {len(job_cards)} existing job listings")
                 return job_cards
             
             self.logger.info(f"Performing new LinkedIn job search: {keywords} in {location or 'Any location'}")
+            job_cards = self._load_search_results_page(search_url)
+            
+            if job_cards is None:
+                self.logger.warning("Search URL did not load any results, falling back to the search UI")
+                job_cards = self._search_jobs_via_ui(keywords, location, filters)
+            else:
+                self.logger.info(f"Found {len(job_cards)} job listings with Easy Apply filter")
+                self.search_completed = True
+                self.current_job_index = 0  # Reset job index for new search
+            
+            self.current_search = (keywords, location, filters)
+            self.current_search_url = search_url
+            self.current_search_page = 0
+            return job_cards
+            
+        except Exception as e:
+            self.logger.error(f"Error searching LinkedIn jobs: {str(e)}")
+            return []
+    
+    def _load_search_results_page(self, search_url, timeout=15):
+        """Open a search URL and wait for the results list
+        
+        Returns the job cards, an empty list if LinkedIn reports no matching jobs,
+        or None if the results page did not load.
+        """
+        try:
+            self.logger.info(f"Opening search URL: {search_url}")
+            self.open_page(search_url)
             
+            results_xpath = ("//li[@data-occludable-job-id] | "
+                             "//li[contains(@class, 'scaffold-layout__list-item')] | "
+                             "//*[contains(@class, 'jobs-search-no-results')]")
+            WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.find_elements(By.XPATH, results_xpath))
             
-            self.driver.get(self.jobs_url)
+            if self.driver.find_elements(By.XPATH, "//*[contains(@class, 'jobs-search-no-results')]"):
+                self.logger.info("LinkedIn reports no matching jobs for this search")
+                return []
+            
+            return self._get_job_cards()
+            
+        except TimeoutException:
+            self.logger.warning(f"Search results did not load within {timeout}s")
+            return None
+        except Exception as e:
+            self.logger.warning(f"Error loading search results page: {str(e)}")
+            return None
+    
+    def go_to_search_page(self, page):
+        """Load another results page of the current search (page is zero-based)
+        
+        Returns the job cards on that page, or an empty list when there are no more results.
+        """
+        if not self.current_search:
+            return []
+        
+        keywords, location, filters = self.current_search
+        job_cards = self._load_search_results_page(
+            build_linkedin_search_url(keywords, location, filters, page=page))
+        if not job_cards:
+            return []
+        
+        self.current_search_page = page
+        self.current_job_index = 0
+        return job_cards
+    
+    def _search_jobs_via_ui(self, keywords, location=None, filters=None):
+        """Search for jobs by typing into the LinkedIn search box and clicking the filters"""
+        try:
+            self.logger.info(f"Performing LinkedIn job search through the UI: {keywords} in {location or 'Any location'}")
+            
+            
+            self.open_page(self.jobs_url)
             self.random_delay(3, 5)  # Increased delay for page load
             self.logger.info("Navigated to jobs page successfully")
             
@@ -473,22 +560,59 @@ class LinkedInAutomation(BaseJobAutomation):
             self.logger.error(f"Error getting job cards: {str(e)}")
             return []
     
-    def extract_job_details(self, job_element):
-        """Extract detailed job information from LinkedIn job listing"""
+    def get_card_job_id(self, job_element):
+        """Read the LinkedIn job id from a job card without clicking it"""
         try:
+            for attribute in ('data-occludable-job-id', 'data-job-id'):
+                job_id = job_element.get_attribute(attribute)
+                if job_id:
+                    return job_id.strip()
+
+            try:
+                job_data_element = job_element.find_element(By.XPATH, ".//*[@data-job-id or @data-occludable-job-id]")
+                job_id = (job_data_element.get_attribute('data-job-id') or
+                          job_data_element.get_attribute('data-occludable-job-id'))
+                if job_id:
+                    return job_id.strip()
+            except NoSuchElementException:
+                pass
+
+            try:
+                link = job_element.find_element(By.XPATH, ".//a[contains(@href, '/jobs/view/') or contains(@href, 'currentJobId=')]")
+                job_id_match = re.search(r'(?:/jobs/view/|currentJobId=)(\d+)', link.get_attribute('href') or '')
+                if job_id_match:
+                    return job_id_match.group(1)
+            except NoSuchElementException:
+                pass
+
+        except StaleElementReferenceException:
+            self.logger.debug("Job card went stale while reading its job id")
+        except Exception as e:
+            self.logger.debug(f"Could not read job id from card: {str(e)}")
+
+        return None
+
+    def extract_job_details(self, job_element, _stale_retry=False):
+        """Extract detailed job information from LinkedIn job listing
+        
+        Accepts a job card element or a JobCardHandle. A stale handle is re-resolved
+        by its job id; a stale plain element is given up on rather than guessed.
+        """
+        job_element, handle = unwrap_job_card(job_element)
+        try:
+            if job_element is None:
+                self.logger.error("Job card is no longer in the results list")
+                return None
+            
             # Check if element is stale and re-find it if necessary
             try:
                 # Test if element is still attached to DOM
                 job_element.is_displayed()
             except StaleElementReferenceException:
-                self.logger.warning("Job element is stale, trying to re-find...")
-                # Try to re-find the element by refreshing the job list
-                self.random_delay(2, 3)
-                jobs = self.driver.find_elements(By.XPATH, "//main//li[contains(@class, 'ember-view')]")
-                if jobs:
-                    job_element = jobs[0]  # Use first available job element
-                else:
-                    self.logger.error("Could not re-find job elements")
+                self.logger.warning("Job element is stale, re-resolving it by job id...")
+                job_element = handle.resolve() if handle else None
+                if job_element is None:
+                    self.logger.error("Could not re-find this job card")
                     return None
             
             job_details = {
@@ -608,14 +732,9 @@ class LinkedInAutomation(BaseJobAutomation):
             
         except StaleElementReferenceException as e:
             self.logger.error(f"Stale element reference in job details extraction: {str(e)}")
-            # Try one more time with a fresh search
-            try:
-                self.random_delay(2, 3)
-                jobs = self.driver.find_elements(By.XPATH, "//main//li[contains(@class, 'ember-view')]")
-                if jobs:
-                    return self.extract_job_details(jobs[0])
-            except Exception:
-                pass
+            # Try one more time with the same job's card, looked up by its id
+            if handle and not _stale_retry and handle.resolve() is not None:
+                return self.extract_job_details(handle, _stale_retry=True)
             return None
         except Exception as e:
             self.logger.error(f"Error extracting job details: {str(e)}")
@@ -846,61 +965,64 @@ class LinkedInAutomation(BaseJobAutomation):
             self.logger.error(f"Error matching job to preferences: {str(e)}")
             return False
 
-    def process_jobs_sequentially(self, user_preferences=None, user_skills=None, user_data=None, max_applications=10):
-        """Process jobs sequentially - click each job card, extract details, and apply if suitable"""
+    def process_jobs_sequentially(self, user_preferences=None, user_skills=None, user_data=None, max_applications=10, seen_jobs=None):
+        """Process jobs sequentially - click each job card, extract details, and apply if suitable
+
+        If a SeenJobIndex is passed as seen_jobs, cards whose job id is already in the index
+        are skipped before they are clicked, and every processed job is added to it.
+        """
         try:
             applications_made = 0
-            
+            skipped_seen = 0
+            jobs_processed = 0
+            if max_applications <= 0:
+                return {'applications_made': 0, 'skipped_seen': 0, 'success': True}
+
             self.logger.info(f"[START] STARTING SEQUENTIAL JOB PROCESSING - Target: {max_applications} applications")
             
-            while applications_made < max_applications:
-                # Get current job cards
-                job_cards = self._get_job_cards()
-                
-                if not job_cards:
-                    self.logger.info("No job cards found")
-                    break
+            # The cursor yields each card of the search once, by job id, loading more
+            # cards and result pages as needed
+            cursor = JobListCursor(self)
+            for card_job_id, current_job in cursor:
+                self.current_job_index = cursor.position
                 
-                self.logger.info(f"📋 Found {len(job_cards)} job cards, currently at index {self.current_job_index}")
+                # Skip jobs already handled by an earlier search before clicking anything
+                if seen_jobs is not None and card_job_id and seen_jobs.should_skip('linkedin', card_job_id):
+                    self.logger.info(f"⏭️ Skipping job {card_job_id}: already seen")
+                    skipped_seen += 1
+                    continue
                 
-                # Check if we've processed all available jobs
-                if self.current_job_index >= len(job_cards):
-                    self.logger.info("All available jobs processed, trying to load more...")
-                    # Try to load more jobs
-                    if self.scroll_to_load_more_jobs():
-                        job_cards = self._get_job_cards()
-                        self.logger.info(f"📋 After scrolling, found {len(job_cards)} job cards")
-                    
-                    # If still no new jobs, we're done
-                    if self.current_job_index >= len(job_cards):
-                        self.logger.info(" No more jobs available")
-                        break
+                jobs_processed += 1
+                self.logger.info(f"\n🎯 PROCESSING JOB {jobs_processed} (job id {card_job_id or 'unknown'})")
                 
-                # Get current job card
-                current_job = job_cards[self.current_job_index]
-                self.logger.info(f"\n🎯 PROCESSING JOB {self.current_job_index + 1}/{len(job_cards)}")
+                # Process this specific job; the handle re-finds the card by id if the list re-renders
+                result = self.apply_to_job(JobCardHandle(self, current_job, card_job_id),
+                                           user_preferences, user_skills, user_data)
                 
-                # Process this specific job
-                result = self.apply_to_job(current_job, user_preferences, user_skills, user_data)
+                if seen_jobs is not None:
+                    processed_job_id = (result.get('job_details') or {}).get('platform_job_id') or card_job_id
+                    seen_jobs.mark_seen('linkedin', processed_job_id)
                 
                 if result['success']:
                     applications_made += 1
-                    self.logger.info(f" Successfully applied to job {self.current_job_index + 1}. Total applications: {applications_made}")
+                    self.logger.info(f" Successfully applied to job {jobs_processed}. Total applications: {applications_made}")
+                    if applications_made >= max_applications:
+                        break
                 else:
-                    self.logger.info(f"⚠️ Skipped job {self.current_job_index + 1}: {result.get('error', 'Unknown error')}")
-                
-                # Move to next job
-                self.current_job_index += 1
+                    self.logger.info(f"⚠️ Skipped job {jobs_processed}: {result.get('error', 'Unknown error')}")
                 
                 # Small delay between jobs
                 self.random_delay(2, 4)
             
-            self.logger.info(f"[COMPLETE] JOB PROCESSING COMPLETED. Total applications made: {applications_made}/{max_applications}")
-            return {'applications_made': applications_made, 'success': True}
+            if cursor.exhausted:
+                self.logger.info(" No more jobs available")
             
+            self.logger.info(f"[COMPLETE] JOB PROCESSING COMPLETED. Total applications made: {applications_made}/{max_applications}, already seen jobs skipped: {skipped_seen}")
+            return {'applications_made': applications_made, 'skipped_seen': skipped_seen, 'success': True}
+
         except Exception as e:
             self.logger.error(f" Error in sequential job processing: {str(e)}")
-            return {'success': False, 'error': str(e), 'applications_made': applications_made}
+            return {'success': False, 'error': str(e), 'applications_made': applications_made, 'skipped_seen': skipped_seen}
 
     def apply_to_job(self, job_element_or_index, user_preferences=None, user_skills=None, user_data=None):
         """Apply to a job on LinkedIn if it matches user preferences"""
@@ -909,7 +1031,8 @@ class LinkedInAutomation(BaseJobAutomation):
             self.logger.info("Starting application process for a new job")
             self.logger.info("----------------------------------------")
             
-            # Handle both job element and job index
+            # Handle job element, job card handle and job index
+            handle = None
             if isinstance(job_element_or_index, int):
                 # If we get an index, get fresh job cards and use the index
                 job_cards = self._get_job_cards()
@@ -917,20 +1040,24 @@ class LinkedInAutomation(BaseJobAutomation):
                     return {'success': False, 'error': 'Job index out of range'}
                 job_element = job_cards[job_element_or_index]
             else:
-                job_element = job_element_or_index
-            
-            # Check if element is stale and handle it
-            try:
-                job_element.is_displayed()  # Test if element is still valid
-            except StaleElementReferenceException:
-                self.logger.warning("Job element is stale, refreshing job cards...")
-                # Refresh job cards and get current job
-                job_cards = self._get_job_cards()
-                if self.current_job_index < len(job_cards):
-                    job_element = job_cards[self.current_job_index]
-                else:
+                job_element, handle = unwrap_job_card(job_element_or_index)
+                if job_element is None:
+                    return {'success': False, 'error': 'Job card is no longer in the results list'}
+            
+            if handle is None:
+                # Remember the card's job id so a re-render can be recovered without guessing
+                handle = JobCardHandle(self, job_element, self.get_card_job_id(job_element))
+            
+            # Check if element is stale and re-resolve it by job id
+            if handle.is_stale():
+                self.logger.warning("Job element is stale, re-resolving it by job id...")
+                job_element = handle.resolve()
+                if job_element is None:
                     return {'success': False, 'error': 'Could not refresh stale job element'}
             
+            # Opening a job and applying counts against the shared LinkedIn rate limit
+            self.throttle()
+            
             # First click on the job card to load its details in the right panel
             self.logger.info("Clicking on job card to load details...")
             try:
@@ -970,7 +1097,7 @@ class LinkedInAutomation(BaseJobAutomation):
             job_details = self.extract_job_details_from_panel()
             if not job_details or not job_details.get('job_title'):
                 self.logger.warning("Could not extract job details from panel, trying from card")
-                job_details = self.extract_job_details(job_element)
+                job_details = self.extract_job_details(handle)
                 
             if not job_details:
                 return {'success': False, 'error': 'Could not extract job details'}
@@ -2017,6 +2144,25 @@ class LinkedInAutomation(BaseJobAutomation):
                     
                     self.logger.info(f"Analysis: Category={question_analysis['category']}, Required={question_analysis['is_required']}")
                     
+                    # Long answers are typed while the AI is still writing them
+                    if self.ai_answerer.is_streamable(question_analysis, question.options):
+                        chunks = self.ai_answerer.stream_answer(
+                            question_text=question.question_text,
+                            user_context=user_context,
+                            question_analysis=question_analysis,
+                            options=question.options,
+                            job_context=job_context,
+                            max_chars=self.form_parser.get_max_length(question)
+                        )
+                        success, answer = self.form_parser.fill_question_answer_stream(question, chunks)
+                        if success:
+                            successful_fills += 1
+                            self.logger.info(f" AI Answer (streamed, {len(answer)} chars): '{answer[:80]}...'")
+                            self.random_delay(0.5, 1.5)
+                        else:
+                            self.logger.warning("⚠️ Failed to fill streamed answer")
+                        continue
+                    
                     # Generate AI answer
                     answer = self.ai_answerer.generate_answer(
                         question_text=question.question_text,
@@ -2052,6 +2198,12 @@ class LinkedInAutomation(BaseJobAutomation):
             self.logger.info(f"   Total questions: {total_questions}")
             self.logger.info(f"   Successfully filled: {successful_fills}")
             self.logger.info(f"   Success rate: {(successful_fills/total_questions*100):.1f}%" if total_questions > 0 else "   Success rate: N/A")
+            self.logger.info(f"   {self.answer_engine.summary()}")
+            self.logger.info(f"   AI calls avoided by reusing earlier answers: {self.ai_answerer.answer_memory.llm_calls_avoided}")
+            prompt_stats = self.ai_answerer.get_prompt_stats(job_context)
+            if prompt_stats['questions']:
+                self.logger.info(f"   Prompt tokens this application: ~{prompt_stats['tokens_after']} "
+                                 f"(~{prompt_stats['tokens_before']} with the full profile in every prompt)")
             
             return True
             
@@ -2938,103 +3090,11 @@ class LinkedInAutomation(BaseJobAutomation):
     def _determine_answer_from_question(self, question_text, user_data, user_skills):
         """Determine whether to answer yes or no to a question based on user data"""
         try:
-            question_lower = question_text.lower()
-            
-            # Education questions - improved detection
-            if any(word in question_lower for word in ['bachelor', 'degree', 'university', 'college', 'graduation', 'undergraduate', 'graduate']):
-                # Assume user has a degree (most common case)
-                self.logger.info(f" EDUCATION QUESTION: Answering YES (assuming user has degree)")
-                return True
-            
-            # Work authorization questions
-            if any(word in question_lower for word in ['authorized', 'work authorization', 'legally authorized', 'eligible to work']):
-                self.logger.info(f" WORK AUTHORIZATION: Answering YES")
-                return True  # Assume user is authorized to work
-            
-            # Visa/sponsorship questions - conservative approach
-            if any(word in question_lower for word in ['visa', 'sponsorship', 'sponsor', 'require sponsorship']):
-                self.logger.info(f" VISA SPONSORSHIP: Answering NO (conservative)")
-                return False  # Most users don't require sponsorship
-            
-            # Remote work comfort questions
-            if any(phrase in question_lower for phrase in ['remote setting', 'remote work', 'work remotely', 'work from home', 'comfortable working remotely']):
-                self.logger.info(f" REMOTE WORK: Answering YES (most people are comfortable)")
-                return True
-            
-            # On-site work comfort questions  
-            if any(phrase in question_lower for phrase in ['onsite setting', 'on-site', 'office setting', 'comfortable working onsite', 'comfortable working on-site']):
-                self.logger.info(f" ONSITE WORK: Answering YES (most people are comfortable)")
-                return True
-            
-            # Immediately start questions
-            if any(phrase in question_lower for phrase in ['start immediately', 'can you start', 'available to start', 'start urgently']):
-                self.logger.info(f" START IMMEDIATELY: Answering YES")
-                return True
-            
-            # Security clearance questions
-            if any(phrase in question_lower for phrase in ['security clearance', 'clearance', 'government clearance']):
-                self.logger.info(f" SECURITY CLEARANCE: Answering NO (uncommon)")
-                return False
-            
-            # Experience with specific technologies
-            for skill in user_skills:
-                if skill in question_lower and len(skill) > 3:  # Avoid matching short words
-                    self.logger.info(f" SKILL MATCH: Found {skill} in question - answering YES")
-                    return True
-            
-            # Programming languages and common tech terms
-            tech_terms = ['python', 'java', 'javascript', 'c++', 'c#', 'react', 'node', 'angular', 'vue', 'sql', 
-                         'html', 'css', 'git', 'docker', 'aws', 'azure', 'kubernetes', 'mongodb', 'postgresql']
-            user_skills_lower = [s.lower() for s in user_skills]
-            for term in tech_terms:
-                if term in question_lower and term in user_skills_lower:
-                    self.logger.info(f" TECH SKILL MATCH: Found {term} in question - answering YES")
-                    return True
-            
-            # Years of experience questions
-            experience_years = user_data.get('experience_years', 0)
-            if 'years' in question_lower and ('experience' in question_lower or 'worked' in question_lower):
-                # Extract number from question if possible
-                import re
-                numbers = re.findall(r'\d+', question_lower)
-                if numbers:
-                    required_years = int(numbers[0])
-                    answer = experience_years >= required_years
-                    self.logger.info(f" EXPERIENCE YEARS: User has {experience_years}, required {required_years} - answering {'YES' if answer else 'NO'}")
-                    return answer
-            
-            # Generic "Do you have" questions - be optimistic for common skills
-            if question_lower.startswith('do you have') or question_lower.startswith('have you'):
-                # If it mentions common business skills, answer yes
-                if any(term in question_lower for term in ['communication', 'teamwork', 'problem solving', 'leadership', 
-                                                           'time management', 'project management', 'analytical']):
-                    self.logger.info(f" SOFT SKILL QUESTION: Answering YES for common skill")
-                    return True
-            
-            # "Are you" questions - be positive for work-related attributes
-            if question_lower.startswith('are you'):
-                if any(term in question_lower for term in ['detail-oriented', 'self-motivated', 'team player', 
-                                                           'proactive', 'reliable', 'flexible']):
-                    self.logger.info(f" PERSONALITY TRAIT: Answering YES for positive trait")
-                    return True
-            
-            # Salary acknowledgment questions
-            if any(phrase in question_lower for phrase in ['understand and acknowledge', 'salary', 'maximum starting salary', 
-                                                           'by applying', 'acknowledge that', 'salary will be']):
-                self.logger.info(f" SALARY ACKNOWLEDGMENT: Answering YES (agreeing to salary terms)")
-                return True
-            
-            # Commuting/location comfort questions
-            if any(phrase in question_lower for phrase in ['comfortable commuting', 'commuting to', 'location', 
-                                                           'willing to commute', 'able to commute']):
-                self.logger.info(f" COMMUTING: Answering YES (comfortable with commuting)")
-                return True
-            
-            # Agreement/acceptance questions (terms, conditions, etc.)
-            if any(phrase in question_lower for phrase in ['agree', 'accept', 'confirm', 'terms and conditions', 
-                                                           'privacy policy', 'understand that']):
-                self.logger.info(f" AGREEMENT: Answering YES (accepting terms)")
-                return True
+            self._use_answer_profile(user_data, user_skills)
+            answer = self.answer_engine.answer(question_text, options=['Yes', 'No'], kind='choice')
+            if answer:
+                self.logger.info(f" PROFILE RULE: Answering {answer.upper()} to: {question_text[:50]}")
+                return answer == 'Yes'
             
             # Default to conservative "No" for unknown questions
             self.logger.info(f" UNKNOWN QUESTION: No specific match found, defaulting to NO")
@@ -3044,39 +3104,17 @@ class LinkedInAutomation(BaseJobAutomation):
             self.logger.error(f"Error determining answer: {str(e)}")
             return False
     
+    def _use_answer_profile(self, user_data, user_skills=None):
+        """Point the profile rules at this user's data"""
+        profile = profile_from_user_data(user_data)
+        if user_skills:
+            profile['skills'] = user_skills
+        self.answer_engine.use_profile(profile)
+    
     def _matches_experience_range(self, range_text, user_experience):
         """Check if user experience matches a given range like '2-4 years', '5+', etc."""
         try:
-            import re
-            range_lower = range_text.lower()
-            
-            # Handle "5+" format
-            plus_match = re.search(r'(\d+)\+', range_lower)
-            if plus_match:
-                min_years = int(plus_match.group(1))
-                return user_experience >= min_years
-            
-            # Handle "2-4" or "2 to 4" format
-            range_match = re.search(r'(\d+)[-\s]*(to|-)\s*(\d+)', range_lower)
-            if range_match:
-                min_years = int(range_match.group(1))
-                max_years = int(range_match.group(3))
-                return min_years <= user_experience <= max_years
-            
-            # Handle "less than X" format
-            less_match = re.search(r'less than (\d+)', range_lower)
-            if less_match:
-                max_years = int(less_match.group(1))
-                return user_experience < max_years
-            
-            # Handle "more than X" format
-            more_match = re.search(r'more than (\d+)', range_lower)
-            if more_match:
-                min_years = int(more_match.group(1))
-                return user_experience > min_years
-            
-            return False
-            
+            return matches_experience_range(range_text, user_experience)
         except Exception as e:
             self.logger.error(f"Error matching experience range: {str(e)}")
             return False
@@ -3084,6 +3122,8 @@ class LinkedInAutomation(BaseJobAutomation):
     def _answer_dropdown_questions(self, user_data, user_skills):
         """Handle dropdown/select questions"""
         try:
+            self._use_answer_profile(user_data, user_skills)
+            
             # Find all select elements
             dropdowns = self.driver.find_elements(By.XPATH, "//select")
             
@@ -3119,63 +3159,12 @@ class LinkedInAutomation(BaseJobAutomation):
                     select = Select(dropdown)
                     options = select.options
                     
-                    # Determine best option based on context
+                    # Determine best option based on context using the profile rules
                     selected_option = None
-                    
-                    # Education level dropdown
-                    if any(word in dropdown_context for word in ['education', 'degree', 'qualification']):
-                        education_level = user_data.get('education', {}).get('level', '').lower()
-                        for option in options:
-                            option_text = option.text.lower()
-                            if education_level and education_level in option_text:
-                                selected_option = option
-                                break
-                            elif 'bachelor' in option_text and 'bachelor' in education_level:
-                                selected_option = option
-                                break
-                    
-                    # Experience level dropdown
-                    elif any(word in dropdown_context for word in ['experience', 'years']):
-                        experience_years = user_data.get('experience_years', 0)
-                        for option in options:
-                            option_text = option.text.lower()
-                            if self._matches_experience_range(option_text, experience_years):
-                                selected_option = option
-                                break
-                    
-                    # Commuting comfort dropdown
-                    elif any(phrase in dropdown_context for phrase in ['comfortable commuting', 'commuting to', 'location', 'willing to commute']):
-                        # Look for "Yes" or positive options for commuting comfort
-                        for option in options:
-                            option_text = option.text.lower()
-                            if any(word in option_text for word in ['yes', 'comfortable', 'willing', 'able']):
-                                selected_option = option
-                                self.logger.info(f"🚗 COMMUTING DROPDOWN: Selecting positive option '{option.text}'")
-                                break
-                    
-                    # Work preferences (remote/onsite/hybrid)
-                    elif any(phrase in dropdown_context for phrase in ['work preference', 'remote work', 'work location', 'work setting']):
-                        # Prefer options that show flexibility
-                        preference_priority = ['hybrid', 'flexible', 'remote', 'onsite', 'office']
-                        for pref in preference_priority:
-                            for option in options:
-                                option_text = option.text.lower()
-                                if pref in option_text:
-                                    selected_option = option
-                                    self.logger.info(f"💼 WORK PREFERENCE DROPDOWN: Selecting '{option.text}'")
-                                    break
-                            if selected_option:
-                                break
-                    
-                    # Location dropdown
-                    elif any(word in dropdown_context for word in ['location', 'country', 'city']):
-                        user_location = user_data.get('location', '').lower()
-                        if user_location:
-                            for option in options:
-                                option_text = option.text.lower()
-                                if user_location in option_text or any(city in option_text for city in user_location.split()):
-                                    selected_option = option
-                                    break
+                    option_texts = [option.text for option in options]
+                    answer = self.answer_engine.answer(dropdown_context, options=option_texts, kind='choice')
+                    if answer:
+                        selected_option = options[option_texts.index(answer)]
                     
                     # Select the determined option
                     if selected_option and selected_option.text.strip() != "":
@@ -3253,11 +3242,20 @@ class LinkedInAutomation(BaseJobAutomation):
         self.cleanup()
     
     def scroll_to_load_more_jobs(self, max_scrolls=3):
-        """Scroll down to load more job listings"""
+        """Scroll down to load more job listings, waiting for new cards instead of sleeping
+        
+        Returns True if the job list grew.
+        """
+        grew = False
         try:
             for i in range(max_scrolls):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                self.random_delay(2, 3)
+                job_cards = self._get_job_cards()
+                if not job_cards:
+                    break
+                
+                if wait_for_list_growth(self.driver, job_cards[-1]):
+                    grew = True
+                    continue
                 
                 # Check if "Show more" button exists and click it
                 try:
@@ -3265,15 +3263,19 @@ class LinkedInAutomation(BaseJobAutomation):
                         By.XPATH, "//button[contains(@aria-label, 'See more jobs')]")
                     if show_more_button.is_displayed():
                         self.safe_click(show_more_button)
-                        self.random_delay(2, 3)
+                        if wait_for_list_growth(self.driver, job_cards[-1]):
+                            grew = True
+                            continue
                 except NoSuchElementException:
                     pass
+                
+                # The list did not grow and there is nothing left to load
+                break
                     
         except Exception as e:
             self.logger.warning(f"Error scrolling to load more jobs: {str(e)}")
-            return False
         
-        return True
+        return grew
     
     def _prepare_user_data_for_automation(self, user_preferences=None, resume_path=None):
         """Prepare user data dictionary for automation process"""
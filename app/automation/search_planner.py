@@ -0,0 +1,230 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Search Planner - Collapses title x location combinations into fewer, ordered searches
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+# Words that do not make two job titles "compatible" on their own
+TITLE_STOP_WORDS = {
+    'a', 'an', 'and', 'the', 'of', 'for', 'in', 'to', 'with', 'at', 'on',
+    'sr', 'jr', 'senior', 'junior', 'lead', 'principal', 'staff', 'associate',
+    'i', 'ii', 'iii', 'intern', 'trainee', 'entry', 'level', 'remote'
+}
+
+# Rough per-platform costs used for the plan preview (seconds)
+SEARCH_COST_SECONDS = {
+    'linkedin': 30,  # navigation, typing and filter application
+    'indeed': 20
+}
+DEFAULT_SEARCH_COST_SECONDS = 25
+
+# How each platform's search box reads "any of these titles" (start, separator, end).
+# Platforms not listed here get one title per search.
+OR_QUERY_FORMATS = {
+    'linkedin': ('', ' OR ', ''),   # "Python Developer" OR "Backend Developer"
+    'indeed': ('(', ' or ', ')'),   # ("Python Developer" or "Backend Developer"), like Indeed's advanced search
+}
+JOB_COST_SECONDS = 15  # click, extraction, matching and apply attempt per processed job
+
+
+@dataclass
+class PlannedSearch:
+    """A single search to run on a platform"""
+    titles: List[str]
+    location: str
+    keywords: str
+    expected_yield: float = 0.0
+    order: int = 0
+
+    def to_dict(self):
+        return {
+            'keywords': self.keywords,
+            'titles': list(self.titles),
+            'location': self.location,
+            'expected_yield': round(self.expected_yield, 2),
+        }
+
+
+@dataclass
+class SearchPlan:
+    """Ordered list of searches with the naive plan it replaces"""
+    platform: str
+    searches: List[PlannedSearch] = field(default_factory=list)
+    naive_search_count: int = 0
+
+    def __iter__(self):
+        return iter(self.searches)
+
+    def __len__(self):
+        return len(self.searches)
+
+    def estimated_cost_seconds(self, searches=None, jobs_per_search=0):
+        """Estimate wall time for a number of searches (all planned searches by default)"""
+        searches = len(self.searches) if searches is None else searches
+        per_search = SEARCH_COST_SECONDS.get(self.platform, DEFAULT_SEARCH_COST_SECONDS)
+        return searches * (per_search + jobs_per_search * JOB_COST_SECONDS)
+
+    def preview(self, applications_limit=None):
+        """Summarize the plan for display before a run"""
+        return {
+            'platform': self.platform,
+            'naive_searches': self.naive_search_count,
+            'planned_searches': len(self.searches),
+            'searches_saved': max(0, self.naive_search_count - len(self.searches)),
+            'estimated_search_seconds': self.estimated_cost_seconds(),
+            'naive_search_seconds': self.estimated_cost_seconds(self.naive_search_count),
+            'applications_limit': applications_limit,
+            'searches': [search.to_dict() for search in self.searches],
+        }
+
+
+class SearchPlanner:
+    """Plans searches for a platform by merging compatible titles into the platform's
+    OR query syntax and ordering the resulting searches by historical yield"""
+
+    def __init__(self, max_titles_per_query=3, max_keywords_length=100):
+        self.max_titles_per_query = max_titles_per_query
+        self.max_keywords_length = max_keywords_length
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def _title_tokens(title):
+        tokens = re.findall(r'[a-z0-9+#.]+', title.lower())
+        return {token for token in tokens if token not in TITLE_STOP_WORDS}
+
+    @staticmethod
+    def build_keywords(titles, platform='linkedin'):
+        """Build the boolean keyword query for a group of titles in the platform's syntax"""
+        if len(titles) == 1:
+            return titles[0]
+        start, separator, end = OR_QUERY_FORMATS[platform]
+        return start + separator.join(f'"{title}"' for title in titles) + end
+
+    def group_titles(self, job_titles, platform='linkedin'):
+        """Group titles that share a meaningful token (e.g. "Python Developer" and
+        "Backend Developer") so that each group can run as a single OR query on the
+        platform; every title is its own group on platforms without OR queries"""
+        max_titles = self.max_titles_per_query if platform in OR_QUERY_FORMATS else 1
+        titles = []
+        seen = set()
+        for title in job_titles or []:
+            cleaned = ' '.join(str(title).split())
+            if cleaned and cleaned.lower() not in seen:
+                seen.add(cleaned.lower())
+                titles.append(cleaned)
+
+        groups = []  # list of (titles, token set)
+        for title in titles:
+            tokens = self._title_tokens(title)
+            for group_titles, group_tokens in groups:
+                if len(group_titles) >= max_titles:
+                    continue
+                if not tokens or not (tokens & group_tokens):
+                    continue
+                if len(self.build_keywords(group_titles + [title], platform)) > self.max_keywords_length:
+                    continue
+                group_titles.append(title)
+                group_tokens.update(tokens)
+                break
+            else:
+                groups.append(([title], set(tokens)))
+
+        return [group_titles for group_titles, _ in groups]
+
+    @staticmethod
+    def _dedupe_locations(locations):
+        unique = []
+        seen = set()
+        for location in locations or []:
+            cleaned = ' '.join(str(location).split())
+            if cleaned.lower() not in seen:
+                seen.add(cleaned.lower())
+                unique.append(cleaned)
+        return unique or ['']
+
+    def plan(self, platform, job_titles, locations, history=None):
+        """Build an ordered search plan
+
+        Args:
+            platform: Platform name the plan is for
+            job_titles: Preferred job titles
+            locations: Preferred locations
+            history: Optional list of (job_title, location, status) tuples from past applications
+
+        Returns:
+            SearchPlan ordered by expected yield (highest first)
+        """
+        locations = self._dedupe_locations(locations)
+        title_groups = self.group_titles(job_titles, platform)
+        title_yield, location_yield = self._historical_yield(history or [])
+
+        searches = []
+        for group in title_groups:
+            group_score = sum(title_yield.get(title.lower(), 0) for title in group)
+            for location in locations:
+                expected = group_score + location_yield.get(location.lower(), 0)
+                searches.append(PlannedSearch(
+                    titles=group,
+                    location=location,
+                    keywords=self.build_keywords(group, platform),
+                    expected_yield=expected,
+                    order=len(searches)
+                ))
+
+        # Highest yield first; ties keep the user's preference order
+        searches.sort(key=lambda search: (-search.expected_yield, search.order))
+
+        naive_count = len([t for t in job_titles or [] if str(t).strip()]) * len(locations)
+        plan = SearchPlan(platform=platform, searches=searches, naive_search_count=naive_count)
+        self.logger.info(f"Planned {len(searches)} {platform} searches instead of {naive_count}")
+        return plan
+
+    def _historical_yield(self, history):
+        """Count past successful applications per preferred title and location"""
+        title_yield: Dict[str, float] = {}
+        location_yield: Dict[str, float] = {}
+
+        for job_title, location, status in history:
+            if status == 'error':
+                continue
+            weight = 2.0 if status in ('interview', 'hired') else 1.0
+            if job_title:
+                title_yield[job_title.lower()] = title_yield.get(job_title.lower(), 0) + weight
+            if location:
+                location_yield[location.lower()] = location_yield.get(location.lower(), 0) + weight
+
+        return title_yield, location_yield
+
+    @staticmethod
+    def match_history(history, job_titles, locations):
+        """Map raw application history onto the user's preferred titles and locations
+
+        Past applications rarely use the exact preferred title, so a posting counts
+        towards a preference when it contains all of the preference's meaningful words.
+        """
+        matched = []
+        title_tokens = {title: SearchPlanner._title_tokens(title) for title in job_titles or []}
+        for job_title, location, status in history:
+            posting_tokens = SearchPlanner._title_tokens(job_title or '')
+            posting_location = (location or '').lower()
+            matched_title: Optional[str] = None
+            for title, tokens in title_tokens.items():
+                if tokens and tokens <= posting_tokens:
+                    matched_title = title
+                    break
+            matched_location = next(
+                (loc for loc in locations or [] if loc and loc.lower() in posting_location), None)
+            if matched_title or matched_location:
+                matched.append((matched_title, matched_location, status))
+        return matched
@@ -0,0 +1,199 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Search URL builders - Encode keywords, location and filters as query parameters
+so that searches can be opened directly instead of driving the filter UI
+"""
+
+from urllib.parse import urlencode
+
+
+LINKEDIN_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+LINKEDIN_PAGE_SIZE = 25
+
+INDEED_BASE_URL = "https://www.indeed.com"
+INDEED_PAGE_SIZE = 10
+
+# Values that mean "no filter"
+ANY_VALUES = {'', 'any', 'any time', 'all', 'none'}
+
+LINKEDIN_DATE_POSTED = {
+    'past 24 hours': 'r86400', '24h': 'r86400', 'day': 'r86400',
+    'past week': 'r604800', 'week': 'r604800',
+    'past month': 'r2592000', 'month': 'r2592000'
+}
+
+LINKEDIN_EXPERIENCE_LEVEL = {
+    'internship': '1',
+    'entry': '2', 'entry level': '2',
+    'associate': '3',
+    'mid': '4', 'mid-senior': '4', 'mid-senior level': '4', 'senior': '4',
+    'director': '5',
+    'executive': '6'
+}
+
+LINKEDIN_WORK_MODE = {
+    'onsite': '1', 'on-site': '1',
+    'remote': '2',
+    'hybrid': '3'
+}
+
+LINKEDIN_JOB_TYPE = {
+    'full-time': 'F',
+    'part-time': 'P',
+    'contract': 'C', 'freelance': 'C',
+    'temporary': 'T',
+    'internship': 'I',
+    'volunteer': 'V',
+    'other': 'O'
+}
+
+LINKEDIN_SORT_BY = {
+    'most recent': 'DD', 'recent': 'DD', 'date': 'DD',
+    'most relevant': 'R', 'relevant': 'R', 'relevance': 'R'
+}
+
+INDEED_DATE_POSTED = {
+    'past 24 hours': '1', '24h': '1', 'day': '1',
+    'past 3 days': '3',
+    'past week': '7', 'week': '7',
+    'past 14 days': '14',
+    'past month': '14', 'month': '14'  # Indeed's widest "fromage" window
+}
+
+INDEED_EXPERIENCE_LEVEL = {
+    'internship': 'ENTRY_LEVEL',
+    'entry': 'ENTRY_LEVEL', 'entry level': 'ENTRY_LEVEL',
+    'associate': 'MID_LEVEL', 'mid': 'MID_LEVEL', 'mid-senior': 'MID_LEVEL',
+    'senior': 'SENIOR_LEVEL', 'director': 'SENIOR_LEVEL', 'executive': 'SENIOR_LEVEL'
+}
+
+INDEED_JOB_TYPE = {
+    'full-time': 'fulltime',
+    'part-time': 'parttime',
+    'contract': 'contract', 'freelance': 'contract',
+    'temporary': 'temporary',
+    'internship': 'internship'
+}
+
+INDEED_REMOTE_ATTRIBUTE = '0kf:attr(DSQF7);'
+
+
+def _as_list(value):
+    """Filters may hold a single value or a list of values"""
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return [v for v in value if v is not None]
+    return [value]
+
+
+def _map_values(value, mapping):
+    """Map user-facing filter values to platform codes, dropping unknown and "any" values"""
+    codes = []
+    for item in _as_list(value):
+        key = str(item).strip().lower()
+        if key in ANY_VALUES:
+            continue
+        code = mapping.get(key)
+        if code and code not in codes:
+            codes.append(code)
+    return codes
+
+
+def build_linkedin_search_url(keywords, location=None, filters=None, page=0):
+    """Build a LinkedIn job search URL
+
+    Args:
+        keywords: Search keywords (may be a boolean OR query)
+        location: Location text, omitted when empty
+        filters: Optional dict with easy_apply, date_posted, experience_level,
+            work_mode, work_type and sort_by entries
+        page: Zero-based results page, encoded as start=25*page
+
+    Returns:
+        Absolute search URL
+    """
+    filters = filters or {}
+    params = [('keywords', keywords or '')]
+
+    if location:
+        params.append(('location', location))
+
+    if filters.get('easy_apply'):
+        params.append(('f_AL', 'true'))
+
+    date_codes = _map_values(filters.get('date_posted'), LINKEDIN_DATE_POSTED)
+    if date_codes:
+        params.append(('f_TPR', date_codes[0]))
+
+    experience_codes = _map_values(filters.get('experience_level'), LINKEDIN_EXPERIENCE_LEVEL)
+    if experience_codes:
+        params.append(('f_E', ','.join(experience_codes)))
+
+    work_mode_codes = _map_values(filters.get('work_mode'), LINKEDIN_WORK_MODE)
+    if work_mode_codes:
+        params.append(('f_WT', ','.join(work_mode_codes)))
+
+    job_type_codes = _map_values(filters.get('work_type'), LINKEDIN_JOB_TYPE)
+    if job_type_codes:
+        params.append(('f_JT', ','.join(job_type_codes)))
+
+    sort_codes = _map_values(filters.get('sort_by'), LINKEDIN_SORT_BY)
+    if sort_codes:
+        params.append(('sortBy', sort_codes[0]))
+
+    if page:
+        params.append(('start', str(page * LINKEDIN_PAGE_SIZE)))
+
+    return f"{LINKEDIN_SEARCH_URL}?{urlencode(params)}"
+
+
+def build_indeed_search_url(keywords, location=None, filters=None, page=0, base_url=INDEED_BASE_URL):
+    """Build an Indeed job search URL
+
+    Args:
+        keywords: Search keywords (may be a boolean ("A" or "B") query)
+        location: Location text, omitted when empty
+        filters: Optional dict with easy_apply, date_posted, experience_level,
+            work_mode and work_type entries
+        page: Zero-based results page, encoded as start=10*page
+        base_url: Country site to search, e.g. https://in.indeed.com
+
+    Returns:
+        Absolute search URL
+    """
+    filters = filters or {}
+    params = [('q', keywords or '')]
+
+    if location:
+        params.append(('l', location))
+
+    date_codes = _map_values(filters.get('date_posted'), INDEED_DATE_POSTED)
+    if date_codes:
+        params.append(('fromage', date_codes[0]))
+
+    # Indeed accepts a single job type and experience level per search
+    job_type_codes = _map_values(filters.get('work_type'), INDEED_JOB_TYPE)
+    if job_type_codes:
+        params.append(('jt', job_type_codes[0]))
+
+    experience_codes = _map_values(filters.get('experience_level'), INDEED_EXPERIENCE_LEVEL)
+    if experience_codes:
+        params.append(('explvl', experience_codes[0]))
+
+    if 'remote' in [str(mode).strip().lower() for mode in _as_list(filters.get('work_mode'))]:
+        params.append(('sc', INDEED_REMOTE_ATTRIBUTE))
+
+    if filters.get('easy_apply'):
+        params.append(('iafilter', '1'))
+
+    if page:
+        params.append(('start', str(page * INDEED_PAGE_SIZE)))
+
+    return f"{base_url.rstrip('/')}/jobs?{urlencode(params)}"
@@ -0,0 +1,146 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Seen Job Index - Session-level de-duplication of job postings across searches
+"""
+
+import logging
+from threading import Lock
+
+
+class SeenJobIndex:
+    """Tracks job postings already handled in this session, keyed by platform and job id"""
+
+    # Origins recorded for every id in the index
+    PREVIOUSLY_APPLIED = 'previously_applied'
+    SEEN_THIS_SESSION = 'seen_this_session'
+
+    def __init__(self, applied_lookup=None):
+        """
+        Args:
+            applied_lookup: Callable (platform, job_id) -> bool asked for every id not in the index,
+                used when the index could not be seeded with the existing applications
+        """
+        self.logger = logging.getLogger(__name__)
+        self._seen = {}  # platform -> {platform_job_id: origin}
+        self._lock = Lock()
+        self.applied_lookup = applied_lookup
+        self.stats = {
+            'seeded': 0,
+            'checked': 0,
+            'skipped_previously_applied': 0,
+            'skipped_duplicates': 0
+        }
+
+    @classmethod
+    def from_applications(cls, user_id):
+        """Build an index seeded with every job the user already has a JobApplication for
+
+        If seeding fails, the index asks the database about every job it does not know instead.
+        """
+        from app.models.job_application import JobApplication
+
+        def has_applied(platform, job_id):
+            return JobApplication.query.filter_by(
+                user_id=user_id, platform=platform, platform_job_id=job_id
+            ).first() is not None
+
+        index = cls()
+        try:
+            rows = JobApplication.query.with_entities(
+                JobApplication.platform, JobApplication.platform_job_id
+            ).filter_by(user_id=user_id).all()
+
+            for platform, platform_job_id in rows:
+                index.add(platform, platform_job_id, origin=cls.PREVIOUSLY_APPLIED)
+
+            index.logger.info(f"Seen job index seeded with {index.stats['seeded']} existing applications")
+        except Exception as e:
+            index.logger.warning(f"Could not seed seen job index from applications, checking each job instead: {str(e)}")
+            index.applied_lookup = has_applied
+
+        return index
+
+    @staticmethod
+    def _normalize(platform, job_id):
+        platform = (platform or '').strip().lower()
+        job_id = str(job_id).strip() if job_id is not None else ''
+        return platform, job_id
+
+    def add(self, platform, job_id, origin=SEEN_THIS_SESSION):
+        """Record a job id; ids seeded from the database keep their original origin"""
+        platform, job_id = self._normalize(platform, job_id)
+        if not platform or not job_id:
+            return
+
+        with self._lock:
+            platform_ids = self._seen.setdefault(platform, {})
+            if job_id in platform_ids:
+                return
+            platform_ids[job_id] = origin
+            if origin == self.PREVIOUSLY_APPLIED:
+                self.stats['seeded'] += 1
+
+    def mark_seen(self, platform, job_id):
+        """Record a job that has been processed during this session"""
+        self.add(platform, job_id, origin=self.SEEN_THIS_SESSION)
+
+    def is_seen(self, platform, job_id):
+        """Return True if the job id is already in the index (no stats are recorded)"""
+        platform, job_id = self._normalize(platform, job_id)
+        with self._lock:
+            return job_id in self._seen.get(platform, {})
+
+    def should_skip(self, platform, job_id):
+        """Check a job id before doing any work on it and count the skip if it is known
+
+        Returns False for empty ids so that cards without a readable id are still processed.
+        Ids not in the index go to applied_lookup, if set; a job it cannot check is skipped.
+        """
+        platform, job_id = self._normalize(platform, job_id)
+        if not platform or not job_id:
+            return False
+
+        with self._lock:
+            origin = self._seen.get(platform, {}).get(job_id)
+        if origin is None and self.applied_lookup is not None:
+            try:
+                applied = self.applied_lookup(platform, job_id)
+            except Exception as e:
+                self.logger.warning(f"Could not check if job {job_id} was already applied to, skipping it: {str(e)}")
+                applied = True
+            if applied:
+                self.add(platform, job_id, origin=self.PREVIOUSLY_APPLIED)
+                origin = self.PREVIOUSLY_APPLIED
+
+        with self._lock:
+            self.stats['checked'] += 1
+            if origin is None:
+                return False
+
+            if origin == self.PREVIOUSLY_APPLIED:
+                self.stats['skipped_previously_applied'] += 1
+            else:
+                self.stats['skipped_duplicates'] += 1
+            return True
+
+    @property
+    def total_skipped(self):
+        return self.stats['skipped_previously_applied'] + self.stats['skipped_duplicates']
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(ids) for ids in self._seen.values())
+
+    def get_stats(self):
+        """Get a copy of the index statistics for session reporting"""
+        with self._lock:
+            stats = dict(self.stats)
+        stats['total_skipped'] = stats['skipped_previously_applied'] + stats['skipped_duplicates']
+        stats['tracked_jobs'] = len(self)
+        return stats
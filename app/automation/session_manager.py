@@ -95,6 +95,13 @@ class AutomationSessionManager:
                 'applications_made': stats.get('successful_applications', 0),
                 'total_searched': stats.get('total_searched', 0),
                 'failed_applications': stats.get('failed_applications', 0),
+                'duplicates_skipped': stats.get('duplicates_skipped', 0),
+                'stale_recoveries': stats.get('stale_recoveries', 0),
+                'questions_answered_locally': stats.get('questions_answered_locally', 0),
+                'questions_sent_to_ai': stats.get('questions_sent_to_ai', 0),
+                'ai_calls_avoided': stats.get('ai_calls_avoided', 0),
+                'ai_breaker': stats.get('ai_breaker', {}),
+                'rate_limit_waits': stats.get('rate_limit_waits', {}),
                 'errors': stats.get('errors', [])[-3:],  # Last 3 errors
                 'platforms_processed': session.get('platforms_processed', [])
             }
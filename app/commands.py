@@ -0,0 +1,32 @@
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+            
+GitHub:     https://github.com/ShakeebSk
+'''
+
+import click
+from flask import current_app
+
+from modules.history_export import export_csv_history, export_model
+from modules.history_store import get_history_store
+
+
+def init_commands(app):
+    """Initialize the application's command line commands."""
+
+    @app.cli.command('export-history')
+    @click.option('--folder', default=None, help='Export folder (default: HISTORY_EXPORT_PATH).')
+    def export_history(folder):
+        """Append new applications and history CSV rows to the Parquet export."""
+        from app.models.job_application import JobApplication
+
+        folder = folder or current_app.config['HISTORY_EXPORT_PATH']
+        exported = {'applications': export_model(folder, 'applications', JobApplication, 'application_date', 'platform')}
+        store = get_history_store(current_app.config['HISTORY_DB_PATH'], current_app.config['HISTORY_CSV_PATH'],
+                                  current_app.config['HISTORY_FAILED_CSV_PATH'])
+        if store is not None:
+            exported.update(export_csv_history(folder, store))
+        for dataset, rows in exported.items():
+            click.echo(f'{dataset}: {rows} new rows')
+        click.echo(f'Parquet history in {folder}')
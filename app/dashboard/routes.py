@@ -8,7 +8,7 @@ GitHub:     https://github.com/ShakeebSk
 
 import os
 import json
-from flask import render_template, redirect, url_for, flash, request, current_app, jsonify
+from flask import render_template, redirect, url_for, flash, request, current_app, jsonify, Response, stream_with_context, send_file, abort
 from flask_login import current_user, login_required
 from werkzeug.utils import secure_filename
 from app import db
@@ -18,6 +18,7 @@ from app.models.user import User
 from app.models.job_application import JobApplication
 from app.models.job_preferences import Resume, JobPreferences
 from app.utils.resume_handler import ResumeHandler
+from app.utils.application_export import EXPORT_FORMATS, get_export_manager, iter_application_rows, stream_csv
 from datetime import datetime, timedelta
 from sqlalchemy import func
 
@@ -123,6 +124,69 @@ def applications():
                          current_platform=platform_filter)
 
 
+@bp.route('/applications/export.csv')
+@login_required
+def export_applications_csv():
+    """Download all applications (with the page's filters) as CSV, streamed while it is read."""
+    
+    rows = iter_application_rows(current_user.id,
+                                 request.args.get('status', ''),
+                                 request.args.get('platform', ''))
+    file_name = f"applications-{datetime.now().strftime('%Y%m%d-%H%M%S')}.csv"
+    return Response(stream_with_context(stream_csv(rows)),
+                    mimetype='text/csv',
+                    headers={'Content-Disposition': f'attachment; filename="{file_name}"'})
+
+
+def get_exports():
+    """Shared background export manager of the configured export folder."""
+    return get_export_manager(current_app.config['EXPORT_FOLDER'],
+                              current_app.config['EXPORT_RETENTION_HOURS'] * 3600)
+
+
+@bp.route('/applications/export', methods=['POST'])
+@login_required
+def start_applications_export():
+    """Start a background export of applications (Excel by default) and return where to follow it."""
+    
+    data = request.get_json(silent=True) or request.form
+    export_format = data.get('format', 'xlsx')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'success': False, 'message': f'Unknown export format: {export_format}'}), 400
+    
+    export_id = get_exports().start(current_app._get_current_object(), current_user.id, export_format,
+                                    data.get('status', ''), data.get('platform', ''))
+    return jsonify({
+        'success': True,
+        'export_id': export_id,
+        'status_url': url_for('dashboard.export_status', export_id=export_id),
+        'download_url': url_for('dashboard.download_export', export_id=export_id)
+    }), 202
+
+
+@bp.route('/exports/<export_id>')
+@login_required
+def export_status(export_id):
+    """Status and row count of a background export."""
+    
+    export = get_exports().get(export_id, current_user.id)
+    if export is None:
+        return jsonify({'success': False, 'message': 'Export not found'}), 404
+    return jsonify(export)
+
+
+@bp.route('/exports/<export_id>/download')
+@login_required
+def download_export(export_id):
+    """Download a finished background export."""
+    
+    export = get_exports().get_file(export_id, current_user.id)
+    if export is None:
+        abort(404)
+    path, file_name = export
+    return send_file(os.path.abspath(path), as_attachment=True, download_name=file_name)
+
+
 @bp.route('/application/<int:id>')
 @login_required
 def application_detail(id):
@@ -620,13 +684,25 @@ def test_automation():
                 'message': 'No job preferences found. Please set up your preferences first.'
             })
         
+        # Preview the searches each enabled platform would run, with estimated cost
+        platform_priorities = automation_manager.get_platform_priorities()
+        today_apps, daily_limit = automation_manager.check_daily_limit()
+        remaining_applications = max(0, daily_limit - today_apps)
+        search_plan = {}
+        for platform_name, priority in sorted(platform_priorities.items(), key=lambda x: x[1]):
+            if priority == 0 or platform_name not in ('linkedin', 'indeed'):
+                continue
+            plan = automation_manager.get_search_plan(search_criteria, platform_name)
+            search_plan[platform_name] = plan.preview(min(5, remaining_applications))
+        
         # Return test results
         test_results = {
             'success': True,
             'message': 'Automation test completed successfully',
             'search_criteria': search_criteria,
-            'platform_priorities': automation_manager.get_platform_priorities(),
-            'daily_limit_status': automation_manager.check_daily_limit(),
+            'platform_priorities': platform_priorities,
+            'daily_limit_status': (today_apps, daily_limit),
+            'search_plan': search_plan,
             'credentials_status': {
                 'linkedin': bool(current_user.linkedin_username and current_user.linkedin_password),
                 'indeed': bool(current_user.indeed_username and current_user.indeed_password),
@@ -6,35 +6,148 @@ Uses Google Gemini API to intelligently answer application questions
 
 import os
 import json
+import hashlib
 import logging
-import requests
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterator, List, Any, Optional, Union
 from datetime import datetime
-import re
+
+from config.config import Config
+from modules.ai.llm_provider import CircuitOpenError, LLMProviderError, get_provider
+from modules.answer_rules import ProfileAnswerEngine, profile_from_user_data
+from app.utils.answer_memory import AnswerMemory
 
 logger = logging.getLogger(__name__)
 
+# Profile sections in prompt order
+PROFILE_SECTIONS = ('personal', 'professional', 'preferences', 'online')
+
+# Sections each question category needs in compact mode; other categories get the whole profile
+COMPACT_PROFILE_SECTIONS = {
+    'yes_no': ('professional', 'preferences'),
+    'experience': ('professional',),
+    'salary': ('professional', 'preferences'),
+    'availability': ('preferences',),
+    'location': ('personal', 'preferences'),
+    'education': ('professional',),
+    'skills': ('professional',)
+}
+
+# Profile values that say nothing; compact prompts leave those fields out
+EMPTY_VALUES = ('', 'Not specified', 'None')
+
+# Per-category instructions, sent after the shared prompt prefix
+CATEGORY_INSTRUCTIONS = {
+    'yes_no': """Answer this yes/no question appropriately.
+
+Instructions:
+- Answer with just "Yes" or "No" (or select the appropriate option if multiple choice)
+- Base your answer on the user's profile information
+- Be consistent with typical job application expectations
+- If work authorization is asked, answer "Yes" unless specified otherwise
+- If willing to relocate is asked, consider the user's preferences""",
+    'experience': """Provide the user's years of experience.
+
+Instructions:
+- Provide the number of years from the user's profile
+- If not specified, estimate based on their background
+- Give just the number (e.g., "3" or "5")
+- Round to the nearest whole number""",
+    'salary': """Provide the user's salary expectation.
+
+Instructions:
+- If user has specified salary expectation, use that
+- Otherwise, provide a reasonable range based on role and experience
+- Keep it professional and market-appropriate
+- Use format like "80000-90000" or "Negotiable" or "Market Rate\"""",
+    'availability': """Answer the availability question.
+
+Instructions:
+- Use the user's specified availability
+- If not specified, use "Immediately" or "2 weeks notice" as appropriate
+- Be professional and realistic""",
+    'cover_letter': """Write a professional response to this application question.
+
+Instructions:
+- Write 2-4 sentences maximum
+- Highlight relevant skills and experience from the user's profile
+- Show enthusiasm for the role and company
+- Be professional but personable
+- Connect user's background to the job requirements
+- Keep it concise and impactful""",
+    'general': """Answer this job application question professionally.
+
+Instructions:
+- Use information from the user's profile when relevant
+- Keep answers concise and professional
+- If it's a multiple choice question, select the most appropriate option
+- If it's a text question, provide a brief but complete answer
+- Be honest and accurate based on the user's background"""
+}
+
+
+# Looser similarity accepted for reusing an earlier answer on the same subject while the circuit breaker is open
+OUTAGE_REUSE_THRESHOLD = 0.6
+
+# Free text answers long enough to be worth typing while they are generated
+STREAMED_CATEGORIES = ('cover_letter',)
+STREAMED_TYPES = ('textarea',)
+
+
+class ReplacementText(str):
+    """Chunk of a streamed answer that replaces every chunk yielded before it (e.g. the fallback after a failed stream)"""
+    replaces = True
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token) for prompt size reporting"""
+    return (len(text) + 3) // 4
+
+
 class AIQuestionAnswerer:
     """
     AI-powered service to answer job application questions using Google Gemini API
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, answer_engine: ProfileAnswerEngine = None,
+                 answer_memory: AnswerMemory = None):
         """
         Initialize the AI Question Answerer
         
         Args:
             api_key: Google Gemini API key
+            answer_engine: Rule engine answering profile questions without the API (shared with the bot)
+            answer_memory: Similarity index reusing earlier AI answers for reworded questions
         """
         self.api_key = api_key or os.getenv('GOOGLE_GEMINI_API_KEY')
         if not self.api_key:
             raise ValueError("Google Gemini API key is required")
         
-        self.base_url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json'
-        })
+        self.model = "gemini-1.5-flash"
+        self.provider = get_provider(
+            'gemini',
+            api_key=self.api_key,
+            model=self.model,
+            base_url=Config.GEMINI_API_BASE_URL,
+            timeout=Config.AI_REQUEST_TIMEOUT,
+            max_retries=Config.AI_MAX_RETRIES,
+            max_concurrency=Config.AI_MAX_CONCURRENT_REQUESTS,
+            slow_call=Config.AI_SLOW_CALL_SECONDS or None,
+            breaker_cooldown=Config.AI_BREAKER_COOLDOWN,
+            hedge=Config.AI_HEDGE_REQUESTS
+        )
+        
+        self.answer_engine = answer_engine or ProfileAnswerEngine()
+        self.answer_memory = answer_memory or AnswerMemory(threshold=Config.AI_ANSWER_REUSE_THRESHOLD)
+        
+        # Session caches for the rendered prompt parts
+        self.compact_profile = Config.AI_COMPACT_PROFILE
+        self._context_key = None
+        self._user_context = ""
+        self._profile_sections = {}
+        self._profile_texts = {}
+        self._job_contexts = {}
+        self._prompt_prefixes = {}
+        self._applications = {}  # job key -> prompt token counts, in application order
         
         logger.info(" AI Question Answerer initialized with Google Gemini")
     
@@ -42,6 +155,9 @@ class AIQuestionAnswerer:
         """
         Prepare user context from database data for AI processing
         
+        The rendered context is cached for the session and only rebuilt when the
+        user data (or the month shown as the current date) changes.
+        
         Args:
             user_data: Dictionary containing user information
             
@@ -49,6 +165,20 @@ class AIQuestionAnswerer:
             Formatted context string for AI
         """
         try:
+            context_key = (
+                hashlib.sha1(json.dumps(user_data, sort_keys=True, default=str).encode()).hexdigest(),
+                datetime.now().strftime('%B %Y')
+            )
+            if context_key == self._context_key:
+                return self._user_context
+            
+            # Questions about profile facts are answered from the same data without the API
+            profile = profile_from_user_data(user_data)
+            self.answer_engine.use_profile(profile)
+            # Reused answers are only valid for the profile they were generated from
+            self.answer_memory.use_profile(
+                hashlib.sha1(json.dumps(profile, sort_keys=True, default=str).encode()).hexdigest())
+            
             # Extract key information
             personal_info = {
                 'name': user_data.get('full_name', ''),
@@ -72,47 +202,122 @@ class AIQuestionAnswerer:
                 'github_url': user_data.get('github_url', '')
             }
             
-            # Build context string
-            context = f"""
-USER PROFILE INFORMATION:
-===========================
-
-Personal Details:
+            # Rendered once per section, so compact prompts can pick only the sections a question needs
+            self._profile_sections = {
+                'personal': f"""Personal Details:
 - Full Name: {personal_info['name']}
 - Email: {personal_info['email']}
 - Phone: {personal_info['phone']}
-- Location: {personal_info['city']}
-
-Professional Background:
+- Location: {personal_info['city']}""",
+                'professional': f"""Professional Background:
 - Years of Experience: {personal_info['experience_years']}
 - Current Role: {personal_info['current_role']}
 - Education: {personal_info['education']}
 - Skills: {', '.join(personal_info['skills']) if personal_info['skills'] else 'Not specified'}
 - Previous Companies: {', '.join(personal_info['previous_companies']) if personal_info['previous_companies'] else 'Not specified'}
 - Certifications: {', '.join(personal_info['certifications']) if personal_info['certifications'] else 'None'}
-- Languages: {', '.join(personal_info['languages']) if personal_info['languages'] else 'English'}
-
-Availability & Preferences:
+- Languages: {', '.join(personal_info['languages']) if personal_info['languages'] else 'English'}""",
+                'preferences': f"""Availability & Preferences:
 - Availability: {personal_info['availability']}
 - Salary Expectation: {personal_info['salary_expectation']}
 - Work Authorization: {personal_info['work_authorization']}
 - Willing to Relocate: {personal_info['willing_to_relocate']}
-- Preferred Work Type: {personal_info['preferred_work_type']}
-
-Online Presence:
+- Preferred Work Type: {personal_info['preferred_work_type']}""",
+                'online': f"""Online Presence:
 - LinkedIn: {personal_info['linkedin_url']}
 - Portfolio: {personal_info['portfolio_url']}
-- GitHub: {personal_info['github_url']}
-
-CURRENT DATE: {datetime.now().strftime('%B %Y')}
-"""
+- GitHub: {personal_info['github_url']}"""
+            }
+            self._context_key = context_key
+            self._profile_texts.clear()
+            self._prompt_prefixes.clear()
+            self._user_context = self._render_profile(PROFILE_SECTIONS)
             
-            return context.strip()
+            return self._user_context
             
         except Exception as e:
             logger.error(f"Error preparing user context: {str(e)}")
             return "User information not available"
     
+    def _render_profile(self, sections, drop_empty: bool = False) -> str:
+        """Render the chosen profile sections (in their fixed order) followed by the current date"""
+        body = "\n\n".join(self._profile_sections[name] for name in PROFILE_SECTIONS if name in sections)
+        if drop_empty:
+            body = "\n".join(line for line in body.split("\n")
+                             if not line.startswith("- ") or line.split(":", 1)[-1].strip() not in EMPTY_VALUES)
+        return f"""USER PROFILE INFORMATION:
+===========================
+
+{body}
+
+CURRENT DATE: {self._context_key[1]}"""
+    
+    def _profile_text(self, category: str) -> str:
+        """Full profile, or in compact mode only the filled-in fields of the sections the question category needs"""
+        if not self.compact_profile:
+            return self._user_context
+        sections = COMPACT_PROFILE_SECTIONS.get(category, PROFILE_SECTIONS)
+        text = self._profile_texts.get(sections)
+        if text is None:
+            text = self._profile_texts[sections] = self._render_profile(sections, drop_empty=True)
+        return text
+    
+    def _job_context_text(self, job_context: Dict[str, Any] = None) -> str:
+        """Job context block, rendered once per job"""
+        if not job_context:
+            return ""
+        key = self._job_key(job_context)
+        text = self._job_contexts.get(key)
+        if text is None:
+            if len(self._job_contexts) >= 256:
+                self._job_contexts.clear()
+            text = self._job_contexts[key] = f"""JOB CONTEXT:
+- Position: {job_context.get('job_title', 'Not specified')}
+- Company: {job_context.get('company_name', 'Not specified')}
+- Location: {job_context.get('location', 'Not specified')}"""
+        return text
+    
+    @staticmethod
+    def _job_key(job_context: Dict[str, Any] = None) -> tuple:
+        job_context = job_context or {}
+        return (job_context.get('job_title'), job_context.get('company_name'), job_context.get('location'))
+    
+    def build_prompt(self, question_text: str, user_context: str, question_analysis: Dict[str, Any],
+                     options: List[str] = None, job_context: Dict[str, Any] = None) -> List[Dict[str, str]]:
+        """
+        Build the prompt as a stable prefix (profile and job context) and a short question suffix
+        
+        The prefix is identical for every question of the same job and category, so providers
+        with prompt caching can reuse it; locally it is rendered once and kept.
+        
+        Args:
+            question_text: The question to answer
+            user_context: Context from prepare_user_context (any other string is sent as given)
+            question_analysis: Analysis of question type and category
+            options: Available options for select/radio questions
+            job_context: Job-specific context (title, company, description)
+            
+        Returns:
+            Messages with the prefix as the system message and the question as the user message
+        """
+        category = question_analysis.get('category', 'general')
+        profile_text = self._profile_text(category) if user_context == self._user_context else user_context
+        job_text = self._job_context_text(job_context)
+        
+        prefix_key = (profile_text, job_text)
+        prefix = self._prompt_prefixes.get(prefix_key)
+        if prefix is None:
+            if len(self._prompt_prefixes) >= 256:
+                self._prompt_prefixes.clear()
+            prefix = self._prompt_prefixes[prefix_key] = "\n\n".join(
+                part for part in (profile_text, job_text) if part)
+        
+        instructions = CATEGORY_INSTRUCTIONS.get(category, CATEGORY_INSTRUCTIONS['general'])
+        options_text = f"\nAvailable Options: {', '.join(options)}" if options and category != 'cover_letter' else ""
+        question = f"{instructions}\n\nQuestion: {question_text}{options_text}\n\nAnswer:"
+        
+        return [{'role': 'system', 'content': prefix}, {'role': 'user', 'content': question}]
+    
     def analyze_question_type(self, question_text: str, element_type: str = None) -> Dict[str, Any]:
         """
         Analyze the type of question and determine the appropriate response format
@@ -125,87 +330,17 @@ CURRENT DATE: {datetime.now().strftime('%B %Y')}
             Dictionary containing question analysis
         """
         try:
-            question_lower = question_text.lower().strip()
-            
-            # Common question patterns
-            patterns = {
-                'yes_no': [
-                    r'\b(are you|do you|have you|can you|will you|would you)\b.*\?',
-                    r'\b(yes|no)\b.*\?',
-                    r'\b(authorized to work|work authorization)\b',
-                    r'\b(willing to relocate|relocate)\b',
-                    r'\b(background check|drug test)\b'
-                ],
-                'experience': [
-                    r'\b(years of experience|experience.*years)\b',
-                    r'\bhow many years\b',
-                    r'\byears.*working\b',
-                    r'\bexperience.*level\b'
-                ],
-                'availability': [
-                    r'\b(when can you start|start date|availability)\b',
-                    r'\b(available to start|notice period)\b'
-                ],
-                'salary': [
-                    r'\b(salary|compensation|pay|wage)\b.*\b(expectation|requirement|range)\b',
-                    r'\b(expected salary|salary range)\b'
-                ],
-                'location': [
-                    r'\b(current location|where.*located|city|state)\b',
-                    r'\b(address|zip code|postal code)\b'
-                ],
-                'education': [
-                    r'\b(degree|education|university|college|school)\b',
-                    r'\b(graduation|graduated|gpa)\b'
-                ],
-                'cover_letter': [
-                    r'\b(cover letter|why.*interested|why.*apply)\b',
-                    r'\b(tell us about yourself|describe yourself)\b',
-                    r'\b(motivation|interest.*position)\b'
-                ],
-                'skills': [
-                    r'\b(skills|proficiency|expertise|technologies)\b',
-                    r'\b(programming languages|software|tools)\b'
-                ]
-            }
-            
-            question_type = 'text'  # Default
-            category = 'general'
-            
-            # Determine question category
-            for cat, pattern_list in patterns.items():
-                for pattern in pattern_list:
-                    if re.search(pattern, question_lower):
-                        category = cat
-                        break
-                if category != 'general':
-                    break
-            
-            # Determine input type based on element or content
-            if element_type:
-                if element_type.lower() in ['select', 'dropdown']:
-                    question_type = 'select'
-                elif element_type.lower() in ['radio']:
-                    question_type = 'radio'
-                elif element_type.lower() in ['checkbox']:
-                    question_type = 'checkbox'
-                elif element_type.lower() in ['textarea']:
-                    question_type = 'textarea'
-            
-            # Override based on content analysis
-            if any(word in question_lower for word in ['select', 'choose', 'pick']):
-                question_type = 'select'
-            elif '?' in question_text and len(question_text.split()) < 15:
-                question_type = 'short_text'
-            elif any(word in question_lower for word in ['explain', 'describe', 'tell', 'why', 'how']):
-                question_type = 'textarea'
+            # One pass over the precompiled classifier (category, input type and answer hint)
+            question_class = self.answer_engine.classify(question_text, element_type)
             
             return {
-                'type': question_type,
-                'category': category,
-                'is_required': '*' in question_text or 'required' in question_lower,
-                'is_yes_no': category == 'yes_no',
-                'needs_detailed_response': question_type in ['textarea', 'cover_letter']
+                'type': question_class.input_type,
+                'category': question_class.category,
+                'kind': question_class.kind,
+                'answer_hint': question_class.hint,
+                'is_required': question_class.is_required,
+                'is_yes_no': question_class.is_yes_no,
+                'needs_detailed_response': question_class.needs_detailed_response
             }
             
         except Exception as e:
@@ -234,134 +369,37 @@ CURRENT DATE: {datetime.now().strftime('%B %Y')}
             Generated answer
         """
         try:
-            # Build job context
-            job_info = ""
-            if job_context:
-                job_info = f"""
-JOB CONTEXT:
-- Position: {job_context.get('job_title', 'Not specified')}
-- Company: {job_context.get('company_name', 'Not specified')}
-- Location: {job_context.get('location', 'Not specified')}
-"""
+            # Deterministic fast path: profile facts and option choices need no API call
+            kind = self._answer_kind(question_analysis, options)
+            local_answer = self.answer_engine.answer(question_text, options=options, kind=kind)
+            if local_answer:
+                logger.info(f" Answered from profile: {question_text[:50]}...")
+                return local_answer
             
-            # Build options context
-            options_text = ""
-            if options:
-                options_text = f"Available Options: {', '.join(options)}"
+            # Same question asked before in other words: reuse that answer
+            reusable = self.answer_memory.is_reusable(kind, question_analysis.get('category'), question_text)
+            if reusable:
+                reused_answer = self.answer_memory.lookup(question_text, options=options, kind=kind)
+                if reused_answer:
+                    return reused_answer
+            
+            messages = self.build_prompt(question_text, user_context, question_analysis, options, job_context)
+            self._record_prompt(job_context, messages, user_context)
             
-            # Create specialized prompts based on question type
-            if question_analysis['category'] == 'yes_no':
-                prompt = f"""
-Based on the user's profile, answer this yes/no question appropriately:
-
-{user_context}
-{job_info}
-
-Question: {question_text}
-{options_text}
-
-Instructions:
-- Answer with just "Yes" or "No" (or select the appropriate option if multiple choice)
-- Base your answer on the user's profile information
-- Be consistent with typical job application expectations
-- If work authorization is asked, answer "Yes" unless specified otherwise
-- If willing to relocate is asked, consider the user's preferences
-
-Answer:"""
-
-            elif question_analysis['category'] == 'experience':
-                prompt = f"""
-Based on the user's profile, provide their years of experience:
-
-{user_context}
-{job_info}
-
-Question: {question_text}
-{options_text}
-
-Instructions:
-- Provide the number of years from the user's profile
-- If not specified, estimate based on their background
-- Give just the number (e.g., "3" or "5")
-- Round to the nearest whole number
-
-Answer:"""
-
-            elif question_analysis['category'] == 'salary':
-                prompt = f"""
-Based on the user's profile and job context, provide salary expectation:
-
-{user_context}
-{job_info}
-
-Question: {question_text}
-{options_text}
-
-Instructions:
-- If user has specified salary expectation, use that
-- Otherwise, provide a reasonable range based on role and experience
-- Keep it professional and market-appropriate
-- Use format like "80000-90000" or "Negotiable" or "Market Rate"
-
-Answer:"""
-
-            elif question_analysis['category'] == 'availability':
-                prompt = f"""
-Based on the user's profile, answer the availability question:
-
-{user_context}
-{job_info}
-
-Question: {question_text}
-{options_text}
-
-Instructions:
-- Use the user's specified availability
-- If not specified, use "Immediately" or "2 weeks notice" as appropriate
-- Be professional and realistic
-
-Answer:"""
-
-            elif question_analysis['category'] == 'cover_letter':
-                prompt = f"""
-Write a professional response to this application question:
-
-{user_context}
-{job_info}
-
-Question: {question_text}
-
-Instructions:
-- Write 2-4 sentences maximum
-- Highlight relevant skills and experience from the user's profile
-- Show enthusiasm for the role and company
-- Be professional but personable
-- Connect user's background to the job requirements
-- Keep it concise and impactful
-
-Answer:"""
-
-            else:  # General questions
-                prompt = f"""
-Answer this job application question professionally based on the user's profile:
-
-{user_context}
-{job_info}
-
-Question: {question_text}
-{options_text}
-
-Instructions:
-- Use information from the user's profile when relevant
-- Keep answers concise and professional
-- If it's a multiple choice question, select the most appropriate option
-- If it's a text question, provide a brief but complete answer
-- Be honest and accurate based on the user's background
-
-Answer:"""
-
             # Call Google Gemini API
-            response = self._call_gemini_api(prompt)
+            self.answer_engine.note_llm_call()
+            try:
+                response = self._call_gemini_api(messages, raise_paused=True)
+            except CircuitOpenError as e:
+                # API paused by the circuit breaker: a close earlier answer on the same subject beats a generic one
+                logger.info(f"Gemini API paused: {str(e)}")
+                if reusable:
+                    reused_answer = self.answer_memory.lookup(
+                        question_text, options=options, kind=kind,
+                        threshold=OUTAGE_REUSE_THRESHOLD, same_subject=True)
+                    if reused_answer:
+                        return reused_answer
+                response = None
             
             if response:
                 # Clean and format the response
@@ -373,6 +411,8 @@ Answer:"""
                     answer_lower = answer.lower()
                     for option in options:
                         if option.lower() in answer_lower or answer_lower in option.lower():
+                            if reusable:
+                                self.answer_memory.add(question_text, option, kind=kind, options=options)
                             return option
                 
                 # Limit length for different input types
@@ -381,6 +421,9 @@ Answer:"""
                 elif question_analysis['type'] != 'textarea':
                     answer = answer[:200]  # Limit other responses
                 
+                if reusable:
+                    self.answer_memory.add(question_text, answer, kind=kind, options=options)
+                
                 logger.info(f" Generated answer for question: {question_text[:50]}...")
                 return answer
             else:
@@ -391,64 +434,211 @@ Answer:"""
             logger.error(f"Error generating answer: {str(e)}")
             return self._get_fallback_answer(question_analysis, options)
     
-    def _call_gemini_api(self, prompt: str) -> Optional[str]:
+    def is_streamable(self, question_analysis: Dict[str, Any], options: List[str] = None) -> bool:
+        """Long free text answers (cover letters, text areas) are streamed; short and choice answers are not"""
+        if options or not Config.AI_STREAM_LONG_ANSWERS:
+            return False
+        return (question_analysis.get('category') in STREAMED_CATEGORIES or
+                question_analysis.get('type') in STREAMED_TYPES)
+    
+    def stream_answer(self, question_text: str, user_context: str, question_analysis: Dict[str, Any],
+                      options: List[str] = None, job_context: Dict[str, Any] = None,
+                      max_chars: int = None) -> Iterator[str]:
+        """
+        Generate an answer as a stream of text chunks, so long answers can be typed while the AI writes them
+        
+        Questions that are not streamable (see is_streamable), answered from the profile or reused
+        yield the complete answer of generate_answer as a single chunk. Closing the generator
+        cancels the generation. If the stream fails, the answer falls back like generate_answer;
+        when text was already yielded, the fallback comes as a ReplacementText chunk.
+        
+        Args:
+            question_text: The question to answer
+            user_context: User's background information
+            question_analysis: Analysis of question type and category
+            options: Available options for select/radio questions
+            job_context: Job-specific context (title, company, description)
+            max_chars: Length cap of the whole answer (default: Config.AI_LONG_ANSWER_MAX_CHARS)
+            
+        Yields:
+            Text chunks of the answer
+        """
+        max_chars = max_chars or Config.AI_LONG_ANSWER_MAX_CHARS
+        if not self.is_streamable(question_analysis, options):
+            yield self.generate_answer(question_text, user_context, question_analysis, options, job_context)[:max_chars]
+            return
+        
+        kind = self._answer_kind(question_analysis, options)
+        local_answer = self.answer_engine.answer(question_text, options=options, kind=kind)
+        if local_answer:
+            logger.info(f" Answered from profile: {question_text[:50]}...")
+            yield local_answer[:max_chars]
+            return
+        
+        # Same question asked before in other words: reuse that answer
+        reusable = self.answer_memory.is_reusable(kind, question_analysis.get('category'), question_text)
+        if reusable:
+            reused_answer = self.answer_memory.lookup(question_text, options=options, kind=kind)
+            if reused_answer:
+                yield reused_answer[:max_chars]
+                return
+        
+        messages = self.build_prompt(question_text, user_context, question_analysis, options, job_context)
+        self._record_prompt(job_context, messages, user_context)
+        self.answer_engine.note_llm_call()
+        
+        stream = self.provider.stream(
+            messages,
+            max_chars=max_chars,
+            extra={'generationConfig': {
+                'temperature': 0.7,
+                'topK': 40,
+                'topP': 0.95,
+                'maxOutputTokens': max(200, min(1024, max_chars // 3))
+            }}
+        )
+        failed = False
+        paused = False
+        try:
+            at_start = True
+            for chunk in stream:
+                if at_start:
+                    chunk = chunk.lstrip()
+                    at_start = not chunk
+                if chunk:
+                    yield chunk
+        except CircuitOpenError as e:
+            logger.info(f"Gemini API paused: {str(e)}")
+            failed = paused = True
+        except LLMProviderError as e:
+            logger.error(f"Gemini API streaming error: {str(e)}")
+            failed = True
+        except Exception as e:
+            logger.error(f"Error streaming answer: {str(e)}")
+            failed = True
+        finally:
+            # Also reached when the caller closes the generator: stop the generation
+            stream.cancel()
+        
+        answer = stream.text.strip()
+        if answer and not failed:
+            if reusable and not stream.truncated:
+                self.answer_memory.add(question_text, answer, kind=kind, options=options)
+            logger.info(f" Streamed answer ({len(stream.text)} chars{', capped' if stream.truncated else ''}) "
+                        f"for question: {question_text[:50]}...")
+            return
+        
+        # A stream cut short is a failed answer: replace what was typed, as generate_answer would answer
+        fallback = None
+        if paused and reusable:
+            fallback = self.answer_memory.lookup(question_text, options=options, kind=kind,
+                                                 threshold=OUTAGE_REUSE_THRESHOLD, same_subject=True)
+        if not fallback:
+            logger.warning("Failed to stream a response from AI, using fallback")
+            fallback = self._get_fallback_answer(question_analysis, options)
+        fallback = fallback[:max_chars]
+        yield ReplacementText(fallback) if answer else fallback
+    
+    @staticmethod
+    def _answer_kind(question_analysis: Dict[str, Any], options: List[str] = None) -> str:
+        """Map a question analysis to the question kind used by the answer rules"""
+        if options:
+            return 'choice'
+        if question_analysis.get('kind'):
+            return question_analysis['kind']
+        if question_analysis.get('type') in ['select', 'radio', 'checkbox'] or question_analysis.get('is_yes_no'):
+            return 'choice'
+        if question_analysis.get('type') == 'textarea':
+            return 'textarea'
+        return 'text'
+    
+    def get_answer_stats(self) -> Dict[str, Any]:
+        """Share of questions answered from the profile, reused from earlier answers or sent to the API"""
+        stats = self.answer_engine.get_stats()
+        stats['reuse'] = self.answer_memory.get_stats()
+        stats['llm_calls_avoided'] = stats['answered_locally'] + stats['reuse']['llm_calls_avoided']
+        return stats
+    
+    def _record_prompt(self, job_context: Dict[str, Any], messages: List[Dict[str, str]], user_context: str):
+        """Count the tokens sent for an application, next to what the single full-profile prompt used to send"""
+        key = self._job_key(job_context)
+        record = self._applications.get(key)
+        if record is None:
+            if len(self._applications) >= 100:
+                self._applications.pop(next(iter(self._applications)))
+            record = self._applications[key] = {
+                'job': job_context.get('job_title', '') if job_context else '',
+                'questions': 0, 'prompt_tokens': 0, 'full_prompt_tokens': 0, 'prefix_tokens': 0
+            }
+        
+        prefix, question = messages[0]['content'], messages[1]['content']
+        # The same prompt with the full profile rendered in, as every question used to be sent
+        full_prompt = "\n\n".join(part for part in (user_context, self._job_context_text(job_context), question) if part)
+        record['questions'] += 1
+        record['prompt_tokens'] += estimate_tokens(prefix + "\n\n" + question)
+        record['full_prompt_tokens'] += estimate_tokens(full_prompt)
+        record['prefix_tokens'] += estimate_tokens(prefix)
+    
+    def get_prompt_stats(self, job_context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Prompt tokens sent per application, before (full profile in every prompt) and after compaction
+        
+        Args:
+            job_context: Only report this application
+            
+        Returns:
+            Dictionary of token counts; estimates, about four characters per token
+        """
+        records = list(self._applications.values())
+        if job_context is not None:
+            record = self._applications.get(self._job_key(job_context))
+            records = [record] if record else []
+        
+        applications = len(records)
+        before = sum(record['full_prompt_tokens'] for record in records)
+        after = sum(record['prompt_tokens'] for record in records)
+        return {
+            'applications': applications,
+            'questions': sum(record['questions'] for record in records),
+            'tokens_before': before,
+            'tokens_after': after,
+            'tokens_per_application_before': round(before / applications) if applications else 0,
+            'tokens_per_application_after': round(after / applications) if applications else 0,
+            'prefix_tokens': sum(record['prefix_tokens'] for record in records),
+            'reduction': round(1 - after / before, 3) if before else 0.0,
+            'provider_cached_tokens': self.provider.metrics.cached_tokens
+        }
+    
+    def _call_gemini_api(self, prompt: Union[str, List[Dict[str, str]]], raise_paused: bool = False) -> Optional[str]:
         """
         Call Google Gemini API with the given prompt
         
         Args:
-            prompt: The prompt to send to the API
+            prompt: The prompt, or messages whose system message is sent as the system instruction
+            raise_paused: Raise CircuitOpenError when the circuit breaker is open, instead of returning None
             
         Returns:
             Generated response text or None if failed
         """
         try:
-            url = f"{self.base_url}?key={self.api_key}"
+            # Retries, timeouts and safety settings are handled by the shared provider
+            response = self.provider.complete(
+                prompt,
+                extra={'generationConfig': {
+                    'temperature': 0.7,
+                    'topK': 40,
+                    'topP': 0.95,
+                    'maxOutputTokens': 200
+                }}
+            )
+            return response.text
             
-            payload = {
-                "contents": [
-                    {
-                        "parts": [
-                            {
-                                "text": prompt
-                            }
-                        ]
-                    }
-                ],
-                "generationConfig": {
-                    "temperature": 0.7,
-                    "topK": 40,
-                    "topP": 0.95,
-                    "maxOutputTokens": 200,
-                    "stopSequences": []
-                },
-                "safetySettings": [
-                    {
-                        "category": "HARM_CATEGORY_HARASSMENT",
-                        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-                    },
-                    {
-                        "category": "HARM_CATEGORY_HATE_SPEECH",
-                        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-                    }
-                ]
-            }
-            
-            response = self.session.post(url, json=payload, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'candidates' in data and len(data['candidates']) > 0:
-                    if 'content' in data['candidates'][0]:
-                        parts = data['candidates'][0]['content'].get('parts', [])
-                        if parts and 'text' in parts[0]:
-                            return parts[0]['text']
-            else:
-                logger.error(f"Gemini API error: {response.status_code} - {response.text}")
-                
-        except requests.exceptions.Timeout:
-            logger.error("Gemini API timeout")
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Gemini API request error: {str(e)}")
+        except CircuitOpenError as e:
+            if raise_paused:
+                raise
+            logger.info(f"Gemini API paused: {str(e)}")
+        except LLMProviderError as e:
+            logger.error(f"Gemini API error: {str(e)}")
         except Exception as e:
             logger.error(f"Gemini API call error: {str(e)}")
         
@@ -0,0 +1,245 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Answer Memory - Reuses AI answers for questions phrased differently across application forms
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from modules.answer_rules import match_option
+
+# Words that carry no meaning about what a form question asks for
+STOP_WORDS = frozenset("""
+a an and are as at be by can could did do does for from have has how i if in into is it its many
+me much my of on or our please provide select share tell than that the this to total us was we
+were what when which will with would you your yourself
+""".split())
+
+# Motivation and company questions: the answer names one employer or role, so it never fits another job
+JOB_SPECIFIC_QUESTION = re.compile(
+    r"\b(why|work here|join (us|our)|about us|this (company|organi[sz]ation|employer|role|position|job|team|opportunity)"
+    r"|our (company|team|mission|product|values)|interest(ed)? in (the|this|our) )")
+
+
+class AnswerMemory:
+    """
+    TF-IDF cosine similarity index over questions already answered by the AI.
+    A new question close enough to a stored one reuses its answer (mapped onto the new
+    question's options) instead of calling the API again.
+    """
+
+    # Job specific answers (cover letters, motivation, the company) must never be copied to another job
+    REUSABLE_KINDS = ('text', 'choice')
+    NON_REUSABLE_CATEGORIES = ('cover_letter',)
+
+    def __init__(self, threshold: float = 0.85, max_entries: int = 500):
+        """
+        Args:
+            threshold: Minimum cosine similarity for a stored answer to be reused
+            max_entries: Oldest questions are dropped beyond this many
+        """
+        self.logger = logging.getLogger(__name__)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries = []  # [{'question', 'terms', 'answer', 'kind', 'options'}]
+        self._exact = {}  # (normalized question, kind) -> entry
+        self._matrix = None  # L2-normalized TF-IDF rows, rebuilt lazily after changes
+        self._vocabulary = {}
+        self._idf = None
+        self._profile_key = None
+        self._lock = Lock()
+        self.stats = {
+            'lookups': 0,
+            'exact_hits': 0,
+            'similar_hits': 0,
+            'option_misses': 0,
+            'stored': 0
+        }
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return ' '.join(str(text or '').lower().replace('*', ' ').split())
+
+    @staticmethod
+    def terms(text: str) -> List[str]:
+        """Content words of a question, lightly stemmed so 'years'/'year' and 'working'/'work' meet"""
+        terms = []
+        for word in re.findall(r"[a-z0-9+#.]+", str(text or '').lower()):
+            word = word.strip('.')
+            if not word or word in STOP_WORDS:
+                continue
+            if len(word) > 5 and word.endswith('ing'):
+                word = word[:-3]
+            elif len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+                word = word[:-1]
+            terms.append(word)
+        return terms
+
+    def use_profile(self, profile_key: str) -> None:
+        """Forget every stored answer when the applicant changes; answers are only valid for one profile"""
+        with self._lock:
+            if profile_key != self._profile_key:
+                self._profile_key = profile_key
+                self._entries.clear()
+                self._exact.clear()
+                self._matrix = None
+
+    @staticmethod
+    def is_job_specific(question: str) -> bool:
+        """Motivation and company questions ('Why do you want to work here?') are answered for one job only"""
+        return JOB_SPECIFIC_QUESTION.search(str(question or '').lower()) is not None
+
+    def is_reusable(self, kind: str, category: str = None, question: str = None) -> bool:
+        return (kind in self.REUSABLE_KINDS and category not in self.NON_REUSABLE_CATEGORIES
+                and not self.is_job_specific(question))
+
+    def add(self, question: str, answer: str, kind: str = 'text', options: List[str] = None) -> None:
+        """Store an AI answer for later reuse; job specific questions are never stored"""
+        question = self.normalize(question)
+        terms = self.terms(question)
+        if not terms or not answer or self.is_job_specific(question):
+            return
+
+        entry = {'question': question, 'terms': terms, 'answer': str(answer), 'kind': kind,
+                 'options': list(options or [])}
+        with self._lock:
+            previous = self._exact.get((question, kind))
+            if previous is not None:
+                self._entries.remove(previous)
+            self._entries.append(entry)
+            self._exact[(question, kind)] = entry
+            if len(self._entries) > self.max_entries:
+                dropped = self._entries.pop(0)
+                self._exact.pop((dropped['question'], dropped['kind']), None)
+            self._matrix = None
+            self.stats['stored'] += 1
+
+    def _rebuild(self) -> None:
+        # Vocabulary and IDF over the stored questions; small enough to rebuild after each change
+        documents = [entry['terms'] for entry in self._entries]
+        vocabulary = {}
+        for terms in documents:
+            for term in terms:
+                vocabulary.setdefault(term, len(vocabulary))
+
+        counts = np.zeros((len(documents), len(vocabulary)), dtype=np.float32)
+        for row, terms in enumerate(documents):
+            for term, count in Counter(terms).items():
+                counts[row, vocabulary[term]] = 1.0 + math.log(count)  # Sublinear term frequency
+
+        document_frequency = np.count_nonzero(counts, axis=0)
+        self._idf = (np.log((1.0 + len(documents)) / (1.0 + document_frequency)) + 1.0).astype(np.float32)
+        self._matrix = self._unit_rows(counts * self._idf)
+        self._vocabulary = vocabulary
+
+    @staticmethod
+    def _unit_rows(matrix):
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def _vector(self, terms: List[str]):
+        vector = np.zeros(len(self._vocabulary), dtype=np.float32)
+        for term, count in Counter(terms).items():
+            column = self._vocabulary.get(term)
+            if column is not None:
+                vector[column] = (1.0 + math.log(count)) * self._idf[column]
+        # Query words never seen before still count towards the norm, so unknown subjects lower the score
+        unseen = sum(((1.0 + math.log(count)) * self._idf.max(initial=1.0)) ** 2
+                     for term, count in Counter(terms).items() if term not in self._vocabulary)
+        norm = math.sqrt(float(vector @ vector) + unseen)
+        return vector / norm if norm else vector
+
+    def find(self, question: str, kind: str = 'text', threshold: float = None,
+             same_subject: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Find the most similar stored question of the same kind, at least `threshold` similar (default: self.threshold)
+
+        With `same_subject`, only stored questions whose content words contain the new question's,
+        or are contained in them, are considered: 'hybrid' is never matched with 'onsite'.
+
+        Returns:
+            Dictionary with 'question', 'answer', 'options' and 'similarity', or None below the threshold
+        """
+        question = self.normalize(question)
+        if self.is_job_specific(question):
+            return None
+        with self._lock:
+            entry = self._exact.get((question, kind))
+            if entry is not None:
+                return dict(entry, similarity=1.0, exact=True)
+
+            terms = self.terms(question)
+            if not terms or not self._entries:
+                return None
+            if self._matrix is None:
+                self._rebuild()
+
+            scores = self._matrix @ self._vector(terms)
+            subject = set(terms)
+            kinds = np.array([stored['kind'] == kind and
+                              (not same_subject or subject <= set(stored['terms']) or subject >= set(stored['terms']))
+                              for stored in self._entries])
+            scores = np.where(kinds, scores, -1.0)
+            best = int(np.argmax(scores))
+            if scores[best] < (self.threshold if threshold is None else threshold):
+                return None
+            return dict(self._entries[best], similarity=float(scores[best]), exact=False)
+
+    def lookup(self, question: str, options: List[str] = None, kind: str = 'text',
+               threshold: float = None, same_subject: bool = False) -> Optional[str]:
+        """
+        Reuse a stored answer for a question similar enough to one answered before
+
+        Args:
+            question: The question text
+            options: Options offered by the new question; the stored answer is mapped onto them
+            kind: Question kind ('text' or 'choice')
+            threshold: Minimum similarity for this lookup (default: self.threshold)
+            same_subject: Only reuse questions with the same content words, or a subset of them
+
+        Returns:
+            The reused answer, or None when the AI has to be asked
+        """
+        match = self.find(question, kind, threshold, same_subject)
+        answer = match['answer'] if match else None
+        if answer is not None and options:
+            answer = match_option(answer, options)
+
+        with self._lock:
+            self.stats['lookups'] += 1
+            if match is None:
+                return None
+            if answer is None:
+                self.stats['option_misses'] += 1
+                return None
+            self.stats['exact_hits' if match['exact'] else 'similar_hits'] += 1
+
+        self.logger.info(f"Reused answer ({match['similarity']:.2f} similar to '{match['question'][:50]}')")
+        return answer
+
+    @property
+    def llm_calls_avoided(self) -> int:
+        return self.stats['exact_hits'] + self.stats['similar_hits']
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return reuse statistics, including the AI calls avoided this session"""
+        lookups = self.stats['lookups']
+        return {
+            **self.stats,
+            'entries': len(self._entries),
+            'llm_calls_avoided': self.llm_calls_avoided,
+            'hit_rate': round(self.llm_calls_avoided / lookups, 3) if lookups else 0.0
+        }
@@ -0,0 +1,282 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Application Export - Streams a user's job applications as CSV or Excel with bounded memory
+"""
+
+import csv
+import io
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+from app import db
+from app.models.job_application import JobApplication
+
+# Header -> JobApplication column, in export order
+EXPORT_COLUMNS = [
+    ('ID', 'id'),
+    ('Job Title', 'job_title'),
+    ('Company', 'company_name'),
+    ('Platform', 'platform'),
+    ('Status', 'status'),
+    ('Applied On', 'application_date'),
+    ('Response On', 'response_date'),
+    ('Location', 'location'),
+    ('Work Type', 'work_type'),
+    ('Salary', 'salary'),
+    ('Job URL', 'job_url'),
+    ('Platform Job ID', 'platform_job_id'),
+    ('Auto Applied', 'auto_applied'),
+    ('Resume Used', 'resume_used'),
+    ('Error', 'error_message'),
+    ('Notes', 'notes'),
+    ('Follow Up On', 'follow_up_date'),
+]
+EXPORT_FORMATS = ('csv', 'xlsx')
+CHUNK_SIZE = 1000
+
+
+def iter_application_rows(user_id: int, status: str = '', platform: str = '',
+                          chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple]:
+    """
+    Yields a user's applications as tuples in `EXPORT_COLUMNS` order, oldest first.
+
+    Rows are read `chunk_size` at a time by increasing id (keyset paging), as plain
+    tuples rather than ORM objects, so memory stays the same for any number of rows.
+
+    Args:
+        user_id: Owner of the applications
+        status: Only applications with this status, if given
+        platform: Only applications from this platform, if given
+        chunk_size: Rows read per query
+
+    Yields:
+        One tuple per application
+    """
+    columns = [getattr(JobApplication, attribute) for _, attribute in EXPORT_COLUMNS]
+    last_id = 0
+    while True:
+        query = db.session.query(*columns).filter(JobApplication.user_id == user_id, JobApplication.id > last_id)
+        if status:
+            query = query.filter(JobApplication.status == status)
+        if platform:
+            query = query.filter(JobApplication.platform == platform)
+        rows = query.order_by(JobApplication.id).limit(chunk_size).all()
+        if not rows:
+            return
+        for row in rows:
+            yield tuple(row)
+        last_id = rows[-1][0]
+        if len(rows) < chunk_size:
+            return
+
+
+def export_value(value):
+    """
+    Converts a value for a spreadsheet cell.
+
+    Dates become text, and text that a spreadsheet would run as a formula
+    ("=", "+", "-", "@") is prefixed with a quote.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@'):
+        return "'" + value
+    return value
+
+
+def stream_csv(rows: Iterator[Tuple], rows_per_chunk: int = 500) -> Iterator[str]:
+    """
+    Yields a CSV file (header first) in chunks of `rows_per_chunk` rows.
+
+    Args:
+        rows: Rows in `EXPORT_COLUMNS` order, e.g. from `iter_application_rows`
+        rows_per_chunk: Rows written per yielded chunk
+
+    Yields:
+        Parts of the CSV text, starting with a byte order mark so Excel reads UTF-8
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    writer.writerow([header for header, _ in EXPORT_COLUMNS])
+    count = 0
+    for row in rows:
+        writer.writerow([export_value(value) for value in row])
+        count += 1
+        if count % rows_per_chunk == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    yield buffer.getvalue()
+
+
+def write_xlsx(path: str, rows: Iterator[Tuple], progress=None) -> int:
+    """
+    Writes rows to an Excel file with openpyxl's write-only mode, which keeps
+    only the current row in memory.
+
+    Args:
+        path: Excel file to write, replaced only once it is complete
+        rows: Rows in `EXPORT_COLUMNS` order
+        progress: Optional callable, called with the number of rows written so far
+
+    Returns:
+        Number of rows written
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Applications')
+    sheet.append([header for header, _ in EXPORT_COLUMNS])
+    count = 0
+    for row in rows:
+        # Dates stay real Excel dates
+        values = [value if isinstance(value, datetime) else export_value(value) for value in row]
+        sheet.append([ILLEGAL_CHARACTERS_RE.sub('', value) if isinstance(value, str) else value for value in values])
+        count += 1
+        if progress and count % CHUNK_SIZE == 0:
+            progress(count)
+    temporary = path + '.part'
+    workbook.save(temporary)
+    os.replace(temporary, path)
+    return count
+
+
+def write_csv(path: str, rows: Iterator[Tuple], progress=None) -> int:
+    """
+    Writes rows to a CSV file chunk by chunk. See `write_xlsx` for the arguments.
+    """
+    count = 0
+
+    def counted():
+        nonlocal count
+        for row in rows:
+            count += 1
+            if progress and count % CHUNK_SIZE == 0:
+                progress(count)
+            yield row
+
+    temporary = path + '.part'
+    with open(temporary, 'w', encoding='utf-8', newline='') as file:
+        for chunk in stream_csv(counted()):
+            file.write(chunk)
+    os.replace(temporary, path)
+    return count
+
+
+class ExportManager:
+    """
+    Runs exports in background threads and keeps their status until they expire.
+    Finished files are kept in `folder` for `retention` seconds.
+    """
+
+    def __init__(self, folder: str, retention: float = 24 * 3600):
+        self.folder = folder
+        self.retention = retention
+        self.jobs: Dict[str, Dict] = {}  # export id -> status
+        self.lock = threading.Lock()
+
+    def start(self, app, user_id: int, export_format: str = 'xlsx', status: str = '', platform: str = '') -> str:
+        """
+        Starts an export of a user's applications.
+
+        Args:
+            app: The Flask app, the export thread runs in its app context
+            user_id: Owner of the applications
+            export_format: "xlsx" or "csv"
+            status: Only applications with this status, if given
+            platform: Only applications from this platform, if given
+
+        Returns:
+            The export id
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f'Unknown export format: {export_format}')
+        self.cleanup()
+        os.makedirs(self.folder, exist_ok=True)
+        export_id = uuid.uuid4().hex
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        job = {
+            'id': export_id,
+            'user_id': user_id,
+            'format': export_format,
+            'status': 'running',
+            'rows': 0,
+            'error': None,
+            'file_name': f'applications-{stamp}.{export_format}',
+            'path': os.path.join(self.folder, f'{export_id}.{export_format}'),
+            'created': time.time(),
+        }
+        with self.lock:
+            self.jobs[export_id] = job
+        threading.Thread(target=self._run, args=(app, job, status, platform), daemon=True).start()
+        return export_id
+
+    def _run(self, app, job: Dict, status: str, platform: str) -> None:
+        def progress(rows):
+            job['rows'] = rows
+
+        writer = write_xlsx if job['format'] == 'xlsx' else write_csv
+        try:
+            with app.app_context():
+                job['rows'] = writer(job['path'], iter_application_rows(job['user_id'], status, platform), progress)
+                db.session.remove()
+            job['status'] = 'done'
+        except Exception as e:
+            job['status'] = 'error'
+            job['error'] = str(e)
+
+    def get(self, export_id: str, user_id: int) -> Optional[Dict]:
+        """Returns the status of one of the user's exports, or None."""
+        with self.lock:
+            job = self.jobs.get(export_id)
+        if job is None or job['user_id'] != user_id:
+            return None
+        return {key: value for key, value in job.items() if key not in ('path', 'user_id')}
+
+    def get_file(self, export_id: str, user_id: int) -> Optional[Tuple[str, str]]:
+        """Returns the (path, download name) of one of the user's finished exports, or None."""
+        with self.lock:
+            job = self.jobs.get(export_id)
+        if job is None or job['user_id'] != user_id or job['status'] != 'done' or not os.path.exists(job['path']):
+            return None
+        return job['path'], job['file_name']
+
+    def cleanup(self) -> List[str]:
+        """Forgets exports older than the retention and deletes their files. Returns their ids."""
+        expired = []
+        with self.lock:
+            for export_id, job in list(self.jobs.items()):
+                if job['status'] != 'running' and time.time() - job['created'] > self.retention:
+                    expired.append(export_id)
+                    del self.jobs[export_id]
+                    if os.path.exists(job['path']):
+                        os.remove(job['path'])
+        return expired
+
+
+_managers: Dict[str, ExportManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_export_manager(folder: str, retention: float = 24 * 3600) -> ExportManager:
+    """Returns the shared export manager of an export folder."""
+    with _managers_lock:
+        manager = _managers.get(folder)
+        if manager is None:
+            manager = ExportManager(folder, retention)
+            _managers[folder] = manager
+        return manager
@@ -494,6 +494,72 @@ class FormQuestionParser:
         except:
             return False
     
+    # Streamed text is typed in pieces of at least this many characters, to limit WebDriver round trips
+    MIN_TYPED_CHUNK = 24
+    
+    def get_max_length(self, question: FormQuestion) -> Optional[int]:
+        """Return the maxlength of a text question's input, or None if it sets none"""
+        try:
+            if question.input_element is None:
+                return None
+            max_length = question.input_element.get_attribute("maxlength")
+            return int(max_length) if max_length and int(max_length) > 0 else None
+        except Exception:
+            return None
+    
+    def fill_question_answer_stream(self, question: FormQuestion, chunks) -> Tuple[bool, str]:
+        """
+        Fill in an answer that is still being generated, typing each piece as it arrives
+        
+        Only text and textarea inputs are typed incrementally; other input types wait for the
+        whole answer and go through fill_question_answer. The chunks are closed (cancelling the
+        generation) if typing fails. A chunk with a true `replaces` attribute (see
+        ai_question_answerer.ReplacementText) clears the field and replaces the text typed so far.
+        
+        Args:
+            question: FormQuestion object
+            chunks: Iterable of answer text chunks (e.g. AIQuestionAnswerer.stream_answer)
+            
+        Returns:
+            Tuple of (True if successfully filled, the text that was filled in)
+        """
+        if question.input_type not in ["text", "textarea"] or not question.input_element:
+            answer = ""
+            for chunk in chunks:
+                answer = chunk if getattr(chunk, "replaces", False) else answer + chunk
+            return self.fill_question_answer(question, answer), answer
+        
+        input_elem = question.input_element
+        typed = []
+        pending = ""
+        try:
+            input_elem.clear()
+            self.logger.info(f"📝 Streaming answer into {question.input_type} question: '{question.question_text[:50]}...'")
+            for chunk in chunks:
+                if getattr(chunk, "replaces", False):
+                    input_elem.clear()
+                    typed = []
+                    pending = ""
+                pending += chunk
+                if len(pending) >= self.MIN_TYPED_CHUNK:
+                    input_elem.send_keys(pending)
+                    typed.append(pending)
+                    pending = ""
+            if pending:
+                input_elem.send_keys(pending)
+                typed.append(pending)
+            return bool(typed), "".join(typed)
+            
+        except StaleElementReferenceException:
+            self.logger.error("Element became stale during streamed filling")
+        except Exception as e:
+            self.logger.error(f"Error filling streamed answer: {str(e)}")
+        finally:
+            close = getattr(chunks, "close", None)
+            if close:
+                close()
+        return False, "".join(typed)
+    
     def fill_question_answer(self, question: FormQuestion, answer: str) -> bool:
         """
         Fill in the answer for a specific question
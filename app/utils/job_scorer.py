@@ -9,16 +9,11 @@ import re
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-try:
-    from google import genai
-    from google.genai import types
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
-    logging.warning("Google Gemini not available. Job scoring will use basic scoring.")
-
+from config.config import Config
+from modules.ai.llm_provider import LLMProviderError, get_provider
+from modules.rate_limiter import rate_limit_key
 from app.models.user import User
-from app.models.job_preferences import JobPreferences
+from app.models.job_preference import JobPreferences
 from app.models.job_application import JobApplication
 from app import db
 
@@ -33,15 +28,22 @@ class JobScorer:
         self.gemini_api_key = gemini_api_key
         self.client = None
         
-        if GEMINI_AVAILABLE and gemini_api_key:
-            try:
-                self.client = genai.Client(api_key=gemini_api_key)
-                logger.info("Gemini AI client initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize Gemini client: {e}")
-                self.client = None
+        if gemini_api_key:
+            self.client = get_provider(
+                'gemini',
+                api_key=gemini_api_key,
+                model="gemini-2.0-flash",
+                base_url=Config.GEMINI_API_BASE_URL,
+                timeout=Config.AI_REQUEST_TIMEOUT,
+                max_retries=Config.AI_MAX_RETRIES,
+                max_concurrency=Config.AI_MAX_CONCURRENT_REQUESTS,
+                slow_call=Config.AI_SLOW_CALL_SECONDS or None,
+                breaker_cooldown=Config.AI_BREAKER_COOLDOWN,
+                hedge=Config.AI_HEDGE_REQUESTS
+            )
+            logger.info("Gemini AI client initialized successfully")
         else:
-            logger.warning("Gemini API not available or API key not provided")
+            logger.warning("Gemini API key not provided. Job scoring will use basic scoring.")
     
     def format_user_resume_data(self, user: User, job_preferences: JobPreferences) -> str:
         """Format user data into resume text for AI scoring"""
@@ -125,15 +127,9 @@ class JobScorer:
         Score (0–100):
         """
         
+        response = None
         try:
-            response = self.client.models.generate_content(
-                model="gemini-2.0-flash",
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.3,
-                    max_output_tokens=10
-                )
-            )
+            response = self.client.complete(prompt, temperature=0.3, max_tokens=10)
             
             score_text = response.text.strip()
             score = int(score_text)
@@ -148,6 +144,9 @@ class JobScorer:
         except ValueError:
             logger.error(f"Could not parse AI score response: {response.text.strip()}")
             return None
+        except LLMProviderError as e:
+            logger.error(f"Error calling Gemini API: {e}")
+            return None
         except Exception as e:
             logger.error(f"Error calling Gemini API: {e}")
             return None
@@ -254,14 +253,11 @@ class JobScorer:
         
         for i, job_details in enumerate(jobs_list[:max_jobs]):
             try:
-                score_result = self.score_job_for_user(user_id, job_details)
+                # AI calls wait for the shared Gemini rate limit in the provider, fairly between users
+                with rate_limit_key(f"user:{user_id}"):
+                    score_result = self.score_job_for_user(user_id, job_details)
                 scored_jobs.append(score_result)
                 
-                # Add delay between AI calls to respect rate limits
-                if self.client and i > 0 and i % 10 == 0:
-                    import time
-                    time.sleep(2)  # 2 second delay every 10 jobs
-                    
             except Exception as e:
                 logger.error(f"Error scoring job {i}: {e}")
                 continue
@@ -0,0 +1,204 @@
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+# Offline benchmark of the AI layer against the local stub LLM server (no API keys, no network).
+#
+# Flows, each run for a number of simulated applications:
+#   form filling  `AIQuestionAnswerer`: analyze + answer each question of an application form
+#   job scoring   `JobScorer.get_ai_job_score` for each job
+#   skills        `ai_extract_skills` (OpenAI-compatible) and `gemini_extract_skills` per job description
+# For each flow it reports LLM calls, prompt/completion tokens and wall time per application.
+# Then it compares a cover letter answered whole with one streamed by `stream_answer`: the time
+# until typing can start.
+# If a selected flow cannot be imported in this environment (e.g. `skills` needs `config.secrets` and a
+# GUI for pyautogui), the benchmark exits with an error before running anything; leave it out with --flows.
+#
+# Usage:  python benchmarks/bench_ai_layer.py [--applications 20] [--questions 6] [--latency 0.2]
+#                                             [--jitter 0.05] [--error-rate 0.0] [--chunk-delay 0.03] [--workers 1]
+#                                             [--flows form,scoring,skills]
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config import Config
+from modules.ai.llm_provider import close_all_providers, get_provider, provider_metrics
+from bench_prompt_tokens import JOBS, USER_DATA
+from bench_question_classifier import load_corpus
+from stub_llm_server import StubLLMServer
+
+RESUME_TEXT = """Asha Rao - Backend Engineer, 4 years
+Python, Django, Flask, PostgreSQL, Redis, Docker, AWS. Built payment reconciliation services at Razorpay
+and internal tooling at Infosys. B.Tech in Computer Science."""
+
+JOB_DESCRIPTION = """We are looking for a backend engineer to design and build REST APIs in Python (Django),
+own PostgreSQL schemas and run services on AWS with Docker. 3+ years of experience required.
+Nice to have: Kafka, Kubernetes, observability tooling. Strong communication and ownership expected."""
+
+
+def make_job(number: int) -> dict:
+    job = dict(JOBS[number % len(JOBS)])
+    job["job_title"] = f"{job['job_title']} #{number}"
+    # Unique descriptions, so the skills cache does not hide the API calls being measured
+    job["job_description"] = f"{JOB_DESCRIPTION}\nRequisition {number}."
+    return job
+
+
+def totals() -> dict:
+    calls = prompt_tokens = completion_tokens = 0
+    for metrics in provider_metrics().values():
+        calls += metrics["calls"]
+        prompt_tokens += metrics["prompt_tokens"]
+        completion_tokens += metrics["completion_tokens"]
+    return {"calls": calls, "prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens}
+
+
+def run_flow(name: str, task, applications: int, workers: int) -> None:
+    before = totals()
+    durations = []
+
+    def timed(number):
+        started = time.perf_counter()
+        task(number)
+        durations.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(timed, range(applications)))
+    wall = time.perf_counter() - started
+
+    after = totals()
+    used = {key: after[key] - before[key] for key in after}
+    durations.sort()
+    p95 = durations[min(len(durations) - 1, int(round(0.95 * (len(durations) - 1))))]
+    print(f"  {name:<14} {used['calls'] / applications:6.1f} calls  "
+          f"{used['prompt_tokens'] / applications:7.0f} + {used['completion_tokens'] / applications:5.0f} tokens  "
+          f"{statistics.median(durations) * 1000:7.0f} ms p50  {p95 * 1000:7.0f} ms p95  "
+          f"({applications / wall:5.1f} applications/s)")
+
+
+def form_filling_flow(base_url: str, questions: int, seed: int):
+    from app.utils.ai_question_answerer import AIQuestionAnswerer
+
+    Config.GEMINI_API_BASE_URL = base_url
+    answerer = AIQuestionAnswerer(api_key="stub-key")
+    user_context = answerer.prepare_user_context(USER_DATA)
+    corpus = load_corpus()
+
+    def apply(number: int) -> None:
+        job = make_job(number)
+        for question in random.Random(seed + number).sample(corpus, questions):
+            analysis = answerer.analyze_question_type(question)
+            options = ["Yes", "No"] if analysis["kind"] == "choice" else None
+            answerer.generate_answer(question, user_context, analysis, options, job)
+
+    return apply, answerer
+
+
+def job_scoring_flow(base_url: str):
+    from app.utils.job_scorer import JobScorer
+
+    Config.GEMINI_API_BASE_URL = base_url
+    scorer = JobScorer(gemini_api_key="stub-key")
+    return lambda number: scorer.get_ai_job_score(RESUME_TEXT, make_job(number))
+
+
+def skills_flow(base_url: str):
+    from modules.ai.openaiConnections import ai_extract_skills
+    from modules.ai.geminiConnections import gemini_extract_skills
+
+    openai_client = get_provider("openai-like", api_key="stub-key", model="stub-model", base_url=base_url)
+    gemini_client = get_provider("gemini", api_key="stub-key", model="stub-model", base_url=base_url)
+
+    def extract(number: int) -> None:
+        description = make_job(number)["job_description"]
+        ai_extract_skills(openai_client, description, stream=False)
+        gemini_extract_skills(gemini_client, description + "\n(Gemini)")
+
+    return extract
+
+
+def cover_letter_latency(base_url: str, applications: int) -> None:
+    from app.utils.ai_question_answerer import AIQuestionAnswerer
+
+    Config.GEMINI_API_BASE_URL = base_url
+    answerer = AIQuestionAnswerer(api_key="stub-key")
+    user_context = answerer.prepare_user_context(USER_DATA)
+    question = "Please write a short cover letter for this position"
+    analysis = answerer.analyze_question_type(question, "textarea")
+
+    whole, first_chunk = [], []
+    for number in range(applications):
+        started = time.perf_counter()
+        answerer.generate_answer(question, user_context, analysis, None, make_job(number))
+        whole.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        chunks = answerer.stream_answer(question, user_context, analysis, None, make_job(number))
+        next(chunks)
+        first_chunk.append(time.perf_counter() - started)
+        for _ in chunks:
+            pass
+    print(f"  cover letter   typing starts after {statistics.median(whole) * 1000:7.0f} ms whole, "
+          f"{statistics.median(first_chunk) * 1000:7.0f} ms streamed (p50)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the AI layer against a local stub LLM server")
+    parser.add_argument("--applications", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=6, help="form questions per application")
+    parser.add_argument("--latency", type=float, default=0.2, help="stub seconds per completion")
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of stub completions failing with 503")
+    parser.add_argument("--chunk-delay", type=float, default=0.03, help="stub seconds between streamed chunks")
+    parser.add_argument("--workers", type=int, default=1, help="applications processed in parallel")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--flows", default="form,scoring,skills", help="comma separated flows to run")
+    args = parser.parse_args()
+    selected = [name.strip() for name in args.flows.split(",") if name.strip()]
+
+    with StubLLMServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, seed=args.seed,
+                       chunk_delay=args.chunk_delay) as stub:
+        flows = {
+            "form": ("form filling", lambda: form_filling_flow(stub.base_url, args.questions, args.seed)[0]),
+            "scoring": ("job scoring", lambda: job_scoring_flow(stub.base_url)),
+            "skills": ("skills", lambda: skills_flow(stub.base_url)),
+        }
+        unknown = [name for name in selected if name not in flows]
+        if unknown:
+            parser.error(f"unknown flows {', '.join(unknown)} (choose from {', '.join(flows)})")
+
+        # Build every flow first: a partial table would read like a complete one
+        tasks = []
+        for name in selected:
+            label, build = flows[name]
+            try:
+                tasks.append((label, build()))
+            except Exception as e:  # Missing pieces (e.g. a GUI for pyautogui) in this environment
+                close_all_providers()
+                sys.exit(f"Cannot run the {name} flow here ({type(e).__name__}: {e}); "
+                         f"leave it out with --flows")
+
+        print(f"Stub at {stub.base_url}: {args.latency * 1000:.0f} ms +/- {args.jitter * 1000:.0f} ms, "
+              f"{args.error_rate:.0%} errors; {args.applications} applications, {args.workers} worker(s)")
+        print("  per application:")
+        for label, task in tasks:
+            run_flow(label, task, args.applications, args.workers)
+        cover_letter_latency(stub.base_url, min(args.applications, 5))
+
+        print(f"  stub served {stub.stats['requests']} requests ({stub.stats['errors']} failed)")
+    close_all_providers()
+
+
+if __name__ == "__main__":
+    main()
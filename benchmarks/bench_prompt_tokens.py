@@ -0,0 +1,87 @@
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+# Prompt size report: tokens sent per application by `AIQuestionAnswerer`.
+#
+# Builds the prompts for a few simulated applications (questions drawn from the form label
+# corpus) without calling any API, and compares the old layout (the full profile rendered into
+# every prompt) with the cached prefix layout, with and without the compact profile mode.
+# Token counts are estimates (about four characters per token).
+#
+# Usage:  python benchmarks/bench_prompt_tokens.py [--applications 20] [--questions 6]
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.ai_question_answerer import AIQuestionAnswerer
+from bench_question_classifier import load_corpus
+
+USER_DATA = {
+    'full_name': 'Asha Rao',
+    'email': 'asha.rao@example.com',
+    'phone': '+91 98765 43210',
+    'city': 'Pune, Maharashtra',
+    'experience_years': 4,
+    'current_role': 'Backend Engineer',
+    'education': 'B.Tech in Computer Science',
+    'skills': ['Python', 'Django', 'Flask', 'PostgreSQL', 'Redis', 'Docker', 'AWS', 'REST APIs'],
+    'previous_companies': ['Infosys', 'Razorpay'],
+    'certifications': ['AWS Certified Developer - Associate'],
+    'languages': ['English', 'Hindi', 'Marathi'],
+    'availability': '30 days notice',
+    'salary_expectation': '18-22 LPA',
+    'linkedin_url': 'https://www.linkedin.com/in/asha-rao',
+    'github_url': 'https://github.com/asharao',
+}
+
+JOBS = [
+    {'job_title': 'Senior Python Developer', 'company_name': 'Acme Analytics', 'location': 'Pune'},
+    {'job_title': 'Backend Engineer', 'company_name': 'Globex', 'location': 'Bengaluru (Hybrid)'},
+    {'job_title': 'Software Engineer II', 'company_name': 'Initech', 'location': 'Remote'},
+]
+
+
+def run(compact: bool, applications: int, questions: int, seed: int) -> dict:
+    answerer = AIQuestionAnswerer(api_key='benchmark')
+    answerer.compact_profile = compact
+    user_context = answerer.prepare_user_context(USER_DATA)
+    corpus = load_corpus()
+    rng = random.Random(seed)
+
+    for number in range(applications):
+        job = dict(JOBS[number % len(JOBS)], job_id=number)
+        job['job_title'] = f"{job['job_title']} #{number}"
+        for question in rng.sample(corpus, questions):
+            analysis = answerer.analyze_question_type(question)
+            options = ['Yes', 'No'] if analysis['kind'] == 'choice' else None
+            messages = answerer.build_prompt(question, user_context, analysis, options, job)
+            answerer._record_prompt(job, messages, user_context)
+    return answerer.get_prompt_stats()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report prompt tokens per application before and after compaction")
+    parser.add_argument("--applications", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=6, help="AI answered questions per application")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{args.applications} applications x {args.questions} questions (estimated tokens)")
+    for compact in (False, True):
+        stats = run(compact, args.applications, args.questions, args.seed)
+        label = "compact profile" if compact else "cached prefix"
+        print(f"  {label:<16} before {stats['tokens_per_application_before']:6d}/application   "
+              f"after {stats['tokens_per_application_after']:6d}/application   "
+              f"({stats['reduction']:.0%} fewer, {stats['prefix_tokens'] / max(stats['tokens_after'], 1):.0%} of it a reusable prefix)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+# Micro-benchmark: question classification over a corpus of real form labels.
+#
+# Compares the previous approach (a pattern dict rebuilt on every call, scanned with sequential
+# `re.search` calls, then every answer rule checked with `any(word in label ...)`) against the
+# precompiled `QuestionClassifier`, cold (cache cleared every round) and warm (labels repeating
+# across jobs, as they do in a real run). Also checks both give the same category and rules.
+#
+# Usage:  python benchmarks/bench_question_classifier.py [--rounds 200]
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.answer_rules import DEFAULT_RULES
+from modules.question_classifier import CATEGORY_PATTERNS, QuestionClassifier
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "form_labels.txt")
+
+
+def load_corpus(path: str = CORPUS_PATH) -> list[str]:
+    with open(path, encoding="utf-8") as file:
+        return [line.strip() for line in file if line.strip() and not line.startswith("#")]
+
+
+def legacy_classify(question_text: str, kind: str) -> tuple[str, list[str]]:
+    '''The previous per-call scanning: category by sequential regex search, then every rule checked'''
+    question_lower = question_text.lower().strip()
+    patterns = {category: list(pattern_list) for category, pattern_list in CATEGORY_PATTERNS.items()}  # Rebuilt per call
+
+    category = 'general'
+    for cat, pattern_list in patterns.items():
+        for pattern in pattern_list:
+            if re.search(pattern, question_lower):
+                category = cat
+                break
+        if category != 'general':
+            break
+
+    label = " ".join(question_lower.split())
+    rules = [rule.name for rule in DEFAULT_RULES if rule.matches(label, kind)]
+    return category, rules
+
+
+def compiled_classify(classifier: QuestionClassifier, question_text: str, kind: str) -> tuple[str, list[str]]:
+    question_class = classifier.classify(question_text)
+    _, rules = classifier.rules_for(question_text, kind)
+    return question_class.category, [rule.name for rule in rules]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark question classification over form labels")
+    parser.add_argument("--rounds", type=int, default=200, help="passes over the corpus per measurement")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    kinds = ("text", "choice")
+    classifier = QuestionClassifier(DEFAULT_RULES)
+
+    mismatches = [
+        (label, kind) for label in corpus for kind in kinds
+        if legacy_classify(label, kind) != compiled_classify(classifier, label, kind)
+    ]
+
+    def run_legacy():
+        for label in corpus:
+            for kind in kinds:
+                legacy_classify(label, kind)
+
+    def run_cold():
+        classifier.cache_clear()
+        for label in corpus:
+            for kind in kinds:
+                compiled_classify(classifier, label, kind)
+
+    def run_warm():
+        for label in corpus:
+            for kind in kinds:
+                compiled_classify(classifier, label, kind)
+
+    questions = len(corpus) * len(kinds) * args.rounds
+    print(f"Corpus: {len(corpus)} labels x {len(kinds)} kinds, {args.rounds} rounds")
+    results = {}
+    for name, function in (("legacy scan", run_legacy), ("compiled (cold)", run_cold), ("compiled (warm)", run_warm)):
+        function()  # Warm up imports and the regex cache
+        seconds = min(timeit.repeat(function, number=args.rounds, repeat=3))
+        results[name] = seconds
+        print(f"  {name:<16} {seconds / questions * 1e6:8.2f} us/question")
+
+    for name in ("compiled (cold)", "compiled (warm)"):
+        print(f"  speed-up {name:<16} {results['legacy scan'] / results[name]:6.1f}x")
+    print(f"  mismatches vs legacy: {len(mismatches)}")
+    for label, kind in mismatches[:10]:
+        print(f"    [{kind}] {label}: {legacy_classify(label, kind)} != "
+              f"{compiled_classify(classifier, label, kind)}")
+
+
+if __name__ == "__main__":
+    main()
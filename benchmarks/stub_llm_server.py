@@ -0,0 +1,269 @@
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+# Local stub of the Gemini and OpenAI-compatible APIs, for offline benchmarks.
+#
+# Serves `POST /models/{model}:generateContent` and `:streamGenerateContent?alt=sse` (Gemini),
+# `POST /chat/completions` with or without `"stream": true` (OpenAI, DeepSeek, local LLM servers)
+# and `GET /models`. Every completion waits a configurable latency
+# (plus jitter), fails with a 503 at a configurable error rate, and answers with a canned
+# response picked from the last user message: a score for job scoring prompts, skills JSON for
+# extraction prompts, Yes for yes/no questions, a number for experience questions, else a sentence.
+# Token usage is reported like the real APIs (estimated at four characters per token). Streamed
+# answers are sent word by word as server-sent events, `chunk_delay` seconds apart; other answers
+# take as long to generate but arrive at once.
+#
+# Point the app at it with GEMINI_API_BASE_URL=http://127.0.0.1:8765, or the standalone script
+# with llm_api_url = "http://127.0.0.1:8765" in config/secret.py.
+#
+# Usage:  python benchmarks/stub_llm_server.py [--port 8765] [--latency 0.3] [--jitter 0.1] [--error-rate 0.05]
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SKILLS_RESPONSE = {
+    "tech_stack": ["Python", "Django", "PostgreSQL", "Docker", "AWS"],
+    "technical_skills": ["REST API Design", "Microservices", "System Design"],
+    "other_skills": ["Communication", "Cross-team collaboration"],
+    "required_skills": ["Python", "Django", "PostgreSQL", "REST API Design"],
+    "nice_to_have": ["AWS", "Docker"],
+}
+
+# (words in the prompt, canned answer), first match wins
+CANNED_RESPONSES = [
+    (("suitability scoring",), "72"),
+    (("extract all skills",), json.dumps(SKILLS_RESPONSE)),
+    (("cover letter",), "I am excited to apply for this role. My backend experience with Python and AWS "
+                        "matches your requirements, and I enjoy building reliable services with small teams."),
+    (("yes/no",), "Yes"),
+    (("years of experience",), "3"),
+    (("salary",), "Negotiable"),
+    (("availability",), "Immediately"),
+]
+DEFAULT_RESPONSE = "I have hands-on experience with this and can share details in an interview."
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, (len(text) + 3) // 4)
+
+
+class StubLLMServer:
+    '''
+    Threaded stub server; use as a context manager or call `start()` / `stop()`.
+    * Takes in `latency` and `jitter` (seconds), `error_rate` (0..1) and an optional `seed`
+    * Takes in `chunk_delay`, the seconds between streamed chunks
+    * `base_url` is the URL to pass as the provider base URL
+    * `stats` counts requests, errors and tokens per endpoint kind
+    '''
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: int | None = None, responses=None, chunk_delay: float = 0.02):
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.responses = list(responses or CANNED_RESPONSES)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "streamed": 0, "prompt_tokens": 0, "completion_tokens": 0,
+                      "gemini": 0, "openai": 0}
+
+        stub = self
+
+        class Handler(StubHandler):
+            server_stub = stub
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubLLMServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="stub-llm-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for key in self.stats:
+                self.stats[key] = 0
+
+    def answer_for(self, prompt: str) -> str:
+        prompt = prompt.lower()
+        for words, answer in self.responses:
+            if all(word in prompt for word in words):
+                return answer
+        return DEFAULT_RESPONSE
+
+    def wait_and_maybe_fail(self) -> bool:
+        '''Sleeps the configured latency; returns True if this request should fail'''
+        with self._lock:
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+            fail = self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        return fail
+
+    def count(self, kind: str, prompt_tokens: int = 0, completion_tokens: int = 0, error: bool = False,
+              streamed: bool = False) -> None:
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats[kind] += 1
+            self.stats["streamed"] += int(streamed)
+            self.stats["errors"] += int(error)
+            self.stats["prompt_tokens"] += prompt_tokens
+            self.stats["completion_tokens"] += completion_tokens
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_stub: StubLLMServer = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: dict, headers: dict | None = None) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send(200, {
+                "data": [{"id": "stub-model"}],
+                "models": [{"name": "models/stub-model", "supportedGenerationMethods": ["generateContent"]}],
+            })
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        stub = self.server_stub
+
+        path = self.path.split("?", 1)[0]
+        if path.endswith(":generateContent") or path.endswith(":streamGenerateContent"):
+            kind = "gemini"
+            streamed = path.endswith(":streamGenerateContent")
+            turns = ["".join(part.get("text", "") for part in content.get("parts", [])) for content in body.get("contents", [])]
+            system = "".join(part.get("text", "") for part in (body.get("systemInstruction") or {}).get("parts", []))
+        elif path.endswith("/chat/completions"):
+            kind = "openai"
+            streamed = bool(body.get("stream"))
+            messages = body.get("messages", [])
+            turns = [str(message.get("content", "")) for message in messages if message.get("role") != "system"]
+            system = "".join(str(message.get("content", "")) for message in messages if message.get("role") == "system")
+        else:
+            self._send(404, {"error": "not found"})
+            return
+
+        prompt = "\n".join([system] + turns)
+        if stub.wait_and_maybe_fail():
+            stub.count(kind, error=True)
+            self._send(503, {"error": {"message": "stub overloaded", "code": 503}}, {"Retry-After": "0"})
+            return
+
+        # The system part is shared context (e.g. the profile); the question is in the last turn
+        answer = stub.answer_for(turns[-1] if turns else prompt)
+        prompt_tokens, completion_tokens = estimate_tokens(prompt), estimate_tokens(answer)
+        stub.count(kind, prompt_tokens, completion_tokens, streamed=streamed)
+        if streamed:
+            self._send_stream(kind, answer, prompt_tokens, completion_tokens)
+            return
+        if stub.chunk_delay:
+            time.sleep(stub.chunk_delay * (len(answer.split(" ")) - 1))
+        if kind == "gemini":
+            self._send(200, {
+                "candidates": [{"content": {"parts": [{"text": answer}], "role": "model"}, "finishReason": "STOP"}],
+                "usageMetadata": {"promptTokenCount": prompt_tokens, "candidatesTokenCount": completion_tokens},
+            })
+        else:
+            self._send(200, {
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": answer}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens},
+            })
+
+
+    def _send_stream(self, kind: str, answer: str, prompt_tokens: int, completion_tokens: int) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        words = answer.split(" ")
+        try:
+            for index, word in enumerate(words):
+                text = word if index == 0 else " " + word
+                if kind == "gemini":
+                    event = {"candidates": [{"content": {"parts": [{"text": text}], "role": "model"}}]}
+                    if index == len(words) - 1:
+                        event["candidates"][0]["finishReason"] = "STOP"
+                        event["usageMetadata"] = {"promptTokenCount": prompt_tokens,
+                                                  "candidatesTokenCount": completion_tokens}
+                else:
+                    event = {"choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}]}
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                self.wfile.flush()
+                if self.server_stub.chunk_delay and index < len(words) - 1:
+                    time.sleep(self.server_stub.chunk_delay)
+            if kind == "openai":
+                usage = {"choices": [], "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens}}
+                self.wfile.write(f"data: {json.dumps(usage)}\n\ndata: [DONE]\n\n".encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client cancelled the stream
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stub of the Gemini and OpenAI-compatible APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds per completion")
+    parser.add_argument("--jitter", type=float, default=0.1, help="+/- seconds around the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of completions answered with 503")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = StubLLMServer(args.host, args.port, args.latency, args.jitter, args.error_rate, args.seed)
+    print(f"Stub LLM server on {server.base_url} (latency {args.latency}s +/- {args.jitter}s, "
+          f"error rate {args.error_rate:.0%}). Ctrl+C to stop.")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(json.dumps(server.stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -37,6 +37,7 @@ class Config:
     
     # AI Configuration
     GOOGLE_GEMINI_API_KEY = os.environ.get('GOOGLE_GEMINI_API_KEY')
+    GEMINI_API_BASE_URL = os.environ.get('GEMINI_API_BASE_URL', '')  # Empty for Google's endpoint; set for a proxy or local stub
     OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')  # For future OpenAI support
     
     # AI Service Settings
@@ -44,4 +45,31 @@ class Config:
     AI_DEFAULT_SERVICE = os.environ.get('AI_DEFAULT_SERVICE', 'gemini')  # 'gemini' or 'openai'
     AI_REQUEST_TIMEOUT = int(os.environ.get('AI_REQUEST_TIMEOUT', '10'))  # seconds
     AI_MAX_RETRIES = int(os.environ.get('AI_MAX_RETRIES', '3'))
+    AI_MAX_CONCURRENT_REQUESTS = int(os.environ.get('AI_MAX_CONCURRENT_REQUESTS', '4'))  # per provider
+    AI_SLOW_CALL_SECONDS = float(os.environ.get('AI_SLOW_CALL_SECONDS', '8'))  # slower calls count as failures for the circuit breaker, 0 only counts failures
+    AI_BREAKER_COOLDOWN = float(os.environ.get('AI_BREAKER_COOLDOWN', '30'))  # seconds the breaker stays open
+    AI_HEDGE_REQUESTS = os.environ.get('AI_HEDGE_REQUESTS', 'false').lower() == 'true'  # second request after the p95 latency
+    AI_ANSWER_REUSE_THRESHOLD = float(os.environ.get('AI_ANSWER_REUSE_THRESHOLD', '0.85'))  # cosine similarity
+    AI_COMPACT_PROFILE = os.environ.get('AI_COMPACT_PROFILE', 'true').lower() == 'true'  # Only profile sections a question needs
+    AI_STREAM_LONG_ANSWERS = os.environ.get('AI_STREAM_LONG_ANSWERS', 'true').lower() == 'true'  # Type cover letters while generated
+    AI_LONG_ANSWER_MAX_CHARS = int(os.environ.get('AI_LONG_ANSWER_MAX_CHARS', '1500'))  # Cap when the field sets no maxlength
     AI_FALLBACK_ANSWERS = os.environ.get('AI_FALLBACK_ANSWERS', 'true').lower() == 'true'
+    
+    # Rate limits shared by all user sessions: (requests per minute, burst); 0 per minute is unlimited
+    RATE_LIMITS = {
+        'gemini': (float(os.environ.get('GEMINI_REQUESTS_PER_MINUTE', '15')), int(os.environ.get('GEMINI_REQUEST_BURST', '5'))),  # Gemini free tier: 15/min
+        'openai': (float(os.environ.get('OPENAI_REQUESTS_PER_MINUTE', '0')), int(os.environ.get('OPENAI_REQUEST_BURST', '5'))),
+        'linkedin': (float(os.environ.get('LINKEDIN_ACTIONS_PER_MINUTE', '12')), int(os.environ.get('LINKEDIN_ACTION_BURST', '3'))),  # Page loads and applications
+        'indeed': (float(os.environ.get('INDEED_ACTIONS_PER_MINUTE', '12')), int(os.environ.get('INDEED_ACTION_BURST', '3')))
+    }
+    RATE_LIMIT_STATE_PATH = os.environ.get('RATE_LIMIT_STATE_PATH', '')  # SQLite file to share the limits between processes
+    
+    # Application history (the standalone bot's CSV files and their indexed copy) and its Parquet export
+    HISTORY_CSV_PATH = os.environ.get('HISTORY_CSV_PATH', 'all excels/all_applied_applications_history.csv')
+    HISTORY_FAILED_CSV_PATH = os.environ.get('HISTORY_FAILED_CSV_PATH', 'all excels/all_failed_applications_history.csv')
+    HISTORY_DB_PATH = os.environ.get('HISTORY_DB_PATH', 'all excels/applications_history.db')
+    HISTORY_EXPORT_PATH = os.environ.get('HISTORY_EXPORT_PATH', 'all excels/parquet')  # `flask export-history` writes here
+    
+    # Dashboard exports of applications, kept for download for EXPORT_RETENTION_HOURS
+    EXPORT_FOLDER = os.environ.get('EXPORT_FOLDER', 'app/data/exports')
+    EXPORT_RETENTION_HOURS = float(os.environ.get('EXPORT_RETENTION_HOURS', '24'))
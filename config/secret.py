@@ -34,7 +34,8 @@ Note: Select your AI provider.
 # Your LLM url or other AI api url and port
 llm_api_url = ""       # Examples: "https://api.openai.com/v1/", "http://127.0.0.1:1234/v1/", "http://localhost:1234/v1/", "https://api.deepseek.com", "https://api.deepseek.com/v1"
 '''
-Note: Don't forget to add / at the end of your url. You may not need this if you are using Gemini.
+Note: Don't forget to add / at the end of your url. Leave it empty "" for Gemini to use Google's API,
+any url set here is used as the Gemini API url too (e.g. "http://127.0.0.1:8765" for benchmarks/stub_llm_server.py).
 '''
 
 # Your LLM API key or other AI API key 
@@ -61,6 +62,30 @@ stream_output = False                    # Examples: True or False. (False is re
 '''
 Set `stream_output = True` if you want to stream AI output or `stream_output = False` if not.
 '''
+
+# How long to wait for one AI API request, and how many times to retry it on timeouts, rate limits or server errors?
+ai_request_timeout = 30                 # Seconds per attempt. Examples: 30, 60 (Local LLMs on slower machines may need more)
+ai_max_retries = 3                      # Examples: 0, 3. Retries wait with a growing, randomized delay.
+
+# How many AI API requests can be in flight at the same time per provider?
+ai_max_concurrent_requests = 4          # Examples: 1, 4. Keep it at 1 for local LLMs that can only serve one request at a time.
+
+# When the AI API keeps failing or answering slower than `ai_slow_call_seconds`, stop calling it for `ai_breaker_cooldown` seconds and answer without it.
+ai_slow_call_seconds = 20               # Examples: 10, 20. Use 0 to only count failures (Local LLMs may need this)
+ai_breaker_cooldown = 30                # Examples: 30, 60
+
+# Send a second request when the first one is slower than usual (p95) and use whichever answers first? (Costs extra tokens)
+ai_hedge_requests = False               # True or False, Note: True or False are case-sensitive
+
+# Where should skills extracted from job descriptions be cached? The same job description is never sent to the AI twice.
+skills_cache_path = "all excels/skills_cache.db"    # Examples: "all excels/skills_cache.db", or "" to disable the cache
+skills_cache_max_entries = 5000                    # Examples: 1000, 5000. Least recently seen descriptions are dropped beyond this.
+
+# How many AI API requests per minute may this bot send, and how many at once after a pause? (Avoids "429 Too Many Requests")
+ai_requests_per_minute = 0              # Examples: 15 (Gemini free tier), 60, or 0 for no limit
+ai_request_burst = 5                    # Examples: 1, 5
+# Share the AI and LinkedIn rate limits with other bots running on this computer through this file?
+rate_limit_state_path = ""              # Examples: "all excels/rate_limits.db", or "" for this bot only
 ##
 
 
@@ -6,6 +6,9 @@ close_tabs = False                  # True or False, Note: True or False are cas
 Note: RECOMMENDED TO LEAVE IT AS `True`, if you set it `False`, be sure to CLOSE ALL TABS BEFORE CLOSING THE BROWSER!!!
 '''
 
+# External application links are captured without opening a tab when possible, then resolved to the company's link in the background
+external_link_workers = 4           # Number of links resolved at once. 0 to resolve each link before moving to the next job
+
 # Follow easy applied companies
 follow_companies = False            # True or False, Note: True or False are case-sensitive
 
@@ -24,6 +27,13 @@ Note: Will be treated as False if `run_in_background = True`
 alternate_sortby = True             # True or False, Note: True or False are case-sensitive
 cycle_date_posted = True            # True or False, Note: True or False are case-sensitive
 stop_date_cycle_at_24hr = True      # True or False, Note: True or False are case-sensitive
+run_min_gap_minutes = 2             # Shortest wait between two cycles, used while cycles keep finding new job postings
+run_max_gap_minutes = 60            # Longest wait between two cycles, reached while cycles find nothing new
+run_probe_minutes = 5               # While waiting, check the most recent postings every these many minutes and start the next cycle early if there are new ones. 0 to never check
+easy_apply_limit_pause_hours = 0    # When the daily Easy Apply limit is reached, wait these many hours and continue. 0 to stop the run
+run_state_path = "logs/run_schedule.json"  # Where the wait between cycles and the job postings already seen are saved across restarts. "" to not save
+run_checkpoint_path = "logs/run_checkpoint.json"  # Where the search term, page and job the run is at are saved, so a crashed or stopped run continues from there. "" to always start over
+run_checkpoint_max_hours = 24       # A saved position older than these many hours is ignored and the run starts over
 
 
 
@@ -43,11 +53,28 @@ generated_resume_path = "all resumes/" # (In Development)
 # Directory and name of the files where history of applied jobs is saved (Sentence after the last "/" will be considered as the file name).
 file_name = "all excels/all_applied_applications_history.csv"
 failed_file_name = "all excels/all_failed_applications_history.csv"
+history_db_path = "all excels/applications_history.db"    # Indexed copy of both files, imported from them once. "" to disable
+history_flush_interval = 5          # Seconds between writes of new rows to the above files (they are always written when the bot exits). 0 writes every row at once
+history_rotate_mb = 50              # Size in MB at which a file is renamed to "<name>.1.csv", "<name>.2.csv", ... and a new one started. 0 to never rotate
+history_export_path = ""            # Folder to append new history rows to as Parquet (needs pyarrow) after every run, e.g. "all excels/parquet". "" to disable
 logs_folder_path = "logs/"
+log_rotate_mb = 10                  # log.txt is renamed to log.1.txt, log.2.txt, ... (higher is newer) when it grows past this size in MB. 0 to never rotate by size
+log_rotate_hours = 24               # ... or when it is older than these many hours. 0 to never rotate by age
+log_backups = 5                     # Number of rotated log files to keep
+log_json = False                    # True to also write every logged line as a JSON record to "log.jsonl" for log tools
+screenshot_format = "webp"          # Format of failure screenshots in "<logs_folder_path>/screenshots": "webp", "jpeg" or "png" (webp and jpeg need Pillow, else "png" is used)
+screenshot_quality = 70             # Quality of webp and jpeg screenshots, from 1 to 100
+screenshot_max_width = 1280         # Screenshots wider than this are scaled down (needs Pillow). 0 to keep the full size
+screenshot_capture_dom = False      # True to also save the page's HTML with every screenshot (as "<name>.html.gz")
+screenshots_max_mb = 200            # Oldest screenshots are deleted when the folder grows past this size in MB. 0 for no limit
+screenshots_max_age_days = 14       # Screenshots older than these many days are deleted. 0 to keep them
 
 # Set the maximum amount of time allowed to wait between each click in secs
 click_gap = 0                       # Enter max allowed secs to wait approximately. (Only Non Negative Integers Eg: 0,1,2,3,....)
 
+# Set how many LinkedIn search pages may be opened per minute (protects the account from throttling)
+linkedin_pages_per_minute = 12      # Enter 0 for no limit (Only Non Negative Integers Eg: 0,6,12,....)
+
 # If you want to see Chrome running then set run_in_background as False (May reduce performance). 
 run_in_background = False           # True or False, Note: True or False are case-sensitive ,   If True, this will make pause_at_failed_question, pause_before_submit and run_in_background as False
 
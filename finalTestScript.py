@@ -79,11 +79,10 @@ import csv
 import re
 import pyautogui
 
-# Set CSV field size limit to prevent field size errors
-csv.field_size_limit(1000000)  # Set to 1MB instead of default 131KB
-
 from random import choice, shuffle, randint
 from datetime import datetime
+from functools import partial
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -101,13 +100,24 @@ from selenium.common.exceptions import (
 from config.personals import *
 from config.questions import *
 from config.search import *
-from config.secrets import use_AI, username, password, ai_provider
+from config.secrets import use_AI, username, password, ai_provider, skills_cache_path, skills_cache_max_entries
+from config.secrets import ai_requests_per_minute, ai_request_burst, rate_limit_state_path
 from config.settings import *
 
 from modules.open_chrome import *
 from modules.helpers import *
 from modules.clickers_and_finders import *
 from modules.validator import validate_config
+from modules.answer_rules import ProfileAnswerEngine
+from modules.ai.skills_cache import get_skills_cache
+from modules.rate_limiter import configure_rate_limits, rate_limit, rate_limiter_metrics
+from modules.history_store import AppliedJobIds, get_history_store
+from modules.history_writer import close_history_writers, get_history_writer, history_files
+from modules.history_export import export_csv_history
+from modules.screenshots import ScreenshotService, flush_screenshots, get_screenshot_service
+from modules.run_scheduler import RunScheduler
+from modules.run_checkpoint import RunCheckpoint, fingerprint, page_url, resume_index
+from modules.external_links import CAPTURE_SCRIPT, TAKE_CAPTURED_SCRIPT, LinkResolver, close_link_resolver, get_link_resolver
 from modules.ai.openaiConnections import (
     ai_create_openai_client,
     ai_extract_skills,
@@ -177,6 +187,41 @@ notice_period = str(notice_period)
 aiClient = None
 about_company_for_ai = None 
 
+# Deterministic answers from the config, tried before falling back to defaults or AI
+answer_engine = ProfileAnswerEngine(
+    {
+        "first_name": first_name,
+        "middle_name": middle_name,
+        "last_name": last_name,
+        "full_name": full_name,
+        "phone": phone_number,
+        "street": street,
+        "city": current_city,
+        "state": state,
+        "zipcode": zipcode,
+        "country": country,
+        "years_of_experience": years_of_experience,
+        "notice_period": notice_period,
+        "current_ctc": current_ctc,
+        "desired_salary": desired_salary,
+        "linkedin": linkedIn,
+        "website": website,
+        "headline": linkedin_headline,
+        "summary": linkedin_summary,
+        "cover_letter": cover_letter,
+        "recent_employer": recent_employer,
+        "confidence_level": confidence_level,
+        "gender": gender,
+        "ethnicity": ethnicity,
+        "disability_status": disability_status,
+        "veteran_status": veteran_status,
+        "us_citizenship": us_citizenship,
+        "require_visa": require_visa,
+        "security_clearance": security_clearance,
+        "referral_source": "https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System",
+    }
+)
+
 
 # < Login Functions
 def is_logged_in_LN() -> bool:
@@ -246,20 +291,77 @@ def login_LN() -> None:
 # >
 
 
-def get_applied_job_ids() -> set:
+def get_history():
+    """
+    Function to get the indexed applied and failed jobs history
+    * Imports the history csv files the first time
+    * Returns a `HistoryStore`, or `None` if `history_db_path` is empty or the database can't be opened
+    """
+    return get_history_store(history_db_path, file_name, failed_file_name)
+
+
+def save_history(kind: Literal["applied", "failed"], record: dict) -> None:
     """
-    Function to get a `set` of applied job's Job IDs
-    * Returns a set of Job IDs from existing applied jobs history csv file
+    Function to add a job to the indexed history, even when the csv file can't be written
     """
-    job_ids = set()
+    history = get_history()
+    if not history:
+        return
     try:
-        with open(file_name, "r", encoding="utf-8") as file:
-            reader = csv.reader(file)
-            for row in reader:
-                job_ids.add(row[0])
-    except FileNotFoundError:
-        print_lg(f"The CSV file '{file_name}' does not exist.")
-    return job_ids
+        if kind == "applied":
+            history.add_applied(record)
+        else:
+            history.add_failed(record)
+    except Exception as e:
+        print_lg("Failed to update the applications history store!", e)
+
+
+def history_write_failed(error: Exception) -> None:
+    """
+    Function called when a batch of history rows couldn't be written, they are retried on the next flush
+    """
+    print_lg("Failed to write the applications history excel, will retry!", error)
+
+
+def history_written(kind: Literal["applied", "failed"]):
+    """
+    Function to get the callback run after a batch of history rows is written to the csv file
+    * `save_history` already added those rows to the history store, so it must not import them again
+    """
+    def skip_in_store(path: str, start: int, end: int) -> None:
+        history = get_history()
+        if history:
+            history.skip_written(path, kind, start, end)
+    return skip_in_store
+
+
+def get_history_csv(path: str, fieldnames: list[str], kind: Literal["applied", "failed"]):
+    """
+    Function to get the buffered writer of a history csv file
+    * Rows are written in batches every `history_flush_interval` seconds and when the bot exits
+    * The file is rotated to a numbered file (".1.csv", ".2.csv", ...) when it grows past `history_rotate_mb`
+    """
+    return get_history_writer(
+        path,
+        fieldnames,
+        flush_interval=history_flush_interval,
+        max_bytes=int(history_rotate_mb * 1024 * 1024),
+        transform=truncate_for_csv,
+        on_error=history_write_failed,
+        on_written=history_written(kind),
+    )
+
+
+def get_applied_job_ids() -> AppliedJobIds:
+    """
+    Function to get the applied job's Job IDs
+    * Returns a set-like `AppliedJobIds`: `job_id in applied_jobs` is a point query on the history store
+    * Without the store (or if it fails), the Job IDs are read from the applied jobs history csv files
+    """
+    history = get_history()
+    if history is None and history_db_path:
+        print_lg(f"Applied jobs history store '{history_db_path}' is not available, reading '{file_name}' instead.")
+    return AppliedJobIds(history, history_files(file_name))
 
 
 def set_search_location() -> None:
@@ -369,6 +471,48 @@ def apply_filters() -> None:
         # print_lg(e)
 
 
+DATE_POSTED_PARAMS = {"Past 24 hours": "r86400", "Past week": "r604800", "Past month": "r2592000"}
+EXPERIENCE_LEVEL_PARAMS = {"Internship": "1", "Entry level": "2", "Associate": "3", "Mid-Senior level": "4", "Director": "5", "Executive": "6"}
+JOB_TYPE_PARAMS = {"Full-time": "F", "Part-time": "P", "Contract": "C", "Temporary": "T", "Volunteer": "V", "Internship": "I", "Other": "O"}
+ON_SITE_PARAMS = {"On-site": "1", "Remote": "2", "Hybrid": "3"}
+filtered_search_urls = {}
+
+
+def search_url(searchTerm: str, most_recent: bool = False) -> str:
+    """
+    Function to get the search results URL of a search term with the configured filters
+    - Uses the URL LinkedIn showed after `apply_filters` for this search term, else builds it from the search settings
+    - Filters picked by name (companies, industry, ...) need LinkedIn's ids, so only the recorded URL has them
+    - Returns the first page, sorted by most recent if `most_recent`
+    """
+    url = filtered_search_urls.get(searchTerm)
+    if url is None:
+        params = {"keywords": searchTerm}
+        if search_location.strip():
+            params["location"] = search_location.strip()
+        if date_posted in DATE_POSTED_PARAMS:
+            params["f_TPR"] = DATE_POSTED_PARAMS[date_posted]
+        for param, options, selected in (
+            ("f_E", EXPERIENCE_LEVEL_PARAMS, experience_level),
+            ("f_JT", JOB_TYPE_PARAMS, job_type),
+            ("f_WT", ON_SITE_PARAMS, on_site),
+        ):
+            values = [options[option] for option in selected if option in options]
+            if values:
+                params[param] = ",".join(values)
+        if easy_apply_only:
+            params["f_AL"] = "true"
+        if sort_by:
+            params["sortBy"] = "DD" if sort_by == "Most recent" else "R"
+        url = "https://www.linkedin.com/jobs/search/?" + urlencode(params)
+    url = page_url(url, 1)
+    if most_recent:
+        parts = urlsplit(url)
+        query = [(key, value) for key, value in parse_qsl(parts.query) if key != "sortBy"] + [("sortBy", "DD")]
+        url = urlunsplit(parts._replace(query=urlencode(query)))
+    return url
+
+
 def get_page_info() -> tuple[WebElement | None, int | None]:
     """
     Function to get pagination element and current page number
@@ -584,13 +728,6 @@ def upload_resume(modal: WebElement, resume: str) -> tuple[bool, str]:
         return False, "Previous resume"
 
 
-# Function to answer common questions for Easy Apply
-def answer_common_questions(label: str, answer: str) -> str:
-    if "sponsorship" in label or "visa" in label:
-        answer = require_visa
-    return answer
-
-
 # Function to answer the questions for Easy Apply
 def answer_questions(
     modal: WebElement,
@@ -630,27 +767,17 @@ def answer_questions(
                 ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
                 if "email" in label or "phone" in label:
                     answer = prev_answer
-                elif "gender" in label or "sex" in label:
-                    answer = gender
-                elif "disability" in label:
-                    answer = disability_status
-                elif "proficiency" in label:
-                    answer = "Professional"
-                # Add location handling
-                elif any(
-                    loc_word in label
-                    for loc_word in ["location", "city", "state", "country"]
-                ):
-                    if "country" in label:
-                        answer = country
-                    elif "state" in label:
-                        answer = state
-                    elif "city" in label:
-                        answer = current_city if current_city else work_location
-                    else:
-                        answer = work_location
                 else:
-                    answer = answer_common_questions(label, answer)
+                    # Gender, disability, proficiency, location, visa... from the profile rules
+                    answer = (
+                        answer_engine.answer(
+                            label,
+                            optionsText,
+                            "choice",
+                            {"work_location": work_location},
+                        )
+                        or answer
+                    )
                 try:
                     select.select_by_visible_text(answer)
                 except NoSuchElementException as e:
@@ -735,10 +862,12 @@ def answer_questions(
             label_org += " [ "
             options = radio.find_elements(By.TAG_NAME, "input")
             options_labels = []
+            options_texts = []
 
             for option in options:
                 id = option.get_attribute("id")
                 option_label = try_xp(radio, f'.//label[@for="{id}"]', False)
+                options_texts.append(option_label.text if option_label else "Unknown")
                 options_labels.append(
                     f'"{option_label.text if option_label else "Unknown"}"<{option.get_attribute("value")}>'
                 )  # Saving option as "label <value>"
@@ -747,14 +876,13 @@ def answer_questions(
                 label_org += f" {options_labels[-1]},"
 
             if overwrite_previous_answers or prev_answer is None:
-                if "citizenship" in label or "employment eligibility" in label:
-                    answer = us_citizenship
-                elif "veteran" in label or "protected" in label:
-                    answer = veteran_status
-                elif "disability" in label or "handicapped" in label:
-                    answer = disability_status
-                else:
-                    answer = answer_common_questions(label, answer)
+                # Citizenship, veteran, disability, visa... from the profile rules
+                answer = (
+                    answer_engine.answer(
+                        label, options_texts, "choice", {"work_location": work_location}
+                    )
+                    or answer
+                )
                 foundOption = try_xp(
                     radio, f".//label[normalize-space()='{answer}']", False
                 )
@@ -812,87 +940,18 @@ def answer_questions(
 
             prev_answer = text.get_attribute("value")
             if not prev_answer or overwrite_previous_answers:
-                if "experience" in label or "years" in label:
-                    answer = years_of_experience
-                elif "phone" in label or "mobile" in label:
-                    answer = phone_number
-                elif "street" in label:
-                    answer = street
-                elif "city" in label or "location" in label or "address" in label:
-                    answer = current_city if current_city else work_location
-                    do_actions = True
-                elif "signature" in label:
-                    answer = full_name  # 'signature' in label or 'legal name' in label or 'your name' in label or 'full name' in label: answer = full_name     # What if question is 'name of the city or university you attend, name of referral etc?'
-                elif "name" in label:
-                    if "full" in label:
-                        answer = full_name
-                    elif "first" in label and "last" not in label:
-                        answer = first_name
-                    elif "middle" in label and "last" not in label:
-                        answer = middle_name
-                    elif "last" in label and "first" not in label:
-                        answer = last_name
-                    elif "employer" in label:
-                        answer = recent_employer
-                    else:
-                        answer = full_name
-                elif "notice" in label:
-                    if "month" in label:
-                        answer = notice_period_months
-                    elif "week" in label:
-                        answer = notice_period_weeks
-                    else:
-                        answer = notice_period
-                elif (
-                    "salary" in label
-                    or "compensation" in label
-                    or "ctc" in label
-                    or "pay" in label
-                ):
-                    if "current" in label or "present" in label:
-                        if "month" in label:
-                            answer = current_ctc_monthly
-                        elif "lakh" in label:
-                            answer = current_ctc_lakhs
-                        else:
-                            answer = current_ctc
-                    else:
-                        if "month" in label:
-                            answer = desired_salary_monthly
-                        elif "lakh" in label:
-                            answer = desired_salary_lakhs
-                        else:
-                            answer = desired_salary
-                elif "linkedin" in label:
-                    answer = linkedIn
-                elif (
-                    "website" in label
-                    or "blog" in label
-                    or "portfolio" in label
-                    or "link" in label
-                ):
-                    answer = website
-                elif "scale of 1-10" in label:
-                    answer = confidence_level
-                elif "headline" in label:
-                    answer = linkedin_headline
-                elif (
-                    ("hear" in label or "come across" in label)
-                    and "this" in label
-                    and ("job" in label or "position" in label)
-                ):
-                    answer = "https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System"
-                elif "state" in label or "province" in label:
-                    answer = state
-                elif "zip" in label or "postal" in label or "code" in label:
-                    answer = zipcode
-                elif "country" in label:
-                    answer = country
-                else:
-                    answer = answer_common_questions(label, answer)
+                # Experience, contact details, notice period, salary, links... from the profile rules
+                rule_answer = answer_engine.lookup(
+                    label, kind="text", context={"work_location": work_location}
+                )
+                answer_engine.record(rule_answer)
+                if rule_answer:
+                    answer = rule_answer.value
+                    do_actions = rule_answer.rule == "city"
                 ##> ------ Yang Li : MARKYangL - Feature ------
                 if answer == "":
                     if use_AI and aiClient:
+                        answer_engine.note_llm_call()
                         try:
                             if ai_provider.lower() == "openai":
                                 answer = ai_answer_question(
@@ -960,13 +1019,12 @@ def answer_questions(
             answer = ""
             prev_answer = text_area.get_attribute("value")
             if not prev_answer or overwrite_previous_answers:
-                if "summary" in label:
-                    answer = linkedin_summary
-                elif "cover" in label:
-                    answer = cover_letter
+                # Summary and cover letter from the profile rules
+                answer = answer_engine.answer(label, kind="textarea") or ""
                 if answer == "":
                     
                     if use_AI and aiClient:
+                        answer_engine.note_llm_call()
                         try:
                             if ai_provider.lower() == "openai":
                                 answer = ai_answer_question(
@@ -1068,7 +1126,8 @@ def external_apply(
     screenshot_name: str,
 ) -> tuple[bool, str, int]:
     """
-    Function to open new tab and save external job application links
+    Function to get the external job application link
+    - The link LinkedIn opens is captured without loading it, falls back to reading it from the new tab
     """
     global tabs_count, dailyEasyApplyLimitReached
     if easy_apply_only:
@@ -1086,6 +1145,8 @@ def external_apply(
         if pagination_element != None:
             return True, application_link, tabs_count
     try:
+        tabs_before = len(driver.window_handles)
+        driver.execute_script(CAPTURE_SCRIPT)
         wait.until(
             EC.element_to_be_clickable(
                 (
@@ -1095,8 +1156,13 @@ def external_apply(
             )
         ).click()  # './/button[contains(span, "Apply") and not(span[contains(@class, "disabled")])]'
         wait_span_click(driver, "Continue", 1, True, False)
+        captured_links = driver.execute_script(TAKE_CAPTURED_SCRIPT)
         windows = driver.window_handles
         tabs_count = len(windows)
+        if captured_links and tabs_count == tabs_before:
+            application_link = captured_links[-1]
+            print_lg('Captured the external application link "{}"'.format(application_link))
+            return False, application_link, tabs_count
         driver.switch_to.window(windows[-1])
         application_link = driver.current_url
         print_lg('Got the external application link "{}"'.format(application_link))
@@ -1122,6 +1188,20 @@ def external_apply(
         return True, application_link, tabs_count
 
 
+def get_external_links() -> LinkResolver:
+    """
+    Function to get the pool resolving external application links to the company's link and saving those jobs
+    - Uses the LinkedIn cookies of the browser to follow LinkedIn redirects
+    """
+    resolver = get_link_resolver(
+        workers=external_link_workers,
+        on_error=lambda link, e: print_lg(f'Failed to save the job with external link "{link}"!', e),
+    )
+    if not resolver.has_cookies():
+        resolver.set_cookies(driver.get_cookies())
+    return resolver
+
+
 def follow_company(modal: WebDriver = driver) -> None:
     """
     Function to follow or un-follow easy applied companies based om `follow_companies`
@@ -1153,55 +1233,71 @@ def failed_job(
     """
     Function to update failed jobs list in excel
     """
+    save_history("failed", {
+        "job_id": job_id,
+        "job_link": job_link,
+        "resume_tried": resume,
+        "date_listed": date_listed,
+        "date_tried": datetime.now(),
+        "assumed_reason": error,
+        "stack_trace": exception,
+        "external_job_link": application_link,
+        "screenshot_name": screenshot_name,
+    })
     try:
-        with open(failed_file_name, "a", newline="", encoding="utf-8") as file:
-            fieldnames = [
-                "Job ID",
-                "Job Link",
-                "Resume Tried",
-                "Date listed",
-                "Date Tried",
-                "Assumed Reason",
-                "Stack Trace",
-                "External Job link",
-                "Screenshot Name",
-            ]
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            if file.tell() == 0:
-                writer.writeheader()
-            writer.writerow(
-                {
-                    "Job ID": truncate_for_csv(job_id),
-                    "Job Link": truncate_for_csv(job_link),
-                    "Resume Tried": truncate_for_csv(resume),
-                    "Date listed": truncate_for_csv(date_listed),
-                    "Date Tried": datetime.now(),
-                    "Assumed Reason": truncate_for_csv(error),
-                    "Stack Trace": truncate_for_csv(exception),
-                    "External Job link": truncate_for_csv(application_link),
-                    "Screenshot Name": truncate_for_csv(screenshot_name),
-                }
-            )
-            file.close()
+        fieldnames = [
+            "Job ID",
+            "Job Link",
+            "Resume Tried",
+            "Date listed",
+            "Date Tried",
+            "Assumed Reason",
+            "Stack Trace",
+            "External Job link",
+            "Screenshot Name",
+        ]
+        get_history_csv(failed_file_name, fieldnames, "failed").write(
+            {
+                "Job ID": job_id,
+                "Job Link": job_link,
+                "Resume Tried": resume,
+                "Date listed": date_listed,
+                "Date Tried": datetime.now(),
+                "Assumed Reason": error,
+                "Stack Trace": exception,
+                "External Job link": application_link,
+                "Screenshot Name": screenshot_name,
+            }
+        )
     except Exception as e:
         print_lg("Failed to update failed jobs list!", e)
-        pyautogui.alert(
-            "Failed to update the excel of failed jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file",
-            "Failed Logging",
-        )
+
+
+def get_screenshots() -> ScreenshotService:
+    """
+    Function to get the service saving failure screenshots to "<logs_folder_path>/screenshots"
+    - Screenshots are compressed and saved in the background, old ones are deleted past the size and age limits
+    """
+    return get_screenshot_service(
+        (logs_folder_path + "/screenshots").replace("//", "/"),
+        image_format=screenshot_format,
+        quality=screenshot_quality,
+        max_width=screenshot_max_width,
+        capture_dom=screenshot_capture_dom,
+        max_mb=screenshots_max_mb,
+        max_age_days=screenshots_max_age_days,
+    )
 
 
 def screenshot(driver: WebDriver, job_id: str, failedAt: str) -> str:
     """
     Function to to take screenshot for debugging
-    - Returns screenshot name as String
+    - Only grabs the screenshot, it is saved in the background
+    - Returns screenshot file name as String, "Not Available" if it couldn't be taken
     """
-    screenshot_name = "{} - {} - {}.png".format(job_id, failedAt, str(datetime.now()))
-    path = logs_folder_path + "/screenshots/" + screenshot_name.replace(":", ".")
-    # special_chars = {'*', '"', '\\', '<', '>', ':', '|', '?'}
-    # for char in special_chars:  path = path.replace(char, '-')
-    driver.save_screenshot(path.replace("//", "/"))
-    return screenshot_name
+    return get_screenshots().capture(
+        driver, "{} - {} - {}".format(job_id, failedAt, str(datetime.now()))
+    )
 
 
 # >
@@ -1230,60 +1326,71 @@ def submitted_jobs(
     """
     Function to create or update the Applied jobs CSV file, once the application is submitted successfully
     """
+    save_history("applied", {
+        "job_id": job_id,
+        "title": title,
+        "company": company,
+        "work_location": work_location,
+        "work_style": work_style,
+        "about_job": description,
+        "experience_required": experience_required,
+        "skills_required": skills,
+        "hr_name": hr_name,
+        "hr_link": hr_link,
+        "resume": resume,
+        "reposted": reposted,
+        "date_posted": date_listed,
+        "date_applied": date_applied,
+        "job_link": job_link,
+        "external_job_link": application_link,
+        "questions_found": questions_list,
+        "connect_request": connect_request,
+    })
     try:
-        with open(file_name, mode="a", newline="", encoding="utf-8") as csv_file:
-            fieldnames = [
-                "Job ID",
-                "Title",
-                "Company",
-                "Work Location",
-                "Work Style",
-                "About Job",
-                "Experience required",
-                "Skills required",
-                "HR Name",
-                "HR Link",
-                "Resume",
-                "Re-posted",
-                "Date Posted",
-                "Date Applied",
-                "Job Link",
-                "External Job link",
-                "Questions Found",
-                "Connect Request",
-            ]
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            if csv_file.tell() == 0:
-                writer.writeheader()
-            writer.writerow(
-                {
-                    "Job ID": truncate_for_csv(job_id),
-                    "Title": truncate_for_csv(title),
-                    "Company": truncate_for_csv(company),
-                    "Work Location": truncate_for_csv(work_location),
-                    "Work Style": truncate_for_csv(work_style),
-                    "About Job": truncate_for_csv(description),
-                    "Experience required": truncate_for_csv(experience_required),
-                    "Skills required": truncate_for_csv(skills),
-                    "HR Name": truncate_for_csv(hr_name),
-                    "HR Link": truncate_for_csv(hr_link),
-                    "Resume": truncate_for_csv(resume),
-                    "Re-posted": truncate_for_csv(reposted),
-                    "Date Posted": truncate_for_csv(date_listed),
-                    "Date Applied": truncate_for_csv(date_applied),
-                    "Job Link": truncate_for_csv(job_link),
-                    "External Job link": truncate_for_csv(application_link),
-                    "Questions Found": truncate_for_csv(questions_list),
-                    "Connect Request": truncate_for_csv(connect_request),
-                }
-            )
-        csv_file.close()
+        fieldnames = [
+            "Job ID",
+            "Title",
+            "Company",
+            "Work Location",
+            "Work Style",
+            "About Job",
+            "Experience required",
+            "Skills required",
+            "HR Name",
+            "HR Link",
+            "Resume",
+            "Re-posted",
+            "Date Posted",
+            "Date Applied",
+            "Job Link",
+            "External Job link",
+            "Questions Found",
+            "Connect Request",
+        ]
+        get_history_csv(file_name, fieldnames, "applied").write(
+            {
+                "Job ID": job_id,
+                "Title": title,
+                "Company": company,
+                "Work Location": work_location,
+                "Work Style": work_style,
+                "About Job": description,
+                "Experience required": experience_required,
+                "Skills required": skills,
+                "HR Name": hr_name,
+                "HR Link": hr_link,
+                "Resume": resume,
+                "Re-posted": reposted,
+                "Date Posted": date_listed,
+                "Date Applied": date_applied,
+                "Job Link": job_link,
+                "External Job link": application_link,
+                "Questions Found": questions_list,
+                "Connect Request": connect_request,
+            }
+        )
     except Exception as e:
         print_lg("Failed to update submitted jobs list!", e)
-        pyautogui.alert(
-            "Failed to update the excel of applied jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file",
-            "Failed Logging",
-        )
 
 
 # Function to discard the job application
@@ -1300,9 +1407,27 @@ def apply_to_jobs(search_terms: list[str]) -> None:
     global current_city, failed_count, skip_count, easy_applied_count, external_jobs_count, tabs_count, pause_before_submit, pause_at_failed_question, useNewResume
     current_city = current_city.strip()
 
-    if randomize_search_order:
-        shuffle(search_terms)
-    for searchTerm in search_terms:
+    checkpoint = get_run_checkpoint()
+    settings_fingerprint = fingerprint(
+        sorted(search_terms), search_location, date_posted, sort_by, easy_apply_only
+    )
+    resumed = checkpoint.resume(settings_fingerprint)
+    if resumed:
+        search_terms = resumed["search_terms"]
+        rejected_jobs = set(resumed["rejected_jobs"])
+        blacklisted_companies = set(resumed["blacklisted_companies"])
+        print_lg(
+            f'Resuming the previous run at "{search_terms[resumed["term_index"]]}", page {resumed["page"]}'
+        )
+    else:
+        if randomize_search_order:
+            shuffle(search_terms)
+        checkpoint.start(settings_fingerprint, search_terms)
+    for term_index, searchTerm in enumerate(search_terms):
+        resuming = resumed and term_index == resumed["term_index"]
+        if resumed and term_index < resumed["term_index"]:
+            continue
+        rate_limit("linkedin")
         driver.get(f"https://www.linkedin.com/jobs/search/?keywords={searchTerm}")
         print_lg(
             "\n________________________________________________________________________________________________________________________\n"
@@ -1310,8 +1435,16 @@ def apply_to_jobs(search_terms: list[str]) -> None:
         print_lg(f'\n>>>> Now searching for "{searchTerm}" <<<<\n\n')
 
         apply_filters()
+        filtered_search_urls[searchTerm] = driver.current_url
 
         current_count = 0
+        resume_job_id = None
+        if resuming:
+            current_count = resumed["applied"]
+            resume_job_id = resumed["job_id"]
+            if resumed["page"] > 1:
+                rate_limit("linkedin")
+                driver.get(page_url(driver.current_url, resumed["page"]))
         try:
             while current_count < switch_number:
                 # Wait until job listings are loaded
@@ -1322,12 +1455,29 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                 )
 
                 pagination_element, current_page = get_page_info()
+                checkpoint.at_page(
+                    term_index,
+                    current_page or 1,
+                    current_count,
+                    rejected_jobs,
+                    blacklisted_companies,
+                    resume_job_id,
+                )
 
                 # Find all job listings in current page
                 buffer(3)
                 job_listings = driver.find_elements(
                     By.XPATH, "//li[@data-occludable-job-id]"
                 )
+                if resume_job_id:
+                    # Jobs before the one the previous run stopped at are done
+                    job_listings = job_listings[
+                        resume_index(
+                            [job.get_dom_attribute("data-occludable-job-id") for job in job_listings],
+                            resume_job_id,
+                        ):
+                    ]
+                    resume_job_id = None
 
                 for job in job_listings:
                     if keep_screen_awake:
@@ -1339,6 +1489,8 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     job_id, title, company, work_location, work_style, skip = (
                         get_job_main_details(job, blacklisted_companies, rejected_jobs)
                     )
+                    checkpoint.at_job(job_id, current_count)
+                    get_run_scheduler().saw(job_id)
 
                     if skip:
                         continue
@@ -1648,7 +1800,8 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         if skip:
                             continue
 
-                    submitted_jobs(
+                    save_job = partial(
+                        submitted_jobs,
                         job_id,
                         title,
                         company,
@@ -1664,10 +1817,14 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         date_listed,
                         date_applied,
                         job_link,
-                        application_link,
-                        questions_list,
-                        connect_request,
+                        questions_list=questions_list,
+                        connect_request=connect_request,
                     )
+                    if application_link == "Easy Applied":
+                        save_job(application_link)
+                    else:
+                        # Resolved to the company's link and saved in the background, while this loop goes on
+                        get_external_links().submit(application_link, save_job)
                     if uploaded:
                         useNewResume = False
 
@@ -1703,6 +1860,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                 "Browser window closed or session is invalid. Ending application process.",
                 e,
             )
+            checkpoint.save()
             raise e  # Re-raise to be caught by main
         except Exception as e:
             print_lg("Failed to find Job listings!")
@@ -1714,6 +1872,83 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     f"Failed to get page source, browser might have crashed. {page_source_error}"
                 )
             # print_lg(e)
+    checkpoint.clear()
+
+
+run_checkpoint = None
+
+
+def get_run_checkpoint() -> RunCheckpoint:
+    """
+    Function to get the checkpoint of the current run through the search terms
+    - Saved to `run_checkpoint_path`, so a crashed or killed run can pick up where it stopped
+    """
+    global run_checkpoint
+    if run_checkpoint is None:
+        run_checkpoint = RunCheckpoint(
+            run_checkpoint_path, max_age=run_checkpoint_max_hours * 3600
+        )
+    return run_checkpoint
+
+
+run_scheduler = None
+probe_count = 0
+
+
+def get_run_scheduler() -> RunScheduler:
+    """
+    Function to get the scheduler deciding when the next cycle of a non-stop run starts
+    - Its state is loaded from and saved to `run_state_path`
+    """
+    global run_scheduler
+    if run_scheduler is None:
+        run_scheduler = RunScheduler(
+            run_state_path,
+            min_gap=run_min_gap_minutes * 60,
+            max_gap=run_max_gap_minutes * 60,
+            probe_interval=run_probe_minutes * 60,
+            limit_pause=easy_apply_limit_pause_hours * 3600,
+        )
+    return run_scheduler
+
+
+def probe_new_postings() -> list[str]:
+    """
+    Function to check the most recent postings of the next search term between cycles
+    - Opens a single page of the same filtered search the cycle uses, without opening any job
+    - Returns the job IDs on that page
+    """
+    global probe_count
+    searchTerm = search_terms[probe_count % len(search_terms)]
+    probe_count += 1
+    rate_limit("linkedin")
+    driver.get(search_url(searchTerm, most_recent=True))
+    wait.until(
+        EC.presence_of_all_elements_located((By.XPATH, "//li[@data-occludable-job-id]"))
+    )
+    return [
+        job.get_dom_attribute("data-occludable-job-id")
+        for job in driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")
+    ]
+
+
+def wait_for_next_cycle() -> None:
+    """
+    Function to wait until the next cycle is due, or start it early when new postings show up
+    - Doesn't check for new postings while waiting for the daily Easy Apply limit to reset (also after a restart)
+    """
+    global dailyEasyApplyLimitReached
+    scheduler = get_run_scheduler()
+    print_lg(
+        "Next cycle in {} min...".format(round(scheduler.seconds_left() / 60, 1))
+    )
+    reason = scheduler.wait(
+        probe_new_postings,
+        lambda e: print_lg("Failed to check for new job postings!", e),
+    )
+    if reason == "new postings":
+        print_lg("Found new job postings, starting the next cycle now!")
+    dailyEasyApplyLimitReached = False
 
 
 def run(total_runs: int) -> int:
@@ -1727,15 +1962,18 @@ def run(total_runs: int) -> int:
     print_lg(
         f"Currently looking for jobs posted within '{date_posted}' and sorting them by '{sort_by}'"
     )
+    scheduler = get_run_scheduler()
+    scheduler.start_cycle()
+    rate_limit_waits = rate_limiter_metrics().get("linkedin", {}).get("waited", 0)
     apply_to_jobs(search_terms)
     print_lg(
         "########################################################################################################################\n"
     )
-    if not dailyEasyApplyLimitReached:
-        print_lg("Sleeping for 10 min...")
-        sleep(300)
-        print_lg("Few more min... Gonna start with in next 5 min...")
-        sleep(300)
+    rate_limited = rate_limiter_metrics().get("linkedin", {}).get("waited", 0) > rate_limit_waits
+    scheduler.finish_cycle(dailyEasyApplyLimitReached, rate_limited)
+    print_lg(f"New job postings found in this cycle: {scheduler.cycle_new}")
+    if run_non_stop and (not dailyEasyApplyLimitReached or easy_apply_limit_pause_hours):
+        wait_for_next_cycle()
     buffer(3)
     return total_runs + 1
 
@@ -1750,6 +1988,10 @@ def main() -> None:
         alert_title = "Error Occurred. Closing Browser!"
         total_runs = 1
         validate_config()
+        configure_rate_limits(
+            {ai_provider: (ai_requests_per_minute, ai_request_burst), "linkedin": (linkedin_pages_per_minute, 3)},
+            rate_limit_state_path,
+        )
 
         if not os.path.exists(default_resume_path):
             pyautogui.alert(
@@ -1806,6 +2048,9 @@ def main() -> None:
 
         # Start applying to jobs
         driver.switch_to.window(linkedIn_tab)
+        if run_non_stop and get_run_scheduler().seconds_left():
+            print_lg("Continuing the schedule of the previous run.")
+            wait_for_next_cycle()
         total_runs = run(total_runs)
         while run_non_stop:
             if cycle_date_posted:
@@ -1858,6 +2103,31 @@ def main() -> None:
         )
         print_lg("\nFailed jobs:                    {}".format(failed_count))
         print_lg("Irrelevant jobs skipped:        {}\n".format(skip_count))
+        print_lg("Questions answered:             {}\n".format(answer_engine.summary()))
+        # Where the run stopped, with the job it was working on
+        get_run_checkpoint().save()
+        # Jobs with external links still being resolved are saved before the history files are closed
+        close_link_resolver()
+        if not close_history_writers():
+            pyautogui.alert(
+                "Failed to update the excels of applied and failed jobs!\nProbably because of 1 of the following reasons:\n1. The file is currently open or in use by another program\n2. Permission denied to write to the file\n3. Failed to find the file",
+                "Failed Logging",
+            )
+        if history_export_path and get_history():
+            try:
+                exported = export_csv_history(history_export_path, get_history())
+                print_lg("History exported to Parquet:    {applied} applied, {failed} failed\n".format(**exported))
+            except Exception as e:
+                print_lg("Failed to export the applications history to Parquet!", e)
+        skills_cache = get_skills_cache(skills_cache_path, skills_cache_max_entries) if use_AI else None
+        if skills_cache:
+            cache_stats = skills_cache.get_stats()
+            print_lg("Skills from cache:              {} of {} descriptions\n".format(
+                cache_stats["hits"], cache_stats["hits"] + cache_stats["misses"]))
+        for resource, limiter_stats in rate_limiter_metrics().items():
+            if limiter_stats["waited"]:
+                print_lg("Rate limit waits ({}):{}{} totalling {}s\n".format(
+                    resource, " " * max(1, 13 - len(resource)), limiter_stats["waited"], limiter_stats["total_wait"]))
         if randomly_answered_questions:
             print_lg(
                 "\n\nQuestions randomly answered:\n  {}  \n\n".format(
@@ -1909,6 +2179,8 @@ def main() -> None:
             print_lg("Browser already closed.", e)
         except Exception as e:
             critical_error_log("When quitting...", e)
+        flush_screenshots()
+        flush_logs()
 
 
 if __name__ == "__main__":
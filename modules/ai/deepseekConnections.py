@@ -3,17 +3,16 @@ from config.secrets import *
 from config.settings import showAiErrorAlerts
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
+from modules.ai.llm_provider import LLMProvider, get_provider
+from modules.ai.skills_cache import get_skills_cache
 
 from pyautogui import confirm
-from openai import OpenAI
-from openai.types.model import Model
-from openai.types.chat import ChatCompletion, ChatCompletionChunk
-from typing import Iterator, Literal
+from typing import Literal
 
-def deepseek_create_client() -> OpenAI | None:
+def deepseek_create_client() -> LLMProvider | None:
     '''
     Creates a DeepSeek client using the OpenAI compatible API.
-    * Returns an OpenAI-compatible client configured for DeepSeek
+    * Returns an OpenAI-compatible `LLMProvider` configured for DeepSeek
     '''
     try:
         print_lg("Creating DeepSeek client...")
@@ -28,7 +27,18 @@ def deepseek_create_client() -> OpenAI | None:
             base_url = base_url[:-1]
         
         # Create client with DeepSeek endpoint
-        client = OpenAI(base_url=base_url, api_key=llm_api_key)
+        client = get_provider(
+            "deepseek",
+            api_key=llm_api_key,
+            model=llm_model,
+            base_url=base_url,
+            timeout=ai_request_timeout,
+            max_retries=ai_max_retries,
+            max_concurrency=ai_max_concurrent_requests,
+            slow_call=ai_slow_call_seconds or None,
+            breaker_cooldown=ai_breaker_cooldown,
+            hedge=ai_hedge_requests,
+        )
         
         print_lg("---- SUCCESSFULLY CREATED DEEPSEEK CLIENT! ----")
         print_lg(f"Using API URL: {base_url}")
@@ -55,10 +65,10 @@ def deepseek_model_supports_temperature(model_name: str) -> bool:
     deepseek_models = ["deepseek-chat", "deepseek-reasoner"]
     return model_name in deepseek_models
 
-def deepseek_completion(client: OpenAI, messages: list[dict], response_format: dict = None, temperature: float = 0, stream: bool = stream_output) -> dict | ValueError:
+def deepseek_completion(client: LLMProvider, messages: list[dict], response_format: dict = None, temperature: float = 0, stream: bool = stream_output) -> dict | ValueError:
     '''
     Completes a chat using DeepSeek API and formats the results.
-    * Takes in `client` of type `OpenAI` - The DeepSeek client
+    * Takes in `client` of type `LLMProvider` - The DeepSeek client
     * Takes in `messages` of type `list[dict]` - The conversation messages
     * Takes in `response_format` of type `dict` for JSON representation (optional)
     * Takes in `temperature` of type `float` for randomness control (default 0)
@@ -69,14 +79,7 @@ def deepseek_completion(client: OpenAI, messages: list[dict], response_format: d
         raise ValueError("DeepSeek client is not available!")
     ##> ------ Tim L : tulxoro - Improvement ------
     # Set up parameters for the API call
-    params = {
-        
-        "model": llm_model, 
-   
-        "messages": messages, 
-        "stream": stream,
-        "timeout": 30  
-    }
+    params = {"extra": {}}
     
     # Add temperature if supported
     if deepseek_model_supports_temperature(llm_model):
@@ -84,43 +87,34 @@ def deepseek_completion(client: OpenAI, messages: list[dict], response_format: d
 
     # Add response format if needed (DeepSeek uses OpenAI-compatible API)
     if response_format:
-        params["response_format"] = response_format
+        params["extra"]["response_format"] = response_format
 
     try:
-        # Make the API call
+        # Make the API call, retries and timeouts are handled by the provider
         print_lg(f"Calling DeepSeek API for completion...")
         print_lg(f"Using model: {llm_model}")
         print_lg(f"Message count: {len(messages)}")
-        completion = client.chat.completions.create(**params)
-    ##<
-        result = ""
-        
-        # Process the response
         if stream:
-            print_lg("--STREAMING STARTED")
-            for chunk in completion:
-                # Check for errors
-                if chunk.model_extra and chunk.model_extra.get("error"):
-                    raise ValueError(f'Error occurred with DeepSeek API: "{chunk.model_extra.get("error")}"')
-                
-                chunk_message = chunk.choices[0].delta.content
-                if chunk_message is not None:
-                    result += chunk_message
-                print_lg(chunk_message, end="", flush=True)
-            print_lg("\n--STREAMING COMPLETE")
+            # Print the answer while it is generated
+            print_lg("\nDeepSeek Answer:\n")
+            chunks = client.stream(messages, **params)
+            for chunk in chunks:
+                print_lg(chunk, end="", flush=True)
+            print_lg("")
+            completion = chunks.response
         else:
-            # Check for errors
-            if completion.model_extra and completion.model_extra.get("error"):
-                raise ValueError(f'Error occurred with DeepSeek API: "{completion.model_extra.get("error")}"')
-            
-            result = completion.choices[0].message.content
+            completion = client.complete(messages, **params)
+    ##<
+        result = completion.text
+        print_lg(f"DeepSeek response in {completion.latency:.2f}s after {completion.attempts} attempt(s)")
         
         # Convert to JSON if needed
         if response_format:
             result = convert_to_json(result)
         
-        print_lg("\nDeepSeek Answer:\n")
-        print_lg(result, pretty=response_format is not None)
+        if not stream:
+            print_lg("\nDeepSeek Answer:\n")
+            print_lg(result, pretty=response_format is not None)
         return result
     except Exception as e:
         error_message = f"DeepSeek API error: {str(e)}"
@@ -141,14 +135,20 @@ def deepseek_completion(client: OpenAI, messages: list[dict], response_format: d
             
         raise ValueError(error_message)
 
-def deepseek_extract_skills(client: OpenAI, job_description: str, stream: bool = stream_output) -> dict | ValueError:
+def deepseek_extract_skills(client: LLMProvider, job_description: str, stream: bool = stream_output) -> dict | ValueError:
     '''
     Function to extract skills from job description using DeepSeek API.
-    * Takes in `client` of type `OpenAI` - The DeepSeek client
+    * Takes in `client` of type `LLMProvider` - The DeepSeek client
     * Takes in `job_description` of type `str` - The job description text
     * Takes in `stream` of type `bool` to indicate if it's a streaming call
     * Returns a `dict` object representing JSON response
     '''
+    skills_cache = get_skills_cache(skills_cache_path, skills_cache_max_entries)
+    cached = skills_cache.get(job_description) if skills_cache else None
+    if cached is not None:
+        print_lg("Skills loaded from cache (job description seen before)")
+        return cached
+
     try:
         print_lg("Extracting skills from job description using DeepSeek...")
         
@@ -170,14 +170,16 @@ def deepseek_extract_skills(client: OpenAI, job_description: str, stream: bool =
         # Ensure the result is a dictionary
         if isinstance(result, str):
             result = convert_to_json(result)
-            
+        
+        if skills_cache:
+            skills_cache.put(job_description, result, client.name, client.model)
         return result
     except Exception as e:
         critical_error_log("Error occurred while extracting skills with DeepSeek!", e)
         return {"error": str(e)}
 
 def deepseek_answer_question(
-    client: OpenAI, 
+    client: LLMProvider, 
     question: str, options: list[str] | None = None, 
     question_type: Literal['text', 'textarea', 'single_select', 'multiple_select'] = 'text', 
     job_description: str = None, about_company: str = None, user_information_all: str = None,
@@ -185,7 +187,7 @@ def deepseek_answer_question(
 ) -> dict | ValueError:
     '''
     Function to answer a question using DeepSeek AI.
-    * Takes in `client` of type `OpenAI` - The DeepSeek client
+    * Takes in `client` of type `LLMProvider` - The DeepSeek client
     * Takes in `question` of type `str` - The question to answer
     * Takes in `options` of type `list[str] | None` - Options for select questions
     * Takes in `question_type` - Type of question (text, textarea, single_select, multiple_select)
@@ -1,18 +1,21 @@
-import google.generativeai as genai
-from config.secrets import llm_model, llm_api_key
+from config.secrets import llm_model, llm_api_key, llm_api_url, ai_request_timeout, ai_max_retries, ai_max_concurrent_requests
+from config.secrets import skills_cache_path, skills_cache_max_entries
+from config.secrets import ai_slow_call_seconds, ai_breaker_cooldown, ai_hedge_requests
 from config.settings import showAiErrorAlerts
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
+from modules.ai.llm_provider import LLMProvider, get_provider
+from modules.ai.skills_cache import get_skills_cache
 from pyautogui import confirm
 from typing import Literal
 
-def gemini_get_models_list():
+def gemini_get_models_list(model: LLMProvider):
     """
     Lists available Gemini models that support content generation.
     """
     try:
         print_lg("Getting Gemini models list...")
-        models = [m.name for m in genai.list_models() if 'generateContent' in m.supported_generation_methods]
+        models = model.list_models()
         print_lg("Available models:")
         for model in models:
             print_lg(f"- {model}")
@@ -31,15 +34,26 @@ def gemini_create_client():
         if not llm_api_key or "YOUR_API_KEY" in llm_api_key:
             raise ValueError("Gemini API key is not set. Please set it in `config/secrets.py`.")
         
-        genai.configure(api_key=llm_api_key)
+        # `llm_api_url` is usually left empty for Gemini, the provider then uses Google's endpoint;
+        # any other url (e.g. the benchmark stub server) is used as the Gemini API base url
+        model = get_provider(
+            "gemini",
+            api_key=llm_api_key,
+            model=llm_model,
+            base_url=llm_api_url,
+            timeout=ai_request_timeout,
+            max_retries=ai_max_retries,
+            max_concurrency=ai_max_concurrent_requests,
+            slow_call=ai_slow_call_seconds or None,
+            breaker_cooldown=ai_breaker_cooldown,
+            hedge=ai_hedge_requests,
+        )
         
-        models = gemini_get_models_list()
+        models = gemini_get_models_list(model)
         if "error" in models:
             raise ValueError(models[1])
         if not any(llm_model in m for m in models):
              raise ValueError(f"Model `{llm_model}` is not found or not available for content generation!")
-
-        model = genai.GenerativeModel(llm_model)
         
         print_lg("---- SUCCESSFULLY CONFIGURED GEMINI CLIENT! ----")
         print_lg(f"Using Model: {llm_model}")
@@ -58,7 +72,7 @@ def gemini_create_client():
 def gemini_completion(model, prompt: str, is_json: bool = False) -> dict | str:
     """
     Generates content using the Gemini model.
-    * Takes in `model` - The Gemini model object.
+    * Takes in `model` - The Gemini `LLMProvider`.
     * Takes in `prompt` of type `str` - The prompt to send to the model.
     * Takes in `is_json` of type `bool` - Whether to expect a JSON response.
     * Returns the response as a string or a dictionary.
@@ -67,35 +81,11 @@ def gemini_completion(model, prompt: str, is_json: bool = False) -> dict | str:
         raise ValueError("Gemini client is not available!")
 
     try:
-        # The Gemini API has a 'safety_settings' parameter to control content filtering.
-        # For a job application helper, it's generally safe to set these to a less restrictive level
-        # to avoid blocking legitimate content from resumes or job descriptions.
-        safety_settings = [
-            {
-                "category": "HARM_CATEGORY_HARASSMENT",
-                "threshold": "BLOCK_NONE",
-            },
-            {
-                "category": "HARM_CATEGORY_HATE_SPEECH",
-                "threshold": "BLOCK_NONE",
-            },
-            {
-                "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                "threshold": "BLOCK_NONE",
-            },
-            {
-                "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                "threshold": "BLOCK_NONE",
-            },
-        ]
-
+        # The provider sends the safety settings at BLOCK_NONE. For a job application helper
+        # this avoids blocking legitimate content from resumes or job descriptions.
         print_lg(f"Calling Gemini API for completion...")
-        response = model.generate_content(prompt, safety_settings=safety_settings)
-        
-        # The response might be blocked. Check for that.
-        if not response.parts:
-             raise ValueError("The response from the Gemini API was empty. This might be due to the safety filters blocking the prompt or the response. The prompt was:\n" + prompt)
-
+        # An empty or blocked response raises an `LLMProviderError` with the block reason
+        response = model.complete(prompt)
         result = response.text
 
         if is_json:
@@ -115,14 +105,23 @@ def gemini_completion(model, prompt: str, is_json: bool = False) -> dict | str:
 def gemini_extract_skills(model, job_description: str) -> list[str] | None:
     """
     Extracts skills from a job description using the Gemini model.
-    * Takes in `model` - The Gemini model object.
+    * Takes in `model` - The Gemini `LLMProvider`.
     * Takes in `job_description` of type `str`.
     * Returns a `dict` object representing JSON response.
     """
+    skills_cache = get_skills_cache(skills_cache_path, skills_cache_max_entries)
+    cached = skills_cache.get(job_description) if skills_cache else None
+    if cached is not None:
+        print_lg("Skills loaded from cache (job description seen before)")
+        return cached
+
     try:
         print_lg("Extracting skills from job description using Gemini...")
         prompt = extract_skills_prompt.format(job_description) + "\n\nImportant: Respond with only the JSON object, without any markdown formatting or other text."
-        return gemini_completion(model, prompt, is_json=True)
+        result = gemini_completion(model, prompt, is_json=True)
+        if skills_cache:
+            skills_cache.put(job_description, result, model.name, model.model)
+        return result
     except Exception as e:
         critical_error_log("Error occurred while extracting skills with Gemini!", e)
         return {"error": str(e)}
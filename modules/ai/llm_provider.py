@@ -0,0 +1,971 @@
+"""
+Author:     Shakeeb Shaikh
+LinkedIn:   https://www.linkedin.com/in/shakib-shaikh-660a44377/
+
+GitHub:     https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System
+
+Unified LLM provider layer shared by the Flask app (`app/utils`) and the standalone
+script (`modules/ai/*Connections.py`).
+
+Every provider talks plain HTTP through one pooled `httpx.AsyncClient` (HTTP/2 when
+the optional `h2` package is installed) running on a shared background event loop, with
+retry and jittered backoff, a per-provider concurrency limit and latency/token metrics.
+Synchronous callers use `LLMProvider.complete`, async callers `LLMProvider.acomplete`
+(async callers on their own loop get a pool and concurrency limit for that loop).
+
+A per-provider circuit breaker rejects calls at once (`CircuitOpenError`) while the API is
+failing or too slow, so callers fall back to local answers instead of waiting on timeouts.
+Optionally a call is hedged: a second request is sent when the first outlives the p95 latency.
+
+Long answers can be streamed (`LLMProvider.stream`, `LLMProvider.astream`): text arrives as
+server-sent events and is handed out chunk by chunk, with a length cap and cancellation.
+
+Every HTTP attempt, retries and hedged requests included, first waits (at most `timeout` seconds)
+for the process-wide rate limit of its API (`modules.rate_limiter`).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import queue
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Literal
+
+import httpx
+
+from modules.rate_limiter import RateLimitTimeout, arate_limit, get_rate_limit_key
+
+try:
+    import h2  # noqa: F401  (only needed to enable HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+ProviderKind = Literal["gemini", "openai"]
+
+DEFAULT_BASE_URLS = {
+    "gemini": "https://generativelanguage.googleapis.com/v1beta",
+    "openai": "https://api.openai.com/v1",
+    "deepseek": "https://api.deepseek.com/v1",
+}
+
+# Providers that speak the OpenAI chat completions protocol
+OPENAI_COMPATIBLE = {"openai", "openai-like", "deepseek"}
+
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+GEMINI_SAFETY_SETTINGS = [
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+]
+
+
+class LLMProviderError(Exception):
+    """
+    Raised when a provider call fails after all retries.
+    * `status_code` is the last HTTP status (or `None` for transport errors)
+    * `retryable` tells whether the failure was transient
+    """
+
+    def __init__(self, message: str, status_code: int | None = None, retryable: bool = False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+
+
+class CircuitOpenError(LLMProviderError):
+    """
+    Raised without calling the API while a provider's circuit breaker is open.
+    * `retry_in` is the number of seconds until the breaker lets a probe request through
+    """
+
+    def __init__(self, message: str, retry_in: float = 0.0):
+        super().__init__(message, retryable=False)
+        self.retry_in = retry_in
+
+
+@dataclass
+class ProviderConfig:
+    """Connection settings for one provider/model pair"""
+    name: str
+    api_key: str = ""
+    model: str = ""
+    base_url: str = ""
+    timeout: float = 30.0
+    max_retries: int = 3
+    max_concurrency: int = 4
+    backoff_base: float = 0.5
+    backoff_cap: float = 8.0
+    # Circuit breaker: trips when at least `breaker_failure_ratio` of the last `breaker_window`
+    # calls failed or took longer than `breaker_slow_call` seconds (`None`: only failures count)
+    breaker_window: int = 10
+    breaker_min_calls: int = 4
+    breaker_failure_ratio: float = 0.5
+    breaker_slow_call: float | None = None
+    breaker_cooldown: float = 30.0
+    # Hedging: send a second, identical request when the first outlives the p95 latency
+    hedge: bool = False
+    hedge_min_samples: int = 20
+    hedge_min_delay: float = 0.5
+
+    @property
+    def kind(self) -> ProviderKind:
+        return "openai" if self.name in OPENAI_COMPATIBLE else "gemini"
+
+    def resolved_base_url(self) -> str:
+        return (self.base_url or DEFAULT_BASE_URLS.get(self.name, DEFAULT_BASE_URLS["openai"])).rstrip("/")
+
+
+@dataclass
+class LLMResponse:
+    """Result of one completion"""
+    text: str
+    provider: str
+    model: str
+    latency: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0      # Prompt tokens served from the provider's context cache
+    attempts: int = 1
+    first_chunk_latency: float | None = None    # Streamed calls: seconds until the first text arrived
+    raw: dict = field(default_factory=dict, repr=False)
+
+    def json(self) -> dict:
+        """
+        Parses the response text as JSON, tolerating markdown code fences.
+        * Returns a `dict` or raises `ValueError`
+        """
+        text = self.text.strip()
+        if text.startswith("```"):
+            text = text.split("\n", 1)[1] if "\n" in text else ""
+            if text.rstrip().endswith("```"):
+                text = text.rstrip()[:-3]
+        return json.loads(text)
+
+
+class ProviderMetrics:
+    """Thread-safe call, latency and token counters for one provider"""
+
+    def __init__(self, window: int = 500):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cached_tokens = 0
+        self.in_flight = 0
+        self.hedged = 0         # Calls that sent a second, hedged request
+        self.hedge_wins = 0     # Hedged calls answered by the second request
+        self.streamed = 0       # Calls streamed chunk by chunk
+        self.stream_cancels = 0 # Streams stopped early by the caller (length cap, cancellation)
+
+    def started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self, latency: float, response: LLMResponse | None = None, retries: int = 0) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.calls += 1
+            self.retries += retries
+            self._latencies.append(latency)
+            if response is None:
+                self.errors += 1
+            else:
+                self.prompt_tokens += response.prompt_tokens
+                self.completion_tokens += response.completion_tokens
+                self.cached_tokens += response.cached_tokens
+
+    def hedge(self, won: bool) -> None:
+        with self._lock:
+            self.hedged += 1
+            self.hedge_wins += int(won)
+
+    def stream(self, cancelled: bool) -> None:
+        with self._lock:
+            self.streamed += 1
+            self.stream_cancels += int(cancelled)
+
+    def sample_count(self) -> int:
+        with self._lock:
+            return len(self._latencies)
+
+    def percentile(self, pct: float) -> float | None:
+        with self._lock:
+            samples = sorted(self._latencies)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(round(pct / 100 * (len(samples) - 1)))))
+        return samples[index]
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latencies = list(self._latencies)
+            data = {
+                "calls": self.calls,
+                "errors": self.errors,
+                "retries": self.retries,
+                "in_flight": self.in_flight,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "cached_tokens": self.cached_tokens,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "streamed": self.streamed,
+                "stream_cancels": self.stream_cancels,
+            }
+        data["avg_latency"] = round(sum(latencies) / len(latencies), 3) if latencies else None
+        data["p50_latency"] = self.percentile(50)
+        data["p95_latency"] = self.percentile(95)
+        return data
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker.
+    * closed: calls go through and their outcome is recorded in a sliding window
+    * open: calls are rejected at once for `cooldown` seconds after too many bad outcomes
+    * half_open: after the cooldown one probe call goes through; success closes the breaker,
+      failure opens it again
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, config: ProviderConfig, clock=time.monotonic):
+        self.config = config
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes = deque(maxlen=max(1, config.breaker_window))
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    def retry_in(self) -> float:
+        return max(0.0, self.opened_at + self.config.breaker_cooldown - self._clock())
+
+    def allow(self) -> bool:
+        """Returns whether a call may go to the API now"""
+        with self._lock:
+            if self.state == self.OPEN and self.retry_in() <= 0:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, success: bool, latency: float) -> None:
+        """Records the outcome of an allowed call"""
+        slow = self.config.breaker_slow_call is not None and latency > self.config.breaker_slow_call
+        bad = not success or slow
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                if bad:
+                    self._open()
+                else:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+                return
+            self._outcomes.append(bad)
+            if self.state == self.CLOSED and len(self._outcomes) >= self.config.breaker_min_calls and \
+                    sum(self._outcomes) / len(self._outcomes) >= self.config.breaker_failure_ratio:
+                self._open()
+
+    def release(self) -> None:
+        """Forgets an allowed call that was cancelled before it had an outcome"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self.opened_at = self._clock()
+        self.times_opened += 1
+        self._outcomes.clear()
+        logger.warning(f"Circuit breaker for {self.config.name} opened; "
+                       f"answering without it for {self.config.breaker_cooldown:.0f}s")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            outcomes = list(self._outcomes)
+            return {
+                "state": self.state,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+                "recent_failure_rate": round(sum(outcomes) / len(outcomes), 3) if outcomes else 0.0,
+                "retry_in": round(self.retry_in(), 1) if self.state == self.OPEN else 0.0,
+            }
+
+
+class _LoopThread:
+    """Background asyncio loop shared by all providers so sync callers get pooled connections"""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name="llm-provider-loop", daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @classmethod
+    def get(cls) -> "_LoopThread":
+        with cls._instance_lock:
+            if cls._instance is None or not cls._instance.thread.is_alive():
+                cls._instance = cls()
+            return cls._instance
+
+    def run(self, coro, timeout: float | None = None):
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # Timed out or interrupted: stop the coroutine too, or it keeps its connection and semaphore slot
+            future.cancel()
+            raise
+
+
+class LLMStream:
+    """
+    Synchronous iterator over a streamed completion, fed from the shared loop.
+    * Iterating yields text chunks of type `str` as they arrive; `text` holds all text handed out
+    * `max_chars` caps the text: the last chunk is cut there and the request cancelled (`truncated`)
+    * `cancel()` stops the generation; safe to call from any thread, also called on `with` exit
+    * `response` is the final `LLMResponse` once the provider finished, else `None`
+    """
+
+    _END = object()
+
+    def __init__(self, events, max_chars: int | None = None, chunk_timeout: float | None = None):
+        self.max_chars = max_chars
+        self.chunk_timeout = chunk_timeout
+        self.text = ""
+        self.response: LLMResponse | None = None
+        self.truncated = False
+        self.cancelled = False
+        self._finished = False
+        self._queue = queue.Queue()
+        self._future = asyncio.run_coroutine_threadsafe(self._pump(events), _LoopThread.get().loop)
+
+    async def _pump(self, events) -> None:
+        try:
+            async for event in events:
+                self._queue.put(event)
+        except Exception as e:
+            self._queue.put(e)
+        finally:
+            await events.aclose()
+            self._queue.put(self._END)
+
+    def __iter__(self) -> "LLMStream":
+        return self
+
+    def __next__(self) -> str:
+        while not self._finished:
+            try:
+                event = self._queue.get(timeout=self.chunk_timeout)
+            except queue.Empty:
+                self.cancel()
+                raise LLMProviderError("Streamed response timed out", retryable=True)
+            if event is self._END:
+                self._finished = True
+            elif isinstance(event, Exception):
+                self._finished = True
+                raise event
+            elif isinstance(event, LLMResponse):
+                self.response = event
+            else:
+                return self._take(event)
+        raise StopIteration
+
+    def _take(self, chunk: str) -> str:
+        if self.max_chars is not None and len(self.text) + len(chunk) >= self.max_chars:
+            chunk = chunk[:max(0, self.max_chars - len(self.text))]
+            self.truncated = True
+            self.cancel()
+        self.text += chunk
+        return chunk
+
+    def read(self) -> str:
+        """
+        Waits for the rest of the stream.
+        * Returns the whole text (cut at `max_chars`)
+        """
+        for _ in self:
+            pass
+        return self.text
+
+    def cancel(self) -> None:
+        if not self._finished:
+            self.cancelled = True
+            self._finished = True
+            self._future.cancel()
+
+    def __enter__(self) -> "LLMStream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cancel()
+
+
+class LLMProvider:
+    """
+    One configured provider/model with its own connection pool, concurrency limit and metrics.
+    Obtain instances through `get_provider` so that callers share them.
+    """
+
+    def __init__(self, config: ProviderConfig):
+        self.config = config
+        self.metrics = ProviderMetrics()
+        self.breaker = CircuitBreaker(config)
+        # Connection pool and concurrency limit per event loop: neither can be used from another loop
+        self._pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return f"<LLMProvider {self.config.name}:{self.config.model}>"
+
+    @property
+    def name(self) -> str:
+        return self.config.name
+
+    @property
+    def model(self) -> str:
+        return self.config.model
+
+    @property
+    def rate_limit_resource(self) -> str:
+        """Rate limiter bucket of this provider's API: "gemini", "deepseek" or "openai" (also local servers)"""
+        if self.config.kind == "gemini":
+            return "gemini"
+        return "deepseek" if self.name == "deepseek" else "openai"
+
+    # ---- connection handling (always on the shared loop) ----
+
+    def _pool(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """Returns the client and semaphore of the running loop, creating them on its first call"""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None or pool[0].is_closed:
+            limits = httpx.Limits(
+                max_connections=self.config.max_concurrency * 2,
+                max_keepalive_connections=self.config.max_concurrency,
+            )
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=limits,
+                timeout=httpx.Timeout(self.config.timeout, connect=min(10.0, self.config.timeout)),
+            )
+            pool = self._pools[loop] = (client, asyncio.Semaphore(self.config.max_concurrency))
+        return pool
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        return self._pool()[0]
+
+    async def aclose(self) -> None:
+        """Closes the pool of the running loop; pools of other loops are dropped with their loop"""
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None and not pool[0].is_closed:
+            await pool[0].aclose()
+
+    def close(self) -> None:
+        """
+        Closes the provider's connection pool.
+        * Safe to call more than once; the pool is recreated on the next call
+        """
+        _LoopThread.get().run(self.aclose(), timeout=10)
+
+    # ---- request building and parsing ----
+
+    @staticmethod
+    def _as_messages(prompt_or_messages) -> list[dict]:
+        if isinstance(prompt_or_messages, str):
+            return [{"role": "user", "content": prompt_or_messages}]
+        return list(prompt_or_messages)
+
+    def _build_request(self, messages: list[dict], json_mode: bool, temperature: float | None,
+                       max_tokens: int | None, extra: dict | None, stream: bool = False) -> tuple[str, dict, dict]:
+        base_url = self.config.resolved_base_url()
+
+        if self.config.kind == "openai":
+            url = f"{base_url}/chat/completions"
+            headers = {"Content-Type": "application/json"}
+            if self.config.api_key and self.config.api_key != "not-needed":
+                headers["Authorization"] = f"Bearer {self.config.api_key}"
+            body = {"model": self.config.model, "messages": messages}
+            if temperature is not None:
+                body["temperature"] = temperature
+            if max_tokens is not None:
+                body["max_tokens"] = max_tokens
+            if json_mode:
+                body["response_format"] = {"type": "json_object"}
+            if stream:
+                body["stream"] = True
+                if self.name != "openai-like":  # Local servers may reject unknown fields
+                    body["stream_options"] = {"include_usage": True}
+        else:
+            model = self.config.model if self.config.model.startswith("models/") else f"models/{self.config.model}"
+            url = f"{base_url}/{model}:streamGenerateContent?alt=sse" if stream else f"{base_url}/{model}:generateContent"
+            headers = {"Content-Type": "application/json", "x-goog-api-key": self.config.api_key}
+            system = "\n\n".join(m["content"] for m in messages if m.get("role") == "system")
+            contents = [
+                {"role": "model" if m.get("role") == "assistant" else "user", "parts": [{"text": m["content"]}]}
+                for m in messages if m.get("role") != "system"
+            ]
+            generation_config = {}
+            if temperature is not None:
+                generation_config["temperature"] = temperature
+            if max_tokens is not None:
+                generation_config["maxOutputTokens"] = max_tokens
+            if json_mode:
+                generation_config["responseMimeType"] = "application/json"
+            body = {"contents": contents, "safetySettings": GEMINI_SAFETY_SETTINGS}
+            if generation_config:
+                body["generationConfig"] = generation_config
+            if system:
+                body["systemInstruction"] = {"parts": [{"text": system}]}
+
+        if extra:
+            body.update(extra)
+        return url, headers, body
+
+    def _parse_response(self, data: dict) -> tuple[str, int, int, int]:
+        if self.config.kind == "openai":
+            if data.get("error"):
+                raise LLMProviderError(f"Provider returned an error: {data['error']}")
+            choices = data.get("choices") or []
+            text = (choices[0].get("message") or {}).get("content") if choices else None
+            usage = data.get("usage") or {}
+            cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+            return text or "", usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0), cached or 0
+
+        candidates = data.get("candidates") or []
+        parts = ((candidates[0].get("content") or {}).get("parts") or []) if candidates else []
+        text = "".join(part.get("text", "") for part in parts)
+        if not text:
+            reason = (data.get("promptFeedback") or {}).get("blockReason") or \
+                (candidates[0].get("finishReason") if candidates else "no candidates")
+            raise LLMProviderError(f"Gemini returned an empty response ({reason})")
+        usage = data.get("usageMetadata") or {}
+        return (text, usage.get("promptTokenCount", 0), usage.get("candidatesTokenCount", 0),
+                usage.get("cachedContentTokenCount", 0))
+
+    def _parse_stream_event(self, data: dict) -> tuple[str, dict | None]:
+        """Returns the text of one streamed event and its usage (`None` until the provider sends it)"""
+        if data.get("error"):
+            raise LLMProviderError(f"Provider returned an error: {data['error']}")
+        if self.config.kind == "openai":
+            choices = data.get("choices") or []
+            text = ((choices[0].get("delta") or {}).get("content") or "") if choices else ""
+            usage = data.get("usage")
+            if usage:
+                cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+                usage = (usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0), cached or 0)
+            return text, usage
+
+        candidates = data.get("candidates") or []
+        parts = ((candidates[0].get("content") or {}).get("parts") or []) if candidates else []
+        usage = data.get("usageMetadata")
+        if usage:
+            usage = (usage.get("promptTokenCount", 0), usage.get("candidatesTokenCount", 0),
+                     usage.get("cachedContentTokenCount", 0))
+        return "".join(part.get("text", "") for part in parts), usage
+
+    def _backoff_delay(self, attempt: int, retry_after: str | None) -> float:
+        if retry_after:
+            try:
+                return min(self.config.backoff_cap, float(retry_after))
+            except ValueError:
+                pass
+        # Full jitter: uniform in [0, min(cap, base * 2^attempt)]
+        return random.uniform(0, min(self.config.backoff_cap, self.config.backoff_base * (2 ** attempt)))
+
+    # ---- public API ----
+
+    async def acomplete(self, prompt_or_messages, json_mode: bool = False, temperature: float | None = None,
+                        max_tokens: int | None = None, extra: dict | None = None,
+                        rate_limit_key: str | None = None) -> LLMResponse:
+        """
+        Gets a completion from the provider.
+        * Takes in `prompt_or_messages`, a prompt `str` or OpenAI-style `list[dict]` messages
+        * Takes in `json_mode` of type `bool` to request a JSON response
+        * Takes in optional `temperature`, `max_tokens` and raw `extra` body fields
+        * Takes in `rate_limit_key`, the fairness key of the rate limit (default: this thread's key)
+        * Returns an `LLMResponse`, raises `LLMProviderError` after all retries fail or when no
+          rate limit token came in time, or `CircuitOpenError` at once while the circuit breaker is open
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(
+                f"{self.name} circuit breaker is open, retrying in {self.breaker.retry_in():.0f}s",
+                retry_in=self.breaker.retry_in())
+
+        client = self._ensure_client()
+        url, headers, body = self._build_request(
+            self._as_messages(prompt_or_messages), json_mode, temperature, max_tokens, extra)
+
+        if rate_limit_key is None:
+            rate_limit_key = get_rate_limit_key()
+        started = time.perf_counter()
+        self.metrics.started()
+        retries = [0]
+        try:
+            hedge_delay = self._hedge_delay()
+            if hedge_delay is None:
+                result = await self._send(client, url, headers, body, started, retries, rate_limit_key)
+            else:
+                result = await self._send_hedged(client, url, headers, body, started, retries, hedge_delay,
+                                                 rate_limit_key)
+        except RateLimitTimeout as e:
+            # Waiting for our own rate limit says nothing about the provider's health
+            self.metrics.finished(time.perf_counter() - started, None, retries=retries[0])
+            self.breaker.release()
+            raise LLMProviderError(str(e), retryable=True) from e
+        except LLMProviderError:
+            latency = time.perf_counter() - started
+            self.metrics.finished(latency, None, retries=retries[0])
+            self.breaker.record(False, latency)
+            raise
+        except BaseException:
+            # Cancelled by the caller: says nothing about the provider's health
+            self.metrics.finished(time.perf_counter() - started, None, retries=retries[0])
+            self.breaker.release()
+            raise
+        self.metrics.finished(result.latency, result, retries=retries[0])
+        self.breaker.record(True, result.latency)
+        return result
+
+    def _hedge_delay(self) -> float | None:
+        # Hedge only once the p95 is known from enough samples
+        if not self.config.hedge or self.metrics.sample_count() < self.config.hedge_min_samples:
+            return None
+        return max(self.config.hedge_min_delay, self.metrics.percentile(95) or 0.0)
+
+    async def _send_hedged(self, client: httpx.AsyncClient, url: str, headers: dict, body: dict,
+                           started: float, retries: list, hedge_delay: float, key: str | None) -> LLMResponse:
+        """
+        Sends the request and, if it has not answered after `hedge_delay` seconds, an identical
+        second one. The first success wins and the other request is cancelled.
+        """
+        first = asyncio.ensure_future(self._send(client, url, headers, body, started, retries, key))
+        done, _ = await asyncio.wait({first}, timeout=hedge_delay)
+        if done:
+            return first.result()
+
+        second = asyncio.ensure_future(self._send(client, url, headers, body, started, retries, key))
+        pending = {first, second}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.metrics.hedge(won=task is second)
+                        return task.result()
+                    error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+        self.metrics.hedge(won=False)
+        raise error
+
+    async def _send(self, client: httpx.AsyncClient, url: str, headers: dict, body: dict,
+                    started: float, retries: list, key: str | None) -> LLMResponse:
+        """
+        Sends one request with retries and backoff; `retries[0]` counts the retries made.
+        Every attempt takes a rate limit token of fairness `key` first.
+        """
+        attempt = 0
+        last_error: LLMProviderError | None = None
+        async with self._pool()[1]:
+            while attempt <= self.config.max_retries:
+                retry_after = None
+                await arate_limit(self.rate_limit_resource, key=key, timeout=self.config.timeout)
+                try:
+                    response = await client.post(url, headers=headers, json=body)
+                    if response.status_code == 200:
+                        text, prompt_tokens, completion_tokens, cached_tokens = self._parse_response(response.json())
+                        return LLMResponse(
+                            text=text, provider=self.name, model=self.model,
+                            latency=time.perf_counter() - started,
+                            prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                            cached_tokens=cached_tokens, attempts=attempt + 1, raw=response.json())
+                    retryable = response.status_code in RETRYABLE_STATUS_CODES
+                    retry_after = response.headers.get("retry-after")
+                    last_error = LLMProviderError(
+                        f"{self.name} API error {response.status_code}: {response.text[:300]}",
+                        status_code=response.status_code, retryable=retryable)
+                except httpx.TimeoutException as e:
+                    last_error = LLMProviderError(f"{self.name} API timeout: {e}", retryable=True)
+                except httpx.TransportError as e:
+                    last_error = LLMProviderError(f"{self.name} API connection error: {e}", retryable=True)
+                except (ValueError, LLMProviderError) as e:
+                    last_error = e if isinstance(e, LLMProviderError) else \
+                        LLMProviderError(f"{self.name} API returned an unreadable response: {e}")
+
+                if not last_error.retryable or attempt >= self.config.max_retries:
+                    break
+                delay = self._backoff_delay(attempt, retry_after)
+                logger.warning(f"{last_error} - retrying in {delay:.2f}s ({attempt + 1}/{self.config.max_retries})")
+                await asyncio.sleep(delay)
+                attempt += 1
+                retries[0] += 1
+
+        raise last_error
+
+    def complete(self, prompt_or_messages, json_mode: bool = False, temperature: float | None = None,
+                 max_tokens: int | None = None, extra: dict | None = None) -> LLMResponse:
+        """
+        Synchronous facade over `acomplete`, running on the shared background loop.
+        * Same arguments and return value as `acomplete`; rate limited under the calling thread's key
+        """
+        coro = self.acomplete(prompt_or_messages, json_mode=json_mode, temperature=temperature,
+                              max_tokens=max_tokens, extra=extra, rate_limit_key=get_rate_limit_key())
+        return _LoopThread.get().run(coro, timeout=self._sync_deadline())
+
+    def _sync_deadline(self) -> float:
+        # The worst case of all attempts, their rate limit waits and the backoff between them
+        return (2 * self.config.timeout + self.config.backoff_cap) * (self.config.max_retries + 1) + 5
+
+    async def _stream_events(self, prompt_or_messages, json_mode: bool, temperature: float | None,
+                             max_tokens: int | None, extra: dict | None, rate_limit_key: str | None):
+        """
+        Streams one completion: yields the text chunks, then the final `LLMResponse`.
+        Failures before the first chunk are retried like `acomplete`; once text has been handed
+        out, a failure ends the stream with `LLMProviderError`. Every attempt takes a rate limit token.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(
+                f"{self.name} circuit breaker is open, retrying in {self.breaker.retry_in():.0f}s",
+                retry_in=self.breaker.retry_in())
+
+        client = self._ensure_client()
+        url, headers, body = self._build_request(
+            self._as_messages(prompt_or_messages), json_mode, temperature, max_tokens, extra, stream=True)
+
+        started = time.perf_counter()
+        self.metrics.started()
+        attempt = 0
+        parts = []
+        usage = None
+        first_chunk = None
+        try:
+            async with self._pool()[1]:
+                while True:
+                    retry_after = None
+                    await arate_limit(self.rate_limit_resource, key=rate_limit_key, timeout=self.config.timeout)
+                    try:
+                        async with client.stream("POST", url, headers=headers, json=body) as response:
+                            if response.status_code != 200:
+                                await response.aread()
+                                retry_after = response.headers.get("retry-after")
+                                raise LLMProviderError(
+                                    f"{self.name} API error {response.status_code}: {response.text[:300]}",
+                                    status_code=response.status_code,
+                                    retryable=response.status_code in RETRYABLE_STATUS_CODES)
+                            async for line in response.aiter_lines():
+                                if not line.startswith("data:"):
+                                    continue
+                                data = line[5:].strip()
+                                if data == "[DONE]":
+                                    break
+                                text, event_usage = self._parse_stream_event(json.loads(data))
+                                usage = event_usage or usage
+                                if text:
+                                    if first_chunk is None:
+                                        first_chunk = time.perf_counter() - started
+                                    parts.append(text)
+                                    yield text
+                        break
+                    except LLMProviderError as e:
+                        last_error = e
+                    except httpx.TimeoutException as e:
+                        last_error = LLMProviderError(f"{self.name} API timeout: {e}", retryable=True)
+                    except httpx.TransportError as e:
+                        last_error = LLMProviderError(f"{self.name} API connection error: {e}", retryable=True)
+                    except ValueError as e:
+                        last_error = LLMProviderError(f"{self.name} API returned an unreadable event: {e}")
+
+                    # Text already handed out cannot be taken back, so only a silent failure is retried
+                    if parts or not last_error.retryable or attempt >= self.config.max_retries:
+                        raise last_error
+                    delay = self._backoff_delay(attempt, retry_after)
+                    logger.warning(f"{last_error} - retrying in {delay:.2f}s ({attempt + 1}/{self.config.max_retries})")
+                    await asyncio.sleep(delay)
+                    attempt += 1
+            if not parts:
+                raise LLMProviderError(f"{self.name} returned an empty streamed response")
+        except RateLimitTimeout as e:
+            self.metrics.finished(time.perf_counter() - started, None, retries=attempt)
+            self.metrics.stream(cancelled=False)
+            self.breaker.release()
+            raise LLMProviderError(str(e), retryable=True) from e
+        except LLMProviderError:
+            latency = time.perf_counter() - started
+            self.metrics.finished(latency, None, retries=attempt)
+            self.metrics.stream(cancelled=False)
+            self.breaker.record(False, first_chunk if first_chunk is not None else latency)
+            raise
+        except BaseException:
+            # Cut short by the caller; the text received so far still counts
+            latency = time.perf_counter() - started
+            partial = LLMResponse(text="".join(parts), provider=self.name, model=self.model, latency=latency,
+                                  attempts=attempt + 1, first_chunk_latency=first_chunk)
+            self.metrics.finished(latency, partial, retries=attempt)
+            self.metrics.stream(cancelled=True)
+            if first_chunk is None:
+                self.breaker.release()
+            else:
+                self.breaker.record(True, first_chunk)
+            raise
+
+        latency = time.perf_counter() - started
+        prompt_tokens, completion_tokens, cached_tokens = usage or (0, 0, 0)
+        result = LLMResponse(
+            text="".join(parts), provider=self.name, model=self.model, latency=latency,
+            prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, cached_tokens=cached_tokens,
+            attempts=attempt + 1, first_chunk_latency=first_chunk)
+        self.metrics.finished(latency, result, retries=attempt)
+        self.metrics.stream(cancelled=False)
+        # A stream is as slow as its first chunk; long answers must not trip the breaker
+        self.breaker.record(True, first_chunk)
+        yield result
+
+    async def astream(self, prompt_or_messages, json_mode: bool = False, temperature: float | None = None,
+                      max_tokens: int | None = None, extra: dict | None = None, rate_limit_key: str | None = None):
+        """
+        Streams a completion while it is generated.
+        * Same arguments as `acomplete`
+        * Yields the text in chunks of type `str`; raises like `acomplete`
+        """
+        if rate_limit_key is None:
+            rate_limit_key = get_rate_limit_key()
+        events = self._stream_events(prompt_or_messages, json_mode, temperature, max_tokens, extra, rate_limit_key)
+        try:
+            async for event in events:
+                if isinstance(event, str):
+                    yield event
+        finally:
+            await events.aclose()
+
+    def stream(self, prompt_or_messages, json_mode: bool = False, temperature: float | None = None,
+               max_tokens: int | None = None, extra: dict | None = None, max_chars: int | None = None) -> LLMStream:
+        """
+        Synchronous streaming facade over `astream`, running on the shared background loop.
+        * Same arguments as `acomplete`, plus `max_chars` to stop the generation at that length
+        * Returns an `LLMStream`: iterate it for text chunks, `cancel()` it to stop early.
+          Errors (including `CircuitOpenError`) are raised while iterating
+        * Rate limited under the calling thread's key
+        """
+        events = self._stream_events(prompt_or_messages, json_mode, temperature, max_tokens, extra,
+                                     get_rate_limit_key())
+        return LLMStream(events, max_chars=max_chars, chunk_timeout=self._sync_deadline())
+
+    async def alist_models(self) -> list[str]:
+        client = self._ensure_client()
+        base_url = self.config.resolved_base_url()
+        if self.config.kind == "openai":
+            headers = {}
+            if self.config.api_key and self.config.api_key != "not-needed":
+                headers["Authorization"] = f"Bearer {self.config.api_key}"
+            response = await client.get(f"{base_url}/models", headers=headers)
+            response.raise_for_status()
+            return [model.get("id") for model in response.json().get("data", [])]
+
+        response = await client.get(f"{base_url}/models", headers={"x-goog-api-key": self.config.api_key})
+        response.raise_for_status()
+        return [
+            model.get("name") for model in response.json().get("models", [])
+            if "generateContent" in model.get("supportedGenerationMethods", ["generateContent"])
+        ]
+
+    def list_models(self) -> list[str]:
+        """
+        Lists the model ids available from the provider.
+        * Returns a `list[str]`, raises `httpx.HTTPError` on failure
+        """
+        return _LoopThread.get().run(self.alist_models(), timeout=self.config.timeout + 5)
+
+
+_providers: dict[tuple, LLMProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_provider(name: str, api_key: str = "", model: str = "", base_url: str = "",
+                 timeout: float = 30.0, max_retries: int = 3, max_concurrency: int = 4,
+                 slow_call: float | None = None, breaker_cooldown: float = 30.0, hedge: bool = False) -> LLMProvider:
+    """
+    Returns the shared provider for a name/model/endpoint/key combination, creating it on first use.
+    Callers passing other connection, breaker or hedge settings get a provider (and connection pool)
+    of their own, so they never change the settings of another caller's provider.
+    * Takes in `name`: "gemini", "openai", "openai-like" or "deepseek"
+    * Takes in connection settings; `timeout` and `max_retries` apply per attempt and per call
+    * Takes in circuit breaker settings: calls slower than `slow_call` seconds count as failures,
+      an open breaker rejects calls for `breaker_cooldown` seconds
+    * Takes in `hedge` to send a second request when the first outlives the p95 latency
+    * Returns an `LLMProvider`
+    """
+    name = (name or "openai").lower()
+    key_hash = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+    key = (name, model, (base_url or "").rstrip("/"), key_hash, float(timeout), int(max_retries), int(max_concurrency),
+           slow_call, float(breaker_cooldown), bool(hedge))
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None:
+            provider = LLMProvider(ProviderConfig(
+                name=name, api_key=api_key or "", model=model, base_url=base_url,
+                timeout=float(timeout), max_retries=int(max_retries), max_concurrency=int(max_concurrency),
+                breaker_slow_call=slow_call, breaker_cooldown=float(breaker_cooldown), hedge=bool(hedge)))
+            _providers[key] = provider
+        return provider
+
+
+def provider_metrics() -> dict[str, dict]:
+    """
+    Returns metrics for every provider created so far, keyed by "name:model" ("name:model#2", ... for
+    providers of the same model with other settings).
+    """
+    with _providers_lock:
+        providers = list(_providers.values())
+    metrics = {}
+    for provider in providers:
+        label = f"{provider.name}:{provider.model}"
+        if label in metrics:
+            label = f"{label}#{sum(name.split('#')[0] == label for name in metrics) + 1}"
+        metrics[label] = dict(provider.metrics.snapshot(), breaker=provider.breaker.snapshot())
+    return metrics
+
+
+def close_all_providers() -> None:
+    """
+    Closes the connection pools of all providers.
+    """
+    with _providers_lock:
+        providers = list(_providers.values())
+    for provider in providers:
+        try:
+            provider.close()
+        except Exception as e:
+            logger.warning(f"Error closing {provider!r}: {e}")
@@ -18,12 +18,11 @@ from config.search import security_clearance, did_masters
 
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
+from modules.ai.llm_provider import LLMProvider, get_provider
+from modules.ai.skills_cache import get_skills_cache
 
 from pyautogui import confirm
-from openai import OpenAI
-from openai.types.model import Model
-from openai.types.chat import ChatCompletion, ChatCompletionChunk
-from typing import Iterator, Literal
+from typing import Literal
 
 
 apiCheckInstructions = """
@@ -56,25 +55,12 @@ def ai_error_alert(
     critical_error_log(message, stackTrace)
 
 
-# Function to check if an error occurred
-def ai_check_error(response: ChatCompletion | ChatCompletionChunk) -> None:
-    """
-    Function to check if an error occurred.
-    * Takes in `response` of type `ChatCompletion` or `ChatCompletionChunk`
-    * Raises a `ValueError` if an error is found
-    """
-    if response.model_extra.get("error"):
-        raise ValueError(
-            f'Error occurred with API: "{response.model_extra.get("error")}"'
-        )
-
-
 # Function to create an OpenAI client
-def ai_create_openai_client() -> OpenAI:
+def ai_create_openai_client() -> LLMProvider:
     """
     Function to create an OpenAI client.
     * Takes no arguments
-    * Returns an `OpenAI` object
+    * Returns an `LLMProvider` object speaking the OpenAI chat completions API
     """
     try:
         print_lg("Creating OpenAI client...")
@@ -83,14 +69,25 @@ def ai_create_openai_client() -> OpenAI:
                 "AI is not enabled! Please enable it by setting `use_AI = True` in `secrets.py` in `config` folder."
             )
 
-        client = OpenAI(base_url=llm_api_url, api_key=llm_api_key)
+        client = get_provider(
+            "openai",
+            api_key=llm_api_key,
+            model=llm_model,
+            base_url=llm_api_url,
+            timeout=ai_request_timeout,
+            max_retries=ai_max_retries,
+            max_concurrency=ai_max_concurrent_requests,
+            slow_call=ai_slow_call_seconds or None,
+            breaker_cooldown=ai_breaker_cooldown,
+            hedge=ai_hedge_requests,
+        )
 
         models = ai_get_models_list(client)
         if "error" in models:
             raise ValueError(models[1])
         if len(models) == 0:
             raise ValueError("No models are available!")
-        if llm_model not in [model.id for model in models]:
+        if llm_model not in models:
             raise ValueError(f"Model `{llm_model}` is not found!")
 
         print_lg("---- SUCCESSFULLY CREATED OPENAI CLIENT! ----")
@@ -107,10 +104,10 @@ def ai_create_openai_client() -> OpenAI:
 
 
 # Function to close an OpenAI client
-def ai_close_openai_client(client: OpenAI) -> None:
+def ai_close_openai_client(client: LLMProvider) -> None:
     """
     Function to close an OpenAI client.
-    * Takes in `client` of type `OpenAI`
+    * Takes in `client` of type `LLMProvider`
     * Returns no value
     """
     try:
@@ -122,21 +119,20 @@ def ai_close_openai_client(client: OpenAI) -> None:
 
 
 # Function to get list of models available in OpenAI API
-def ai_get_models_list(client: OpenAI) -> list[Model | str]:
+def ai_get_models_list(client: LLMProvider) -> list[str]:
     """
     Function to get list of models available in OpenAI API.
-    * Takes in `client` of type `OpenAI`
-    * Returns a `list` object
+    * Takes in `client` of type `LLMProvider`
+    * Returns a `list` of model ids
     """
     try:
         print_lg("Getting AI models list...")
         if not client:
             raise ValueError("Client is not available!")
-        models = client.models.list()
-        ai_check_error(models)
+        models = client.list_models()
         print_lg("Available models:")
-        print_lg(models.data, pretty=True)
-        return models.data
+        print_lg(models, pretty=True)
+        return models
     except Exception as e:
         critical_error_log("Error occurred while getting models list!", e)
         return ["error", e]
@@ -163,7 +159,7 @@ def model_supports_temperature(model_name: str) -> bool:
 
 # Function to get chat completion from OpenAI API
 def ai_completion(
-    client: OpenAI,
+    client: LLMProvider,
     messages: list[dict],
     response_format: dict = None,
     temperature: float = 0,
@@ -171,7 +167,7 @@ def ai_completion(
 ) -> dict | ValueError:
     """
     Function that completes a chat and prints and formats the results of the OpenAI API calls.
-    * Takes in `client` of type `OpenAI`
+    * Takes in `client` of type `LLMProvider`
     * Takes in `messages` of type `list[dict]`. Example: `[{"role": "user", "content": "Hello"}]`
     * Takes in `response_format` of type `dict` for JSON representation, default is `None`
     * Takes in `temperature` of type `float` for temperature, default is `0`
@@ -181,61 +177,66 @@ def ai_completion(
     if not client:
         raise ValueError("Client is not available!")
 
-    params = {"model": llm_model, "messages": messages, "stream": stream}
-
-    if model_supports_temperature(llm_model):
-        params["temperature"] = temperature
+    extra = {}
     if response_format and llm_spec in ["openai", "openai-like"]:
-        params["response_format"] = response_format
-
-    completion = client.chat.completions.create(**params)
+        extra["response_format"] = response_format
 
-    result = ""
-
-    # Log response
+    temperature = temperature if model_supports_temperature(llm_model) else None
     if stream:
-        print_lg("--STREAMING STARTED")
-        for chunk in completion:
-            ai_check_error(chunk)
-            chunkMessage = chunk.choices[0].delta.content
-            if chunkMessage != None:
-                result += chunkMessage
-            print_lg(chunkMessage, end="", flush=True)
-        print_lg("\n--STREAMING COMPLETE")
+        # Print the answer while it is generated
+        print_lg("\nAI Answer to Question:\n")
+        chunks = client.stream(messages, temperature=temperature, extra=extra)
+        for chunk in chunks:
+            print_lg(chunk, end="", flush=True)
+        print_lg("")
+        response = chunks.response
     else:
-        ai_check_error(completion)
-        result = completion.choices[0].message.content
+        response = client.complete(messages, temperature=temperature, extra=extra)
+    result = response.text
+    print_lg(
+        f"AI response in {response.latency:.2f}s ({response.prompt_tokens} prompt + {response.completion_tokens} completion tokens)"
+    )
 
     if response_format:
         result = convert_to_json(result)
 
-    print_lg("\nAI Answer to Question:\n")
-    print_lg(result, pretty=response_format)
+    if not stream:
+        print_lg("\nAI Answer to Question:\n")
+        print_lg(result, pretty=response_format)
     return result
 
 
 def ai_extract_skills(
-    client: OpenAI, job_description: str, stream: bool = stream_output
+    client: LLMProvider, job_description: str, stream: bool = stream_output
 ) -> dict | ValueError:
     """
     Function to extract skills from job description using OpenAI API.
-    * Takes in `client` of type `OpenAI`
+    * Takes in `client` of type `LLMProvider`
     * Takes in `job_description` of type `str`
     * Takes in `stream` of type `bool` to indicate if it's a streaming call
     * Returns a `dict` object representing JSON response
     """
+    skills_cache = get_skills_cache(skills_cache_path, skills_cache_max_entries)
+    cached = skills_cache.get(job_description) if skills_cache else None
+    if cached is not None:
+        print_lg("-- SKILLS FROM CACHE (job description seen before)")
+        return cached
+
     print_lg("-- EXTRACTING SKILLS FROM JOB DESCRIPTION")
     try:
         prompt = extract_skills_prompt.format(job_description)
 
         messages = [{"role": "user", "content": prompt}]
         ##> ------ Dheeraj Deshwal : dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Bug fix ------
-        return ai_completion(
+        result = ai_completion(
             client,
             messages,
             response_format=extract_skills_response_format,
             stream=stream,
         )
+        if skills_cache:
+            skills_cache.put(job_description, result, client.name, client.model)
+        return result
     ##<
     except Exception as e:
         ai_error_alert(
@@ -245,7 +246,7 @@ def ai_extract_skills(
 
 
 def ai_answer_question(
-    client: OpenAI,
+    client: LLMProvider,
     question: str,
     options: list[str] | None = None,
     question_type: Literal[
@@ -260,7 +261,7 @@ def ai_answer_question(
     Function to generate AI-based answers for questions in a form.
 
     Parameters:
-    - `client`: OpenAI client instance.
+    - `client`: `LLMProvider` client instance.
     - `question`: The question being answered.
     - `options`: List of options (for `single_select` or `multiple_select` questions).
     - `question_type`: Type of question (text, textarea, single_select, multiple_select) It is restricted to one of four possible values.
@@ -297,7 +298,7 @@ def ai_answer_question(
 
 
 def ai_gen_experience(
-    client: OpenAI,
+    client: LLMProvider,
     job_description: str,
     about_company: str,
     required_skills: dict,
@@ -308,7 +309,7 @@ def ai_gen_experience(
 
 
 def ai_generate_resume(
-    client: OpenAI,
+    client: LLMProvider,
     job_description: str,
     about_company: str,
     required_skills: dict,
@@ -321,7 +322,7 @@ def ai_generate_resume(
 
 
 def ai_generate_coverletter(
-    client: OpenAI,
+    client: LLMProvider,
     job_description: str,
     about_company: str,
     required_skills: dict,
@@ -335,7 +336,7 @@ def ai_generate_coverletter(
 
 ##< Evaluation Agents
 def ai_evaluate_resume(
-    client: OpenAI,
+    client: LLMProvider,
     job_description: str,
     about_company: str,
     required_skills: dict,
@@ -346,7 +347,7 @@ def ai_evaluate_resume(
 
 
 def ai_evaluate_resume(
-    client: OpenAI,
+    client: LLMProvider,
     job_description: str,
     about_company: str,
     required_skills: dict,
@@ -357,7 +358,7 @@ def ai_evaluate_resume(
 
 
 def ai_check_job_relevance(
-    client: OpenAI,
+    client: LLMProvider,
     job_description: str,
     about_company: str,
     stream: bool = stream_output,
@@ -0,0 +1,173 @@
+"""
+Author:     Shakeeb Shaikh
+LinkedIn:   https://www.linkedin.com/in/shakib-shaikh-660a44377/
+
+GitHub:     https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System
+
+Content-addressed cache for skills extracted from job descriptions.
+
+The same posting shows up again across searches, reruns and users, so the skills JSON
+(the `extract_skills_prompt` schema) is stored in SQLite under a hash of the normalized
+description and shared by every provider. A repeat posting costs no tokens and no API call.
+The cache is bounded: least recently used descriptions are evicted beyond `max_entries`.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+# Bump when the extraction prompt or schema changes, so older results are not reused
+SCHEMA_VERSION = "skills-v1"
+SKILL_KEYS = ("tech_stack", "technical_skills", "other_skills", "required_skills", "nice_to_have")
+
+
+def normalize_description(job_description: str) -> str:
+    '''
+    Normalizes a job description so whitespace and case differences hash the same.
+    '''
+    return " ".join(str(job_description or "").split()).casefold()
+
+
+def description_key(job_description: str) -> str:
+    '''
+    Returns the cache key (sha256 hex digest) of a job description.
+    '''
+    normalized = normalize_description(job_description)
+    return hashlib.sha256(f"{SCHEMA_VERSION}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+def is_valid_skills(skills) -> bool:
+    '''
+    Only complete extraction results are cached (never error dicts or partial answers).
+    '''
+    return isinstance(skills, dict) and "error" not in skills and all(key in skills for key in SKILL_KEYS)
+
+
+class SkillsCache:
+    '''
+    SQLite backed, size bounded skills cache.
+    * Takes in `path` of the database file (folders are created) and `max_entries` to keep
+    * Safe to share between threads and processes: every call opens its own short connection
+    '''
+
+    def __init__(self, path: str, max_entries: int = 5000):
+        self.path = path
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS skills_cache (
+                    key TEXT PRIMARY KEY,
+                    skills TEXT NOT NULL,
+                    provider TEXT,
+                    model TEXT,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            connection.execute("CREATE INDEX IF NOT EXISTS skills_cache_last_used ON skills_cache (last_used_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def get(self, job_description: str) -> dict | None:
+        '''
+        Returns the cached skills `dict` of a job description, or `None` if it was never extracted.
+        '''
+        key = description_key(job_description)
+        try:
+            with self._connect() as connection:
+                row = connection.execute("SELECT skills FROM skills_cache WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE skills_cache SET last_used_at = ?, hits = hits + 1 WHERE key = ?", (time.time(), key))
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return json.loads(row[0])
+
+    def put(self, job_description: str, skills: dict, provider: str = None, model: str = None) -> bool:
+        '''
+        Stores the skills extracted from a job description. Invalid results are ignored.
+        * Returns `True` if stored
+        '''
+        if not is_valid_skills(skills):
+            return False
+        key = description_key(job_description)
+        now = time.time()
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO skills_cache (key, skills, provider, model, created_at, last_used_at, hits) "
+                    "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                    (key, json.dumps(skills), provider, model, now, now)
+                )
+                evicted = connection.execute(
+                    "DELETE FROM skills_cache WHERE key IN ("
+                    "SELECT key FROM skills_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                ).rowcount
+        except sqlite3.Error:
+            return False
+        with self._lock:
+            self.stats["stored"] += 1
+            self.stats["evicted"] += max(evicted, 0)
+        return True
+
+    def __len__(self) -> int:
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM skills_cache").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM skills_cache")
+
+    def get_stats(self) -> dict:
+        '''
+        Returns this run's `hits`, `misses`, `stored`, `evicted` and the `hit_rate`.
+        '''
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+_caches: dict[str, SkillsCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_skills_cache(path: str, max_entries: int = 5000) -> SkillsCache | None:
+    '''
+    Returns the shared `SkillsCache` for `path`, or `None` if `path` is empty (cache disabled)
+    or the database cannot be opened.
+    '''
+    if not path:
+        return None
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            try:
+                cache = SkillsCache(path, max_entries)
+            except (sqlite3.Error, OSError):
+                return None
+            _caches[path] = cache
+        cache.max_entries = max_entries
+        return cache
@@ -0,0 +1,469 @@
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+# Deterministic answers for application form questions.
+# Maps a question label to a profile value (and that value to one of the offered options)
+# before anything is sent to an LLM. Shared by the standalone script (`finalTestScript.py`)
+# and the web app (`AIQuestionAnswerer`, `LinkedInAutomation`).
+
+import re
+from collections import ChainMap, Counter
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Literal
+
+from modules.question_classifier import QuestionClassifier, QuestionClass
+
+QuestionKind = Literal["text", "textarea", "choice"]
+
+YES_PHRASES = ["yes", "agree", "i do", "i have", "i can", "i am", "true"]
+NO_PHRASES = ["no", "disagree", "i don't", "i do not", "i cannot", "i am not", "false"]
+DECLINE_PHRASES = ["decline", "not wish", "don't wish", "prefer not", "not want"]
+
+# Short technology names that are still worth matching as a skill (see `_skill_in_question`)
+TECH_TERMS = ['python', 'java', 'javascript', 'c++', 'c#', 'react', 'node', 'angular', 'vue', 'sql',
+              'html', 'css', 'git', 'docker', 'aws', 'azure', 'kubernetes', 'mongodb', 'postgresql']
+SOFT_SKILLS = ['communication', 'teamwork', 'problem solving', 'leadership', 'time management',
+               'project management', 'analytical']
+POSITIVE_TRAITS = ['detail-oriented', 'self-motivated', 'team player', 'proactive', 'reliable', 'flexible']
+WORK_MODE_PRIORITY = ['hybrid', 'flexible', 'remote', 'onsite', 'office']
+
+_re_plus = re.compile(r'(\d+)\s*\+')
+_re_range = re.compile(r'(\d+)[-\s]*(to|-)\s*(\d+)')
+_re_less = re.compile(r'(less than|under|fewer than|below) (\d+)')
+_re_more = re.compile(r'(more than|over|at least|above) (\d+)')
+_re_number = re.compile(r'\d+')
+
+
+def _yes_no(flag: bool) -> str:
+    return "Yes" if flag else "No"
+
+
+def _to_int(value, default: int = 0) -> int:
+    try:
+        return int(float(str(value).strip()))
+    except (TypeError, ValueError):
+        return default
+
+
+def matches_experience_range(range_text: str, years: int | float) -> bool:
+    '''
+    Checks if `years` falls in a range label like "2-4 years", "5+", "less than 1 year".
+    * Takes in `range_text` of type `str` and `years` of type `int | float`
+    * Returns `bool`
+    '''
+    range_lower = range_text.lower()
+
+    plus_match = _re_plus.search(range_lower)
+    if plus_match:
+        return years >= int(plus_match.group(1))
+
+    range_match = _re_range.search(range_lower)
+    if range_match:
+        return int(range_match.group(1)) <= years <= int(range_match.group(3))
+
+    less_match = _re_less.search(range_lower)
+    if less_match:
+        return years < int(less_match.group(2))
+
+    more_match = _re_more.search(range_lower)
+    if more_match:
+        return years > int(more_match.group(2))
+
+    digits = range_lower.strip().split()[0] if range_lower.strip() else ""
+    if digits.isdigit():
+        return abs(int(digits) - years) <= 1  # Single number options, within 1 year tolerance
+    return False
+
+
+def match_option(answer: str, options: list[str]) -> str | None:
+    '''
+    Maps an answer to one of the offered options.
+    * Tries an exact match, then yes/no/decline phrase families, then experience ranges
+      for numeric answers, then partial matching in both directions
+    * Returns the matching option text, or `None` if nothing fits
+    '''
+    if answer is None or not options:
+        return None
+    answer_lower = str(answer).strip().lower()
+    if not answer_lower:
+        return None
+    candidates = [(option, option.strip().lower()) for option in options
+                  if option and option.strip() and option.strip().lower() not in ("select an option", "select")]
+
+    for option, option_lower in candidates:
+        if option_lower == answer_lower:
+            return option
+
+    if answer_lower in ("decline", "prefer not to say"):
+        for phrase in DECLINE_PHRASES:
+            for option, option_lower in candidates:
+                if phrase in option_lower:
+                    return option
+        return None
+
+    if answer_lower in ("yes", "no"):
+        # Compare leading words only, so "no" does not match "not sure" and "i am" does not match "i am not"
+        def starts_with(option_lower, phrases):
+            return any(option_lower == phrase or re.match(re.escape(phrase) + r"\b", option_lower) for phrase in phrases)
+        # "I don't wish to answer" is neither a yes nor a no
+        candidates = [c for c in candidates if not any(phrase in c[1] for phrase in DECLINE_PHRASES)]
+        negative = [(option, option_lower) for option, option_lower in candidates if starts_with(option_lower, NO_PHRASES)]
+        pool = negative if answer_lower == "no" else [c for c in candidates if c not in negative]
+        phrases = NO_PHRASES if answer_lower == "no" else YES_PHRASES
+        for phrase in phrases:
+            for option, option_lower in pool:
+                if starts_with(option_lower, [phrase]):
+                    return option
+        return None
+
+    if _re_number.fullmatch(answer_lower):
+        years = int(answer_lower)
+        for option, option_lower in candidates:
+            if _re_number.search(option_lower) and matches_experience_range(option_lower, years):
+                return option
+        return None
+
+    for option, option_lower in candidates:
+        if answer_lower in option_lower or option_lower in answer_lower:
+            return option
+    return None
+
+
+@dataclass(frozen=True)
+class AnswerRule:
+    '''
+    One deterministic rule.
+    * `keywords`: the rule fires if any of them is in the lower-cased label (always, if empty)
+    * `requires`: groups of words of which each group needs at least one match
+    * `value`: profile key, or a callable `(profile, label, options) -> str | None`
+    * `kinds`: question kinds the rule applies to
+    '''
+    name: str
+    keywords: tuple[str, ...]
+    value: str | Callable
+    kinds: tuple[str, ...] = ("text", "textarea", "choice")
+    requires: tuple[tuple[str, ...], ...] = ()
+    excludes: tuple[str, ...] = ()
+
+    def matches(self, label: str, kind: str) -> bool:
+        # Reference semantics; `QuestionClassifier.candidate_rules` evaluates all rules in one pass
+        if kind not in self.kinds:
+            return False
+        if self.keywords and not any(keyword in label for keyword in self.keywords):
+            return False
+        if any(word in label for word in self.excludes):
+            return False
+        return all(any(word in label for word in group) for group in self.requires)
+
+    def resolve(self, profile, label: str, options: list[str] | None) -> str | None:
+        value = self.value(profile, label, options) if callable(self.value) else profile.get(self.value)
+        if value is None:
+            return None
+        value = str(value)
+        return value if value.strip() else None
+
+
+## Value resolvers
+
+def _city(profile, label, options):
+    return profile.get("city") or profile.get("work_location")
+
+
+def _location(profile, label, options):
+    if "country" in label:
+        return profile.get("country")
+    if "state" in label:
+        return profile.get("state")
+    if "city" in label:
+        return _city(profile, label, options)
+    return profile.get("work_location") or profile.get("city")
+
+
+def _name(profile, label, options):
+    if "full" in label:
+        return profile.get("full_name")
+    if "first" in label and "last" not in label:
+        return profile.get("first_name")
+    if "middle" in label and "last" not in label:
+        return profile.get("middle_name")
+    if "last" in label and "first" not in label:
+        return profile.get("last_name")
+    if "employer" in label:
+        return profile.get("recent_employer")
+    return profile.get("full_name")
+
+
+def _notice_period(profile, label, options):
+    days = profile.get("notice_period")
+    if days is None or str(days).strip() == "":
+        return None
+    days = _to_int(days)
+    if "month" in label:
+        return str(days // 30)
+    if "week" in label:
+        return str(days // 7)
+    return str(days)
+
+
+def _salary(profile, label, options):
+    current = "current" in label or "present" in label
+    amount = profile.get("current_ctc" if current else "desired_salary")
+    if amount is None or str(amount).strip() == "":
+        return None
+    if not isinstance(amount, (int, float)) and not str(amount).replace(".", "", 1).isdigit():
+        return str(amount)  # Free text like "15 LPA" or "Negotiable"
+    amount = float(amount)
+    if "month" in label:
+        return str(round(amount / 12, 2))
+    if "lakh" in label:
+        return str(round(amount / 100000, 2))
+    return str(int(amount)) if amount == int(amount) else str(amount)
+
+
+def _experience(profile, label, options):
+    years = _to_int(profile.get("years_of_experience"))
+    required = _re_number.findall(label)
+    if options and required and match_option("Yes", options):
+        # "Do you have 3+ years of experience with X?" answered against the profile
+        return _yes_no(years >= int(required[0]))
+    return str(years)
+
+
+def _skill_in_question(profile, label, options):
+    for skill in profile.get("skills") or []:
+        skill = str(skill).lower().strip()
+        if skill and skill in label and (len(skill) > 3 or skill in TECH_TERMS):
+            return "Yes"
+    return None
+
+
+def _work_mode(profile, label, options):
+    for preference in WORK_MODE_PRIORITY:
+        for option in options or []:
+            if preference in option.lower():
+                return option
+    return "Yes"
+
+
+def _fixed(value):
+    return lambda profile, label, options: value
+
+
+def _flag(key, default):
+    return lambda profile, label, options: profile.get(key) or default
+
+
+# Order matters: the first rule whose value fits the question (and its options) wins
+DEFAULT_RULES: tuple[AnswerRule, ...] = (
+    # Free text questions (mirrors the order of `answer_questions` in finalTestScript.py)
+    AnswerRule("years_of_experience", ("experience", "years"), _experience, kinds=("text", "choice")),
+    AnswerRule("phone", ("phone", "mobile"), "phone", kinds=("text",)),
+    AnswerRule("email", ("email",), "email", kinds=("text",)),
+    AnswerRule("street", ("street",), "street", kinds=("text",)),
+    AnswerRule("city", ("city", "location", "address"), _city, kinds=("text",)),
+    AnswerRule("signature", ("signature",), "full_name", kinds=("text",)),
+    AnswerRule("name", ("name",), _name, kinds=("text",)),
+    AnswerRule("notice_period", ("notice",), _notice_period, kinds=("text",)),
+    AnswerRule("salary", ("salary", "compensation", "ctc", "pay"), _salary, kinds=("text",)),
+    AnswerRule("linkedin", ("linkedin",), "linkedin", kinds=("text",)),
+    AnswerRule("website", ("website", "blog", "portfolio", "link"), "website", kinds=("text",)),
+    AnswerRule("confidence_level", ("scale of 1-10",), "confidence_level", kinds=("text",)),
+    AnswerRule("headline", ("headline",), "headline", kinds=("text",)),
+    AnswerRule("referral_source", ("hear", "come across"), "referral_source", kinds=("text",),
+               requires=(("this",), ("job", "position"))),
+    AnswerRule("state", ("state", "province"), "state", kinds=("text",)),
+    AnswerRule("zipcode", ("zip", "postal", "code"), "zipcode", kinds=("text",)),
+    AnswerRule("country", ("country",), "country", kinds=("text",)),
+    AnswerRule("summary", ("summary",), "summary", kinds=("textarea",)),
+    AnswerRule("cover_letter", ("cover",), "cover_letter", kinds=("textarea",)),
+
+    # Choice questions: personal and compliance details
+    AnswerRule("gender", ("gender", "sex"), "gender", kinds=("choice",)),
+    AnswerRule("disability", ("disability", "handicapped"), "disability_status", kinds=("choice",)),
+    AnswerRule("veteran", ("veteran", "protected"), "veteran_status", kinds=("choice",)),
+    AnswerRule("ethnicity", ("ethnicity", "race"), "ethnicity", kinds=("choice",)),
+    AnswerRule("citizenship", ("citizenship", "employment eligibility"), "us_citizenship", kinds=("choice",)),
+    AnswerRule("proficiency", ("proficiency",), _fixed("Professional"), kinds=("choice",)),
+    AnswerRule("visa", ("sponsorship", "sponsor", "visa"), _flag("require_visa", "No"), kinds=("text", "choice")),
+    AnswerRule("work_authorization", ("authorized", "work authorization", "eligible to work"),
+               _flag("work_authorization", "Yes"), kinds=("choice",)),
+    AnswerRule("education_level", ("education", "degree", "qualification"), "education", kinds=("choice",)),
+    AnswerRule("education", ("bachelor", "degree", "university", "college", "graduation", "undergraduate", "graduate"),
+               _fixed("Yes"), kinds=("choice",)),
+    AnswerRule("location", ("location", "city", "state", "country"), _location, kinds=("choice",)),
+    AnswerRule("work_mode", ("work preference", "work location", "work setting"), _work_mode, kinds=("choice",)),
+    AnswerRule("remote", ("remote setting", "remote work", "work remotely", "work from home", "comfortable working remotely"),
+               _fixed("Yes"), kinds=("choice",)),
+    AnswerRule("onsite", ("onsite setting", "on-site", "office setting", "comfortable working onsite"),
+               _fixed("Yes"), kinds=("choice",)),
+    AnswerRule("relocation", ("relocate",), _flag("willing_to_relocate", "Yes"), kinds=("choice",)),
+    AnswerRule("start_immediately", ("start immediately", "can you start", "available to start", "start urgently"),
+               _fixed("Yes"), kinds=("choice",)),
+    AnswerRule("security_clearance", ("security clearance", "clearance"),
+               lambda profile, label, options: _yes_no(bool(profile.get("security_clearance"))), kinds=("choice",)),
+    AnswerRule("skill", (), _skill_in_question, kinds=("choice",)),
+    AnswerRule("soft_skill", SOFT_SKILLS, _fixed("Yes"), kinds=("choice",)),
+    AnswerRule("positive_trait", POSITIVE_TRAITS, _fixed("Yes"), kinds=("choice",)),
+    AnswerRule("salary_acknowledgment", ("understand and acknowledge", "salary", "by applying", "acknowledge that"),
+               _fixed("Yes"), kinds=("choice",)),
+    # Yes/no location questions ("Are you comfortable working from this location?") land here after "location"
+    AnswerRule("commute", ("comfortable commuting", "commuting to", "commute", "location"),
+               _fixed("Yes"), kinds=("choice",)),
+    AnswerRule("agreement", ("agree", "accept", "confirm", "terms and conditions", "privacy policy", "understand that"),
+               _fixed("Yes"), kinds=("choice",)),
+)
+
+
+# Compiled once at import and shared by every engine using the default rules
+DEFAULT_CLASSIFIER = QuestionClassifier(DEFAULT_RULES)
+
+
+@dataclass
+class RuleAnswer:
+    '''A deterministic answer and the rule that produced it'''
+    value: str
+    rule: str
+
+
+@dataclass
+class ProfileAnswerEngine:
+    '''
+    Answers form questions from a profile with `DEFAULT_RULES`, tracking how many were
+    answered locally and how many had to go to an LLM.
+    * `profile` is a `dict` with the keys used by the rules (see `profile_from_user_data`)
+    '''
+    profile: dict = field(default_factory=dict)
+    rules: tuple[AnswerRule, ...] = DEFAULT_RULES
+    stats: Counter = field(default_factory=Counter)
+    classifier: QuestionClassifier = field(default=None, repr=False)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def __post_init__(self):
+        if self.classifier is None:
+            self.classifier = DEFAULT_CLASSIFIER if self.rules is DEFAULT_RULES else QuestionClassifier(self.rules)
+
+    def classify(self, question_text: str, element_type: str | None = None) -> QuestionClass:
+        '''Classifies a question (category, input type, answer hint) with the engine's compiled rules'''
+        return self.classifier.classify(question_text, element_type)
+
+    def use_profile(self, profile: dict) -> None:
+        '''Replaces the profile answers are taken from, keeping the statistics'''
+        self.profile = profile
+
+    def lookup(self, label: str, options: list[str] | None = None, kind: QuestionKind = "text",
+               context: dict | None = None) -> RuleAnswer | None:
+        '''
+        Finds a deterministic answer without counting it in the statistics.
+        * Takes in `label` (the question), the offered `options` if any and the question `kind`
+        * Takes in `context`, per-question values like `work_location` that override the profile
+        * Returns a `RuleAnswer` (mapped to an option when options are given) or `None`
+        '''
+        label, rules = self.classifier.rules_for(label, kind)
+        if not label:
+            return None
+        profile = ChainMap(context, self.profile) if context else self.profile
+        for rule in rules:
+            value = rule.resolve(profile, label, options)
+            if value is None:
+                continue
+            if options:
+                value = match_option(value, options)
+                if value is None:
+                    continue
+            return RuleAnswer(value, rule.name)
+        return None
+
+    def answer(self, label: str, options: list[str] | None = None, kind: QuestionKind = "text",
+               context: dict | None = None) -> str | None:
+        '''
+        Same as `lookup`, but counts the question and returns just the answer text.
+        * Returns `None` when no rule fires; the caller then escalates (LLM) or falls back
+        '''
+        result = self.lookup(label, options, kind, context)
+        self.record(result)
+        return result.value if result else None
+
+    def record(self, result: RuleAnswer | None) -> None:
+        '''Counts a question answered through `lookup`; `None` means no rule fired'''
+        with self._lock:
+            self.stats["questions"] += 1
+            if result:
+                self.stats["answered_locally"] += 1
+                self.stats[f"rule:{result.rule}"] += 1
+
+    def note_llm_call(self) -> None:
+        '''Records that a question the rules could not answer was sent to an LLM'''
+        with self._lock:
+            self.stats["sent_to_llm"] += 1
+
+    @property
+    def local_answer_rate(self) -> float:
+        questions = self.stats["questions"]
+        return self.stats["answered_locally"] / questions if questions else 0.0
+
+    def get_stats(self) -> dict:
+        '''
+        Returns the answering statistics.
+        * `questions`, `answered_locally`, `sent_to_llm`, `local_answer_rate` and per-rule counts under `rules`
+        '''
+        with self._lock:
+            rules = {key[5:]: count for key, count in self.stats.items() if key.startswith("rule:")}
+            return {
+                "questions": self.stats["questions"],
+                "answered_locally": self.stats["answered_locally"],
+                "sent_to_llm": self.stats["sent_to_llm"],
+                "local_answer_rate": round(self.local_answer_rate, 3),
+                "rules": rules,
+            }
+
+    def summary(self) -> str:
+        stats = self.get_stats()
+        return (f"{stats['answered_locally']}/{stats['questions']} questions answered from the profile "
+                f"({stats['local_answer_rate']:.0%}), {stats['sent_to_llm']} sent to AI")
+
+
+def _notice_days(notice_period) -> int | None:
+    # Accepts 30 or "30 days"
+    numbers = _re_number.findall(str(notice_period or ""))
+    return int(numbers[0]) if numbers else None
+
+
+def profile_from_user_data(user_data: dict) -> dict:
+    '''
+    Builds a rule profile from the web app's `user_data` dict (see `AutomationManager.get_user_application_data`).
+    * Returns a `dict` for `ProfileAnswerEngine`
+    '''
+    user_data = user_data or {}
+    full_name = user_data.get("full_name") or " ".join(
+        part for part in (user_data.get("first_name"), user_data.get("last_name")) if part)
+    education = user_data.get("education")
+    if isinstance(education, dict):
+        education = education.get("level") or education.get("degree") or ""
+    location = user_data.get("location") or user_data.get("city") or ""
+    return {
+        "first_name": user_data.get("first_name") or (full_name.split()[0] if full_name else ""),
+        "middle_name": user_data.get("middle_name", ""),
+        "last_name": user_data.get("last_name") or (full_name.split()[-1] if len(full_name.split()) > 1 else ""),
+        "full_name": full_name,
+        "email": user_data.get("email"),
+        "phone": user_data.get("phone"),
+        "city": user_data.get("city") or location.split(",")[0].strip(),
+        "work_location": location,
+        "years_of_experience": user_data.get("experience_years", 0),
+        "notice_period": _notice_days(user_data.get("notice_period")),
+        "current_ctc": user_data.get("current_salary"),
+        "desired_salary": user_data.get("expected_salary") or user_data.get("salary_expectation"),
+        "linkedin": user_data.get("linkedin_url"),
+        "website": user_data.get("portfolio_url") or user_data.get("github_url"),
+        "education": education,
+        "skills": user_data.get("skills") or [],
+        "require_visa": user_data.get("visa_sponsorship", "No"),
+        "work_authorization": user_data.get("work_authorization", "Yes"),
+        "willing_to_relocate": user_data.get("willing_to_relocate", "Yes"),
+        "availability": user_data.get("availability"),
+    }
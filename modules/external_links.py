@@ -0,0 +1,180 @@
+"""
+Author:     Shakeeb Shaikh
+LinkedIn:   https://www.linkedin.com/in/shakib-shaikh-660a44377/
+
+GitHub:     https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System
+
+Collects external application links without waiting for the external site to load.
+
+Before the Apply button of an external job is clicked, `CAPTURE_SCRIPT` replaces the page's
+`window.open`, so the link LinkedIn opens is recorded (`TAKE_CAPTURED_SCRIPT`) instead of
+loading in a new tab. The recorded link is usually a LinkedIn redirect. A `LinkResolver`
+turns it into the company's link in a thread pool: it reads the `url` parameter of the
+redirect or follows the HTTP redirects. Then it calls back with the result, so the job is saved
+while the bot goes on with the next posting. A link that can't be resolved is saved as it is.
+It still leads to the application when opened.
+"""
+
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+
+CAPTURE_SCRIPT = """
+if (!window.__externalLinks) {
+    window.__externalLinks = [];
+    const open = window.open;
+    const record = (url) => {
+        if (url && String(url) !== 'about:blank') window.__externalLinks.push(new URL(String(url), location.href).href);
+    };
+    window.open = function (url, ...rest) {
+        if (!window.__captureExternalLinks) return open.call(window, url, ...rest);
+        record(url);
+        // Pages opening a blank window and setting its location later get a stub recording it
+        const location = {assign: record, replace: record, set href(value) { record(value); }, get href() { return 'about:blank'; }};
+        const stub = {closed: false, opener: null, focus() {}, blur() {}, close() {}, document: {write() {}, close() {}}};
+        Object.defineProperty(stub, 'location', {get: () => location, set: record});
+        return stub;
+    };
+}
+window.__captureExternalLinks = true;
+window.__externalLinks.length = 0;
+"""
+
+TAKE_CAPTURED_SCRIPT = """
+window.__captureExternalLinks = false;
+return window.__externalLinks ? window.__externalLinks.splice(0) : [];
+"""
+
+
+def is_linkedin(url: str) -> bool:
+    host = (urlsplit(url).hostname or "").lower()
+    return host == "linkedin.com" or host.endswith(".linkedin.com")
+
+
+def redirect_target(url: str) -> str | None:
+    '''
+    Returns the link a LinkedIn redirect (".../externalApply/...?url=...") points to, else None.
+    '''
+    if not is_linkedin(url):
+        return None
+    for key in ("url", "redirect", "dest"):
+        values = parse_qs(urlsplit(url).query).get(key)
+        if values and values[0].startswith(("http://", "https://")):
+            return values[0]
+    return None
+
+
+class LinkResolver:
+    '''
+    Resolves external application links in a thread pool.
+    * Takes in `workers` threads (0 resolves on the calling thread) and `max_pending` links waiting at most,
+      after which `submit` waits for a free slot
+    * Takes in `timeout` in seconds of each HTTP request
+    * Takes in `on_error(link, error)`, called when saving a resolved link fails
+    '''
+
+    def __init__(self, workers: int = 4, max_pending: int = 50, timeout: float = 15.0, on_error=None):
+        self.workers = workers
+        self.on_error = on_error
+        self.stats = {"submitted": 0, "resolved": 0, "unresolved": 0, "failed": 0}
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="external-links") if workers > 0 else None
+        self._client = httpx.Client(follow_redirects=True, timeout=timeout, headers={
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+        })
+        self._cookies: dict[str, str] = {}
+
+    def set_cookies(self, cookies: list[dict]) -> None:
+        '''
+        Sets the LinkedIn cookies (as returned by `driver.get_cookies()`) used to follow LinkedIn redirects.
+        '''
+        self._cookies = {cookie["name"]: cookie["value"] for cookie in cookies if "name" in cookie and "value" in cookie}
+
+    def has_cookies(self) -> bool:
+        return bool(self._cookies)
+
+    def resolve(self, url: str) -> str:
+        '''
+        Returns the external link `url` leads to, or `url` if it can't be resolved.
+        '''
+        target = redirect_target(url)
+        if target:
+            return target
+        try:
+            cookies = self._cookies if is_linkedin(url) else None
+            # Only the headers are read, not the page
+            with self._client.stream("GET", url, cookies=cookies) as response:
+                final = str(response.url)
+        except (httpx.HTTPError, httpx.InvalidURL):
+            return url
+        # Still on LinkedIn means a login or error page, the original link is more useful
+        return url if is_linkedin(final) else final
+
+    def _run(self, url: str, callback) -> str:
+        try:
+            link = self.resolve(url)
+            self.stats["resolved" if link != url else "unresolved"] += 1
+            try:
+                callback(link)
+            except Exception as e:
+                self.stats["failed"] += 1
+                if self.on_error:
+                    self.on_error(link, e)
+            return link
+        finally:
+            self._slots.release()
+
+    def submit(self, url: str, callback) -> Future:
+        '''
+        Resolves `url` in the background and calls `callback(link)` with the result, from a pool thread.
+        * Returns a `Future` of the resolved link
+        '''
+        self._slots.acquire()
+        self.stats["submitted"] += 1
+        if self._executor is None:
+            future = Future()
+            future.set_result(self._run(url, callback))
+            return future
+        return self._executor.submit(self._run, url, callback)
+
+    def close(self) -> None:
+        '''
+        Waits for the links being resolved and saved, then closes the pool and the HTTP client.
+        '''
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._client.close()
+
+
+_resolver: LinkResolver | None = None
+_resolver_lock = threading.Lock()
+
+
+def get_link_resolver(**options) -> LinkResolver:
+    '''
+    Returns the shared `LinkResolver`, created with `options` on first use.
+    '''
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = LinkResolver(**options)
+        return _resolver
+
+
+def close_link_resolver() -> None:
+    '''
+    Waits for every pending link of the shared `LinkResolver` and closes it.
+    '''
+    global _resolver
+    with _resolver_lock:
+        resolver, _resolver = _resolver, None
+    if resolver is not None:
+        resolver.close()
+
+
+atexit.register(close_link_resolver)
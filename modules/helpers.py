@@ -15,10 +15,11 @@ import json
 from time import sleep
 from random import randint
 from datetime import datetime, timedelta
-from pyautogui import alert
-from pprint import pprint
+from pprint import pprint, pformat
 
-from config.settings import logs_folder_path
+from config.settings import logs_folder_path, log_rotate_mb, log_rotate_hours, log_backups, log_json
+
+from modules.log_writer import get_log_writer, close_log_writer
 
 
 
@@ -87,20 +88,41 @@ def get_log_path():
 __logs_file_path = get_log_path()
 
 
+def get_logger():
+    '''
+    Function to get the queued writer of log.txt (and log.jsonl if `log_json` is on)
+    * Messages are written by a background thread, log.txt is rotated to log.1.txt, log.2.txt, ... (higher is newer) by size and age
+    '''
+    return get_log_writer(
+        __logs_file_path,
+        json_path=os.path.splitext(__logs_file_path)[0] + ".jsonl" if log_json else None,
+        max_bytes=int(log_rotate_mb * 1024 * 1024),
+        max_age=log_rotate_hours * 3600,
+        backups=log_backups,
+    )
+
+
 def print_lg(*msgs: str | dict, end: str = "\n", pretty: bool = False, flush: bool = False, from_critical: bool = False) -> None:
     '''
     Function to log and print. **Note that, `end` and `flush` parameters are ignored if `pretty = True`**
+    * Messages are queued for log.txt without waiting; critical messages wait until they are written
     '''
     try:
+        logger = get_logger()
         for message in msgs:
             pprint(message) if pretty else print(message, end=end, flush=flush)
-            with open(__logs_file_path, 'a+', encoding="utf-8") as file:
-                file.write(str(message) + end)
+            logger.write((pformat(message) + "\n") if pretty else (str(message) + end), "critical" if from_critical else "info")
+        if from_critical:
+            logger.flush()
     except Exception as e:
-        trail = f'Skipped saving this message: "{message}" to log.txt!' if from_critical else "We'll try one more time to log..."
-        alert(f"log.txt in {logs_folder_path} is open or is occupied by another program! Please close it! {trail}", "Failed Logging")
-        if not from_critical:
-            critical_error_log("Log.txt is open or is occupied by another program!", e)
+        print(f"Failed to log to {__logs_file_path}!", e)
+
+
+def flush_logs() -> bool:
+    '''
+    Function to write every queued log message, call before exiting
+    '''
+    return close_log_writer()
 #>
 
 
@@ -0,0 +1,253 @@
+"""
+Author:     Shakeeb Shaikh
+LinkedIn:   https://www.linkedin.com/in/shakib-shaikh-660a44377/
+
+GitHub:     https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System
+
+Incremental Parquet export of the application history, for offline analysis.
+
+Every dataset ("applied" and "failed" from the history CSV files, "applications" from the
+`JobApplication` table) is written under `<folder>/<dataset>/month=YYYY-MM/platform=<name>/`.
+That is the usual Hive layout, so pandas and pyarrow read the month and platform back as
+columns and skip the folders a filter rules out. A watermark per dataset (the last exported
+cursor, in `<folder>/_watermarks.json`) makes each run append only the rows added since the
+last one. Part files are named after their cursor range, so a run that stops half way rewrites
+the same files next time instead of duplicating rows. The history store datasets use its change
+sequence as the cursor, so an updated or re-applied job is exported again as a new version.
+
+`load_history` reads a dataset into a pandas DataFrame, reading only the asked columns and
+keeping the last version of every applied job.
+pyarrow is optional: only exporting and loading need it.
+"""
+
+import json
+import os
+import re
+from datetime import date, datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+from modules.history_store import APPLIED_COLUMNS, FAILED_COLUMNS
+
+
+EXPORT_BATCH_SIZE = 5000
+WATERMARKS_FILE = "_watermarks.json"
+# The standalone bot only applies on LinkedIn
+CSV_HISTORY_PLATFORM = "linkedin"
+# Datasets with one row per key: a newer version (higher cursor) replaces the exported ones
+DATASET_KEYS = {"applied": "job_id"}
+
+
+def require_pyarrow() -> None:
+    '''
+    Raises an `ImportError` with the install hint if pyarrow is not installed.
+    '''
+    if pa is None:
+        raise ImportError("Parquet export needs pyarrow. Install it with: pip install pyarrow")
+
+
+def partition_value(value) -> str:
+    '''
+    Returns `value` as a safe partition folder value, "unknown" if empty.
+    '''
+    value = re.sub(r"[^0-9A-Za-z_.-]+", "_", str(value or "").strip().lower()).strip("_")
+    return value or "unknown"
+
+
+def month_of(value) -> str:
+    '''
+    Returns the "YYYY-MM" month of a `datetime`, `date` or text starting with a date, else "unknown".
+    '''
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y-%m")
+    match = re.match(r"\s*(\d{4})-(\d{2})", str(value or ""))
+    return f"{match.group(1)}-{match.group(2)}" if match else "unknown"
+
+
+def partition_rows(rows: list[dict], date_column: str, platform_column: str | None = None,
+                   platform: str | None = None) -> dict[tuple[str, str], list[dict]]:
+    '''
+    Groups rows by (month, platform).
+    * Takes in `platform_column` to read each row's platform, or a fixed `platform` for every row
+    * The platform column is removed from the rows, it is read back from the folder name
+    '''
+    partitions = {}
+    for row in rows:
+        row = dict(row)
+        row_platform = row.pop(platform_column, None) if platform_column else platform
+        key = (month_of(row.get(date_column)), partition_value(row_platform))
+        partitions.setdefault(key, []).append(row)
+    return partitions
+
+
+class Watermarks:
+    '''
+    Last exported cursor of every dataset, saved as JSON next to the datasets.
+    '''
+
+    def __init__(self, folder: str):
+        self.path = os.path.join(folder, WATERMARKS_FILE)
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                self.values = json.load(file)
+        except (OSError, ValueError):
+            self.values = {}
+
+    def get(self, dataset: str):
+        return self.values.get(dataset)
+
+    def set(self, dataset: str, cursor) -> None:
+        self.values[dataset] = cursor
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(self.values, file, indent=2)
+        os.replace(temporary, self.path)
+
+
+def _write_part(folder: str, dataset: str, month: str, platform: str, first, last, rows: list[dict],
+                schema) -> str:
+    partition = os.path.join(folder, dataset, f"month={month}", f"platform={platform}")
+    os.makedirs(partition, exist_ok=True)
+    path = os.path.join(partition, f"part-{first}-{last}.parquet")
+    table = pa.Table.from_pylist(rows, schema=schema)
+    temporary = path + ".tmp"
+    pq.write_table(table, temporary, compression="zstd")
+    os.replace(temporary, path)
+    return path
+
+
+def export_dataset(folder: str, dataset: str, fetch, cursor_column: str, date_column: str, schema,
+                   platform_column: str | None = None, platform: str | None = None,
+                   batch_size: int = EXPORT_BATCH_SIZE) -> int:
+    '''
+    Appends the rows added since the last export of `dataset`.
+    * Takes in `fetch(after, limit)`, returning up to `limit` rows (`dict`s) with `cursor_column` greater
+      than `after` (`None` for the first export), in cursor order
+    * Takes in the pyarrow `schema` of the written columns, so every part file has the same types
+    * Returns the number of rows exported
+    '''
+    require_pyarrow()
+    os.makedirs(folder, exist_ok=True)
+    watermarks = Watermarks(folder)
+
+    exported = 0
+    after = watermarks.get(dataset)
+    while True:
+        rows = fetch(after, batch_size)
+        if not rows:
+            break
+        first, last = rows[0][cursor_column], rows[-1][cursor_column]
+        for (month, row_platform), partition in partition_rows(rows, date_column, platform_column, platform).items():
+            _write_part(folder, dataset, month, row_platform, first, last, partition, schema)
+        # Only after every part of the batch is written, so a failed run exports the batch again
+        watermarks.set(dataset, last)
+        exported += len(rows)
+        after = last
+        if len(rows) < batch_size:
+            break
+    return exported
+
+
+def export_csv_history(folder: str, store, batch_size: int = EXPORT_BATCH_SIZE) -> dict[str, int]:
+    '''
+    Exports the applied and failed jobs of a `HistoryStore` (the history CSV files) added or
+    updated since the last export, as the "applied" and "failed" datasets.
+    * Returns the number of rows exported per dataset
+    '''
+    require_pyarrow()
+    exported = {}
+    for kind, columns, date_column in (("applied", APPLIED_COLUMNS, "date_applied"),
+                                       ("failed", FAILED_COLUMNS, "date_tried")):
+        names = list(columns.values())
+        schema = pa.schema([("cursor", pa.int64())] + [(name, pa.string()) for name in names])
+
+        def fetch(after, limit, kind=kind, names=names):
+            return store.page(kind, limit, after=after, columns=names, with_cursor=True, by_change=True)[0]
+
+        exported[kind] = export_dataset(folder, kind, fetch, "cursor", date_column, schema,
+                                        platform=CSV_HISTORY_PLATFORM, batch_size=batch_size)
+    return exported
+
+
+def _arrow_type(column):
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return pa.string()
+    if python_type is bool:
+        return pa.bool_()
+    if python_type is int:
+        return pa.int64()
+    if python_type is float:
+        return pa.float64()
+    if python_type is datetime:
+        return pa.timestamp("us")
+    if python_type is date:
+        return pa.date32()
+    return pa.string()
+
+
+def export_model(folder: str, dataset: str, model, date_column: str, platform_column: str | None = None,
+                 batch_size: int = EXPORT_BATCH_SIZE) -> int:
+    '''
+    Exports the new rows of a Flask-SQLAlchemy model (e.g. `JobApplication` as "applications"),
+    by increasing primary key. Must run inside an app context.
+    * Returns the number of rows exported
+    '''
+    require_pyarrow()
+    columns = list(model.__table__.columns)
+    key = model.__table__.primary_key.columns.values()[0]
+    schema = pa.schema([(column.name, _arrow_type(column)) for column in columns if column.name != platform_column])
+
+    def fetch(after, limit):
+        query = model.query
+        if after is not None:
+            query = query.filter(key > after)
+        records = query.order_by(key).limit(limit).all()
+        return [{column.name: getattr(record, column.key) for column in columns} for record in records]
+
+    return export_dataset(folder, dataset, fetch, key.name, date_column, schema,
+                          platform_column=platform_column, batch_size=batch_size)
+
+
+def load_history(folder: str, dataset: str = "applied", columns: list[str] | None = None,
+                 months: list[str] | None = None, platforms: list[str] | None = None):
+    '''
+    Loads an exported dataset into a pandas DataFrame.
+    * Takes in `columns` to read (others are never read from disk), `months` ("YYYY-MM") and
+      `platforms` to read only those partitions
+    * Keyed datasets (see `DATASET_KEYS`) keep only the last exported version of every key
+    * Returns an empty DataFrame if the dataset was never exported
+    '''
+    require_pyarrow()
+    import pandas as pd
+
+    path = os.path.join(folder, dataset)
+    if not os.path.isdir(path):
+        return pd.DataFrame(columns=columns or [])
+    filters = []
+    if months:
+        filters.append(("month", "in", list(months)))
+    if platforms:
+        filters.append(("platform", "in", [partition_value(platform) for platform in platforms]))
+    key = DATASET_KEYS.get(dataset)
+    read_columns = columns
+    if key and columns is not None and "cursor" not in columns:
+        read_columns = list(columns) + ["cursor"]
+    frame = pd.read_parquet(path, engine="pyarrow", columns=read_columns, filters=filters or None)
+    if key:
+        # The last version may sit in a partition the filters leave out (e.g. after a date edit), so the
+        # latest cursor of every key is found over the whole dataset, reading only those two columns
+        latest = pd.read_parquet(path, engine="pyarrow", columns=[key, "cursor"]).groupby(key)["cursor"].max()
+        frame = frame[frame["cursor"].isin(latest.values)].reset_index(drop=True)
+        if read_columns is not columns:
+            frame = frame.drop(columns="cursor")
+    for partition_column in ("month", "platform"):
+        # Partition values come back as categories, plain strings are easier to work with
+        if partition_column in frame.columns:
+            frame[partition_column] = frame[partition_column].astype(str)
+    return frame
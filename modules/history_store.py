@@ -0,0 +1,423 @@
+"""
+Author:     Shakeeb Shaikh
+LinkedIn:   https://www.linkedin.com/in/shakib-shaikh-660a44377/
+
+GitHub:     https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System
+
+Indexed store of the applied and failed jobs history.
+
+The history CSV files only grow, and reading them whole at every start made startup time and
+memory grow with every application ever made. This SQLite store answers "already applied?"
+with a point query on the job id, and lists history without loading job descriptions unless
+asked. Existing CSV files are imported, and rows appended to them later on the next import;
+the CSV files are still written as the export.
+"""
+
+import csv
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+
+
+# CSV header -> column, in the order `submitted_jobs` and `failed_job` write them
+APPLIED_COLUMNS = {
+    "Job ID": "job_id",
+    "Title": "title",
+    "Company": "company",
+    "Work Location": "work_location",
+    "Work Style": "work_style",
+    "About Job": "about_job",
+    "Experience required": "experience_required",
+    "Skills required": "skills_required",
+    "HR Name": "hr_name",
+    "HR Link": "hr_link",
+    "Resume": "resume",
+    "Re-posted": "reposted",
+    "Date Posted": "date_posted",
+    "Date Applied": "date_applied",
+    "Job Link": "job_link",
+    "External Job link": "external_job_link",
+    "Questions Found": "questions_found",
+    "Connect Request": "connect_request",
+}
+FAILED_COLUMNS = {
+    "Job ID": "job_id",
+    "Job Link": "job_link",
+    "Resume Tried": "resume_tried",
+    "Date listed": "date_listed",
+    "Date Tried": "date_tried",
+    "Assumed Reason": "assumed_reason",
+    "Stack Trace": "stack_trace",
+    "External Job link": "external_job_link",
+    "Screenshot Name": "screenshot_name",
+}
+# Large columns left out of listings unless asked for
+LARGE_COLUMNS = ("about_job", "questions_found", "stack_trace")
+
+IMPORT_BATCH_SIZE = 500
+
+
+class HistoryStore:
+    '''
+    SQLite store of applied and failed jobs.
+    * Takes in `path` of the database file (folders are created)
+    * Safe to share between threads: every call opens its own short connection
+    '''
+
+    def __init__(self, path: str):
+        self.path = path
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        applied = ", ".join(f"{column} TEXT" for column in APPLIED_COLUMNS.values() if column != "job_id")
+        failed = ", ".join(f"{column} TEXT" for column in FAILED_COLUMNS.values())
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(f"CREATE TABLE IF NOT EXISTS applied_jobs (job_id TEXT PRIMARY KEY, {applied}, changed INTEGER)")
+            connection.execute(f"CREATE TABLE IF NOT EXISTS failed_jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, {failed}, changed INTEGER)")
+            connection.execute("CREATE INDEX IF NOT EXISTS failed_jobs_job_id ON failed_jobs (job_id)")
+            # "changed" numbers every insert and update in order, so exports also pick up updated rows
+            for table in ("applied_jobs", "failed_jobs"):
+                if "changed" not in [row["name"] for row in connection.execute(f"PRAGMA table_info({table})")]:
+                    connection.execute(f"ALTER TABLE {table} ADD COLUMN changed INTEGER")
+                    connection.execute(f"UPDATE {table} SET changed = rowid")
+                connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_changed ON {table} (changed)")
+            connection.execute("CREATE TABLE IF NOT EXISTS imports (source TEXT PRIMARY KEY, kind TEXT, rows INTEGER, "
+                               "position INTEGER, inode TEXT)")
+            # Databases made before import offsets were kept
+            imported = [row["name"] for row in connection.execute("PRAGMA table_info(imports)")]
+            for column, column_type in (("position", "INTEGER"), ("inode", "TEXT")):
+                if column not in imported:
+                    connection.execute(f"ALTER TABLE imports ADD COLUMN {column} {column_type}")
+            # "modified" is the time of the last change, for Last-Modified and ETag headers
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=10)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    # ---- CSV import ----
+
+    @staticmethod
+    def _lines(file, consumed: list, until: int | None = None):
+        # Complete lines only: a row still being written is read on the next import
+        for line in file:
+            if not line.endswith(b"\n") or (until is not None and consumed[0] >= until):
+                return
+            consumed[0] += len(line)
+            yield line.decode("utf-8", errors="replace")
+
+    def import_csv(self, csv_path: str, kind: str = "applied", until: int | None = None) -> int:
+        '''
+        Imports the rows of a history CSV file that were not imported yet.
+        The byte offset read up to is kept per file, so later calls only read the rows appended
+        since; a rotated (renamed) file keeps its offset and a replaced or shorter file is read again.
+        * Takes in `kind`: "applied" or "failed", and `until`, a byte offset to stop at (default: the end)
+        * Returns the number of rows imported
+        '''
+        columns = APPLIED_COLUMNS if kind == "applied" else FAILED_COLUMNS
+        source = os.path.abspath(csv_path)
+        try:
+            stat = os.stat(csv_path)
+        except OSError:
+            return 0
+        inode = str(stat.st_ino)
+        with closing(self._connect()) as connection:
+            previous = connection.execute("SELECT position, inode FROM imports WHERE source = ?", (source,)).fetchone()
+            if previous is None or previous["inode"] != inode:
+                renamed = connection.execute("SELECT position, inode FROM imports WHERE inode = ? AND kind = ?",
+                                             (inode, kind)).fetchone()
+                previous = renamed or previous
+        position = 0
+        if previous is not None:
+            if previous["inode"] is None:
+                # Imported whole before offsets were kept: applied rows are read again (duplicates are
+                # ignored), failed rows, which have no unique key, only from the end on
+                position = 0 if kind == "applied" else stat.st_size
+            elif previous["inode"] == inode and previous["position"] <= stat.st_size:
+                position = previous["position"]
+        end = stat.st_size if until is None else min(until, stat.st_size)
+        if previous is not None and position >= end:
+            self._save_position(source, kind, 0, position, inode)
+            return 0
+
+        imported = 0
+        # "About Job" cells can exceed the csv module's default field size limit
+        previous_limit = csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+        try:
+            with open(csv_path, "rb") as file, closing(self._connect()) as connection, connection:
+                fieldnames = next(csv.reader([file.readline().decode("utf-8-sig", errors="replace")]), [])
+                # Rows appended after an earlier import are newer applications and replace the stored ones
+                replace = position > file.tell()
+                position = max(position, file.tell())
+                file.seek(position)
+                consumed = [position]
+                batch = []
+                for row in csv.DictReader(self._lines(file, consumed, until), fieldnames=fieldnames):
+                    record = {column: row.get(header) for header, column in columns.items()}
+                    if not record.get("job_id"):
+                        continue
+                    batch.append(record)
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        imported += self._insert(connection, kind, batch, replace=replace)
+                        batch = []
+                if batch:
+                    imported += self._insert(connection, kind, batch, replace=replace)
+                self._save_position(source, kind, imported, consumed[0], inode, connection)
+                if imported:
+                    self._touch(connection)
+        finally:
+            csv.field_size_limit(previous_limit)
+        return imported
+
+    def mark_imported(self, csv_path: str, kind: str = "applied") -> None:
+        '''
+        Marks a CSV file as imported up to its end, after it was rewritten with changes already in the store.
+        '''
+        try:
+            stat = os.stat(csv_path)
+        except OSError:
+            return
+        self._save_position(os.path.abspath(csv_path), kind, 0, stat.st_size, str(stat.st_ino))
+
+    def skip_written(self, csv_path: str, kind: str, start: int, end: int) -> None:
+        '''
+        Marks the rows a writer just appended between byte offsets `start` and `end` of a CSV file as
+        imported, because they were added to the store directly. Call it while holding the file lock.
+        * Rows before `start` that were not imported yet are imported first
+        '''
+        self.import_csv(csv_path, kind, until=start)
+        try:
+            inode = str(os.stat(csv_path).st_ino)
+        except OSError:
+            return
+        source = os.path.abspath(csv_path)
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute("SELECT position, inode FROM imports WHERE source = ?", (source,)).fetchone()
+            # Only when the import reached `start` (or the header of a new file), so no other rows are skipped
+            if row is not None and row["inode"] == inode and start <= row["position"] <= end:
+                self._save_position(source, kind, 0, end, inode, connection)
+
+    def _save_position(self, source: str, kind: str, rows: int, position: int, inode: str,
+                       connection: sqlite3.Connection | None = None) -> None:
+        statement = ("INSERT INTO imports (source, kind, rows, position, inode) VALUES (?, ?, ?, ?, ?) "
+                     "ON CONFLICT (source) DO UPDATE SET rows = rows + excluded.rows, "
+                     "position = excluded.position, inode = excluded.inode")
+        if connection is not None:
+            connection.execute(statement, (source, kind, rows, position, inode))
+            return
+        with closing(self._connect()) as connection, connection:
+            connection.execute(statement, (source, kind, rows, position, inode))
+
+    @staticmethod
+    def _insert(connection: sqlite3.Connection, kind: str, records: list[dict], replace: bool = True) -> int:
+        columns = list((APPLIED_COLUMNS if kind == "applied" else FAILED_COLUMNS).values())
+        table = "applied_jobs" if kind == "applied" else "failed_jobs"
+        # The first record of an applied job id wins when a file is first read; appended rows and new applications replace it
+        verb = "INSERT OR REPLACE" if replace or kind == "failed" else "INSERT OR IGNORE"
+        placeholders = ", ".join("?" for _ in columns)
+        rows = [tuple(None if record.get(column) is None else str(record.get(column)) for column in columns)
+                for record in records]
+        connection.executemany(f"{verb} INTO {table} ({', '.join(columns)}, changed) VALUES ({placeholders}, "
+                               f"(SELECT COALESCE(MAX(changed), 0) + 1 FROM {table}))", rows)
+        return len(rows)
+
+    @staticmethod
+    def _touch(connection: sqlite3.Connection) -> None:
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('modified', ?)", (repr(time.time()),))
+
+    # ---- writes ----
+
+    def add_applied(self, record: dict) -> None:
+        '''
+        Records a submitted application. `record` is keyed by column names (see `APPLIED_COLUMNS`).
+        '''
+        with closing(self._connect()) as connection, connection:
+            self._insert(connection, "applied", [record])
+            self._touch(connection)
+
+    def add_failed(self, record: dict) -> None:
+        '''
+        Records a failed application attempt. `record` is keyed by column names (see `FAILED_COLUMNS`).
+        '''
+        with closing(self._connect()) as connection, connection:
+            self._insert(connection, "failed", [record])
+            self._touch(connection)
+
+    def update_applied(self, job_id: str, values: dict) -> bool:
+        '''
+        Updates columns of one applied job in place, e.g. `{"date_applied": "2024-05-01 10:00:00"}`.
+        * Returns `False` if the job id is not in the history
+        '''
+        columns = [column for column in values if column in APPLIED_COLUMNS.values() and column != "job_id"]
+        if not columns:
+            raise ValueError(f"No applied job columns in {list(values)}")
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        with closing(self._connect()) as connection, connection:
+            cursor = connection.execute(f"UPDATE applied_jobs SET {assignments}, "
+                                        "changed = (SELECT MAX(changed) + 1 FROM applied_jobs) WHERE job_id = ?",
+                                        [None if values[column] is None else str(values[column]) for column in columns] + [str(job_id)])
+            if cursor.rowcount:
+                self._touch(connection)
+            return cursor.rowcount > 0
+
+    # ---- reads ----
+
+    def has_applied(self, job_id: str) -> bool:
+        '''
+        Point query: was this job id applied to before?
+        '''
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT 1 FROM applied_jobs WHERE job_id = ?", (str(job_id),)).fetchone() is not None
+
+    def get_applied(self, job_id: str) -> dict | None:
+        '''
+        Returns the full applied job record of a job id, or `None`.
+        '''
+        with closing(self._connect()) as connection:
+            row = connection.execute("SELECT * FROM applied_jobs WHERE job_id = ?", (str(job_id),)).fetchone()
+        return dict(row) if row else None
+
+    def iter_history(self, kind: str = "applied", include_large: bool = False, batch_size: int = 200):
+        '''
+        Yields history records as `dict`s, oldest first, reading `batch_size` rows at a time.
+        * Takes in `include_large` to also read descriptions, questions and stack traces
+        '''
+        columns = list((APPLIED_COLUMNS if kind == "applied" else FAILED_COLUMNS).values())
+        if not include_large:
+            columns = [column for column in columns if column not in LARGE_COLUMNS]
+        table = "applied_jobs" if kind == "applied" else "failed_jobs"
+        with closing(self._connect()) as connection:
+            cursor = connection.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY rowid")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+
+    def page(self, kind: str = "applied", limit: int = 100, after: int | None = None, offset: int | None = None,
+             columns: list[str] | None = None, with_cursor: bool = False,
+             by_change: bool = False) -> tuple[list[dict], int | None]:
+        '''
+        Returns one page of history records, oldest first, and the cursor of the next page (`None` on the last page).
+        * Takes in `after`, the cursor of the previous page (keyset paging), or else `offset` rows to skip
+        * Takes in `columns` to read, by default all except the large ones
+        * Takes in `with_cursor` to keep each record's own cursor in its "cursor" key
+        * Takes in `by_change` to page in the order records were last inserted or updated instead
+        '''
+        known = list((APPLIED_COLUMNS if kind == "applied" else FAILED_COLUMNS).values())
+        if columns is None:
+            columns = [column for column in known if column not in LARGE_COLUMNS]
+        else:
+            columns = [column for column in columns if column in known]
+        table = "applied_jobs" if kind == "applied" else "failed_jobs"
+        order = "changed" if by_change else "rowid"
+        query = f"SELECT {order} AS cursor, {', '.join(columns)} FROM {table}"
+        parameters = []
+        if after is not None:
+            query += f" WHERE {order} > ?"
+            parameters.append(int(after))
+        query += f" ORDER BY {order} LIMIT ?"
+        parameters.append(int(limit) + 1)  # One more row tells if there is a next page
+        if after is None and offset:
+            query += " OFFSET ?"
+            parameters.append(int(offset))
+        with closing(self._connect()) as connection:
+            rows = [dict(row) for row in connection.execute(query, parameters)]
+        next_cursor = rows[limit - 1]["cursor"] if len(rows) > limit else None
+        if with_cursor:
+            return rows[:limit], next_cursor
+        return [{key: value for key, value in row.items() if key != "cursor"} for row in rows[:limit]], next_cursor
+
+    def count(self, kind: str = "applied") -> int:
+        table = "applied_jobs" if kind == "applied" else "failed_jobs"
+        with closing(self._connect()) as connection:
+            return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def modified(self) -> float:
+        '''
+        Returns the time of the last change to the history, 0 if it was never changed.
+        '''
+        with closing(self._connect()) as connection:
+            row = connection.execute("SELECT value FROM meta WHERE key = 'modified'").fetchone()
+        return float(row[0]) if row else 0.0
+
+
+def read_csv_job_ids(csv_paths: list[str]) -> set[str]:
+    '''
+    Returns the job ids (first column) of history CSV files, skipping missing files.
+    '''
+    job_ids = set()
+    previous_limit = csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+    try:
+        for csv_path in csv_paths:
+            try:
+                with open(csv_path, "r", newline="", encoding="utf-8", errors="replace") as file:
+                    for row in csv.reader(file):
+                        if row:
+                            job_ids.add(row[0])
+            except FileNotFoundError:
+                pass
+    finally:
+        csv.field_size_limit(previous_limit)
+    return job_ids
+
+
+class AppliedJobIds:
+    '''
+    Set-like view of the applied job ids: `in` is a point query, `add` remembers ids for this run.
+    * Takes in `csv_paths`, the applied history CSV files read instead when there is no store or it fails
+    '''
+
+    def __init__(self, store: HistoryStore | None, csv_paths: list[str] | None = None):
+        self.store = store
+        self.csv_paths = list(csv_paths or [])
+        self._added = set()
+        self._csv_job_ids = None
+
+    def __contains__(self, job_id) -> bool:
+        if job_id in self._added:
+            return True
+        if self.store is not None:
+            try:
+                return self.store.has_applied(job_id)
+            except sqlite3.Error:
+                # Read the CSV files from now on, "not applied" would apply to the job again
+                self.store = None
+        if self._csv_job_ids is None:
+            self._csv_job_ids = read_csv_job_ids(self.csv_paths)
+        return job_id in self._csv_job_ids
+
+    def add(self, job_id) -> None:
+        self._added.add(job_id)
+
+
+_stores: dict[str, HistoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_history_store(path: str, applied_csv: str | None = None, failed_csv: str | None = None) -> HistoryStore | None:
+    '''
+    Returns the shared `HistoryStore` for `path`, importing the history CSV files on first use.
+    * Returns `None` if `path` is empty (store disabled) or the database cannot be opened
+    '''
+    if not path:
+        return None
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            try:
+                store = HistoryStore(path)
+                if applied_csv:
+                    store.import_csv(applied_csv, "applied")
+                if failed_csv:
+                    store.import_csv(failed_csv, "failed")
+            except (sqlite3.Error, OSError):
+                return None
+            _stores[path] = store
+        return store
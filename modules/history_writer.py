@@ -0,0 +1,251 @@
+"""
+Author:     Shakeeb Shaikh
+LinkedIn:   https://www.linkedin.com/in/shakib-shaikh-660a44377/
+
+GitHub:     https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System
+
+Buffered, locked and size rotated writer of the applied and failed jobs history CSV files.
+
+Rows are kept in memory and appended in batches through one open handle, every
+`flush_interval` seconds, when `max_rows` are waiting and at shutdown. Each batch is written
+while holding a lock file, so overlapping runs never interleave half written rows.
+When a file grows past `max_bytes` it is renamed to the next numbered segment
+("all_applied_applications_history.1.csv", ".2.csv", ...; higher is newer) and a new file with
+a header is started. `history_files` lists the segments of a file, oldest first, for readers.
+"""
+
+import atexit
+import csv
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: str, timeout: float = 30.0):
+    '''
+    Holds an exclusive lock on `path + ".lock"`, shared by every process using the same file.
+    * Raises `TimeoutError` if the lock is not free within `timeout` seconds
+    '''
+    lock_file = open(path + ".lock", "a+")
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"History file '{path}' is locked by another run")
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        lock_file.close()
+
+
+def _segment_pattern(path: str) -> re.Pattern:
+    stem, extension = os.path.splitext(os.path.basename(path))
+    return re.compile(rf"^{re.escape(stem)}\.(\d+){re.escape(extension)}$")
+
+
+def history_files(path: str) -> list[str]:
+    '''
+    Returns the rotated segments of a history file and the file itself, oldest first.
+    * Only files that exist are returned
+    '''
+    folder = os.path.dirname(path) or "."
+    pattern = _segment_pattern(path)
+    segments = []
+    if os.path.isdir(folder):
+        for name in os.listdir(folder):
+            match = pattern.match(name)
+            if match:
+                segments.append((int(match.group(1)), os.path.join(os.path.dirname(path), name)))
+    files = [segment for _, segment in sorted(segments)]
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def next_segment(path: str) -> str:
+    '''
+    Returns the name the file at `path` is rotated to: one number higher than its newest segment.
+    '''
+    pattern = _segment_pattern(path)
+    numbers = [int(pattern.match(os.path.basename(name)).group(1)) for name in history_files(path)
+               if name != path]
+    stem, extension = os.path.splitext(path)
+    return f"{stem}.{max(numbers, default=0) + 1}{extension}"
+
+
+class HistoryWriter:
+    '''
+    Appends rows to one history CSV file in batches.
+    * Takes in `path`, the CSV `fieldnames`, and `transform` applied to every value (e.g. `truncate_for_csv`)
+    * Takes in `flush_interval` in seconds, `max_rows` to flush early, `max_bytes` to rotate at (0 never rotates)
+    * Takes in `on_error`, called with the exception when a batch could not be written; its rows are kept and retried
+    * Takes in `on_written(path, start, end)`, called with the byte offsets of every written batch while the
+      file lock is still held (e.g. `HistoryStore.skip_written`)
+    '''
+
+    def __init__(self, path: str, fieldnames: list[str], flush_interval: float = 5.0, max_rows: int = 50,
+                 max_bytes: int = 0, transform=None, on_error=None, on_written=None):
+        self.path = path
+        self.fieldnames = list(fieldnames)
+        self.flush_interval = flush_interval
+        self.max_rows = max(1, max_rows)
+        self.max_bytes = max_bytes
+        self.transform = transform or (lambda value: "" if value is None else value)
+        self.on_error = on_error
+        self.on_written = on_written
+        self.stats = {"rows": 0, "flushes": 0, "rotations": 0, "errors": 0}
+        self._rows = []
+        self._lock = threading.RLock()
+        self._file = None
+        self._timer = None
+        self._stopped = threading.Event()
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+    def write(self, row: dict) -> None:
+        '''
+        Queues one row, keyed by `fieldnames`. Missing fields are written empty.
+        '''
+        row = {field: self.transform(row.get(field)) for field in self.fieldnames}
+        with self._lock:
+            self._rows.append(row)
+            flush_now = len(self._rows) >= self.max_rows or self.flush_interval <= 0
+            if not flush_now and self._timer is None:
+                self._timer = threading.Thread(target=self._flush_periodically, name="history-writer", daemon=True)
+                self._timer.start()
+        if flush_now:
+            self.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> bool:
+        '''
+        Writes the waiting rows. Returns `False` if they could not be written (they are retried on the next flush).
+        '''
+        with self._lock:
+            if not self._rows:
+                return True
+            try:
+                with file_lock(self.path):
+                    handle = self._open()
+                    start = os.fstat(handle.fileno()).st_size
+                    writer = csv.DictWriter(handle, fieldnames=self.fieldnames)
+                    if handle.tell() == 0:
+                        writer.writeheader()
+                    writer.writerows(self._rows)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                    self.stats["rows"] += len(self._rows)
+                    self.stats["flushes"] += 1
+                    self._rows = []
+                    if self.on_written:
+                        try:
+                            self.on_written(self.path, start, os.fstat(handle.fileno()).st_size)
+                        except Exception as e:
+                            if self.on_error:
+                                self.on_error(e)
+                    if self.max_bytes and handle.tell() >= self.max_bytes:
+                        self._rotate()
+                return True
+            except Exception as e:
+                self.stats["errors"] += 1
+                self._close_file()
+                if self.on_error:
+                    self.on_error(e)
+                return False
+
+    def _open(self):
+        '''Returns the open handle, reopening it if another run rotated or removed the file. Callers hold the file lock.'''
+        if self._file is not None:
+            try:
+                if os.path.samestat(os.fstat(self._file.fileno()), os.stat(self.path)):
+                    return self._file
+            except OSError:
+                pass
+            self._close_file()
+        self._file = open(self.path, "a", newline="", encoding="utf-8")
+        return self._file
+
+    def _rotate(self) -> None:
+        '''Renames the full file to the next numbered segment. Callers hold the file lock.'''
+        self._close_file()
+        try:
+            os.replace(self.path, next_segment(self.path))
+            self.stats["rotations"] += 1
+        except OSError:
+            pass  # Open in another program (Windows), rotated on a later flush
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def close(self) -> bool:
+        '''
+        Stops the periodic flush, writes the waiting rows and closes the file.
+        '''
+        self._stopped.set()
+        written = self.flush()
+        with self._lock:
+            self._close_file()
+        return written
+
+
+_writers: dict[tuple[str, tuple], HistoryWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_history_writer(path: str, fieldnames: list[str], **options) -> HistoryWriter:
+    '''
+    Returns the shared `HistoryWriter` of `path`, created with `options` on first use.
+    * Every writer is flushed and closed at interpreter exit
+    '''
+    with _writers_lock:
+        writer = _writers.get((path, tuple(fieldnames)))
+        if writer is None:
+            writer = HistoryWriter(path, fieldnames, **options)
+            _writers[(path, tuple(fieldnames))] = writer
+        return writer
+
+
+def close_history_writers() -> bool:
+    '''
+    Flushes and closes every shared writer. Returns `False` if any rows could not be written.
+    '''
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    return all([writer.close() for writer in writers])
+
+
+atexit.register(close_history_writers)
@@ -0,0 +1,246 @@
+"""
+Author:     Shakeeb Shaikh
+LinkedIn:   https://www.linkedin.com/in/shakib-shaikh-660a44377/
+
+GitHub:     https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System
+
+Queued log file writer behind `modules.helpers.print_lg`.
+
+`print_lg` used to open log.txt for every message, including every streamed AI chunk. Now
+messages are put on a queue without waiting and one background thread appends them in batches
+through one open handle. The log is rotated by size and by age to "log.1.txt", "log.2.txt",
+... numbered like the history segments of `modules.history_writer` (higher is newer), keeping the
+newest `backups` files, and can also be written as JSON lines, one record per logged line. When the file can't be written (e.g. open in another program) messages are kept
+and retried instead of stopping the bot with an alert.
+"""
+
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+
+from modules.history_writer import history_files, next_segment
+
+
+class QueuedLogWriter:
+    '''
+    Appends logged text to `path` (and JSON lines to `json_path`) from a background thread.
+    * Takes in `max_bytes` and `max_age` (seconds) to rotate at, 0 to never rotate by that, and `backups` to keep
+    * Takes in `flush_interval`, the most seconds a message waits before it is written,
+      `batch_size` messages written at once, and `max_queued` messages before new ones are dropped
+    '''
+
+    def __init__(self, path: str, json_path: str | None = None, max_bytes: int = 0, max_age: float = 0,
+                 backups: int = 5, flush_interval: float = 0.5, batch_size: int = 500, max_queued: int = 100000):
+        self.path = path
+        self.json_path = json_path or None
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backups = max(1, backups)
+        self.flush_interval = flush_interval
+        self.batch_size = max(1, batch_size)
+        self.stats = {"messages": 0, "batches": 0, "rotations": 0, "dropped": 0, "errors": 0}
+        self._queue = queue.Queue(max_queued)
+        self._pending = []  # Messages taken from the queue but not written yet
+        self._partial_line = None  # Start of a JSON line still waiting for its "\n"
+        self._files = {}
+        self._opened_at = {}
+        self._failing = False
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, text: str, level: str = "info") -> None:
+        '''
+        Queues `text` without waiting. Drops it (and counts it) if the queue is full.
+        '''
+        try:
+            self._queue.put_nowait((time.time(), level, text))
+        except queue.Full:
+            self.stats["dropped"] += 1
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        '''
+        Waits until every message queued so far is written. Returns `False` on timeout or write errors.
+        '''
+        done = threading.Event()
+        try:
+            self._queue.put((None, None, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout) and not self._failing
+
+    def close(self, timeout: float = 5.0) -> bool:
+        '''
+        Writes what is queued and stops the background thread.
+        '''
+        if self._closed:
+            return True
+        written = self.flush(timeout)
+        self._closed = True
+        self._queue.put((None, None, None))
+        self._thread.join(timeout)
+        with self._lock:
+            for file in self._files.values():
+                file.close()
+            self._files = {}
+        return written
+
+    # ---- background thread ----
+
+    def _run(self) -> None:
+        deadline = None  # When the oldest pending message must be written
+        while True:
+            try:
+                item = self._queue.get(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                deadline = self._write_pending()
+                continue
+            items = [item]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for stamp, level, text in items:
+                if stamp is not None:
+                    self._pending.append((stamp, level, text))
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                    continue
+                deadline = self._write_pending()
+                if text is None:  # close()
+                    return
+                text.set()  # flush() waiting on this Event
+            if deadline is not None and (len(self._pending) >= self.batch_size or time.monotonic() >= deadline):
+                deadline = self._write_pending()
+
+    def _write_pending(self) -> float | None:
+        '''Writes the pending messages. Returns when to try again if they could not be written.'''
+        if not self._pending:
+            return None
+        with self._lock:
+            try:
+                self._rotate_if_due()
+                self._file(self.path).write("".join(text for _, _, text in self._pending))
+                self._file(self.path).flush()
+                if self.json_path:
+                    self._file(self.json_path).write(self._json_lines(self._pending))
+                    self._file(self.json_path).flush()
+                self.stats["messages"] += len(self._pending)
+                self.stats["batches"] += 1
+                self._pending = []
+                self._failing = False
+                return None
+            except Exception as e:
+                self.stats["errors"] += 1
+                self._close_files()
+                if not self._failing:
+                    # Can't log this to the file, so only show it; the messages are kept and retried
+                    print(f'Could not write "{self.path}", it may be open in another program. Will retry. ({e})',
+                          file=sys.stderr)
+                self._failing = True
+                return time.monotonic() + max(1.0, self.flush_interval)
+
+    def _json_lines(self, messages: list[tuple]) -> str:
+        '''One record per logged line: messages printed with `end=""` (e.g. streamed chunks) are joined'''
+        records = []
+        for stamp, level, text in messages:
+            lines = text.split("\n")
+            for index, line in enumerate(lines):
+                if self._partial_line is None:
+                    if index == len(lines) - 1 and not line:
+                        continue
+                    self._partial_line = [stamp, level, ""]
+                self._partial_line[2] += line
+                if index < len(lines) - 1:
+                    started, started_level, complete = self._partial_line
+                    records.append(json.dumps({
+                        "time": datetime.fromtimestamp(started).isoformat(timespec="milliseconds"),
+                        "level": started_level,
+                        "message": complete,
+                    }, ensure_ascii=False) + "\n")
+                    self._partial_line = None
+        return "".join(records)
+
+    # ---- files and rotation (callers hold `_lock`) ----
+
+    def _file(self, path: str):
+        file = self._files.get(path)
+        if file is None:
+            folder = os.path.dirname(path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            file = open(path, "a", encoding="utf-8")
+            self._files[path] = file
+            # A log left by an earlier run counts as opened when it was last written
+            self._opened_at.setdefault(path, os.path.getmtime(path) if os.path.getsize(path) else time.time())
+        return file
+
+    def _close_files(self) -> None:
+        for file in self._files.values():
+            try:
+                file.close()
+            except OSError:
+                pass
+        self._files = {}
+
+    def _rotate_if_due(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        too_big = self.max_bytes and os.path.getsize(self.path) >= self.max_bytes
+        opened_at = self._opened_at.get(self.path, os.path.getmtime(self.path))
+        too_old = self.max_age and time.time() - opened_at >= self.max_age
+        if not (too_big or too_old):
+            return
+        self._close_files()
+        for path in filter(None, (self.path, self.json_path)):
+            try:
+                if os.path.exists(path):
+                    self._rotate(path)
+            except OSError:
+                pass  # Open in another program (Windows), rotated later
+            self._opened_at[path] = time.time()
+        self.stats["rotations"] += 1
+
+    def _rotate(self, path: str) -> None:
+        os.replace(path, next_segment(path))
+        rotated = [name for name in history_files(path) if name != path]  # Oldest first
+        for name in rotated[:max(0, len(rotated) - self.backups)]:
+            os.remove(name)
+
+
+_writer: QueuedLogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer(path: str, **options) -> QueuedLogWriter:
+    '''
+    Returns the shared log writer, created for `path` with `options` on first use.
+    * It is flushed and closed at interpreter exit
+    '''
+    global _writer
+    with _writer_lock:
+        if _writer is None or _writer.path != path:
+            if _writer is not None:
+                _writer.close()
+            _writer = QueuedLogWriter(path, **options)
+        return _writer
+
+
+def close_log_writer() -> bool:
+    '''
+    Writes every queued message and closes the shared log writer.
+    '''
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    return writer.close() if writer else True
+
+
+atexit.register(close_log_writer)
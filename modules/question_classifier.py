@@ -0,0 +1,263 @@
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+# Precompiled question classifier.
+# Everything is compiled once at import: one anchored regex picks the question category in
+# priority order, and one keyword scan finds every rule keyword in the label in a single pass,
+# so a question is classified (category, input kind, answer hint) without per-rule scanning.
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Category patterns, in priority order (the first category with a matching pattern wins)
+CATEGORY_PATTERNS: dict[str, list[str]] = {
+    'yes_no': [
+        r'\b(are you|do you|have you|can you|will you|would you)\b.*\?',
+        r'\b(yes|no)\b.*\?',
+        r'\b(authorized to work|work authorization)\b',
+        r'\b(willing to relocate|relocate)\b',
+        r'\b(background check|drug test)\b'
+    ],
+    'experience': [
+        r'\b(years of experience|experience.*years)\b',
+        r'\bhow many years\b',
+        r'\byears.*working\b',
+        r'\bexperience.*level\b'
+    ],
+    'availability': [
+        r'\b(when can you start|start date|availability)\b',
+        r'\b(available to start|notice period)\b'
+    ],
+    'salary': [
+        r'\b(salary|compensation|pay|wage)\b.*\b(expectation|requirement|range)\b',
+        r'\b(expected salary|salary range)\b'
+    ],
+    'location': [
+        r'\b(current location|where.*located|city|state)\b',
+        r'\b(address|zip code|postal code)\b'
+    ],
+    'education': [
+        r'\b(degree|education|university|college|school)\b',
+        r'\b(graduation|graduated|gpa)\b'
+    ],
+    'cover_letter': [
+        r'\b(cover letter|why.*interested|why.*apply)\b',
+        r'\b(tell us about yourself|describe yourself)\b',
+        r'\b(motivation|interest.*position)\b'
+    ],
+    'skills': [
+        r'\b(skills|proficiency|expertise|technologies)\b',
+        r'\b(programming languages|software|tools)\b'
+    ]
+}
+
+ELEMENT_KINDS = {'select': 'select', 'dropdown': 'select', 'radio': 'radio', 'checkbox': 'checkbox', 'textarea': 'textarea'}
+
+
+def _compile_categories(patterns: dict[str, list[str]]) -> re.Pattern:
+    # Each alternative is a lookahead anchored at the start of the label, so alternation order
+    # (not match position) decides which category wins, exactly like scanning them in order.
+    alternatives = [
+        f"(?=[\\s\\S]*?(?P<{category}>{'|'.join(f'(?:{pattern})' for pattern in category_patterns)}))"
+        for category, category_patterns in patterns.items()
+    ]
+    return re.compile("^(?:" + "|".join(alternatives) + ")")
+
+
+_re_category = _compile_categories(CATEGORY_PATTERNS)
+_re_choice_words = re.compile(r'select|choose|pick')
+_re_detail_words = re.compile(r'explain|describe|tell|why|how')
+
+
+def _trie_regex(words) -> str:
+    # Builds a regex from a character trie of `words`, so shared prefixes are matched once
+    # instead of trying every word at every position. Longer words are tried first.
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node) -> str:
+        ends_here = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ends_here:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class KeywordIndex:
+    '''
+    Finds which of a fixed set of keywords occur in a text with a single regex pass.
+    * Equivalent to `{keyword for keyword in keywords if keyword in text}`, including overlapping
+      keywords: a lookahead scan over a trie-shaped regex reports the longest keyword at each
+      position, and every keyword that is a prefix of it is added from a precomputed table.
+    '''
+
+    def __init__(self, keywords):
+        self.keywords = sorted({keyword for keyword in keywords if keyword}, key=len, reverse=True)
+        self.prefixes = {
+            keyword: frozenset(other for other in self.keywords if keyword.startswith(other))
+            for keyword in self.keywords
+        }
+        self.pattern = re.compile(f"(?=({_trie_regex(self.keywords)}))") if self.keywords else None
+
+    def find(self, text: str) -> frozenset:
+        if self.pattern is None:
+            return frozenset()
+        found = set()
+        for match in self.pattern.finditer(text):
+            found |= self.prefixes[match.group(1)]
+        return frozenset(found)
+
+
+@dataclass(frozen=True)
+class QuestionClass:
+    '''Result of classifying one question'''
+    label: str                  # Normalized, lower-cased question text
+    category: str               # yes_no, experience, availability, salary, location, education, cover_letter, skills, general
+    input_type: str             # text, short_text, textarea, select, radio, checkbox
+    kind: str                   # Answer rule kind: text, textarea or choice
+    hint: str | None            # Name of the first answer rule whose keywords match, if any
+    keywords: frozenset         # Rule keywords present in the label
+    is_required: bool
+
+    @property
+    def is_yes_no(self) -> bool:
+        return self.category == 'yes_no'
+
+    @property
+    def needs_detailed_response(self) -> bool:
+        return self.input_type == 'textarea'
+
+
+class QuestionClassifier:
+    '''
+    Classifies form questions against a fixed rule table in one pass.
+    * Takes in `rules`, objects with `name`, `keywords`, `requires`, `excludes` and `kinds`
+      (see `modules.answer_rules.AnswerRule`)
+    '''
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        vocabulary = set()
+        for rule in self.rules:
+            vocabulary.update(rule.keywords)
+            vocabulary.update(rule.excludes)
+            for group in rule.requires:
+                vocabulary.update(group)
+        self.index = KeywordIndex(vocabulary)
+
+        # keyword -> positions of the rules it triggers; rules without keywords are always candidates
+        self._rules_by_keyword: dict[str, list[int]] = {}
+        self._always = []
+        for position, rule in enumerate(self.rules):
+            if not rule.keywords:
+                self._always.append(position)
+            for keyword in rule.keywords:
+                self._rules_by_keyword.setdefault(keyword, []).append(position)
+
+        # The same labels repeat across jobs, so every stage is cached per label
+        self._scan = lru_cache(maxsize=2048)(self._scan_uncached)
+        self._classify = lru_cache(maxsize=2048)(self._classify_uncached)
+        self._rules_for = lru_cache(maxsize=2048)(self._rules_for_uncached)
+
+    @staticmethod
+    def normalize(text) -> str:
+        return " ".join(str(text or "").lower().split())
+
+    def candidate_rules(self, keywords: frozenset, kind: str) -> list:
+        '''
+        Returns the rules that fire for a label's keyword set and question kind, in rule order.
+        '''
+        positions = set(self._always)
+        for keyword in keywords:
+            positions.update(self._rules_by_keyword.get(keyword, ()))
+        candidates = []
+        for position in sorted(positions):
+            rule = self.rules[position]
+            if kind not in rule.kinds:
+                continue
+            if keywords.intersection(rule.excludes):
+                continue
+            if all(keywords.intersection(group) for group in rule.requires):
+                candidates.append(rule)
+        return candidates
+
+    def rules_for(self, text: str, kind: str) -> tuple[str, tuple]:
+        '''
+        Returns `(label, rules)`: the normalized label and the rules that fire for it, in rule order.
+        * Cached, since the same labels repeat across jobs
+        '''
+        return self._rules_for(str(text or ""), kind)
+
+    def _rules_for_uncached(self, text: str, kind: str) -> tuple[str, tuple]:
+        label, keywords = self.scan(text)
+        return label, tuple(self.candidate_rules(keywords, kind))
+
+    def scan(self, text: str) -> tuple[str, frozenset]:
+        '''Normalizes a label and finds its rule keywords. Returns `(label, keywords)`'''
+        return self._scan(str(text or ""))
+
+    def _scan_uncached(self, text: str) -> tuple[str, frozenset]:
+        label = self.normalize(text)
+        return label, self.index.find(label)
+
+    def cache_clear(self) -> None:
+        self._scan.cache_clear()
+        self._classify.cache_clear()
+        self._rules_for.cache_clear()
+
+    def classify(self, question_text: str, element_type: str | None = None) -> QuestionClass:
+        '''
+        Classifies a question.
+        * Takes in `question_text` and optionally the HTML `element_type` (select, radio, checkbox, textarea...)
+        * Returns a `QuestionClass`; results are cached since the same labels repeat across jobs
+        '''
+        return self._classify(str(question_text or ""), (element_type or "").lower())
+
+    def _classify_uncached(self, question_text: str, element_type: str) -> QuestionClass:
+        label, keywords = self.scan(question_text)
+
+        match = _re_category.match(label)
+        category = 'general'
+        if match:
+            category = next(name for name, value in match.groupdict().items() if value is not None)
+
+        input_type = ELEMENT_KINDS.get(element_type, 'text')
+        if _re_choice_words.search(label):
+            input_type = 'select'
+        elif '?' in question_text and len(question_text.split()) < 15:
+            input_type = 'short_text'
+        elif _re_detail_words.search(label):
+            input_type = 'textarea'
+
+        if input_type in ('select', 'radio', 'checkbox') or category == 'yes_no':
+            kind = 'choice'
+        elif input_type == 'textarea':
+            kind = 'textarea'
+        else:
+            kind = 'text'
+
+        # Rules without keywords (e.g. matching the user's skills) say nothing about the question itself
+        candidates = [rule for rule in self.candidate_rules(keywords, kind) if rule.keywords]
+        return QuestionClass(
+            label=label,
+            category=category,
+            input_type=input_type,
+            kind=kind,
+            hint=candidates[0].name if candidates else None,
+            keywords=keywords,
+            is_required='*' in question_text or 'required' in label,
+        )
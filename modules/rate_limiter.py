@@ -0,0 +1,364 @@
+"""
+Author:     Shakeeb Shaikh
+LinkedIn:   https://www.linkedin.com/in/shakib-shaikh-660a44377/
+
+GitHub:     https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System
+
+Token bucket rate limiter shared by every AI and job platform call of a process.
+
+Each resource ("gemini", "openai", "deepseek", "linkedin", "indeed") has one bucket refilling
+at `per_minute` tokens a minute up to `burst`. Waiting callers are served fairly by key (one key
+per user session, see `rate_limit_key`), so a busy session cannot starve the others.
+Threads wait with `rate_limit`, coroutines with `arate_limit`, which keeps their event loop running.
+With a `state_path` the buckets live in a SQLite file and are shared by every process using it.
+Resources without a configured limit are not limited.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+
+
+POLL_INTERVAL = 0.05  # seconds between checks of a waiting coroutine
+
+
+class RateLimitTimeout(Exception):
+    """Raised when no token could be acquired within the timeout"""
+
+
+@dataclass
+class RateLimit:
+    """`per_minute` tokens a minute, at most `burst` at once"""
+    per_minute: float
+    burst: int = 1
+
+    @property
+    def rate(self) -> float:
+        return self.per_minute / 60.0
+
+
+class LocalBucket:
+    """Bucket state of this process. Callers hold the limiter's lock."""
+
+    def __init__(self, limit: RateLimit, clock=time.monotonic):
+        self.limit = limit
+        self._clock = clock
+        self.tokens = float(limit.burst)
+        self.updated = clock()
+
+    def take(self, tokens: float) -> float:
+        """Takes `tokens` and returns 0 if available, else the seconds until they will be"""
+        now = self._clock()
+        self.tokens = min(float(self.limit.burst), self.tokens + (now - self.updated) * self.limit.rate)
+        self.updated = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        return (tokens - self.tokens) / self.limit.rate
+
+
+class SQLiteBucket:
+    """
+    Bucket state in a SQLite file, shared by every process using the same `path`.
+    * Falls back to a `LocalBucket` while the file cannot be used
+    """
+
+    def __init__(self, path: str, resource: str, limit: RateLimit):
+        self.path = path
+        self.resource = resource
+        self.limit = limit
+        self._fallback = LocalBucket(limit)
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits (resource TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5, isolation_level=None)
+
+    def take(self, tokens: float) -> float:
+        try:
+            with closing(self._connect()) as connection:
+                connection.execute("BEGIN IMMEDIATE")
+                row = connection.execute(
+                    "SELECT tokens, updated_at FROM rate_limits WHERE resource = ?", (self.resource,)).fetchone()
+                now = time.time()
+                available = float(self.limit.burst) if row is None else \
+                    min(float(self.limit.burst), row[0] + max(0.0, now - row[1]) * self.limit.rate)
+                wait = 0.0
+                if available >= tokens:
+                    available -= tokens
+                else:
+                    wait = (tokens - available) / self.limit.rate
+                connection.execute(
+                    "INSERT OR REPLACE INTO rate_limits (resource, tokens, updated_at) VALUES (?, ?, ?)",
+                    (self.resource, available, now))
+                connection.execute("COMMIT")
+                return wait
+        except sqlite3.Error:
+            return self._fallback.take(tokens)
+
+
+class RateLimiter:
+    """
+    Fair token bucket limiter of one resource.
+    * Waiters are ordered by start-time fair queuing: each key's requests are spaced by their
+      cost, so a key with one request overtakes a key with many queued ones
+    * Without a `limit` every call passes at once
+    """
+
+    def __init__(self, resource: str, limit: RateLimit | None = None, state_path: str | None = None):
+        self.resource = resource
+        self.limit = limit
+        if limit is None or limit.per_minute <= 0:
+            self.limit, self._bucket = None, None
+        elif state_path:
+            self._bucket = SQLiteBucket(state_path, resource, limit)
+        else:
+            self._bucket = LocalBucket(limit)
+        self._condition = threading.Condition()
+        self._waiters = []  # Heap of [tag, sequence, tokens]
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._last_tag = {}  # key -> tag of its last request
+        self._wait_times = deque(maxlen=500)
+        self._keys = {}  # key -> {"acquired", "wait"}
+        self.stats = {"acquired": 0, "waited": 0, "total_wait": 0.0, "max_wait": 0.0, "timeouts": 0}
+
+    def acquire(self, key: str | None = None, tokens: float = 1, timeout: float | None = None) -> float:
+        """
+        Waits for `tokens` of this resource.
+        * Takes in `key`, the caller's fairness key (e.g. "user:7"), `tokens` the cost of the call
+          and an optional `timeout` in seconds
+        * Returns the seconds waited, raises `RateLimitTimeout` after `timeout`
+        """
+        if self._bucket is None:
+            with self._condition:
+                self._record(key, 0.0)
+            return 0.0
+
+        tokens = min(float(tokens), float(self.limit.burst))
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        with self._condition:
+            entry = self._enqueue(key, tokens)
+            try:
+                while True:
+                    delay = self._take_turn(entry)
+                    if delay is not None and delay <= 0:
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self.stats["timeouts"] += 1
+                        raise RateLimitTimeout(f"No {self.resource} rate limit token within {timeout}s")
+                    waits = [wait for wait in (delay, remaining) if wait is not None]
+                    self._condition.wait(min(waits) if waits else None)
+            except BaseException:
+                self._dequeue(entry)
+                raise
+            finally:
+                # The next waiter may be at the head now
+                self._condition.notify_all()
+            waited = time.monotonic() - started
+            self._record(key, waited)
+        return waited
+
+    async def aacquire(self, key: str | None = None, tokens: float = 1, timeout: float | None = None) -> float:
+        """
+        Waits for `tokens` of this resource without blocking the running event loop.
+        * Same arguments and return value as `acquire`; a cancelled wait leaves the queue
+        """
+        if self._bucket is None:
+            with self._condition:
+                self._record(key, 0.0)
+            return 0.0
+
+        tokens = min(float(tokens), float(self.limit.burst))
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        with self._condition:
+            entry = self._enqueue(key, tokens)
+        try:
+            while True:
+                with self._condition:
+                    delay = self._take_turn(entry)
+                    if delay is not None and delay <= 0:
+                        self._condition.notify_all()
+                        break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    with self._condition:
+                        self.stats["timeouts"] += 1
+                    raise RateLimitTimeout(f"No {self.resource} rate limit token within {timeout}s")
+                # Coroutines are not woken by the condition, so they check again at least every POLL_INTERVAL
+                await asyncio.sleep(min(wait for wait in (delay, remaining, POLL_INTERVAL) if wait is not None))
+        except BaseException:
+            with self._condition:
+                self._dequeue(entry)
+                self._condition.notify_all()
+            raise
+        waited = time.monotonic() - started
+        with self._condition:
+            self._record(key, waited)
+        return waited
+
+    def _enqueue(self, key: str | None, tokens: float) -> list:
+        """Queues a request of `key` and returns its entry. Callers hold the condition."""
+        tag = max(self._virtual_time, self._last_tag.get(key, 0.0)) + tokens
+        self._last_tag[key] = tag
+        entry = [tag, next(self._sequence), tokens]
+        heapq.heappush(self._waiters, entry)
+        return entry
+
+    def _take_turn(self, entry: list) -> float | None:
+        """
+        Takes the tokens of `entry` if it is at the head of the queue. Callers hold the condition.
+        * Returns 0 once taken, the seconds until they will be available, or None while others are ahead
+        """
+        if self._waiters[0] is not entry:
+            return None
+        delay = self._bucket.take(entry[2])
+        if delay > 0:
+            return delay
+        heapq.heappop(self._waiters)
+        self._virtual_time = entry[0] - entry[2]
+        if not self._waiters:
+            self._last_tag.clear()
+        return 0.0
+
+    def _dequeue(self, entry: list) -> None:
+        if entry in self._waiters:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+
+    def _record(self, key: str | None, waited: float) -> None:
+        self.stats["acquired"] += 1
+        self._wait_times.append(waited)
+        if waited >= 0.001:
+            self.stats["waited"] += 1
+            self.stats["total_wait"] += waited
+            self.stats["max_wait"] = max(self.stats["max_wait"], waited)
+        per_key = self._keys.setdefault(key or "default", {"acquired": 0, "wait": 0.0})
+        per_key["acquired"] += 1
+        per_key["wait"] += waited
+
+    def snapshot(self) -> dict:
+        """
+        Returns the limit, calls, waits (count, average, p95, max, total), timeouts, queue length
+        and the calls and total wait per key.
+        """
+        with self._condition:
+            waits = sorted(self._wait_times)
+            data = dict(self.stats, queued=len(self._waiters),
+                        keys={key: dict(values, wait=round(values["wait"], 3)) for key, values in self._keys.items()})
+        data["limit"] = None if self.limit is None else {"per_minute": self.limit.per_minute, "burst": self.limit.burst}
+        data["shared"] = isinstance(self._bucket, SQLiteBucket)
+        data["total_wait"] = round(data["total_wait"], 3)
+        data["max_wait"] = round(data["max_wait"], 3)
+        data["avg_wait"] = round(sum(waits) / len(waits), 3) if waits else 0.0
+        data["p95_wait"] = round(waits[min(len(waits) - 1, int(round(0.95 * (len(waits) - 1))))], 3) if waits else 0.0
+        return data
+
+
+_limits: dict[str, RateLimit] = {}
+_state_path: str | None = None
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+_local = threading.local()
+
+
+def configure_rate_limits(limits: dict, state_path: str | None = None) -> None:
+    '''
+    Sets the limits of the resources.
+    * Takes in `limits`, resource name -> `RateLimit` or `(per_minute, burst)`; 0 per minute is unlimited
+    * Takes in `state_path` of a SQLite file to share the buckets between processes, `None` for this process only
+    * Limiters of unchanged resources keep their state and metrics
+    '''
+    global _state_path
+    with _limiters_lock:
+        for resource, limit in limits.items():
+            if not isinstance(limit, RateLimit):
+                per_minute, burst = limit
+                limit = RateLimit(float(per_minute), max(1, int(burst)))
+            if _limits.get(resource) != limit or _state_path != (state_path or None):
+                _limiters.pop(resource, None)
+            _limits[resource] = limit
+        if _state_path != (state_path or None):
+            _limiters.clear()
+        _state_path = state_path or None
+
+
+def get_rate_limiter(resource: str) -> RateLimiter:
+    '''
+    Returns the shared limiter of a resource (unlimited if never configured).
+    '''
+    with _limiters_lock:
+        limiter = _limiters.get(resource)
+        if limiter is None:
+            limit = _limits.get(resource)
+            try:
+                limiter = RateLimiter(resource, limit, _state_path)
+            except (sqlite3.Error, OSError):
+                limiter = RateLimiter(resource, limit)
+            _limiters[resource] = limiter
+        return limiter
+
+
+def set_rate_limit_key(key: str | None) -> None:
+    '''
+    Sets the fairness key (e.g. "user:7") used by this thread's rate limited calls.
+    '''
+    _local.key = key
+
+
+def get_rate_limit_key() -> str | None:
+    return getattr(_local, "key", None)
+
+
+@contextmanager
+def rate_limit_key(key: str | None):
+    '''
+    Uses `key` as this thread's fairness key inside the `with` block.
+    '''
+    previous = get_rate_limit_key()
+    set_rate_limit_key(key)
+    try:
+        yield
+    finally:
+        set_rate_limit_key(previous)
+
+
+def rate_limit(resource: str, tokens: float = 1, key: str | None = None, timeout: float | None = None) -> float:
+    '''
+    Waits until a call to `resource` is allowed.
+    * Takes in `tokens`, the cost of the call, and the fairness `key` (default: this thread's key)
+    * Returns the seconds waited, raises `RateLimitTimeout` after `timeout`
+    '''
+    return get_rate_limiter(resource).acquire(key if key is not None else get_rate_limit_key(), tokens, timeout)
+
+
+async def arate_limit(resource: str, tokens: float = 1, key: str | None = None, timeout: float | None = None) -> float:
+    '''
+    Like `rate_limit`, for coroutines: waits without blocking the running event loop.
+    * `key` defaults to the fairness key of the thread running the loop
+    '''
+    return await get_rate_limiter(resource).aacquire(key if key is not None else get_rate_limit_key(), tokens, timeout)
+
+
+def rate_limiter_metrics() -> dict[str, dict]:
+    '''
+    Returns the wait metrics of every resource used so far.
+    '''
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.resource: limiter.snapshot() for limiter in limiters}
@@ -0,0 +1,148 @@
+"""
+Author:     Shakeeb Shaikh
+LinkedIn:   https://www.linkedin.com/in/shakib-shaikh-660a44377/
+
+GitHub:     https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System
+
+Checkpoint of a run through the search terms, so a crashed or killed run picks up where it stopped.
+
+The checkpoint holds the order of the search terms, the current term, page and job, the number
+of jobs applied for the current term, and the rejected job ids and blacklisted companies found
+so far. It is written as JSON at every page boundary (and when the run ends), to a temporary
+file that then replaces the old one, so a crash never leaves half a checkpoint.
+
+A checkpoint is only used by a run with the same search settings (`fingerprint`) within
+`max_age` seconds, as older search results will have changed too much. A finished run clears it.
+"""
+
+import hashlib
+import json
+import os
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+JOBS_PER_PAGE = 25
+
+
+def fingerprint(*settings) -> str:
+    '''
+    Returns a short hash of the search settings a checkpoint is valid for.
+    '''
+    return hashlib.sha1(json.dumps(settings, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def page_url(url: str, page: int, per_page: int = JOBS_PER_PAGE) -> str:
+    '''
+    Returns the search results `url` opened at `page` (from 1), using the `start` parameter.
+    '''
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != "start"]
+    if page > 1:
+        query.append(("start", str((page - 1) * per_page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def resume_index(job_ids: list[str], job_id: str | None) -> int:
+    '''
+    Returns the index of the listing to resume from on a page: the job the run stopped at,
+    or 0 if it is not on the page anymore.
+    '''
+    return job_ids.index(job_id) if job_id and job_id in job_ids else 0
+
+
+class RunCheckpoint:
+    '''
+    Position of a run through the search terms, saved to `path` ("" to keep it in memory only).
+    * Takes in `max_age` in seconds after which a saved checkpoint is ignored
+    '''
+
+    def __init__(self, path: str = "", max_age: float = 24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self.state: dict = {}
+
+    def resume(self, settings_fingerprint: str) -> dict | None:
+        '''
+        Loads the saved checkpoint of a run with the same search settings.
+        * Returns it, or None if there is none, it is older than `max_age` or unreadable
+        '''
+        if not self.path:
+            return None
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(state, dict) or state.get("fingerprint") != settings_fingerprint
+                or time.time() - state.get("updated", 0) > self.max_age):
+            return None
+        self.state = state
+        return state
+
+    def start(self, settings_fingerprint: str, search_terms: list[str]) -> None:
+        '''
+        Starts a new run through `search_terms`, in that order.
+        '''
+        self.state = {
+            "fingerprint": settings_fingerprint,
+            "search_terms": list(search_terms),
+            "term_index": 0,
+            "page": 1,
+            "job_id": None,
+            "applied": 0,
+            "rejected_jobs": [],
+            "blacklisted_companies": [],
+        }
+        self.save()
+
+    def at_page(self, term_index: int, page: int, applied: int, rejected_jobs: set, blacklisted_companies: set,
+                job_id: str | None = None) -> None:
+        '''
+        Records the start of a page of results and saves the checkpoint.
+        * Takes in `job_id` when the page is resumed from that job
+        '''
+        self.state.update({
+            "term_index": term_index,
+            "page": page,
+            "job_id": job_id,
+            "applied": applied,
+            "rejected_jobs": sorted(rejected_jobs),
+            "blacklisted_companies": sorted(blacklisted_companies),
+        })
+        self.save()
+
+    def at_job(self, job_id: str, applied: int) -> None:
+        '''
+        Records the job being worked on, saved with the next page or by `save`.
+        '''
+        self.state["job_id"] = job_id
+        self.state["applied"] = applied
+
+    def save(self) -> None:
+        '''
+        Saves the checkpoint atomically, if there is one and `path` is set.
+        '''
+        if not self.path or not self.state:
+            return
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.state["updated"] = time.time()
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(self.state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path)
+
+    def clear(self) -> None:
+        '''
+        Forgets the checkpoint of a finished run.
+        '''
+        self.state = {}
+        if self.path:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,171 @@
+"""
+Author:     Shakeeb Shaikh
+LinkedIn:   https://www.linkedin.com/in/shakib-shaikh-660a44377/
+
+GitHub:     https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System
+
+Decides when the next cycle of a non-stop run starts, from what the previous cycles found.
+
+A cycle that finds job postings not seen before halves the gap to the next cycle (down to
+`min_gap`). A cycle that finds nothing new makes it 1.5 times longer (up to `max_gap`), and
+so does one that had to wait for the LinkedIn rate limit. When the daily Easy Apply limit is
+reached, the next cycle waits `limit_pause` seconds, without probes.
+
+While waiting, a cheap probe (e.g. the first page of the most recent postings) runs every
+`probe_interval` seconds. If it shows a posting not seen before, the next cycle starts right
+away instead of at the end of the gap. Every job id a probe reported counts as seen once the
+next cycle is done, so a posting the search filters leave out starts at most one early cycle.
+
+The gap, the seen job ids, the time of the next cycle and the limit pause are saved as JSON in
+`state_path`, so a restarted bot carries on with what it learned.
+"""
+
+import json
+import os
+import time
+
+
+MAX_SEEN_IDS = 5000
+
+
+class RunScheduler:
+    '''
+    Gap between the cycles of a non-stop run, adjusted to their yield.
+    * Takes in `min_gap`, `max_gap`, `probe_interval` and `limit_pause` in seconds (0 `probe_interval` never probes)
+    * Takes in `clock` and `sleep`, replaceable in tests
+    '''
+
+    def __init__(self, state_path: str = "", min_gap: float = 120, max_gap: float = 3600,
+                 probe_interval: float = 300, limit_pause: float = 0, clock=time.time, sleep=time.sleep):
+        self.state_path = state_path
+        self.min_gap = min_gap
+        self.max_gap = max(max_gap, min_gap)
+        self.probe_interval = probe_interval
+        self.limit_pause = limit_pause
+        self.clock = clock
+        self.sleep = sleep
+        self.gap = min(max(600, self.min_gap), self.max_gap)  # 10 min, like the fixed sleeps it replaces
+        self.next_cycle_at = 0.0
+        self.limit_until = 0.0  # the daily limit is reached until then, so no probes
+        self.seen: dict[str, None] = {}  # job ids in the order seen, as an ordered set
+        self.probed: set[str] = set()
+        self.cycle_new = 0
+        self.stats = {"cycles": 0, "probes": 0, "early_cycles": 0, "new_postings": 0, "waited": 0.0}
+        self._load()
+
+    # ---- state ----
+
+    def _load(self) -> None:
+        if not self.state_path:
+            return
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as file:
+                state = json.load(file)
+            self.gap = min(max(float(state.get("gap", self.gap)), self.min_gap), self.max_gap)
+            self.next_cycle_at = float(state.get("next_cycle_at", 0))
+            self.limit_until = float(state.get("limit_until", 0))
+            self.seen = dict.fromkeys(str(job_id) for job_id in state.get("seen", []))
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+
+    def save(self) -> None:
+        '''
+        Saves the state to `state_path` (atomically), if set.
+        '''
+        if not self.state_path:
+            return
+        folder = os.path.dirname(self.state_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        state = {"gap": self.gap, "next_cycle_at": self.next_cycle_at, "limit_until": self.limit_until,
+                 "seen": list(self.seen)[-MAX_SEEN_IDS:]}
+        temporary = self.state_path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(temporary, self.state_path)
+
+    # ---- cycles ----
+
+    def start_cycle(self) -> None:
+        '''
+        Starts counting the new postings of a cycle.
+        '''
+        self.cycle_new = 0
+
+    def saw(self, job_id: str) -> bool:
+        '''
+        Records a job posting found by a cycle. Returns True if it was not seen before.
+        '''
+        job_id = str(job_id)
+        if not job_id or job_id in self.seen:
+            return False
+        self.seen[job_id] = None
+        if len(self.seen) > MAX_SEEN_IDS:
+            del self.seen[next(iter(self.seen))]
+        self.cycle_new += 1
+        return True
+
+    def finish_cycle(self, limit_reached: bool = False, rate_limited: bool = False) -> float:
+        '''
+        Sets the time of the next cycle from the yield of the one that just ended.
+        * Takes in `limit_reached` if the daily application limit was reached, `rate_limited` if the cycle waited for a rate limit
+        * Returns the seconds until the next cycle
+        '''
+        for job_id in self.probed:
+            self.seen.setdefault(job_id, None)
+        self.probed.clear()
+        self.stats["cycles"] += 1
+        self.stats["new_postings"] += self.cycle_new
+
+        if self.cycle_new:
+            self.gap = max(self.min_gap, self.gap / 2)
+        else:
+            self.gap = min(self.max_gap, self.gap * 1.5)
+        if rate_limited:
+            self.gap = min(self.max_gap, max(self.gap, self.min_gap) * 1.5)
+        delay = max(self.gap, self.limit_pause) if limit_reached else self.gap
+        self.next_cycle_at = self.clock() + delay
+        self.limit_until = self.next_cycle_at if limit_reached else 0.0
+        self.save()
+        return delay
+
+    def seconds_left(self) -> float:
+        '''
+        Returns the seconds until the next cycle is due, 0 if it is.
+        '''
+        return max(0.0, self.next_cycle_at - self.clock())
+
+    def wait(self, probe=None, on_probe_error=None) -> str:
+        '''
+        Sleeps until the next cycle is due, or until `probe` shows a new posting.
+        * Takes in `probe()`, returning the job ids of the newest postings (skipped if None or while the daily limit is reached)
+        * Takes in `on_probe_error(error)`, called when a probe fails (the wait goes on)
+        * Returns "due" or "new postings"
+        '''
+        started = self.clock()
+        try:
+            while True:
+                left = self.seconds_left()
+                if left <= 0:
+                    return "due"
+                if probe is None or self.probe_interval <= 0 or self.clock() < self.limit_until:
+                    self.sleep(left)
+                    continue
+                self.sleep(min(left, self.probe_interval))
+                if self.seconds_left() <= 0:
+                    return "due"
+                self.stats["probes"] += 1
+                try:
+                    new = {str(job_id) for job_id in probe() or []} - self.seen.keys()
+                except Exception as e:
+                    if on_probe_error:
+                        on_probe_error(e)
+                    continue
+                if new:
+                    self.probed.update(new)
+                    self.stats["early_cycles"] += 1
+                    self.next_cycle_at = self.clock()
+                    self.save()
+                    return "new postings"
+        finally:
+            self.stats["waited"] += self.clock() - started
@@ -0,0 +1,220 @@
+"""
+Author:     Shakeeb Shaikh
+LinkedIn:   https://www.linkedin.com/in/shakib-shaikh-660a44377/
+
+GitHub:     https://github.com/ShakeebSk/AutoHire-Intelligent-Job-Application-System
+
+Failure screenshots saved in the background, compressed, with bounded disk use.
+
+Only grabbing the screenshot bytes (and, optionally, the page's HTML) happens on the calling
+thread, because that is the moment the page shows the failure. Compressing to WebP or JPEG,
+downscaling, writing and deleting old files happen on a background thread, so a failure no
+longer adds seconds to the run. Screenshots older than `max_age_days`, and the oldest ones
+beyond `max_files` or `max_mb`, are deleted.
+
+Pillow is optional: without it screenshots are saved as the original PNG.
+"""
+
+import atexit
+import gzip
+import io
+import os
+import queue
+import re
+import threading
+import time
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+IMAGE_EXTENSIONS = (".webp", ".jpg", ".png")
+DOM_EXTENSION = ".html.gz"
+
+
+class ScreenshotService:
+    '''
+    Saves screenshots (and DOM snapshots) of a Selenium driver from a background thread.
+    * Takes in `image_format` "webp", "jpeg" or "png", `quality` (1-100) and `max_width` in pixels (0 keeps the size)
+    * Takes in `capture_dom` to also save the page's HTML next to each screenshot
+    * Takes in the retention limits `max_files`, `max_mb` and `max_age_days` (0 for no limit)
+    '''
+
+    def __init__(self, folder: str, image_format: str = "webp", quality: int = 70, max_width: int = 1280,
+                 capture_dom: bool = False, max_files: int = 500, max_mb: float = 200, max_age_days: float = 14,
+                 max_queued: int = 20):
+        self.folder = folder
+        self.image_format = image_format.lower() if Image is not None else "png"
+        if self.image_format == "jpg":
+            self.image_format = "jpeg"
+        self.extension = {"webp": ".webp", "jpeg": ".jpg"}.get(self.image_format, ".png")
+        self.quality = quality
+        self.max_width = max_width
+        self.capture_dom = capture_dom
+        self.max_files = max_files
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.max_age = max_age_days * 86400
+        self.stats = {"captured": 0, "saved": 0, "dropped": 0, "errors": 0, "deleted": 0,
+                      "capture_seconds": 0.0, "bytes_in": 0, "bytes_out": 0}
+        self._queue = queue.Queue(max_queued)
+        os.makedirs(folder, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="screenshots", daemon=True)
+        self._thread.start()
+
+    def file_name(self, name: str) -> str:
+        '''
+        Returns the file name a screenshot called `name` is saved as.
+        '''
+        return re.sub(r'[\\/*?"<>|:]', ".", name) + self.extension
+
+    def capture(self, driver, name: str) -> str:
+        '''
+        Grabs a screenshot (and the page's HTML if `capture_dom`) and queues it to be saved.
+        * Returns the screenshot's file name, or "Not Available" if it couldn't be taken
+        '''
+        started = time.perf_counter()
+        try:
+            png = driver.get_screenshot_as_png()
+            dom = driver.page_source if self.capture_dom else None
+        except Exception:
+            self.stats["errors"] += 1
+            return "Not Available"
+        finally:
+            self.stats["capture_seconds"] += time.perf_counter() - started
+        file_name = self.file_name(name)
+        try:
+            self._queue.put_nowait((file_name, png, dom))
+        except queue.Full:
+            # Saving can't keep up; losing a screenshot is better than slowing the run down
+            self.stats["dropped"] += 1
+            return "Not Available"
+        self.stats["captured"] += 1
+        return file_name
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        '''
+        Waits until every queued screenshot is saved.
+        '''
+        done = threading.Event()
+        try:
+            self._queue.put(("", None, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    # ---- background thread ----
+
+    def _run(self) -> None:
+        while True:
+            file_name, png, dom = self._queue.get()
+            if png is None:
+                dom.set()  # flush() waiting on this Event
+                continue
+            try:
+                self._save(file_name, png, dom)
+                self.stats["saved"] += 1
+            except Exception:
+                self.stats["errors"] += 1
+            try:
+                self.apply_retention()
+            except OSError:
+                pass
+
+    def compress(self, png: bytes) -> bytes:
+        '''
+        Returns the screenshot in the configured format, downscaled to `max_width`.
+        '''
+        if Image is None or self.image_format == "png" and not self.max_width:
+            return png
+        with Image.open(io.BytesIO(png)) as image:
+            if self.max_width and image.width > self.max_width:
+                image = image.resize((self.max_width, round(image.height * self.max_width / image.width)))
+            if self.image_format == "jpeg":
+                image = image.convert("RGB")
+            output = io.BytesIO()
+            options = {"optimize": True} if self.image_format == "png" else {"quality": self.quality}
+            image.save(output, format=self.image_format.upper(), **options)
+            return output.getvalue()
+
+    def _save(self, file_name: str, png: bytes, dom: str | None) -> None:
+        data = self.compress(png)
+        self.stats["bytes_in"] += len(png)
+        self.stats["bytes_out"] += len(data)
+        path = os.path.join(self.folder, file_name)
+        with open(path + ".part", "wb") as file:
+            file.write(data)
+        os.replace(path + ".part", path)
+        if dom is not None:
+            with gzip.open(os.path.splitext(path)[0] + DOM_EXTENSION, "wt", encoding="utf-8") as file:
+                file.write(dom)
+
+    def apply_retention(self) -> int:
+        '''
+        Deletes screenshots (and their DOM snapshots) that are too old, then the oldest ones
+        beyond `max_files` or `max_mb`. Returns the number of screenshots deleted.
+        '''
+        captures = {}  # screenshot name without extension -> [modified time, total size, paths]
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                for extension in IMAGE_EXTENSIONS + (DOM_EXTENSION,):
+                    if entry.name.endswith(extension):
+                        stat = entry.stat()
+                        capture = captures.setdefault(entry.name[:-len(extension)], [0.0, 0, []])
+                        capture[0] = max(capture[0], stat.st_mtime)
+                        capture[1] += stat.st_size
+                        capture[2].append(entry.path)
+                        break
+
+        oldest_first = sorted(captures.values(), key=lambda capture: capture[0])
+        total_bytes = sum(capture[1] for capture in oldest_first)
+        now = time.time()
+        deleted = 0
+        for index, (modified, size, paths) in enumerate(oldest_first):
+            remaining = len(oldest_first) - index
+            too_old = self.max_age and now - modified > self.max_age
+            too_many = self.max_files and remaining > self.max_files
+            too_big = self.max_bytes and total_bytes > self.max_bytes
+            if not (too_old or too_many or too_big):
+                break
+            for path in paths:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            total_bytes -= size
+            deleted += 1
+        self.stats["deleted"] += deleted
+        return deleted
+
+
+_services: dict[str, ScreenshotService] = {}
+_services_lock = threading.Lock()
+
+
+def get_screenshot_service(folder: str, **options) -> ScreenshotService:
+    '''
+    Returns the shared `ScreenshotService` of `folder`, created with `options` on first use.
+    * Queued screenshots are saved before the interpreter exits
+    '''
+    with _services_lock:
+        service = _services.get(folder)
+        if service is None:
+            service = ScreenshotService(folder, **options)
+            _services[folder] = service
+        return service
+
+
+def flush_screenshots() -> bool:
+    '''
+    Waits until every queued screenshot of every service is saved.
+    '''
+    with _services_lock:
+        services = list(_services.values())
+    return all([service.flush() for service in services])
+
+
+atexit.register(flush_screenshots)
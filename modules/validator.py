@@ -156,6 +156,14 @@ def validate_secrets() -> None | ValueError | TypeError:
     check_string(llm_api_key, "llm_api_key")
     # check_string(llm_embedding_model, "llm_embedding_model")
     check_boolean(stream_output, "stream_output")
+    check_int(ai_slow_call_seconds, "ai_slow_call_seconds", 0)
+    check_int(ai_breaker_cooldown, "ai_breaker_cooldown", 1)
+    check_boolean(ai_hedge_requests, "ai_hedge_requests")
+    check_string(skills_cache_path, "skills_cache_path")
+    check_int(skills_cache_max_entries, "skills_cache_max_entries", 1)
+    check_int(ai_requests_per_minute, "ai_requests_per_minute", 0)
+    check_int(ai_request_burst, "ai_request_burst", 1)
+    check_string(rate_limit_state_path, "rate_limit_state_path")
     
     ##> ------ Yang Li : MARKYangL - Feature ------
     # Validate DeepSeek configuration
@@ -181,6 +189,7 @@ def validate_settings() -> None | ValueError | TypeError:
     __validation_file_path = "config/settings.py"
 
     check_boolean(close_tabs, "close_tabs")
+    check_int(external_link_workers, "external_link_workers", 0)
     check_boolean(follow_companies, "follow_companies")
     # check_boolean(connect_hr, "connect_hr")
     # check_string(connect_request_message, "connect_request_message", min_length=10)
@@ -189,14 +198,36 @@ def validate_settings() -> None | ValueError | TypeError:
     check_boolean(alternate_sortby, "alternate_sortby")
     check_boolean(cycle_date_posted, "cycle_date_posted")
     check_boolean(stop_date_cycle_at_24hr, "stop_date_cycle_at_24hr")
+    check_int(run_min_gap_minutes, "run_min_gap_minutes", 0)
+    check_int(run_max_gap_minutes, "run_max_gap_minutes", 0)
+    check_int(run_probe_minutes, "run_probe_minutes", 0)
+    check_int(easy_apply_limit_pause_hours, "easy_apply_limit_pause_hours", 0)
+    check_string(run_state_path, "run_state_path")
+    check_string(run_checkpoint_path, "run_checkpoint_path")
+    check_int(run_checkpoint_max_hours, "run_checkpoint_max_hours", 0)
     
     # check_string(generated_resume_path, "generated_resume_path", min_length=1)
 
     check_string(file_name, "file_name", min_length=1)
     check_string(failed_file_name, "failed_file_name", min_length=1)
+    check_string(history_db_path, "history_db_path")
+    check_int(history_flush_interval, "history_flush_interval", 0)
+    check_int(history_rotate_mb, "history_rotate_mb", 0)
+    check_string(history_export_path, "history_export_path")
     check_string(logs_folder_path, "logs_folder_path", min_length=1)
+    check_int(log_rotate_mb, "log_rotate_mb", 0)
+    check_int(log_rotate_hours, "log_rotate_hours", 0)
+    check_int(log_backups, "log_backups", 1)
+    check_boolean(log_json, "log_json")
+    check_string(screenshot_format, "screenshot_format", ["webp", "jpeg", "png"])
+    check_int(screenshot_quality, "screenshot_quality", 1)
+    check_int(screenshot_max_width, "screenshot_max_width", 0)
+    check_boolean(screenshot_capture_dom, "screenshot_capture_dom")
+    check_int(screenshots_max_mb, "screenshots_max_mb", 0)
+    check_int(screenshots_max_age_days, "screenshots_max_age_days", 0)
 
     check_int(click_gap, "click_gap", 0)
+    check_int(linkedin_pages_per_minute, "linkedin_pages_per_minute", 0)
 
     check_boolean(run_in_background, "run_in_background")
     check_boolean(disable_extensions, "disable_extensions")
@@ -9,12 +9,42 @@ from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
 import csv
 from datetime import datetime
-import os
+from email.utils import formatdate
+import hashlib
+
+from config.settings import file_name, history_db_path
+from modules.history_store import get_history_store
+from modules.history_writer import file_lock, history_files
 
 app = Flask(__name__,template_folder='app/templates/dashboard')
-CORS(app)
+CORS(app, expose_headers=['ETag', 'Last-Modified', 'Link', 'X-Total-Count', 'X-Next-Cursor'])
 
 PATH = 'all excels/'
+HISTORY_DB = history_db_path or PATH + 'applications_history.db'
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+# Columns listed by the dashboard, "About Job" and "Questions Found" are never read
+LIST_COLUMNS = ['job_id', 'title', 'company', 'hr_name', 'hr_link', 'job_link', 'external_job_link', 'date_applied']
+
+
+def get_history(locked=False):
+    '''
+    Returns the indexed applications history, after importing the rows the bot appended to
+    the history CSV file and its rotated files (".1.csv", ".2.csv", ...) since the last request.
+    Pass `locked` if the caller already holds the history file's lock.
+    '''
+    store = get_history_store(HISTORY_DB)
+    if store is None:
+        raise FileNotFoundError(HISTORY_DB)
+    if not locked:
+        # The bot may be appending to the same file, so hold its lock while reading
+        with file_lock(file_name):
+            return get_history(locked=True)
+    for csvFile in history_files(file_name):
+        store.import_csv(csvFile, 'applied')
+    return store
+
+
 @app.route('/')
 def home():
     return render_template('jobCSV.html')
@@ -22,31 +52,63 @@ def home():
 @app.route('/applied-jobs', methods=['GET'])
 def get_applied_jobs():
     '''
-    Retrieves a list of applied jobs from the applications history CSV file.
-    
+    Retrieves one page of applied jobs from the applications history, oldest first.
+
+    Query parameters:
+        limit: jobs per page (default 100, at most 500)
+        after: the cursor of the previous page from the `X-Next-Cursor` header (keyset paging)
+        offset: jobs to skip, used only without `after`
+
     Returns a JSON response containing a list of jobs, each with details such as 
     Job ID, Title, Company, HR Name, HR Link, Job Link, External Job link, and Date Applied.
+    The total is sent in `X-Total-Count` and the next page in `X-Next-Cursor` and a `Link` header.
+    Responses carry `ETag` and `Last-Modified`, so unchanged pages are answered with 304.
     
-    If the CSV file is not found, returns a 404 error with a relevant message.
+    If there is no history, returns a 404 error with a relevant message.
     If any other exception occurs, returns a 500 error with the exception message.
     '''
 
     try:
+        limit = min(max(request.args.get('limit', PAGE_SIZE, type=int), 1), MAX_PAGE_SIZE)
+        after = request.args.get('after', type=int)
+        offset = max(request.args.get('offset', 0, type=int), 0)
+
+        history = get_history()
+        modified = history.modified()
+        total = history.count('applied')
+        if not total:
+            return jsonify({"error": "No applications history found"}), 404
+
+        # Conditional requests are answered before reading any job
+        etag = hashlib.sha1(f"{modified}:{total}:{limit}:{after}:{offset}".encode()).hexdigest()
+        response = app.response_class(status=200)
+        response.set_etag(etag)
+        response.headers['Last-Modified'] = formatdate(modified or None, usegmt=True)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.make_conditional(request)
+        if response.status_code == 304:
+            return response
+
+        rows, nextCursor = history.page('applied', limit, after=after, offset=offset, columns=LIST_COLUMNS)
         jobs = []
-        with open(PATH + 'all_applied_applications_history.csv', 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                jobs.append({
-                    'Job_ID': row['Job ID'],
-                    'Title': row['Title'],
-                    'Company': row['Company'],
-                    'HR_Name': row['HR Name'],
-                    'HR_Link': row['HR Link'],
-                    'Job_Link': row['Job Link'],
-                    'External_Job_link': row['External Job link'],
-                    'Date_Applied': row['Date Applied']
-                })
-        return jsonify(jobs)
+        for row in rows:
+            jobs.append({
+                'Job_ID': row['job_id'],
+                'Title': row['title'],
+                'Company': row['company'],
+                'HR_Name': row['hr_name'],
+                'HR_Link': row['hr_link'],
+                'Job_Link': row['job_link'],
+                'External_Job_link': row['external_job_link'],
+                'Date_Applied': row['date_applied']
+            })
+        response.set_data(jsonify(jobs).get_data())
+        response.mimetype = 'application/json'
+        response.headers['X-Total-Count'] = str(total)
+        if nextCursor is not None:
+            response.headers['X-Next-Cursor'] = str(nextCursor)
+            response.headers['Link'] = f'<{request.base_url}?limit={limit}&after={nextCursor}>; rel="next"'
+        return response
     except FileNotFoundError:
         return jsonify({"error": "No applications history found"}), 404
     except Exception as e:
@@ -55,7 +117,8 @@ def get_applied_jobs():
 @app.route('/applied-jobs/<job_id>', methods=['PUT'])
 def update_applied_date(job_id):
     """
-    Updates the 'Date Applied' field of a job in the applications history CSV file.
+    Updates the 'Date Applied' field of a job in the applications history and
+    in the history CSV file (or rotated file) that lists it.
 
     Args:
         job_id (str): The Job ID of the job to be updated.
@@ -67,30 +130,36 @@ def update_applied_date(job_id):
         exception message.
     """
     try:
-        data = []
-        csvPath = PATH + 'all_applied_applications_history.csv'
-        
-        if not os.path.exists(csvPath):
-            return jsonify({"error": f"CSV file not found at {csvPath}"}), 404
-            
-        # Read current CSV content
-        with open(csvPath, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            fieldNames = reader.fieldnames
-            found = False
-            for row in reader:
-                if row['Job ID'] == job_id:
-                    row['Date Applied'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        dateApplied = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        # The bot may be appending to the same file, so hold its lock while rewriting
+        with file_lock(file_name):
+            history = get_history(locked=True)
+            found = history.update_applied(job_id, {'date_applied': dateApplied})
+            # Newest file first, the job was most likely applied to recently
+            for csvFile in reversed(history_files(file_name)):
+                data = []
+                foundInFile = False
+                with open(csvFile, 'r', encoding='utf-8') as file:
+                    reader = csv.DictReader(file)
+                    fieldNames = reader.fieldnames
+                    for row in reader:
+                        if row['Job ID'] == job_id:
+                            row['Date Applied'] = dateApplied
+                            foundInFile = True
+                        data.append(row)
+                if foundInFile:
+                    with open(csvFile, 'w', encoding='utf-8', newline='') as file:
+                        writer = csv.DictWriter(file, fieldnames=fieldNames)
+                        writer.writeheader()
+                        writer.writerows(data)
+                    # The rewritten rows are already in the store, don't read them again
+                    history.mark_imported(csvFile, 'applied')
                     found = True
-                data.append(row)
-        
+                    break
+
         if not found:
             return jsonify({"error": f"Job ID {job_id} not found"}), 404
-
-        with open(csvPath, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldNames)
-            writer.writeheader()
-            writer.writerows(data)
         
         return jsonify({"message": "Date Applied updated successfully"}), 200
     except Exception as e:
@@ -0,0 +1,84 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for reusing AI answers across reworded questions
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.utils.answer_memory import AnswerMemory
+
+
+class TestAnswerMemory(unittest.TestCase):
+    """Test similarity lookups, option mapping and reuse statistics"""
+
+    def setUp(self):
+        self.memory = AnswerMemory(threshold=0.85)
+        self.memory.add('How many years of Python experience do you have?', '5')
+        self.memory.add('How many years of experience do you have with Java?', '2')
+        self.memory.add('Are you comfortable working in a hybrid setting?', 'Yes', kind='choice', options=['Yes', 'No'])
+
+    def test_reworded_questions_reuse_answers(self):
+        self.assertEqual(self.memory.lookup('Years of experience with Python?'), '5')
+        self.assertEqual(self.memory.lookup('Java - years of experience'), '2')
+
+    def test_different_subjects_are_not_reused(self):
+        self.assertIsNone(self.memory.lookup('Years of experience with JavaScript?'))
+        self.assertIsNone(self.memory.lookup('Are you comfortable working in an onsite setting?', ['Yes', 'No'], 'choice'))
+
+    def test_looser_threshold_for_outages_keeps_the_subject(self):
+        onsite = 'Are you comfortable working in an onsite setting?'
+        self.assertIsNone(self.memory.lookup(onsite, ['Yes', 'No'], 'choice', threshold=0.6, same_subject=True))
+        self.assertIsNone(self.memory.lookup('Years of experience with JavaScript?', threshold=0.6, same_subject=True))
+
+        hybrid = 'Comfortable in hybrid?'
+        self.assertIsNone(self.memory.lookup(hybrid, ['Yes', 'No'], 'choice'))
+        self.assertEqual(self.memory.lookup(hybrid, ['Yes', 'No'], 'choice', threshold=0.6, same_subject=True), 'Yes')
+
+    def test_choice_answers_map_onto_new_options(self):
+        answer = self.memory.lookup('Are you comfortable with a hybrid work setting?',
+                                    ['Yes, I am', 'No, I am not'], 'choice')
+        self.assertEqual(answer, 'Yes, I am')
+        self.assertIsNone(self.memory.lookup('Are you comfortable with a hybrid work setting?',
+                                             ['Maybe', 'Later'], 'choice'))
+
+    def test_kinds_and_profiles_are_kept_apart(self):
+        self.assertIsNone(self.memory.lookup('Years of experience with Python?', ['Yes', 'No'], 'choice'))
+        self.memory.use_profile('another applicant')
+        self.assertIsNone(self.memory.lookup('How many years of Python experience do you have?'))
+
+    def test_stats_count_llm_calls_avoided(self):
+        self.memory.lookup('How many years of Python experience do you have?')
+        self.memory.lookup('Python experience in years')
+        self.memory.lookup('What is your GPA?')
+
+        stats = self.memory.get_stats()
+        self.assertEqual(stats['lookups'], 3)
+        self.assertEqual(stats['exact_hits'], 1)
+        self.assertEqual(stats['similar_hits'], 1)
+        self.assertEqual(stats['llm_calls_avoided'], 2)
+        self.assertFalse(self.memory.is_reusable('textarea'))
+        self.assertFalse(self.memory.is_reusable('text', 'cover_letter'))
+
+    def test_motivation_and_company_questions_are_not_reused(self):
+        self.memory.add('Why do you want to work here?', 'Acme builds the tools I use every day')
+        self.memory.add('What interests you about this role?', 'The payments platform at Acme')
+        self.assertIsNone(self.memory.lookup('Why do you want to work here?'))
+        self.assertIsNone(self.memory.lookup('What interests you about this role?'))
+        self.assertEqual(self.memory.get_stats()['entries'], 3)
+        self.assertFalse(self.memory.is_reusable('text', 'yes_no', 'Why do you want to join our team?'))
+        self.assertTrue(self.memory.is_reusable('text', 'experience', 'Years of experience with Python?'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the deterministic profile answer rules
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.answer_rules import (
+    ProfileAnswerEngine, match_option, matches_experience_range, profile_from_user_data
+)
+
+
+class TestAnswerRules(unittest.TestCase):
+    """Test profile answers, option mapping and statistics"""
+
+    def setUp(self):
+        self.engine = ProfileAnswerEngine(profile_from_user_data({
+            'first_name': 'Asha',
+            'last_name': 'Rao',
+            'email': 'asha@example.com',
+            'phone': '+91 98765 43210',
+            'location': 'Pune, India',
+            'experience_years': 4,
+            'skills': ['Python', 'SQL'],
+            'expected_salary': 1200000,
+            'notice_period': '30 days'
+        }))
+
+    def test_text_questions_use_profile_values(self):
+        self.assertEqual(self.engine.answer('Mobile phone number'), '+91 98765 43210')
+        self.assertEqual(self.engine.answer('How many years of experience do you have?'), '4')
+        self.assertEqual(self.engine.answer('Notice period (in weeks)'), '4')
+        self.assertEqual(self.engine.answer('Expected salary in lakhs'), '12.0')
+        self.assertEqual(self.engine.answer('First name'), 'Asha')
+
+    def test_choice_questions_map_to_options(self):
+        self.assertEqual(self.engine.answer('Years of experience', ['0-2 years', '3-5 years', '6+ years'], 'choice'), '3-5 years')
+        self.assertEqual(self.engine.answer('Do you have 5+ years of experience?', ['Yes', 'No'], 'choice'), 'No')
+        self.assertEqual(self.engine.answer('Do you have experience with SQL?', ['Yes', 'No'], 'choice'), 'Yes')
+        self.assertEqual(self.engine.answer('Will you now or in the future require visa sponsorship?', ['Yes', 'No'], 'choice'), 'No')
+        self.assertEqual(self.engine.answer('Can you reliably commute to Pune?', ['Yes', 'No'], 'choice'), 'Yes')
+        self.assertEqual(self.engine.answer('Are you comfortable working from this location?', ['Yes', 'No'], 'choice'), 'Yes')
+        self.assertEqual(self.engine.answer('Preferred location', ['Mumbai', 'Pune, India'], 'choice'), 'Pune, India')
+
+    def test_unknown_questions_escalate_and_are_counted(self):
+        self.assertIsNone(self.engine.answer('Why do you want to work here?', kind='textarea'))
+        self.engine.note_llm_call()
+        self.engine.answer('Phone')
+
+        stats = self.engine.get_stats()
+        self.assertEqual(stats['questions'], 2)
+        self.assertEqual(stats['answered_locally'], 1)
+        self.assertEqual(stats['sent_to_llm'], 1)
+        self.assertEqual(stats['local_answer_rate'], 0.5)
+
+    def test_match_option_phrases(self):
+        options = ['I am a protected veteran', 'I am not a protected veteran', "I don't wish to answer"]
+        self.assertEqual(match_option('No', options), 'I am not a protected veteran')
+        self.assertEqual(match_option('Yes', options), 'I am a protected veteran')
+        self.assertEqual(match_option('Decline', options), "I don't wish to answer")
+        self.assertIsNone(match_option('No', ['Yes', 'Not sure']))
+
+    def test_experience_ranges(self):
+        self.assertTrue(matches_experience_range('5+ years', 6))
+        self.assertTrue(matches_experience_range('2 to 4 years', 3))
+        self.assertTrue(matches_experience_range('less than 1 year', 0))
+        self.assertFalse(matches_experience_range('more than 10 years', 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the streamed CSV and background Excel exports of job applications
+"""
+
+import csv
+import io
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import datetime
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from flask import Flask
+from openpyxl import load_workbook
+
+from app import db
+from app.models.user import User
+from app.models.job_application import JobApplication
+from app.utils.application_export import (EXPORT_COLUMNS, ExportManager, iter_application_rows, stream_csv,
+                                          write_xlsx)
+
+
+class TestApplicationExport(unittest.TestCase):
+    """Test chunked row reads, CSV streaming, write-only Excel files and background exports"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(self.folder, 'test.db')
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for user_id in (1, 2):
+                db.session.add(User(id=user_id, username=f'user{user_id}', email=f'user{user_id}@example.com'))
+            for index in range(25):
+                db.session.add(JobApplication(user_id=1, job_title=f'Engineer {index}', company_name='Acme',
+                                              platform='linkedin' if index % 2 else 'indeed',
+                                              application_date=datetime(2024, 5, 1, 9, 0),
+                                              notes='=HYPERLINK("x")' if index == 0 else None))
+            db.session.add(JobApplication(user_id=2, job_title='Not mine', platform='linkedin'))
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_rows_are_read_in_chunks(self):
+        with self.app.app_context():
+            rows = list(iter_application_rows(1, chunk_size=4))
+            self.assertEqual(len(rows), 25)
+            self.assertEqual([row[0] for row in rows], sorted(row[0] for row in rows))
+            self.assertEqual(len(list(iter_application_rows(1, platform='indeed', chunk_size=4))), 13)
+
+    def test_csv_is_streamed_in_chunks(self):
+        with self.app.app_context():
+            chunks = list(stream_csv(iter_application_rows(1), rows_per_chunk=10))
+        self.assertEqual(len(chunks), 3)
+        rows = list(csv.reader(io.StringIO(''.join(chunks).lstrip('\ufeff'))))
+        self.assertEqual(rows[0], [header for header, _ in EXPORT_COLUMNS])
+        self.assertEqual(len(rows), 26)
+        self.assertEqual(rows[1][EXPORT_COLUMNS.index(('Notes', 'notes'))], '\'=HYPERLINK("x")')
+        self.assertEqual(rows[1][EXPORT_COLUMNS.index(('Applied On', 'application_date'))], '2024-05-01 09:00:00')
+
+    def test_xlsx_is_written_in_write_only_mode(self):
+        path = os.path.join(self.folder, 'applications.xlsx')
+        with self.app.app_context():
+            self.assertEqual(write_xlsx(path, iter_application_rows(1)), 25)
+        sheet = load_workbook(path, read_only=True)['Applications']
+        rows = list(sheet.iter_rows(values_only=True))
+        self.assertEqual(rows[0][1], 'Job Title')
+        self.assertEqual(rows[1][5], datetime(2024, 5, 1, 9, 0))
+        self.assertEqual(len(rows), 26)
+
+    def test_background_export_is_downloadable_by_its_owner(self):
+        manager = ExportManager(os.path.join(self.folder, 'exports'), retention=0)
+        export_id = manager.start(self.app, 1, 'xlsx', platform='linkedin')
+        deadline = time.monotonic() + 10
+        while manager.get(export_id, 1)['status'] == 'running' and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        status = manager.get(export_id, 1)
+        self.assertEqual((status['status'], status['rows']), ('done', 12))
+        path, file_name = manager.get_file(export_id, 1)
+        self.assertTrue(os.path.exists(path) and file_name.endswith('.xlsx'))
+        self.assertIsNone(manager.get(export_id, 2))
+        self.assertIsNone(manager.get_file(export_id, 2))
+
+        self.assertEqual(manager.cleanup(), [export_id])
+        self.assertFalse(os.path.exists(path))
+        with self.assertRaises(ValueError):
+            manager.start(self.app, 1, 'pdf')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for job card handles
+"""
+
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from selenium.common.exceptions import StaleElementReferenceException
+from app.automation.element_handles import JobCardHandle, unwrap_job_card
+
+
+def stale_element():
+    element = Mock()
+    element.is_displayed.side_effect = StaleElementReferenceException('stale')
+    return element
+
+
+class TestJobCardHandle(unittest.TestCase):
+    """Test stale job card recovery by job id"""
+
+    def setUp(self):
+        self.bot = Mock()
+        self.bot.job_card_locator = "//li[@data-occludable-job-id='{job_id}']"
+        self.bot.stale_recoveries = {'recovered': 0, 'lost': 0}
+
+    def test_live_element_is_returned_without_a_query(self):
+        element = Mock()
+        handle = JobCardHandle(self.bot, element, '42')
+        self.assertIs(handle.get(), element)
+        self.bot.driver.find_elements.assert_not_called()
+
+    def test_stale_element_is_resolved_by_job_id(self):
+        fresh = Mock()
+        self.bot.driver.find_elements.return_value = [fresh]
+        handle = JobCardHandle(self.bot, stale_element(), '42')
+
+        self.assertIs(handle.get(), fresh)
+        self.bot.driver.find_elements.assert_called_once_with(
+            'xpath', "//li[@data-occludable-job-id='42']")
+        self.assertEqual(self.bot.stale_recoveries['recovered'], 1)
+
+    def test_missing_card_is_not_replaced_by_another(self):
+        self.bot.driver.find_elements.return_value = []
+        handle = JobCardHandle(self.bot, stale_element(), '42')
+        self.assertIsNone(handle.get())
+        self.assertEqual(self.bot.stale_recoveries['lost'], 1)
+
+    def test_unwrap_plain_element(self):
+        element = Mock()
+        self.assertEqual(unwrap_job_card(element), (element, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
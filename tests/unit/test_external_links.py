@@ -0,0 +1,109 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for resolving external application links in the background
+"""
+
+import os
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.external_links import LinkResolver, is_linkedin, redirect_target
+
+
+class RedirectHandler(BaseHTTPRequestHandler):
+    """Redirects /track to /apply, which answers after `delay` seconds"""
+
+    delay = 0.0
+
+    def do_GET(self):
+        if self.path == '/track':
+            self.send_response(302)
+            self.send_header('Location', '/apply')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        time.sleep(self.delay)
+        body = b'<html>Apply here</html>'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLinkResolver(unittest.TestCase):
+    """Test LinkedIn redirects, HTTP redirects and background saving"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), RedirectHandler)
+        cls.base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def tearDown(self):
+        RedirectHandler.delay = 0.0
+
+    def test_linkedin_redirects_are_read_without_requests(self):
+        link = 'https://www.linkedin.com/jobs/view/externalApply/123?url=https%3A%2F%2Fjobs.example.com%2Fapply%3Fid%3D7&urlHash=x'
+        self.assertEqual(redirect_target(link), 'https://jobs.example.com/apply?id=7')
+        self.assertIsNone(redirect_target('https://jobs.example.com/apply?url=https://elsewhere.com'))
+        self.assertTrue(is_linkedin('https://in.linkedin.com/jobs'))
+        self.assertFalse(is_linkedin('https://notlinkedin.com/jobs'))
+
+        resolver = LinkResolver(workers=0)
+        self.assertEqual(resolver.resolve(link), 'https://jobs.example.com/apply?id=7')
+        resolver.close()
+
+    def test_http_redirects_are_followed(self):
+        resolver = LinkResolver(workers=0, timeout=5)
+        self.assertEqual(resolver.resolve(self.base + '/track'), self.base + '/apply')
+        self.assertEqual(resolver.resolve('http://127.0.0.1:1/closed'), 'http://127.0.0.1:1/closed')
+        resolver.close()
+
+    def test_links_are_saved_in_the_background(self):
+        RedirectHandler.delay = 0.3
+        saved = []
+        resolver = LinkResolver(workers=4, timeout=5)
+
+        started = time.perf_counter()
+        futures = [resolver.submit(self.base + '/track', saved.append) for _ in range(4)]
+        self.assertLess(time.perf_counter() - started, 0.2)
+        self.assertEqual([future.result(5) for future in futures], [self.base + '/apply'] * 4)
+        resolver.close()
+        self.assertEqual(saved, [self.base + '/apply'] * 4)
+        self.assertEqual(resolver.stats['resolved'], 4)
+
+    def test_failed_saves_are_reported(self):
+        errors = []
+
+        def save(link):
+            raise OSError('history file is locked')
+
+        resolver = LinkResolver(workers=1, on_error=lambda link, e: errors.append((link, str(e))))
+        resolver.submit(self.base + '/apply', save)
+        resolver.close()
+        self.assertEqual(errors, [(self.base + '/apply', 'history file is locked')])
+        self.assertEqual(resolver.stats['failed'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
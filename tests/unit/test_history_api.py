@@ -0,0 +1,110 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the paged and cached applied jobs history API of run.py
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import run
+from modules.history_store import APPLIED_COLUMNS
+
+
+class TestHistoryAPI(unittest.TestCase):
+    """Test keyset and offset pages, conditional requests and single job updates"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.folder, 'applied.csv')
+        with open(self.csv_path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=list(APPLIED_COLUMNS))
+            writer.writeheader()
+            for index in range(5):
+                writer.writerow({'Job ID': str(100 + index), 'Title': f'Engineer {index}', 'About Job': 'long text',
+                                 'External Job link': 'https://jobs.example.com', 'Date Applied': 'Pending'})
+        self.previous = (run.HISTORY_DB, run.file_name)
+        run.HISTORY_DB, run.file_name = os.path.join(self.folder, 'history.db'), self.csv_path
+        self.client = run.app.test_client()
+
+    def tearDown(self):
+        run.HISTORY_DB, run.file_name = self.previous
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_keyset_pages(self):
+        first = self.client.get('/applied-jobs?limit=2')
+        self.assertEqual([job['Job_ID'] for job in first.get_json()], ['100', '101'])
+        self.assertEqual(first.headers['X-Total-Count'], '5')
+        self.assertNotIn('About_Job', first.get_json()[0])
+
+        ids = [job['Job_ID'] for job in first.get_json()]
+        cursor = first.headers['X-Next-Cursor']
+        while cursor:
+            page = self.client.get(f'/applied-jobs?limit=2&after={cursor}')
+            ids += [job['Job_ID'] for job in page.get_json()]
+            cursor = page.headers.get('X-Next-Cursor')
+        self.assertEqual(ids, ['100', '101', '102', '103', '104'])
+        self.assertIn('rel="next"', first.headers['Link'])
+
+    def test_offset_pages(self):
+        page = self.client.get('/applied-jobs?limit=2&offset=4')
+        self.assertEqual([job['Job_ID'] for job in page.get_json()], ['104'])
+        self.assertNotIn('X-Next-Cursor', page.headers)
+
+    def test_unchanged_pages_are_not_sent_again(self):
+        first = self.client.get('/applied-jobs')
+        again = self.client.get('/applied-jobs', headers={'If-None-Match': first.headers['ETag']})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.data, b'')
+
+        self.client.put('/applied-jobs/103')
+        changed = self.client.get('/applied-jobs', headers={'If-None-Match': first.headers['ETag']})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers['ETag'], first.headers['ETag'])
+
+    def test_rows_appended_by_the_bot_are_listed(self):
+        self.assertEqual(self.client.get('/applied-jobs').headers['X-Total-Count'], '5')
+        with open(self.csv_path, 'a', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=list(APPLIED_COLUMNS))
+            writer.writerow({'Job ID': '105', 'Title': 'Engineer 5', 'About Job': 'first line\nsecond line'})
+            file.write('106,Half written')
+        jobs = self.client.get('/applied-jobs').get_json()
+        self.assertEqual([job['Job_ID'] for job in jobs][-1], '105')
+
+        with open(self.csv_path, 'a', newline='', encoding='utf-8') as file:
+            file.write(',Acme\r\n')
+        self.assertEqual(self.client.get('/applied-jobs').headers['X-Total-Count'], '7')
+
+    def test_update_changes_the_store_and_the_csv(self):
+        response = self.client.put('/applied-jobs/102')
+        self.assertEqual(response.status_code, 200)
+        jobs = {job['Job_ID']: job for job in self.client.get('/applied-jobs').get_json()}
+        self.assertNotEqual(jobs['102']['Date_Applied'], 'Pending')
+        self.assertEqual(jobs['101']['Date_Applied'], 'Pending')
+        with open(self.csv_path, newline='', encoding='utf-8') as file:
+            rows = {row['Job ID']: row for row in csv.DictReader(file)}
+        self.assertEqual(rows['102']['Date Applied'], jobs['102']['Date_Applied'])
+        self.assertEqual(len(rows), 5)
+
+        # Rows appended after the rewrite are still imported
+        with open(self.csv_path, 'a', newline='', encoding='utf-8') as file:
+            csv.DictWriter(file, fieldnames=list(APPLIED_COLUMNS)).writerow({'Job ID': '105'})
+        self.assertEqual(self.client.get('/applied-jobs').headers['X-Total-Count'], '6')
+
+        self.assertEqual(self.client.put('/applied-jobs/999').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
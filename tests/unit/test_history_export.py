@@ -0,0 +1,128 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the incremental, partitioned Parquet export of the application history
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.history_export import export_csv_history, export_model, load_history, month_of, partition_rows, pa
+from modules.history_store import HistoryStore
+
+
+class TestPartitioning(unittest.TestCase):
+    """Test the month and platform partition keys"""
+
+    def test_months(self):
+        self.assertEqual(month_of(datetime(2024, 5, 3)), '2024-05')
+        self.assertEqual(month_of('2024-11-30 10:00:00.123'), '2024-11')
+        self.assertEqual(month_of('Pending'), 'unknown')
+
+    def test_rows_are_grouped_by_month_and_platform(self):
+        rows = [{'id': 1, 'date': '2024-05-01', 'platform': 'LinkedIn'},
+                {'id': 2, 'date': '2024-06-01', 'platform': 'indeed'},
+                {'id': 3, 'date': '2024-05-09', 'platform': 'linkedin'}]
+        partitions = partition_rows(rows, 'date', platform_column='platform')
+        self.assertEqual(sorted(partitions), [('2024-05', 'linkedin'), ('2024-06', 'indeed')])
+        self.assertEqual([row['id'] for row in partitions[('2024-05', 'linkedin')]], [1, 3])
+        self.assertNotIn('platform', partitions[('2024-06', 'indeed')][0])
+
+
+@unittest.skipIf(pa is None, 'pyarrow is not installed')
+class TestParquetExport(unittest.TestCase):
+    """Test incremental exports from the history store and the database, and pruned loads"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.export_folder = os.path.join(self.folder, 'parquet')
+        self.store = HistoryStore(os.path.join(self.folder, 'history.db'))
+        for index, day in enumerate(['2024-05-01 09:00:00', '2024-05-20 09:00:00', '2024-06-02 09:00:00']):
+            self.store.add_applied({'job_id': str(100 + index), 'title': f'Engineer {index}', 'date_applied': day,
+                                    'about_job': 'x' * 1000})
+        self.store.add_failed({'job_id': '900', 'date_tried': '2024-06-03 10:00:00', 'assumed_reason': 'Timeout'})
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_only_new_rows_are_exported(self):
+        self.assertEqual(export_csv_history(self.export_folder, self.store), {'applied': 3, 'failed': 1})
+        self.assertEqual(export_csv_history(self.export_folder, self.store), {'applied': 0, 'failed': 0})
+
+        self.store.add_applied({'job_id': '103', 'title': 'Engineer 3', 'date_applied': '2024-06-10 09:00:00'})
+        self.assertEqual(export_csv_history(self.export_folder, self.store)['applied'], 1)
+        frame = load_history(self.export_folder, 'applied')
+        self.assertEqual(sorted(frame['job_id']), ['100', '101', '102', '103'])
+
+    def test_updated_and_reapplied_jobs_are_exported_once_per_version(self):
+        export_csv_history(self.export_folder, self.store)
+        self.store.update_applied('100', {'date_applied': '2024-06-15 09:00:00'})
+        self.store.add_applied({'job_id': '101', 'title': 'Engineer 1 again', 'date_applied': '2024-05-21 09:00:00'})
+        self.assertEqual(export_csv_history(self.export_folder, self.store), {'applied': 2, 'failed': 0})
+
+        frame = load_history(self.export_folder, 'applied', columns=['job_id', 'title', 'date_applied'])
+        self.assertEqual(list(frame.columns), ['job_id', 'title', 'date_applied'])
+        versions = dict(zip(frame['job_id'], zip(frame['title'], frame['date_applied'])))
+        self.assertEqual(len(frame), 3)
+        self.assertEqual(versions['100'][1], '2024-06-15 09:00:00')
+        self.assertEqual(versions['101'][0], 'Engineer 1 again')
+        # The old version of job 100 is left in May, the filter must not bring it back
+        self.assertNotIn('100', list(load_history(self.export_folder, 'applied', months=['2024-05'])['job_id']))
+
+    def test_partitions_and_column_pruning(self):
+        export_csv_history(self.export_folder, self.store, batch_size=2)
+        self.assertTrue(os.path.isdir(os.path.join(self.export_folder, 'applied', 'month=2024-05', 'platform=linkedin')))
+
+        frame = load_history(self.export_folder, 'applied', columns=['job_id', 'title'], months=['2024-05'])
+        self.assertEqual(list(frame.columns), ['job_id', 'title'])
+        self.assertEqual(sorted(frame['job_id']), ['100', '101'])
+        self.assertEqual(list(load_history(self.export_folder, 'failed', columns=['assumed_reason', 'month'])['month']),
+                         ['2024-06'])
+        self.assertTrue(load_history(self.export_folder, 'never exported').empty)
+
+    def test_database_rows_are_exported_by_platform(self):
+        try:
+            from flask import Flask
+            from flask_sqlalchemy import SQLAlchemy
+        except ImportError:
+            self.skipTest('Flask-SQLAlchemy is not installed')
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        db = SQLAlchemy(app)
+
+        class Application(db.Model):
+            id = db.Column(db.Integer, primary_key=True)
+            job_title = db.Column(db.String(200))
+            platform = db.Column(db.String(50))
+            application_date = db.Column(db.DateTime)
+            auto_applied = db.Column(db.Boolean)
+
+        with app.app_context():
+            db.create_all()
+            db.session.add_all([
+                Application(job_title='Backend', platform='linkedin', application_date=datetime(2024, 5, 1), auto_applied=True),
+                Application(job_title='Frontend', platform='indeed', application_date=datetime(2024, 5, 2), auto_applied=False),
+            ])
+            db.session.commit()
+            self.assertEqual(export_model(self.export_folder, 'applications', Application, 'application_date', 'platform'), 2)
+            self.assertEqual(export_model(self.export_folder, 'applications', Application, 'application_date', 'platform'), 0)
+
+        frame = load_history(self.export_folder, 'applications', platforms=['Indeed'])
+        self.assertEqual(list(frame['job_title']), ['Frontend'])
+        self.assertEqual(bool(frame['auto_applied'][0]), False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the indexed applied and failed jobs history store
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.history_store import APPLIED_COLUMNS, FAILED_COLUMNS, AppliedJobIds, HistoryStore, get_history_store
+from modules.history_writer import HistoryWriter
+
+
+class TestHistoryStore(unittest.TestCase):
+    """Test the incremental CSV import, point lookups and listings without large columns"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.applied_csv = os.path.join(self.folder, 'applied.csv')
+        self.failed_csv = os.path.join(self.folder, 'failed.csv')
+        with open(self.applied_csv, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=list(APPLIED_COLUMNS))
+            writer.writeheader()
+            writer.writerow({'Job ID': '101', 'Title': 'Backend Engineer', 'Company': 'Acme', 'About Job': 'x' * 200000})
+            writer.writerow({'Job ID': '102', 'Title': 'Data Engineer', 'Company': 'Globex'})
+        with open(self.failed_csv, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=list(FAILED_COLUMNS))
+            writer.writeheader()
+            writer.writerow({'Job ID': '201', 'Assumed Reason': 'Required field missing'})
+        self.store = HistoryStore(os.path.join(self.folder, 'history.db'))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_csv_is_imported_once(self):
+        self.assertEqual(self.store.import_csv(self.applied_csv, 'applied'), 2)
+        self.assertEqual(self.store.import_csv(self.applied_csv, 'applied'), 0)
+        self.assertEqual(self.store.import_csv(self.failed_csv, 'failed'), 1)
+        self.assertEqual((self.store.count('applied'), self.store.count('failed')), (2, 1))
+        self.assertEqual(len(self.store.get_applied('101')['about_job']), 200000)
+
+    def test_appended_and_rotated_rows_are_imported_once(self):
+        self.store.import_csv(self.applied_csv, 'applied')
+        self.store.import_csv(self.failed_csv, 'failed')
+        with open(self.applied_csv, 'a', newline='', encoding='utf-8') as file:
+            csv.DictWriter(file, fieldnames=list(APPLIED_COLUMNS)).writerow({'Job ID': '101', 'Title': 'Applied again'})
+        with open(self.failed_csv, 'a', newline='', encoding='utf-8') as file:
+            csv.DictWriter(file, fieldnames=list(FAILED_COLUMNS)).writerow({'Job ID': '202'})
+        self.assertEqual(self.store.import_csv(self.applied_csv, 'applied'), 1)
+        self.assertEqual(self.store.import_csv(self.failed_csv, 'failed'), 1)
+        self.assertEqual(self.store.get_applied('101')['title'], 'Applied again')
+
+        rotated = os.path.join(self.folder, 'failed.1.csv')
+        os.replace(self.failed_csv, rotated)
+        self.assertEqual(self.store.import_csv(rotated, 'failed'), 0)
+        with open(self.failed_csv, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=list(FAILED_COLUMNS))
+            writer.writeheader()
+            writer.writerow({'Job ID': '203'})
+        self.assertEqual(self.store.import_csv(self.failed_csv, 'failed'), 1)
+        self.assertEqual(self.store.count('failed'), 3)
+
+    def test_rows_written_to_the_store_and_the_csv_are_stored_once(self):
+        # Like submitted_jobs and failed_job: the store gets the job directly and the CSV a truncated copy
+        path = os.path.join(self.folder, 'history.db')
+        self.store.import_csv(self.applied_csv, 'applied')
+        writers = [HistoryWriter(csv_path, list(columns), flush_interval=0,
+                                 transform=lambda value: str(value or '')[:10],
+                                 on_written=lambda csv_path, start, end, kind=kind:
+                                 self.store.skip_written(csv_path, kind, start, end))
+                   for csv_path, columns, kind in ((self.applied_csv, APPLIED_COLUMNS, 'applied'),
+                                                   (self.failed_csv, FAILED_COLUMNS, 'failed'))]
+        self.store.add_applied({'job_id': '103', 'title': 'Platform Engineer, Payments'})
+        writers[0].write({'Job ID': '103', 'Title': 'Platform Engineer, Payments'})
+        self.store.add_failed({'job_id': '203', 'assumed_reason': 'Required field missing'})
+        writers[1].write({'Job ID': '203', 'Assumed Reason': 'Required field missing'})
+        for writer in writers:
+            writer.close()
+        changed = self.store.get_applied('103')['changed']
+
+        # Restart: the rows before the written ones (the failed CSV was never imported) are imported once
+        restarted = get_history_store(path, self.applied_csv, self.failed_csv)
+        self.assertEqual((restarted.count('applied'), restarted.count('failed')), (3, 2))
+        self.assertEqual(restarted.get_applied('103')['title'], 'Platform Engineer, Payments')
+        self.assertEqual(restarted.get_applied('103')['changed'], changed)
+        self.assertEqual(restarted.import_csv(self.applied_csv, 'applied'), 0)
+
+    def test_point_lookups(self):
+        self.store.import_csv(self.applied_csv, 'applied')
+        self.assertTrue(self.store.has_applied('102'))
+        self.assertFalse(self.store.has_applied('999'))
+
+        self.store.add_applied({'job_id': '999', 'title': 'ML Engineer', 'reposted': False})
+        self.assertTrue(self.store.has_applied('999'))
+        self.assertEqual(self.store.get_applied('999')['reposted'], 'False')
+
+    def test_listing_skips_large_columns(self):
+        self.store.import_csv(self.applied_csv, 'applied')
+        rows = list(self.store.iter_history('applied', batch_size=1))
+        self.assertEqual([row['job_id'] for row in rows], ['101', '102'])
+        self.assertNotIn('about_job', rows[0])
+        self.assertIn('about_job', next(self.store.iter_history('applied', include_large=True)))
+
+    def test_pages_and_single_row_updates(self):
+        self.store.import_csv(self.applied_csv, 'applied')
+        self.store.add_applied({'job_id': '103', 'title': 'ML Engineer'})
+        first, cursor = self.store.page('applied', limit=2)
+        self.assertEqual([row['job_id'] for row in first], ['101', '102'])
+        self.assertNotIn('about_job', first[0])
+        rest, last_cursor = self.store.page('applied', limit=2, after=cursor)
+        self.assertEqual(([row['job_id'] for row in rest], last_cursor), (['103'], None))
+        self.assertEqual(self.store.page('applied', limit=5, offset=2, columns=['job_id'])[0], [{'job_id': '103'}])
+
+        modified = self.store.modified()
+        self.assertTrue(self.store.update_applied('102', {'date_applied': '2024-05-01 10:00:00'}))
+        self.assertFalse(self.store.update_applied('999', {'date_applied': 'x'}))
+        self.assertEqual(self.store.get_applied('102')['date_applied'], '2024-05-01 10:00:00')
+        self.assertGreaterEqual(self.store.modified(), modified)
+
+    def test_applied_job_ids_view(self):
+        self.store.import_csv(self.applied_csv, 'applied')
+        applied = AppliedJobIds(self.store)
+        self.assertIn('101', applied)
+        self.assertNotIn('555', applied)
+        applied.add('555')
+        self.assertIn('555', applied)
+        self.assertNotIn('101', AppliedJobIds(None))
+
+    def test_applied_job_ids_fall_back_to_the_csv_files(self):
+        self.assertIn('101', AppliedJobIds(None, [self.applied_csv, os.path.join(self.folder, 'missing.csv')]))
+
+        broken = HistoryStore(os.path.join(self.folder, 'broken.db'))
+        os.remove(broken.path)
+        os.mkdir(broken.path)  # sqlite can't open a folder
+        applied = AppliedJobIds(broken, [self.applied_csv])
+        self.assertIn('102', applied)
+        self.assertNotIn('555', applied)
+
+    def test_shared_store_imports_on_first_use(self):
+        store = get_history_store(os.path.join(self.folder, 'shared.db'), self.applied_csv, self.failed_csv)
+        self.assertEqual(store.count('failed'), 1)
+        self.assertIsNone(get_history_store(''))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the buffered, locked and size rotated history CSV writer
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.history_writer import HistoryWriter, file_lock, history_files
+
+FIELDS = ['Job ID', 'Title', 'Date Applied']
+
+
+def read_rows(paths):
+    rows = []
+    for path in paths:
+        with open(path, newline='', encoding='utf-8') as file:
+            rows.extend(csv.DictReader(file))
+    return rows
+
+
+class TestHistoryWriter(unittest.TestCase):
+    """Test batching, interval flushes, locking and rotation readable by the dashboard"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'applied.csv')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_rows_are_batched_until_flush(self):
+        writer = HistoryWriter(self.path, FIELDS, flush_interval=60, max_rows=3, transform=lambda value: str(value)[:5])
+        writer.write({'Job ID': '1', 'Title': 'Backend Engineer'})
+        writer.write({'Job ID': '2'})
+        self.assertFalse(os.path.exists(self.path))
+
+        writer.write({'Job ID': '3'})  # max_rows reached
+        rows = read_rows([self.path])
+        self.assertEqual([row['Job ID'] for row in rows], ['1', '2', '3'])
+        self.assertEqual(rows[0]['Title'], 'Backe')
+        self.assertEqual(writer.stats['flushes'], 1)
+
+        writer.write({'Job ID': '4'})
+        self.assertTrue(writer.close())
+        self.assertEqual(len(read_rows([self.path])), 4)  # One header only
+
+    def test_rows_are_flushed_on_the_interval(self):
+        writer = HistoryWriter(self.path, FIELDS, flush_interval=0.05)
+        writer.write({'Job ID': '1'})
+        deadline = time.monotonic() + 2
+        while writer.stats['rows'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(read_rows([self.path])), 1)
+        writer.close()
+
+    def test_rotated_files_are_listed_oldest_first(self):
+        writer = HistoryWriter(self.path, FIELDS, flush_interval=0, max_bytes=60)
+        for job_id in range(6):
+            writer.write({'Job ID': str(job_id), 'Title': 'Data Engineer'})
+        writer.close()
+
+        files = history_files(self.path)
+        self.assertGreater(writer.stats['rotations'], 1)
+        self.assertEqual(os.path.basename(files[0]), 'applied.1.csv')
+        # Every rotated file has its own header, so readers see all rows in order
+        self.assertEqual([row['Job ID'] for row in read_rows(files)], [str(job_id) for job_id in range(6)])
+
+    def test_failed_batches_are_retried(self):
+        errors = []
+        writer = HistoryWriter(self.path, FIELDS, flush_interval=60, on_error=errors.append)
+        writer.path = os.path.join(self.folder, 'missing', 'applied.csv')
+        writer.write({'Job ID': '1'})
+        self.assertFalse(writer.flush())
+        self.assertEqual(len(errors), 1)
+
+        os.makedirs(os.path.dirname(writer.path))
+        self.assertTrue(writer.close())
+        self.assertEqual(len(read_rows([writer.path])), 1)
+
+    def test_flush_waits_for_the_file_lock(self):
+        writer = HistoryWriter(self.path, FIELDS, flush_interval=60)
+        writer.write({'Job ID': '1'})
+        with file_lock(self.path):  # Another run is writing
+            flushing = threading.Thread(target=writer.flush)
+            flushing.start()
+            flushing.join(0.2)
+            self.assertTrue(flushing.is_alive())
+            self.assertFalse(os.path.exists(self.path))
+        flushing.join(5)
+        self.assertEqual(len(read_rows([self.path])), 1)
+        writer.close()
+
+    def test_writers_sharing_a_file_do_not_interleave(self):
+        writers = [HistoryWriter(self.path, FIELDS, flush_interval=60, max_rows=10) for _ in range(3)]
+
+        def write_all(writer, prefix):
+            for index in range(50):
+                writer.write({'Job ID': f'{prefix}-{index}', 'Title': 'x' * 200})
+            writer.close()
+
+        threads = [threading.Thread(target=write_all, args=(writer, prefix)) for prefix, writer in enumerate(writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        rows = read_rows([self.path])
+        self.assertEqual(len(rows), 150)
+        self.assertTrue(all(row['Title'] == 'x' * 200 for row in rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
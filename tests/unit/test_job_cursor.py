@@ -0,0 +1,107 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the incremental job-list cursor
+"""
+
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.automation.job_cursor import JobListCursor, card_key
+
+
+class FakeCard:
+    """A card; `key` is what the id script reads from a card without a job id"""
+
+    rendered = 0
+
+    def __init__(self, job_id, title='', company='', link=''):
+        FakeCard.rendered += 1
+        self.job_id = job_id
+        self.key = card_key(title, company, link)
+        self.id = f"element-{FakeCard.rendered}"  # A new element every time a card is rendered
+
+
+class FakeBot:
+    """Bot whose result pages grow once and then paginate"""
+
+    def __init__(self, pages, growth=None):
+        self.pages = pages
+        self.growth = list(growth or [])
+        self.current_search_page = 0
+        self.cards = list(pages[0])
+        self.driver = Mock()
+        self.driver.execute_script.side_effect = lambda script, cards: [card.job_id or card.key for card in cards]
+        self.driver.execute_async_script.side_effect = self._grow
+
+    def _grow(self, *args):
+        if self.growth:
+            self.cards.extend(self.growth.pop(0))
+            return True
+        return False
+
+    def _get_job_cards(self):
+        return list(self.cards)
+
+    def go_to_search_page(self, page):
+        if page >= len(self.pages):
+            return []
+        self.current_search_page = page
+        self.cards = list(self.pages[page])
+        return self.cards
+
+
+class TestJobListCursor(unittest.TestCase):
+    """Test job list iteration by job id"""
+
+    def test_yields_each_job_once_across_growth_and_pages(self):
+        bot = FakeBot(
+            pages=[[FakeCard('1'), FakeCard('2')], [FakeCard('3'), FakeCard('2')]],
+            growth=[[FakeCard('1'), FakeCard('4')]]
+        )
+        cursor = JobListCursor(bot)
+        job_ids = [job_id for job_id, _ in cursor]
+
+        self.assertEqual(job_ids, ['1', '2', '4', '3'])
+        self.assertTrue(cursor.exhausted)
+        self.assertEqual(cursor.stats['growth_events'], 1)
+        self.assertEqual(cursor.stats['pages_loaded'], 1)
+
+    def test_stops_when_next_page_has_no_new_jobs(self):
+        bot = FakeBot(pages=[[FakeCard('1')], [FakeCard('1')]])
+        cursor = JobListCursor(bot)
+        self.assertEqual([job_id for job_id, _ in cursor], ['1'])
+        self.assertTrue(cursor.exhausted)
+
+    def test_cards_without_id_are_yielded_once(self):
+        bot = FakeBot(pages=[[FakeCard(None, 'Python Developer', 'Acme', 'https://jobs.example.com/1?ref=a'),
+                              FakeCard('7')]])
+        cursor = JobListCursor(bot, max_pages=1)
+        self.assertEqual([job_id for job_id, _ in cursor], [None, '7'])
+        self.assertEqual(cursor.stats['cards_without_id'], 1)
+
+    def test_rerendered_cards_without_id_are_not_yielded_again(self):
+        # The list re-renders the same posting as a new element, plus a placeholder that renders later
+        bot = FakeBot(
+            pages=[[FakeCard(None, 'Python Developer', 'Acme', 'https://jobs.example.com/1'), FakeCard(None)]],
+            growth=[[FakeCard(None, 'Python  developer', 'Acme', 'https://jobs.example.com/1?ref=b'),
+                     FakeCard(None, 'Python Developer', 'Globex', 'https://jobs.example.com/2')]]
+        )
+        cursor = JobListCursor(bot, max_pages=1)
+        companies = [card.key.split('|')[1] for _, card in cursor]
+        self.assertEqual(companies, ['acme', 'globex'])
+        self.assertEqual(card_key('', '', ''), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
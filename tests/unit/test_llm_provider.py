@@ -0,0 +1,316 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the shared LLM provider layer against a local stub server
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.ai.llm_provider import CircuitOpenError, LLMProviderError, _LoopThread, get_provider, provider_metrics
+from modules.rate_limiter import configure_rate_limits, get_rate_limiter
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers Gemini and OpenAI style requests; fails the first `failures` calls with 503
+    and holds the first `slow_requests` calls for `delay` seconds. Streamed answers are sent
+    word by word, `chunk_delay` seconds apart"""
+
+    failures = 0
+    slow_requests = 0
+    delay = 0.0
+    chunk_delay = 0.0
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_events(self, events):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+        try:
+            for event in events:
+                self.wfile.write(f"data: {event if isinstance(event, str) else json.dumps(event)}\n\n".encode())
+                self.wfile.flush()
+                time.sleep(StubHandler.chunk_delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        StubHandler.requests_seen.append((self.path, dict(self.headers), body))
+
+        # Decided on arrival, so a slow request still running from an earlier test can't take a later test's failure
+        fail = StubHandler.failures > 0
+        if fail:
+            StubHandler.failures -= 1
+
+        if StubHandler.slow_requests > 0:
+            StubHandler.slow_requests -= 1
+            time.sleep(StubHandler.delay)
+
+        if fail:
+            self._send(503, {'error': 'overloaded'}, {'Retry-After': '0'})
+        elif self.path.endswith(':streamGenerateContent?alt=sse'):
+            self._send_events([{'candidates': [{'content': {'parts': [{'text': word}]}}]}
+                               for word in ('gemini ', 'streams ', 'hi')] +
+                              [{'usageMetadata': {'promptTokenCount': 7, 'candidatesTokenCount': 3}}])
+        elif self.path.endswith('/chat/completions') and body.get('stream'):
+            self._send_events([{'choices': [{'delta': {'content': word}}]} for word in ('openai ', 'streams ', 'hi')] +
+                              [{'choices': [], 'usage': {'prompt_tokens': 5, 'completion_tokens': 3}}, '[DONE]'])
+        elif self.path.endswith(':generateContent'):
+            self._send(200, {
+                'candidates': [{'content': {'parts': [{'text': 'gemini says hi'}]}}],
+                'usageMetadata': {'promptTokenCount': 7, 'candidatesTokenCount': 3}
+            })
+        elif self.path.endswith('/chat/completions'):
+            self._send(200, {
+                'choices': [{'message': {'content': 'openai says hi'}}],
+                'usage': {'prompt_tokens': 5, 'completion_tokens': 2}
+            })
+        else:
+            self._send(404, {'error': 'not found'})
+
+
+class StubServer(ThreadingHTTPServer):
+    """Stub server that stays quiet when a client drops a request (e.g. a cancelled hedge)"""
+
+    def handle_error(self, request, client_address):
+        pass
+
+
+class TestLLMProvider(unittest.TestCase):
+    """Test request shapes, retries and metrics of the provider layer"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubServer(('127.0.0.1', 0), StubHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubHandler.failures = 0
+        StubHandler.slow_requests = 0
+        StubHandler.chunk_delay = 0.0
+        StubHandler.requests_seen = []
+
+    def test_gemini_request_and_usage(self):
+        provider = get_provider('gemini', api_key='key', model='gemini-test', base_url=self.base_url)
+        response = provider.complete('Hello', temperature=0.3, max_tokens=10)
+
+        self.assertEqual(response.text, 'gemini says hi')
+        self.assertEqual((response.prompt_tokens, response.completion_tokens), (7, 3))
+        path, headers, body = StubHandler.requests_seen[0]
+        self.assertEqual(path, '/models/gemini-test:generateContent')
+        self.assertEqual(headers['x-goog-api-key'], 'key')
+        self.assertEqual(body['generationConfig'], {'temperature': 0.3, 'maxOutputTokens': 10})
+
+    def test_openai_compatible_request(self):
+        provider = get_provider('deepseek', api_key='secret', model='deepseek-chat', base_url=self.base_url)
+        response = provider.complete([{'role': 'user', 'content': 'Hello'}], json_mode=True)
+
+        self.assertEqual(response.text, 'openai says hi')
+        path, headers, body = StubHandler.requests_seen[0]
+        self.assertEqual(path, '/chat/completions')
+        self.assertEqual(headers['Authorization'], 'Bearer secret')
+        self.assertEqual(body['response_format'], {'type': 'json_object'})
+
+    def test_retries_transient_errors(self):
+        StubHandler.failures = 2
+        provider = get_provider('openai', model='retry-model', base_url=self.base_url, max_retries=3)
+        response = provider.complete('Hello')
+
+        self.assertEqual(response.attempts, 3)
+        self.assertEqual(provider_metrics()['openai:retry-model']['retries'], 2)
+
+    def test_every_attempt_takes_a_rate_limit_token(self):
+        configure_rate_limits({'deepseek': (1200, 1)})  # One token every 50 ms
+        try:
+            StubHandler.failures = 2
+            provider = get_provider('deepseek', model='limited-model', base_url=self.base_url, max_retries=3)
+            self.assertEqual(provider.complete('Hello').attempts, 3)
+            asyncio.run(provider.acomplete('Hello'))
+            self.assertEqual(get_rate_limiter('deepseek').snapshot()['acquired'], 4)
+
+            # No token within the timeout fails the call without sending it or tripping the breaker
+            configure_rate_limits({'deepseek': (1, 1)})
+            provider = get_provider('deepseek', model='limited-model', base_url=self.base_url, timeout=0.2)
+            provider.complete('Hello')
+            with self.assertRaises(LLMProviderError) as context:
+                provider.complete('Hello')
+            self.assertIn('rate limit', str(context.exception))
+            self.assertEqual(len(StubHandler.requests_seen), 5)
+            self.assertEqual(provider.breaker.snapshot()['state'], 'closed')
+        finally:
+            configure_rate_limits({'deepseek': (0, 1)})
+
+    def test_gives_up_after_max_retries(self):
+        StubHandler.failures = 5
+        provider = get_provider('openai', model='failing-model', base_url=self.base_url, max_retries=1)
+        with self.assertRaises(LLMProviderError) as context:
+            provider.complete('Hello')
+
+        self.assertEqual(context.exception.status_code, 503)
+        self.assertEqual(len(StubHandler.requests_seen), 2)
+        self.assertEqual(provider.metrics.snapshot()['errors'], 1)
+
+    def test_circuit_breaker_opens_and_recovers(self):
+        StubHandler.failures = 100
+        provider = get_provider('openai', model='breaker-model', base_url=self.base_url, max_retries=0)
+        for _ in range(provider.config.breaker_min_calls):
+            with self.assertRaises(LLMProviderError):
+                provider.complete('Hello')
+
+        with self.assertRaises(CircuitOpenError):
+            provider.complete('Hello')
+        self.assertEqual(len(StubHandler.requests_seen), provider.config.breaker_min_calls)
+        self.assertEqual(provider_metrics()['openai:breaker-model']['breaker']['state'], 'open')
+
+        # After the cooldown one probe goes through and closes the breaker again
+        StubHandler.failures = 0
+        provider.breaker.opened_at -= provider.config.breaker_cooldown
+        self.assertEqual(provider.complete('Hello').text, 'openai says hi')
+        self.assertEqual(provider.breaker.snapshot()['state'], 'closed')
+
+    def test_slow_calls_trip_the_breaker(self):
+        provider = get_provider('openai', model='slow-model', base_url=self.base_url, slow_call=0.05)
+        StubHandler.slow_requests, StubHandler.delay = 4, 0.1
+        for _ in range(4):
+            provider.complete('Hello')
+        self.assertEqual(provider.breaker.snapshot()['state'], 'open')
+
+    def test_hedged_request_beats_a_slow_one(self):
+        provider = get_provider('openai', model='hedge-model', base_url=self.base_url, hedge=True)
+        provider.config.hedge_min_samples = 1
+        provider.config.hedge_min_delay = 0.05
+        provider.complete('Hello')  # One fast sample for the p95
+
+        StubHandler.slow_requests, StubHandler.delay = 1, 1.0
+        started = time.perf_counter()
+        response = provider.complete('Hello')
+
+        self.assertEqual(response.text, 'openai says hi')
+        self.assertLess(time.perf_counter() - started, 0.9)
+        self.assertEqual(provider.metrics.snapshot()['hedge_wins'], 1)
+
+    def test_gemini_stream_yields_chunks(self):
+        provider = get_provider('gemini', api_key='key', model='gemini-stream', base_url=self.base_url)
+        stream = provider.stream('Hello')
+        chunks = list(stream)
+
+        self.assertEqual(chunks, ['gemini ', 'streams ', 'hi'])
+        self.assertEqual(stream.response.text, 'gemini streams hi')
+        self.assertEqual((stream.response.prompt_tokens, stream.response.completion_tokens), (7, 3))
+        self.assertIsNotNone(stream.response.first_chunk_latency)
+        self.assertEqual(StubHandler.requests_seen[0][0], '/models/gemini-stream:streamGenerateContent?alt=sse')
+        self.assertEqual(provider.metrics.snapshot()['streamed'], 1)
+
+    def test_openai_stream_reports_usage(self):
+        provider = get_provider('openai', model='stream-model', base_url=self.base_url)
+        stream = provider.stream('Hello')
+
+        self.assertEqual(stream.read(), 'openai streams hi')
+        self.assertEqual(stream.response.completion_tokens, 3)
+        body = StubHandler.requests_seen[0][2]
+        self.assertTrue(body['stream'])
+        self.assertEqual(body['stream_options'], {'include_usage': True})
+
+    def test_stream_is_cut_at_max_chars(self):
+        StubHandler.chunk_delay = 0.2
+        provider = get_provider('openai', model='capped-model', base_url=self.base_url)
+        started = time.perf_counter()
+        stream = provider.stream('Hello', max_chars=10)
+
+        self.assertEqual(stream.read(), 'openai str')
+        self.assertTrue(stream.truncated)
+        self.assertIsNone(stream.response)
+        self.assertLess(time.perf_counter() - started, 0.6)  # Did not wait for the rest of the answer
+        deadline = time.monotonic() + 2
+        while provider.metrics.snapshot()['stream_cancels'] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(provider.metrics.snapshot()['stream_cancels'], 1)
+        self.assertEqual(provider.metrics.snapshot()['in_flight'], 0)
+
+    def test_stream_retries_before_the_first_chunk(self):
+        StubHandler.failures = 1
+        provider = get_provider('gemini', api_key='key', model='stream-retry', base_url=self.base_url)
+        stream = provider.stream('Hello')
+
+        self.assertEqual(stream.read(), 'gemini streams hi')
+        self.assertEqual(stream.response.attempts, 2)
+
+    def test_providers_are_shared(self):
+        first = get_provider('gemini', api_key='key', model='shared', base_url=self.base_url)
+        second = get_provider('gemini', api_key='key', model='shared', base_url=self.base_url + '/')
+        self.assertIs(first, second)
+
+        # Other connection settings are not ignored: they get their own provider and pool
+        limited = get_provider('gemini', api_key='key', model='shared', base_url=self.base_url, max_concurrency=1)
+        self.assertIsNot(limited, first)
+        self.assertEqual((limited.config.max_concurrency, first.config.max_concurrency), (1, 4))
+
+        # Nor do breaker and hedge settings of another caller change the shared provider
+        hedged = get_provider('gemini', api_key='key', model='shared', base_url=self.base_url,
+                              slow_call=0.5, breaker_cooldown=5, hedge=True)
+        self.assertIsNot(hedged, first)
+        self.assertEqual((first.config.breaker_slow_call, first.config.breaker_cooldown, first.config.hedge),
+                         (None, 30.0, False))
+        self.assertEqual((hedged.config.breaker_slow_call, hedged.config.breaker_cooldown, hedged.config.hedge),
+                         (0.5, 5.0, True))
+
+    def test_each_event_loop_gets_its_own_pool(self):
+        provider = get_provider('openai', model='loops-model', base_url=self.base_url)
+        self.assertEqual(provider.complete('Hello').text, 'openai says hi')
+        for _ in range(2):
+            self.assertEqual(asyncio.run(provider.acomplete('Hello')).text, 'openai says hi')
+        self.assertEqual(provider.complete('Hello').text, 'openai says hi')
+
+    def test_timed_out_sync_call_is_cancelled(self):
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with self.assertRaises(TimeoutError):
+            _LoopThread.get().run(slow(), timeout=0.1)
+        self.assertTrue(cancelled.wait(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the queued log writer behind print_lg
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.log_writer import QueuedLogWriter
+
+
+class TestQueuedLogWriter(unittest.TestCase):
+    """Test batching, JSON lines, rotation and retries of the log writer"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'log.txt')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def read(self, path):
+        with open(path, encoding='utf-8') as file:
+            return file.read()
+
+    def test_messages_are_written_in_batches(self):
+        writer = QueuedLogWriter(self.path, flush_interval=60)
+        started = time.perf_counter()
+        for index in range(1000):
+            writer.write(f'chunk {index} ')
+        self.assertLess(time.perf_counter() - started, 0.5)  # Never waits for the file
+
+        self.assertTrue(writer.flush())
+        self.assertEqual(self.read(self.path), ''.join(f'chunk {index} ' for index in range(1000)))
+        self.assertLess(writer.stats['batches'], 1000)
+        writer.close()
+
+    def test_messages_are_written_on_the_interval(self):
+        writer = QueuedLogWriter(self.path, flush_interval=0.05)
+        writer.write('Applying to job 1\n')
+        deadline = time.monotonic() + 2
+        while writer.stats['messages'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.read(self.path), 'Applying to job 1\n')
+        writer.close()
+
+    def test_json_records_join_streamed_chunks(self):
+        json_path = os.path.join(self.folder, 'log.jsonl')
+        writer = QueuedLogWriter(self.path, json_path=json_path)
+        writer.write('\nAI Answer to Question:\n\n')
+        for chunk in ('I have ', '4 years', ' of Python'):
+            writer.write(chunk)
+        writer.write('\n')
+        writer.write('Failed!\n', 'critical')
+        writer.close()
+
+        records = [json.loads(line) for line in self.read(json_path).splitlines()]
+        self.assertEqual([record['message'] for record in records],
+                         ['', 'AI Answer to Question:', '', 'I have 4 years of Python', 'Failed!'])
+        self.assertEqual(records[-1]['level'], 'critical')
+        self.assertIn('T', records[0]['time'])
+
+    def test_log_is_rotated_by_size(self):
+        writer = QueuedLogWriter(self.path, max_bytes=100, backups=2)
+        for index in range(7):
+            writer.write('x' * 80 + f' {index}\n')
+            writer.flush()
+        writer.close()
+
+        # A full log is rotated before the next batch to the next number, like the history files:
+        # log.1.txt had lines 0-1 and was deleted as the oldest, log.2.txt has 2-3, log.3.txt 4-5
+        self.assertEqual(self.read(self.path)[-3:], ' 6\n')
+        self.assertFalse(os.path.exists(os.path.join(self.folder, 'log.1.txt')))
+        self.assertTrue(self.read(os.path.join(self.folder, 'log.2.txt')).startswith('x' * 80 + ' 2'))
+        self.assertEqual(self.read(os.path.join(self.folder, 'log.3.txt')).count('\n'), 2)
+        self.assertFalse(os.path.exists(os.path.join(self.folder, 'log.4.txt')))
+
+    def test_log_is_rotated_by_age(self):
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write('Yesterday\n')
+        yesterday = time.time() - 86400
+        os.utime(self.path, (yesterday, yesterday))
+
+        writer = QueuedLogWriter(self.path, max_age=3600)
+        writer.write('Today\n')
+        writer.close()
+        self.assertEqual(self.read(self.path), 'Today\n')
+        self.assertEqual(self.read(os.path.join(self.folder, 'log.1.txt')), 'Yesterday\n')
+
+    def test_unwritable_log_is_retried(self):
+        blocked = os.path.join(self.folder, 'blocked')
+        with open(blocked, 'w') as file:  # A file where the logs folder should be
+            file.write('')
+        writer = QueuedLogWriter(os.path.join(blocked, 'log.txt'), flush_interval=0.01)
+        writer.write('Kept\n')
+        self.assertFalse(writer.flush(timeout=1))
+        self.assertGreaterEqual(writer.stats['errors'], 1)
+
+        os.remove(blocked)
+        self.assertTrue(writer.flush(timeout=3))
+        writer.close()
+        self.assertEqual(self.read(os.path.join(blocked, 'log.txt')), 'Kept\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the cached user context and prompt prefix of the AI question answerer
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.utils.ai_question_answerer import AIQuestionAnswerer
+
+
+class TestPromptContext(unittest.TestCase):
+    """Test context caching, the stable prompt prefix and compact profiles"""
+
+    def setUp(self):
+        self.answerer = AIQuestionAnswerer(api_key='test-key')
+        self.user_data = {
+            'full_name': 'Asha Rao',
+            'email': 'asha@example.com',
+            'city': 'Pune',
+            'experience_years': 4,
+            'skills': ['Python', 'SQL'],
+            'github_url': 'https://github.com/asharao'
+        }
+        self.job = {'job_title': 'Backend Engineer', 'company_name': 'Acme', 'location': 'Pune'}
+        self.context = self.answerer.prepare_user_context(self.user_data)
+
+    def build(self, question, options=None, job=None):
+        analysis = self.answerer.analyze_question_type(question)
+        return self.answerer.build_prompt(question, self.context, analysis, options, job or self.job)
+
+    def test_user_context_is_rendered_once(self):
+        self.assertIs(self.answerer.prepare_user_context(dict(self.user_data)), self.context)
+        changed = self.answerer.prepare_user_context(dict(self.user_data, city='Mumbai'))
+        self.assertIn('Mumbai', changed)
+
+    def test_prefix_is_shared_by_questions_of_a_job(self):
+        first = self.build('Do you have a valid driver\'s license?', ['Yes', 'No'])
+        second = self.build('Are you willing to take a drug test?', ['Yes', 'No'])
+        other_job = self.build('Are you willing to take a drug test?', ['Yes', 'No'], dict(self.job, company_name='Globex'))
+
+        self.assertIs(first[0]['content'], second[0]['content'])
+        self.assertNotEqual(first[0]['content'], other_job[0]['content'])
+        self.assertIn('Question: Are you willing to take a drug test?', second[1]['content'])
+        self.assertNotIn('Question:', second[0]['content'])
+
+    def test_compact_profile_keeps_only_needed_fields(self):
+        prefix = self.build('What are your salary expectations for this range?')[0]['content']
+        self.assertIn('Years of Experience: 4', prefix)
+        self.assertNotIn('asha@example.com', prefix)
+        self.assertNotIn('Salary Expectation:', prefix)  # Empty in the profile
+
+        self.answerer.compact_profile = False
+        self.assertIn('asha@example.com', self.build('What are your salary expectations for this range?')[0]['content'])
+
+    def test_prompt_tokens_are_reported_per_application(self):
+        for question in ('What are your salary expectations for this range?', 'When can you start?'):
+            self.answerer._record_prompt(self.job, self.build(question), self.context)
+
+        stats = self.answerer.get_prompt_stats(self.job)
+        self.assertEqual(stats['applications'], 1)
+        self.assertEqual(stats['questions'], 2)
+        self.assertLess(stats['tokens_after'], stats['tokens_before'])
+        self.assertEqual(self.answerer.get_prompt_stats({'job_title': 'Unknown'})['questions'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
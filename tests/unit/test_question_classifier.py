@@ -0,0 +1,60 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the precompiled question classifier
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.answer_rules import DEFAULT_CLASSIFIER, DEFAULT_RULES
+from modules.question_classifier import KeywordIndex
+
+
+class TestQuestionClassifier(unittest.TestCase):
+    """Test the one-pass classifier against the rule-by-rule semantics"""
+
+    def test_keyword_index_finds_overlapping_keywords(self):
+        index = KeywordIndex(['clearance', 'security clearance', 'pay', 'payment', 'men'])
+        self.assertEqual(index.find('do you have security clearance for payment?'),
+                         {'clearance', 'security clearance', 'pay', 'payment', 'men'})
+        self.assertEqual(index.find('nothing here'), frozenset())
+
+    def test_candidate_rules_match_rule_by_rule_checks(self):
+        labels = [
+            'how did you hear about this job?',
+            'are you comfortable commuting to this location?',
+            'will you require visa sponsorship?',
+            'what is your expected ctc in lakhs?',
+            'first name'
+        ]
+        for label in labels:
+            for kind in ('text', 'textarea', 'choice'):
+                _, rules = DEFAULT_CLASSIFIER.rules_for(label, kind)
+                expected = [rule.name for rule in DEFAULT_RULES if rule.matches(label, kind)]
+                self.assertEqual([rule.name for rule in rules], expected, (label, kind))
+
+    def test_classify_returns_category_kind_and_hint(self):
+        result = DEFAULT_CLASSIFIER.classify('Are you legally authorized to work in India?')
+        self.assertEqual(result.category, 'yes_no')
+        self.assertEqual(result.kind, 'choice')
+        self.assertEqual(result.hint, 'work_authorization')
+
+        result = DEFAULT_CLASSIFIER.classify('Notice period in days', 'input')
+        self.assertEqual((result.category, result.kind, result.hint), ('availability', 'text', 'notice_period'))
+
+        result = DEFAULT_CLASSIFIER.classify('Describe a challenging project', 'textarea')
+        self.assertEqual((result.category, result.kind), ('general', 'textarea'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the shared token bucket rate limiter
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.rate_limiter import (RateLimit, RateLimiter, RateLimitTimeout, configure_rate_limits,
+                                  get_rate_limiter, rate_limit, rate_limit_key)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test token bucket timing, fair queuing, timeouts and cross-process state"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_burst_then_refill_rate(self):
+        limiter = RateLimiter('test', RateLimit(per_minute=600, burst=2))  # 10 tokens a second
+        self.assertLess(limiter.acquire() + limiter.acquire(), 0.01)
+        waited = limiter.acquire()
+        self.assertGreater(waited, 0.05)
+        self.assertLess(waited, 0.3)
+
+        stats = limiter.snapshot()
+        self.assertEqual((stats['acquired'], stats['waited']), (3, 1))
+        self.assertGreater(stats['max_wait'], 0.05)
+
+    def test_unconfigured_resources_are_not_limited(self):
+        limiter = RateLimiter('free')
+        self.assertEqual(sum(limiter.acquire() for _ in range(50)), 0.0)
+        self.assertIsNone(limiter.snapshot()['limit'])
+
+    def test_waiters_are_served_fairly_by_key(self):
+        limiter = RateLimiter('fair', RateLimit(per_minute=1200, burst=1))  # One token every 50 ms
+        limiter.acquire('busy')  # Empty the bucket
+        order = []
+
+        def call(key):
+            limiter.acquire(key)
+            order.append(key)
+
+        busy = [threading.Thread(target=call, args=('busy',)) for _ in range(4)]
+        for thread in busy:
+            thread.start()
+        time.sleep(0.01)
+        quiet = threading.Thread(target=call, args=('quiet',))
+        quiet.start()
+        for thread in busy + [quiet]:
+            thread.join(5)
+
+        # The quiet user's single call does not wait behind all of the busy user's calls
+        self.assertLess(order.index('quiet'), 3)
+        self.assertEqual(limiter.snapshot()['keys']['busy']['acquired'], 5)
+
+    def test_timeout(self):
+        limiter = RateLimiter('slow', RateLimit(per_minute=1, burst=1))
+        limiter.acquire()
+        with self.assertRaises(RateLimitTimeout):
+            limiter.acquire(timeout=0.05)
+        self.assertEqual(limiter.snapshot()['timeouts'], 1)
+        self.assertEqual(limiter.snapshot()['queued'], 0)
+
+    def test_coroutines_wait_without_blocking_the_loop(self):
+        limiter = RateLimiter('async', RateLimit(per_minute=600, burst=1))  # 10 tokens a second
+        limiter.acquire()
+        ticks = []
+
+        async def ticker():
+            while len(ticks) < 100:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            task = asyncio.ensure_future(ticker())
+            waited = await limiter.aacquire('user:1')
+            task.cancel()
+            with self.assertRaises(RateLimitTimeout):
+                await limiter.aacquire('user:1', timeout=0.02)
+            slow = asyncio.ensure_future(limiter.aacquire('user:2'))
+            await asyncio.sleep(0.01)
+            slow.cancel()
+            return waited
+
+        self.assertGreater(asyncio.run(main()), 0.05)
+        self.assertGreater(len(ticks), 3)  # The loop kept running while the coroutine waited
+        stats = limiter.snapshot()
+        self.assertEqual((stats['acquired'], stats['timeouts'], stats['queued']), (2, 1, 0))
+
+    def test_state_is_shared_through_sqlite(self):
+        path = os.path.join(self.folder, 'limits.db')
+        first = RateLimiter('shared', RateLimit(per_minute=60, burst=1), state_path=path)
+        second = RateLimiter('shared', RateLimit(per_minute=60, burst=1), state_path=path)
+
+        self.assertLess(first.acquire(), 0.05)
+        with self.assertRaises(RateLimitTimeout):
+            second.acquire(timeout=0.05)  # The other "process" took the only token
+        self.assertTrue(second.snapshot()['shared'])
+
+    def test_module_level_limits_and_thread_key(self):
+        configure_rate_limits({'module-test': (600, 1)})
+        with rate_limit_key('user:1'):
+            rate_limit('module-test')
+        rate_limit('module-test', key='user:2')
+
+        keys = get_rate_limiter('module-test').snapshot()['keys']
+        self.assertEqual(set(keys), {'user:1', 'user:2'})
+
+
+if __name__ == '__main__':
+    unittest.main()
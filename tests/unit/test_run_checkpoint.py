@@ -0,0 +1,95 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the checkpoint that lets a crashed run pick up where it stopped
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.run_checkpoint import RunCheckpoint, fingerprint, page_url, resume_index
+
+
+class TestRunCheckpoint(unittest.TestCase):
+    """Test saving, resuming, invalidation and the page helpers"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'logs', 'run_checkpoint.json')
+        self.settings = fingerprint(['Python Developer', 'Web Developer'], 'India', 'Past week', '', True)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_restart_resumes_at_the_saved_position(self):
+        checkpoint = RunCheckpoint(self.path)
+        checkpoint.start(self.settings, ['Web Developer', 'Python Developer'])
+        checkpoint.at_page(1, 3, 4, {'111', '222'}, {'Acme'})
+        checkpoint.at_job('333', 5)
+        checkpoint.save()
+
+        resumed = RunCheckpoint(self.path).resume(self.settings)
+        self.assertEqual(resumed['search_terms'], ['Web Developer', 'Python Developer'])
+        self.assertEqual((resumed['term_index'], resumed['page'], resumed['job_id'], resumed['applied']),
+                         (1, 3, '333', 5))
+        self.assertEqual(resumed['rejected_jobs'], ['111', '222'])
+        self.assertEqual(resumed['blacklisted_companies'], ['Acme'])
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+    def test_job_position_is_saved_with_the_next_page(self):
+        checkpoint = RunCheckpoint(self.path)
+        checkpoint.start(self.settings, ['Web Developer'])
+        checkpoint.at_job('333', 1)
+        self.assertIsNone(RunCheckpoint(self.path).resume(self.settings)['job_id'])
+        checkpoint.at_page(0, 2, 1, set(), set())
+        self.assertEqual(RunCheckpoint(self.path).resume(self.settings)['page'], 2)
+
+    def test_other_settings_old_or_broken_checkpoints_are_ignored(self):
+        checkpoint = RunCheckpoint(self.path, max_age=3600)
+        checkpoint.start(self.settings, ['Web Developer'])
+        self.assertIsNone(RunCheckpoint(self.path).resume(fingerprint(['Web Developer'], 'India', 'Past 24 hours', '', True)))
+
+        with open(self.path) as file:
+            state = json.load(file)
+        state['updated'] = time.time() - 7200
+        with open(self.path, 'w') as file:
+            json.dump(state, file)
+        self.assertIsNone(RunCheckpoint(self.path, max_age=3600).resume(self.settings))
+
+        with open(self.path, 'w') as file:
+            file.write('{"fingerprint": ')
+        self.assertIsNone(RunCheckpoint(self.path).resume(self.settings))
+
+    def test_finished_run_clears_the_checkpoint(self):
+        checkpoint = RunCheckpoint(self.path)
+        checkpoint.start(self.settings, ['Web Developer'])
+        checkpoint.clear()
+        self.assertFalse(os.path.exists(self.path))
+        checkpoint.save()
+        self.assertFalse(os.path.exists(self.path))
+        checkpoint.clear()
+
+    def test_page_helpers(self):
+        url = 'https://www.linkedin.com/jobs/search/?keywords=Python&f_TPR=r604800&start=50'
+        self.assertEqual(page_url(url, 4), 'https://www.linkedin.com/jobs/search/?keywords=Python&f_TPR=r604800&start=75')
+        self.assertEqual(page_url(url, 1), 'https://www.linkedin.com/jobs/search/?keywords=Python&f_TPR=r604800')
+        self.assertEqual(resume_index(['1', '2', '3'], '2'), 1)
+        self.assertEqual(resume_index(['1', '2', '3'], '9'), 0)
+        self.assertEqual(resume_index(['1', '2', '3'], None), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the scheduler deciding when the next cycle of a non-stop run starts
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.run_scheduler import RunScheduler
+
+
+class FakeClock:
+    """A clock that only moves when slept on"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestRunScheduler(unittest.TestCase):
+    """Test the gap adjustments, probes, the daily limit pause and the saved state"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'run_schedule.json')
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def scheduler(self, **options):
+        options = {'min_gap': 120, 'max_gap': 3600, 'probe_interval': 300, **options}
+        return RunScheduler(self.path, clock=self.clock, sleep=self.clock.sleep, **options)
+
+    def cycle(self, scheduler, job_ids, **signals):
+        scheduler.start_cycle()
+        for job_id in job_ids:
+            scheduler.saw(job_id)
+        return scheduler.finish_cycle(**signals)
+
+    def test_gap_follows_the_yield(self):
+        scheduler = self.scheduler()
+        self.assertEqual(self.cycle(scheduler, ['1', '2']), 300)
+        self.assertEqual(self.cycle(scheduler, ['1', '2']), 450)
+        self.assertEqual(self.cycle(scheduler, ['3']), 225)
+        self.assertEqual(self.cycle(scheduler, ['4']), 120)
+        self.assertEqual(self.cycle(scheduler, [], rate_limited=True), 270)
+        for _ in range(20):
+            self.cycle(scheduler, [])
+        self.assertEqual(scheduler.gap, 3600)
+
+    def test_probe_starts_the_next_cycle_early(self):
+        scheduler = self.scheduler()
+        self.cycle(scheduler, ['1', '2'])  # next cycle in 300 s
+        scheduler.gap = 1200
+        scheduler.next_cycle_at = self.clock() + 1200
+
+        probes = iter([['1', '2'], ['1', '2', '3']])
+        started = self.clock()
+        self.assertEqual(scheduler.wait(lambda: next(probes)), 'new postings')
+        self.assertEqual(self.clock() - started, 600)
+        self.assertEqual(scheduler.stats['probes'], 2)
+
+        # The probed posting is seen once the next cycle is done, even if the cycle filtered it out
+        self.cycle(scheduler, [])
+        self.assertEqual(scheduler.wait(lambda: ['3']), 'due')
+
+    def test_failed_probes_do_not_stop_the_wait(self):
+        scheduler = self.scheduler()
+        self.cycle(scheduler, ['1'])
+        errors = []
+
+        def probe():
+            raise RuntimeError('page did not load')
+
+        self.assertEqual(scheduler.wait(probe, errors.append), 'due')
+        self.assertEqual(self.clock(), 1300)
+        self.assertEqual(len(errors), 0)  # the 300 s gap ended before the first probe
+
+        self.cycle(scheduler, [])
+        self.assertEqual(scheduler.wait(probe, errors.append), 'due')
+        self.assertEqual(len(errors), 1)
+
+    def test_daily_limit_pauses_without_probes(self):
+        scheduler = self.scheduler(limit_pause=12 * 3600)
+        self.assertEqual(self.cycle(scheduler, ['1'], limit_reached=True), 12 * 3600)
+
+        restarted = self.scheduler(limit_pause=12 * 3600)
+        self.assertEqual(restarted.seconds_left(), 12 * 3600)
+        self.assertEqual(restarted.wait(lambda: ['new']), 'due')
+        self.assertEqual(restarted.stats['probes'], 0)
+
+    def test_state_survives_a_restart(self):
+        scheduler = self.scheduler()
+        self.cycle(scheduler, ['1', '2'])
+        self.cycle(scheduler, [])
+
+        restarted = self.scheduler()
+        self.assertEqual(restarted.gap, 450)
+        self.assertEqual(restarted.seconds_left(), 450)
+        restarted.start_cycle()
+        self.assertFalse(restarted.saw('1'))
+        self.assertTrue(restarted.saw('5'))
+
+        with open(self.path, 'w') as file:
+            file.write('not json')
+        self.assertEqual(self.scheduler().gap, 600)
+
+
+if __name__ == '__main__':
+    unittest.main()
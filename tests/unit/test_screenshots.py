@@ -0,0 +1,126 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the background screenshot service and its retention limits
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.screenshots import Image, ScreenshotService
+
+
+class FakeDriver:
+    """Returns a fixed PNG and page, like a Selenium driver"""
+
+    def __init__(self, png=b'\x89PNG fake image', page_source='<html><body>Apply</body></html>'):
+        self.png = png
+        self.page_source = page_source
+
+    def get_screenshot_as_png(self):
+        return self.png
+
+
+class BrokenDriver:
+    def get_screenshot_as_png(self):
+        raise RuntimeError('browser closed')
+
+
+class TestScreenshotService(unittest.TestCase):
+    """Test background saving, DOM snapshots, retention and failures"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_screenshot_is_saved_in_the_background(self):
+        service = ScreenshotService(self.folder, image_format='png', max_width=0, capture_dom=True)
+        name = service.capture(FakeDriver(), '123 - Failed at questions - 2024-05-01 10:00:00')
+        self.assertEqual(name, '123 - Failed at questions - 2024-05-01 10.00.00.png')
+        self.assertTrue(service.flush())
+
+        with open(os.path.join(self.folder, name), 'rb') as file:
+            self.assertEqual(file.read(), b'\x89PNG fake image')
+        with gzip.open(os.path.join(self.folder, name[:-4] + '.html.gz'), 'rt', encoding='utf-8') as file:
+            self.assertIn('Apply', file.read())
+        self.assertEqual(service.stats['saved'], 1)
+
+    def test_capture_does_not_wait_for_saving(self):
+        service = ScreenshotService(self.folder, image_format='png', max_width=0)
+        release = threading.Event()
+        service._save = lambda *args: release.wait(5)  # A slow disk
+
+        started = time.perf_counter()
+        for index in range(5):
+            service.capture(FakeDriver(), f'job {index}')
+        self.assertLess(time.perf_counter() - started, 1)
+        release.set()
+        self.assertTrue(service.flush())
+
+    def test_full_queue_drops_screenshots(self):
+        service = ScreenshotService(self.folder, image_format='png', max_width=0, max_queued=1)
+        release = threading.Event()
+        service._save = lambda *args: release.wait(5)
+
+        names = [service.capture(FakeDriver(), f'job {index}') for index in range(4)]
+        self.assertIn('Not Available', names)
+        self.assertGreater(service.stats['dropped'], 0)
+        release.set()
+        self.assertTrue(service.flush())
+
+    def test_failed_capture_is_not_available(self):
+        service = ScreenshotService(self.folder)
+        self.assertEqual(service.capture(BrokenDriver(), 'job'), 'Not Available')
+        self.assertEqual(service.stats['errors'], 1)
+
+    def test_retention_deletes_old_and_excess_screenshots(self):
+        service = ScreenshotService(self.folder, image_format='png', max_files=2, max_mb=0, max_age_days=1)
+        now = time.time()
+        for index, age_days in enumerate([3, 0.5, 0.3, 0.1]):
+            for extension in ('.png', '.html.gz'):
+                path = os.path.join(self.folder, f'shot {index}{extension}')
+                with open(path, 'wb') as file:
+                    file.write(b'x' * 100)
+                os.utime(path, (now - age_days * 86400,) * 2)
+
+        self.assertEqual(service.apply_retention(), 2)
+        self.assertEqual(sorted(os.listdir(self.folder)),
+                         ['shot 2.html.gz', 'shot 2.png', 'shot 3.html.gz', 'shot 3.png'])
+
+        service.max_files, service.max_age, service.max_bytes = 0, 0, 250
+        self.assertEqual(service.apply_retention(), 1)
+        self.assertEqual(sorted(os.listdir(self.folder)), ['shot 3.html.gz', 'shot 3.png'])
+
+    @unittest.skipIf(Image is None, 'Pillow is not installed')
+    def test_screenshot_is_compressed_and_scaled_down(self):
+        import io
+        image = Image.new('RGB', (2000, 1000), (30, 90, 200))
+        png = io.BytesIO()
+        image.save(png, format='PNG')
+
+        service = ScreenshotService(self.folder, image_format='jpeg', quality=60, max_width=1000)
+        name = service.capture(FakeDriver(png.getvalue()), 'job')
+        self.assertTrue(service.flush())
+        self.assertTrue(name.endswith('.jpg'))
+        with Image.open(os.path.join(self.folder, name)) as saved:
+            self.assertEqual((saved.format, saved.size), ('JPEG', (1000, 500)))
+
+
+if __name__ == '__main__':
+    unittest.main()
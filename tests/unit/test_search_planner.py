@@ -0,0 +1,76 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the search query planner
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.automation.search_planner import SearchPlanner
+
+
+class TestSearchPlanner(unittest.TestCase):
+    """Test search planning"""
+
+    def setUp(self):
+        self.planner = SearchPlanner(max_titles_per_query=3)
+
+    def test_compatible_titles_are_merged(self):
+        groups = self.planner.group_titles(
+            ['Python Developer', 'Backend Developer', 'Data Analyst', 'Senior Data Scientist'])
+        self.assertEqual(groups, [['Python Developer', 'Backend Developer'],
+                                  ['Data Analyst', 'Senior Data Scientist']])
+
+    def test_seniority_words_do_not_merge_titles(self):
+        groups = self.planner.group_titles(['Senior Designer', 'Senior Accountant'])
+        self.assertEqual(len(groups), 2)
+
+    def test_group_size_is_bounded(self):
+        titles = ['Python Developer', 'Java Developer', 'Go Developer', 'Rust Developer']
+        groups = SearchPlanner(max_titles_per_query=2).group_titles(titles)
+        self.assertEqual([len(group) for group in groups], [2, 2])
+
+    def test_plan_reduces_search_count(self):
+        plan = self.planner.plan('linkedin',
+                                 ['Python Developer', 'Backend Developer', 'Django Developer'],
+                                 ['Pune', 'Mumbai', 'pune'])
+        self.assertEqual(plan.naive_search_count, 6)
+        self.assertEqual(len(plan), 2)
+        self.assertEqual(plan.searches[0].keywords,
+                         '"Python Developer" OR "Backend Developer" OR "Django Developer"')
+        preview = plan.preview(applications_limit=5)
+        self.assertEqual(preview['searches_saved'], 4)
+        self.assertLess(preview['estimated_search_seconds'], preview['naive_search_seconds'])
+
+    def test_each_platform_gets_its_own_query_syntax(self):
+        titles = ['Python Developer', 'Backend Developer']
+        self.assertEqual(self.planner.plan('linkedin', titles, ['Pune']).searches[0].keywords,
+                         '"Python Developer" OR "Backend Developer"')
+        self.assertEqual(self.planner.plan('indeed', titles, ['Pune']).searches[0].keywords,
+                         '("Python Developer" or "Backend Developer")')
+        self.assertEqual([search.keywords for search in self.planner.plan('glassdoor', titles, ['Pune'])],
+                         titles)
+
+    def test_plan_orders_by_historical_yield(self):
+        history = SearchPlanner.match_history(
+            [('Senior Data Analyst', 'Mumbai, India', 'applied'),
+             ('Data Analyst II', 'Mumbai, India', 'interview'),
+             ('Graphic Designer', 'Pune', 'error')],
+            ['Graphic Designer', 'Data Analyst'], ['Pune', 'Mumbai'])
+        plan = self.planner.plan('indeed', ['Graphic Designer', 'Data Analyst'], ['Pune', 'Mumbai'], history)
+        first = plan.searches[0]
+        self.assertEqual((first.keywords, first.location), ('Data Analyst', 'Mumbai'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the search URL builders
+"""
+
+import unittest
+import sys
+import os
+from urllib.parse import urlparse, parse_qs
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.automation.search_urls import build_linkedin_search_url, build_indeed_search_url
+
+
+def query_of(url):
+    return {key: values[0] for key, values in parse_qs(urlparse(url).query).items()}
+
+
+class TestLinkedInSearchUrl(unittest.TestCase):
+    """Test LinkedIn search URL encoding"""
+
+    def test_keywords_location_and_easy_apply(self):
+        url = build_linkedin_search_url('"Python Developer" OR "Backend Developer"', 'Pune, India',
+                                        {'easy_apply': True})
+        self.assertTrue(url.startswith('https://www.linkedin.com/jobs/search/?'))
+        params = query_of(url)
+        self.assertEqual(params['keywords'], '"Python Developer" OR "Backend Developer"')
+        self.assertEqual(params['location'], 'Pune, India')
+        self.assertEqual(params['f_AL'], 'true')
+        self.assertNotIn('start', params)
+
+    def test_filters_and_pagination(self):
+        url = build_linkedin_search_url('Data Analyst', None, {
+            'date_posted': 'Past week',
+            'experience_level': ['Entry', 'mid'],
+            'work_mode': 'hybrid',
+            'work_type': 'full-time',
+            'sort_by': 'Most recent'
+        }, page=2)
+        params = query_of(url)
+        self.assertNotIn('location', params)
+        self.assertNotIn('f_AL', params)
+        self.assertEqual(params['f_TPR'], 'r604800')
+        self.assertEqual(params['f_E'], '2,4')
+        self.assertEqual(params['f_WT'], '3')
+        self.assertEqual(params['f_JT'], 'F')
+        self.assertEqual(params['sortBy'], 'DD')
+        self.assertEqual(params['start'], '50')
+
+    def test_any_values_are_ignored(self):
+        params = query_of(build_linkedin_search_url('QA', 'Remote', {'work_mode': 'any', 'date_posted': 'Any time'}))
+        self.assertNotIn('f_WT', params)
+        self.assertNotIn('f_TPR', params)
+
+
+class TestIndeedSearchUrl(unittest.TestCase):
+    """Test Indeed search URL encoding"""
+
+    def test_filters_and_pagination(self):
+        url = build_indeed_search_url('Java Developer', 'Bengaluru', {
+            'easy_apply': True,
+            'date_posted': 'past week',
+            'work_type': 'contract',
+            'experience_level': 'senior',
+            'work_mode': 'remote'
+        }, page=3, base_url='https://in.indeed.com/')
+        self.assertTrue(url.startswith('https://in.indeed.com/jobs?'))
+        params = query_of(url)
+        self.assertEqual(params['q'], 'Java Developer')
+        self.assertEqual(params['l'], 'Bengaluru')
+        self.assertEqual(params['fromage'], '7')
+        self.assertEqual(params['jt'], 'contract')
+        self.assertEqual(params['explvl'], 'SENIOR_LEVEL')
+        self.assertEqual(params['sc'], '0kf:attr(DSQF7);')
+        self.assertEqual(params['iafilter'], '1')
+        self.assertEqual(params['start'], '30')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the session-level seen job index
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.automation.seen_jobs import SeenJobIndex
+
+
+class TestSeenJobIndex(unittest.TestCase):
+    """Test seen job de-duplication"""
+
+    def setUp(self):
+        self.index = SeenJobIndex()
+
+    def test_unknown_job_is_not_skipped(self):
+        self.assertFalse(self.index.should_skip('linkedin', '123'))
+        self.assertEqual(self.index.get_stats()['checked'], 1)
+
+    def test_job_seen_in_session_is_skipped(self):
+        self.index.mark_seen('linkedin', '123')
+        self.assertTrue(self.index.should_skip('LinkedIn', ' 123 '))
+        self.assertEqual(self.index.get_stats()['skipped_duplicates'], 1)
+
+    def test_previously_applied_jobs_keep_their_origin(self):
+        self.index.add('linkedin', '456', origin=SeenJobIndex.PREVIOUSLY_APPLIED)
+        self.index.mark_seen('linkedin', '456')
+        self.assertTrue(self.index.should_skip('linkedin', '456'))
+        stats = self.index.get_stats()
+        self.assertEqual(stats['seeded'], 1)
+        self.assertEqual(stats['skipped_previously_applied'], 1)
+        self.assertEqual(stats['total_skipped'], 1)
+
+    def test_ids_are_scoped_per_platform(self):
+        self.index.mark_seen('linkedin', '789')
+        self.assertFalse(self.index.should_skip('indeed', '789'))
+
+    def test_empty_ids_are_never_skipped(self):
+        self.index.mark_seen('linkedin', '')
+        self.index.mark_seen('linkedin', None)
+        self.assertFalse(self.index.should_skip('linkedin', None))
+        self.assertEqual(len(self.index), 0)
+
+    def test_lookup_checks_jobs_when_seeding_failed(self):
+        applied = {('linkedin', '321')}
+        index = SeenJobIndex(applied_lookup=lambda platform, job_id: (platform, job_id) in applied)
+        self.assertTrue(index.should_skip('LinkedIn', '321'))
+        self.assertFalse(index.should_skip('linkedin', '654'))
+        self.assertEqual(index.get_stats()['skipped_previously_applied'], 1)
+
+        def broken(platform, job_id):
+            raise RuntimeError('database is locked')
+
+        self.assertTrue(SeenJobIndex(applied_lookup=broken).should_skip('linkedin', '654'))
+
+
+if __name__ == '__main__':
+    unittest.main()
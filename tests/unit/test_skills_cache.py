@@ -0,0 +1,81 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for the content-addressed job description skills cache
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules.ai.skills_cache import SkillsCache, description_key, get_skills_cache
+
+
+def skills(*tech_stack):
+    return {
+        'tech_stack': list(tech_stack),
+        'technical_skills': [],
+        'other_skills': ['Communication'],
+        'required_skills': list(tech_stack),
+        'nice_to_have': []
+    }
+
+
+class TestSkillsCache(unittest.TestCase):
+    """Test hashing, persistence, validation and eviction"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'cache', 'skills.db')
+        self.cache = SkillsCache(self.path, max_entries=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_normalized_descriptions_share_a_key(self):
+        self.assertEqual(description_key('Python  developer\n needed'), description_key('python developer needed'))
+        self.assertNotEqual(description_key('Python developer'), description_key('Java developer'))
+
+    def test_repeat_descriptions_hit_across_instances(self):
+        self.assertIsNone(self.cache.get('Python developer'))
+        self.assertTrue(self.cache.put('Python developer', skills('Python'), 'openai', 'gpt-4o'))
+
+        reopened = SkillsCache(self.path)
+        self.assertEqual(reopened.get('  PYTHON developer '), skills('Python'))
+        self.assertEqual(reopened.get_stats()['hits'], 1)
+        self.assertEqual(self.cache.get_stats()['misses'], 1)
+
+    def test_errors_and_partial_results_are_not_cached(self):
+        self.assertFalse(self.cache.put('Python developer', {'error': 'timeout'}))
+        self.assertFalse(self.cache.put('Python developer', {'tech_stack': ['Python']}))
+        self.assertFalse(self.cache.put('Python developer', 'not json'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_least_recently_used_descriptions_are_evicted(self):
+        self.cache.put('first', skills('A'))
+        self.cache.put('second', skills('B'))
+        self.cache.get('first')
+        self.cache.put('third', skills('C'))
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get('second'))
+        self.assertEqual(self.cache.get('first'), skills('A'))
+        self.assertEqual(self.cache.get_stats()['evicted'], 1)
+
+    def test_empty_path_disables_the_cache(self):
+        self.assertIsNone(get_skills_cache(''))
+        self.assertIs(get_skills_cache(self.path), get_skills_cache(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+'''
+Author:     Shakeeb Shaikh
+LinkedIn:  https://www.linkedin.com/in/shakeeb-shaikh-02b32b282/=
+
+GitHub:     https://github.com/ShakeebSk
+'''
+
+Tests for streamed long answers: generation, length cap, cancellation and incremental typing
+"""
+
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.utils.ai_question_answerer import AIQuestionAnswerer, ReplacementText
+from config.config import Config
+from app.utils.form_question_parser import FormQuestion, FormQuestionParser
+from modules.ai.llm_provider import get_provider
+
+COVER_LETTER = "I am excited to apply for this role because my backend experience matches your needs."
+
+
+class StreamingHandler(BaseHTTPRequestHandler):
+    """Streams COVER_LETTER word by word as Gemini server-sent events, or an error after `fail_after` words"""
+
+    chunk_delay = 0.0
+    fail_after = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+        try:
+            for index, word in enumerate(COVER_LETTER.split(' ')):
+                if index == StreamingHandler.fail_after:
+                    self.wfile.write(b'data: {"error": {"message": "overloaded"}}\n\n')
+                    return
+                event = {'candidates': [{'content': {'parts': [{'text': word if index == 0 else ' ' + word}]}}]}
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                self.wfile.flush()
+                time.sleep(StreamingHandler.chunk_delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class QuietServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        pass
+
+
+class FakeInput:
+    """Records what is typed into a text area"""
+
+    def __init__(self, max_length=None):
+        self.value = ''
+        self.max_length = max_length
+        self.send_count = 0
+
+    def clear(self):
+        self.value = ''
+
+    def send_keys(self, text):
+        self.value += text
+        self.send_count += 1
+
+    def get_attribute(self, name):
+        return str(self.max_length) if name == 'maxlength' and self.max_length else None
+
+
+class TestStreamAnswer(unittest.TestCase):
+    """Test streamed cover letters from the answerer through to the form field"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = QuietServer(('127.0.0.1', 0), StreamingHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StreamingHandler.chunk_delay = 0.0
+        StreamingHandler.fail_after = None
+        self.answerer = AIQuestionAnswerer(api_key='test-key')
+        self.answerer.provider = get_provider('gemini', api_key='test-key', model='stream-test', base_url=self.base_url)
+        self.context = self.answerer.prepare_user_context({'full_name': 'Asha Rao', 'experience_years': 4})
+        self.job = {'job_title': 'Backend Engineer', 'company_name': 'Acme'}
+        self.question = 'Please write a short cover letter for this position'
+        self.analysis = self.answerer.analyze_question_type(self.question, 'textarea')
+
+    def stream(self, max_chars=None):
+        return self.answerer.stream_answer(self.question, self.context, self.analysis, None, self.job, max_chars)
+
+    def test_zero_slow_call_limit_only_counts_failures(self):
+        with patch.object(Config, 'AI_SLOW_CALL_SECONDS', 0):
+            answerer = AIQuestionAnswerer(api_key='no-slow-limit-key')
+        self.assertIsNone(answerer.provider.config.breaker_slow_call)
+
+    def test_long_answers_stream_in_chunks(self):
+        self.assertTrue(self.answerer.is_streamable(self.analysis))
+        chunks = list(self.stream())
+        self.assertGreater(len(chunks), 5)
+        self.assertEqual(''.join(chunks), COVER_LETTER)
+
+    def test_choice_questions_are_answered_whole(self):
+        analysis = self.answerer.analyze_question_type('Are you willing to relocate?', 'radio')
+        self.assertFalse(self.answerer.is_streamable(analysis, ['Yes', 'No']))
+
+    def test_answer_is_capped(self):
+        self.assertEqual(''.join(self.stream(max_chars=20)), COVER_LETTER[:20])
+
+    def test_closing_the_stream_cancels_generation(self):
+        StreamingHandler.chunk_delay = 0.2
+        started = time.perf_counter()
+        chunks = self.stream()
+        self.assertEqual(next(chunks), 'I')
+        chunks.close()
+        self.assertLess(time.perf_counter() - started, 0.6)
+
+    def test_failed_stream_is_replaced_by_the_fallback(self):
+        StreamingHandler.fail_after = 6
+        chunks = list(self.stream())
+        self.assertEqual(''.join(chunks[:-1]), ' '.join(COVER_LETTER.split(' ')[:6]))
+        self.assertIsInstance(chunks[-1], ReplacementText)
+        self.assertEqual(chunks[-1], self.answerer._get_fallback_answer(self.analysis))
+
+        field = FakeInput()
+        question = FormQuestion(None, self.question, 'textarea')
+        question.input_element = field
+        success, typed = FormQuestionParser(driver=None).fill_question_answer_stream(question, iter(chunks))
+        self.assertTrue(success)
+        self.assertEqual((field.value, typed), (chunks[-1], chunks[-1]))
+
+    def test_streamed_answers_are_remembered(self):
+        self.answerer.answer_memory.REUSABLE_KINDS = ('text', 'choice', 'textarea')
+        self.question = 'Describe your experience with backend systems'
+        self.analysis = self.answerer.analyze_question_type(self.question, 'textarea')
+        self.assertEqual(''.join(self.stream()), COVER_LETTER)
+        StreamingHandler.fail_after = 0
+        self.assertEqual(list(self.stream()), [COVER_LETTER])
+
+    def test_answer_is_typed_while_generated(self):
+        field = FakeInput(max_length=40)
+        question = FormQuestion(None, self.question, 'textarea')
+        question.input_element = field
+        parser = FormQuestionParser(driver=None)
+
+        success, typed = parser.fill_question_answer_stream(question, self.stream(parser.get_max_length(question)))
+
+        self.assertTrue(success)
+        self.assertEqual(field.value, COVER_LETTER[:40])
+        self.assertEqual(typed, field.value)
+        self.assertGreater(field.send_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()